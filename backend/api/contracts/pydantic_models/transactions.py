@@ -62,6 +62,7 @@ class PriceGrowthPagination(BaseModel):
     total_pages: int = Field(alias='totalPages')
     has_next: bool = Field(alias='hasNext')
     has_prev: bool = Field(alias='hasPrev')
+    next_cursor: Optional[str] = Field(default=None, alias='nextCursor')
 
 
 class PriceGrowthResponse(BaseModel):
@@ -202,6 +203,10 @@ class PriceGrowthParams(BaseParamsModel):
         alias='perPage',
         description="Records per page"
     )
+    cursor: Optional[str] = Field(
+        default=None,
+        description="Keyset cursor (nextCursor from the previous page)"
+    )
 
     @model_validator(mode='after')
     def apply_normalizations(self) -> 'PriceGrowthParams':
@@ -36,6 +36,9 @@ SUPPLY_SUMMARY_RESPONSE_SCHEMA = ResponseSchema(
         FieldSpec(name="computedAs", type=str, required=False),
         FieldSpec(name="asOfDate", type=str, required=False),
         FieldSpec(name="warnings", type=list, required=False),
+        FieldSpec(name="snapshotBuiltAt", type=str, required=False),
+        FieldSpec(name="inputGenerations", type=dict, required=False),
+        FieldSpec(name="stale", type=bool, required=False),
     ),
     required_meta=make_required_meta(),
     data_is_list=False,
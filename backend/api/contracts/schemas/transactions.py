@@ -61,6 +61,7 @@ PRICE_GROWTH_RESPONSE_SCHEMA = ResponseSchema(
         FieldSpec(name="totalPages", type=int, required=True),
         FieldSpec(name="hasNext", type=bool, required=True),
         FieldSpec(name="hasPrev", type=bool, required=True),
+        FieldSpec(name="nextCursor", type=str, required=False),
         # Response also includes filtersApplied at top level
         FieldSpec(name="filtersApplied", type=dict, required=False),
     ),
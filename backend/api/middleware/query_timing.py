@@ -5,20 +5,31 @@ Captures:
 - Query execution time (db_time_ms)
 - Query count per request
 - Correlates with request_id
+- Per endpoint x fingerprint latency histograms (count, p50/p95/p99, rows)
+- N+1 patterns: the same fingerprint run many times in one request
 
-Safe for production - no EXPLAIN ANALYZE, just timing.
+Safe for production - no EXPLAIN ANALYZE, just timing. Statements are
+reduced to a fingerprint (literals, numbers and IN lists replaced with ?)
+so stats aggregate across parameter values and never hold user data.
 
 Log format:
-    SLOW_QUERY request_id=<uuid> elapsed_ms=<float> stmt=<first 80 chars>
+    SLOW_QUERY request_id=<uuid> elapsed_ms=<float> fingerprint=<id> stmt=<first 80 chars>
     REQUEST_TIMING request_id=<uuid> db_time_ms=<float> query_count=<int>
+    N_PLUS_ONE request_id=<uuid> endpoint=<name> fingerprint=<id> count=<int> stmt=<first 120 chars>
+    QUERY_STATS endpoint=<name> fingerprint=<id> count=<int> p50_ms=<float> p95_ms=<float> ...
 """
 
+import bisect
+import hashlib
 import logging
+import re
+import threading
 import time
+from functools import lru_cache
 from threading import local
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
-from flask import Flask, g
+from flask import Flask, g, has_request_context, request
 from sqlalchemy import event
 from sqlalchemy.engine import Engine
 
@@ -29,60 +40,303 @@ _timing = local()
 
 # Configuration
 SLOW_QUERY_THRESHOLD_MS = 500  # Log queries slower than this
+N_PLUS_ONE_THRESHOLD = 10  # Flag a fingerprint run more than this many times per request
+STATS_DUMP_INTERVAL_SECONDS = 300  # Periodic QUERY_STATS log dump
+STATS_DUMP_TOP_N = 20  # Fingerprints per dump, by total time
+MAX_TRACKED_FINGERPRINTS = 2000  # Bound on (endpoint, fingerprint) entries
+FINGERPRINT_CACHE_SIZE = 1024  # Memoized raw statements (the app issues a few hundred)
 
+# Histogram bucket upper bounds (ms); the last bucket is open-ended
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
 
-def setup_query_timing_middleware(app: Flask) -> None:
+NO_ENDPOINT = '<no-request>'
+
+
+# =============================================================================
+# FINGERPRINTING
+# =============================================================================
+
+_COMMENT_RE = re.compile(r'--[^\n]*|/\*.*?\*/', re.DOTALL)
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r'(?<![\w.])-?\d+(?:\.\d+)?(?![\w.])')
+_PARAM_RE = re.compile(r'%\(\w+\)s|%s|(?<![:\w]):\w+|\$\d+|\?')
+_IN_LIST_RE = re.compile(r'\bin\s*\(\s*\?(?:\s*,\s*\?)*\s*\)')
+_VALUES_RE = re.compile(r'\bvalues\s*\(\s*\?(?:\s*,\s*\?)*\s*\)(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))*')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=FINGERPRINT_CACHE_SIZE)
+def fingerprint_sql(statement: str) -> str:
     """
-    Set up query timing middleware on Flask app.
+    Normalize a SQL statement so queries differing only in values match.
 
-    Hooks into SQLAlchemy engine events to time all queries.
-    Injects timing headers into responses.
+    Comments are dropped, string/number literals and bind parameters become
+    ?, IN (...) and multi-row VALUES lists collapse to one placeholder, and
+    whitespace/case are normalized. Memoized on the raw statement: bound
+    statements repeat verbatim, so each is only normalized once.
+
+    >>> fingerprint_sql("SELECT * FROM t WHERE id IN (1, 2, 3) AND name = 'x'")
+    'select * from t where id in (?) and name = ?'
+    """
+    if not statement:
+        return ''
+    sql = _COMMENT_RE.sub(' ', statement)
+    sql = _STRING_RE.sub('?', sql)
+    sql = _PARAM_RE.sub('?', sql)
+    sql = _NUMBER_RE.sub('?', sql)
+    sql = _WHITESPACE_RE.sub(' ', sql).strip().lower()
+    sql = _IN_LIST_RE.sub('in (?)', sql)
+    sql = _VALUES_RE.sub('values (?)', sql)
+    return sql
+
+
+def fingerprint_id(fingerprint: str) -> str:
+    """Short stable id for a fingerprint, used in log lines."""
+    return hashlib.md5(fingerprint.encode('utf-8')).hexdigest()[:12]
+
+
+# =============================================================================
+# STATS REGISTRY
+# =============================================================================
+
+class _FingerprintStats:
+    """Latency histogram and row totals for one endpoint x fingerprint."""
+
+    __slots__ = ('fingerprint', 'count', 'total_ms', 'max_ms', 'rows', 'buckets', 'n_plus_one')
+
+    def __init__(self, fingerprint: str):
+        self.fingerprint = fingerprint
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.n_plus_one = 0
+
+    def record(self, elapsed_ms: float, rows: Optional[int]) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        if rows:
+            self.rows += rows
+        self.buckets[bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th quantile (capped at max)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        running = 0
+        for i, n in enumerate(self.buckets):
+            running += n
+            if running >= rank:
+                if i < len(LATENCY_BUCKETS_MS):
+                    return min(float(LATENCY_BUCKETS_MS[i]), round(self.max_ms, 2))
+                break
+        return round(self.max_ms, 2)
+
+    def to_dict(self) -> dict:
+        return {
+            'fingerprint_id': fingerprint_id(self.fingerprint),
+            'fingerprint': self.fingerprint,
+            'count': self.count,
+            'total_ms': round(self.total_ms, 2),
+            'mean_ms': round(self.total_ms / self.count, 2) if self.count else 0.0,
+            'p50_ms': self.percentile(0.50),
+            'p95_ms': self.percentile(0.95),
+            'p99_ms': self.percentile(0.99),
+            'max_ms': round(self.max_ms, 2),
+            'rows': self.rows,
+            'n_plus_one_requests': self.n_plus_one,
+            'histogram': dict(zip(
+                [f'le_{b}' for b in LATENCY_BUCKETS_MS] + ['gt_' + str(LATENCY_BUCKETS_MS[-1])],
+                self.buckets,
+            )),
+        }
+
+
+_stats: Dict[Tuple[str, str], _FingerprintStats] = {}
+_stats_lock = threading.Lock()
+_stats_meta = {'since': time.time(), 'dropped': 0, 'last_dump': time.monotonic()}
+
+
+def _record_query(endpoint: str, fingerprint: str, elapsed_ms: float, rows: Optional[int]) -> None:
+    key = (endpoint, fingerprint)
+    with _stats_lock:
+        entry = _stats.get(key)
+        if entry is None:
+            if len(_stats) >= MAX_TRACKED_FINGERPRINTS:
+                _stats_meta['dropped'] += 1
+                return
+            entry = _stats[key] = _FingerprintStats(fingerprint)
+        entry.record(elapsed_ms, rows)
+
+
+def _record_n_plus_one(endpoint: str, fingerprint: str) -> None:
+    with _stats_lock:
+        entry = _stats.get((endpoint, fingerprint))
+        if entry is not None:
+            entry.n_plus_one += 1
+
+
+def get_query_stats(endpoint: Optional[str] = None, limit: Optional[int] = None) -> dict:
+    """
+    Snapshot of per endpoint x fingerprint query stats.
 
     Args:
-        app: Flask application instance
+        endpoint: Only include this Flask endpoint (e.g. 'analytics.aggregate')
+        limit: Keep the top N fingerprints by total time
+
+    Returns:
+        dict with since (epoch seconds), dropped count and entries sorted by
+        total_ms descending
     """
+    with _stats_lock:
+        entries = [
+            dict(stats.to_dict(), endpoint=ep)
+            for (ep, _), stats in _stats.items()
+            if endpoint is None or ep == endpoint
+        ]
+        since = _stats_meta['since']
+        dropped = _stats_meta['dropped']
+
+    entries.sort(key=lambda e: e['total_ms'], reverse=True)
+    if limit is not None:
+        entries = entries[:limit]
+
+    return {
+        'since': since,
+        'dropped': dropped,
+        'n_plus_one_threshold': N_PLUS_ONE_THRESHOLD,
+        'entries': entries,
+    }
+
+
+def reset_query_stats() -> None:
+    """Clear all accumulated fingerprint stats."""
+    with _stats_lock:
+        _stats.clear()
+        _stats_meta['since'] = time.time()
+        _stats_meta['dropped'] = 0
 
-    @event.listens_for(Engine, "before_cursor_execute")
-    def before_execute(conn, cursor, statement, parameters, context, executemany):
-        """Record query start time."""
-        context._query_start_time = time.perf_counter()
 
-    @event.listens_for(Engine, "after_cursor_execute")
-    def after_execute(conn, cursor, statement, parameters, context, executemany):
-        """Record query elapsed time and accumulate per-request."""
-        start_time = getattr(context, '_query_start_time', None)
-        if start_time is None:
+def dump_query_stats(limit: int = STATS_DUMP_TOP_N) -> None:
+    """Log the top fingerprints by total time as QUERY_STATS lines."""
+    for entry in get_query_stats(limit=limit)['entries']:
+        logger.info(
+            f"QUERY_STATS endpoint={entry['endpoint']} "
+            f"fingerprint={entry['fingerprint_id']} count={entry['count']} "
+            f"total_ms={entry['total_ms']} p50_ms={entry['p50_ms']} "
+            f"p95_ms={entry['p95_ms']} p99_ms={entry['p99_ms']} "
+            f"rows={entry['rows']} n_plus_one={entry['n_plus_one_requests']} "
+            f"stmt={entry['fingerprint'][:120]}"
+        )
+
+
+def _maybe_dump_stats() -> None:
+    now = time.monotonic()
+    with _stats_lock:
+        if now - _stats_meta['last_dump'] < STATS_DUMP_INTERVAL_SECONDS:
             return
+        _stats_meta['last_dump'] = now
+    dump_query_stats()
 
-        elapsed_ms = (time.perf_counter() - start_time) * 1000
 
-        # Accumulate timing in thread-local storage
-        if not hasattr(_timing, 'queries'):
-            _timing.queries = []
+# =============================================================================
+# ENGINE + REQUEST HOOKS
+# =============================================================================
 
-        _timing.queries.append({
-            'elapsed_ms': round(elapsed_ms, 2),
-            'rows_affected': cursor.rowcount if cursor.rowcount >= 0 else None,
-        })
+def _current_endpoint() -> str:
+    if has_request_context():
+        return request.endpoint or request.path
+    return NO_ENDPOINT
 
-        # Log slow queries (>500ms)
-        if elapsed_ms > SLOW_QUERY_THRESHOLD_MS:
-            request_id = _get_request_id()
-            # Truncate statement for logging (first 80 chars)
-            stmt_preview = (statement[:80] + '...') if statement and len(statement) > 80 else statement
-            logger.warning(
-                f"SLOW_QUERY request_id={request_id} "
-                f"elapsed_ms={elapsed_ms:.2f} stmt={stmt_preview}"
-            )
+
+def _before_execute(conn, cursor, statement, parameters, context, executemany):
+    """Record query start time."""
+    context._query_start_time = time.perf_counter()
+
+
+def _after_execute(conn, cursor, statement, parameters, context, executemany):
+    """Record query elapsed time and accumulate per-request and per-fingerprint."""
+    start_time = getattr(context, '_query_start_time', None)
+    if start_time is None:
+        return
+
+    elapsed_ms = (time.perf_counter() - start_time) * 1000
+    rows = cursor.rowcount if cursor.rowcount >= 0 else None
+    fingerprint = fingerprint_sql(statement)
+
+    # Accumulate timing in thread-local storage
+    if not hasattr(_timing, 'queries'):
+        _timing.queries = []
+    if not hasattr(_timing, 'fingerprints'):
+        _timing.fingerprints = {}
+
+    _timing.queries.append({
+        'elapsed_ms': round(elapsed_ms, 2),
+        'rows_affected': rows,
+    })
+    _timing.fingerprints[fingerprint] = _timing.fingerprints.get(fingerprint, 0) + 1
+
+    _record_query(_current_endpoint(), fingerprint, elapsed_ms, rows)
+
+    # Log slow queries (>500ms)
+    if elapsed_ms > SLOW_QUERY_THRESHOLD_MS:
+        request_id = _get_request_id()
+        # Truncate statement for logging (first 80 chars)
+        stmt_preview = (statement[:80] + '...') if statement and len(statement) > 80 else statement
+        logger.warning(
+            f"SLOW_QUERY request_id={request_id} "
+            f"elapsed_ms={elapsed_ms:.2f} fingerprint={fingerprint_id(fingerprint)} "
+            f"stmt={stmt_preview}"
+        )
+
+
+def _flag_n_plus_one() -> List[dict]:
+    """Log and record fingerprints repeated past N_PLUS_ONE_THRESHOLD this request."""
+    flagged = []
+    fingerprints = getattr(_timing, 'fingerprints', {})
+    endpoint = _current_endpoint()
+    for fingerprint, count in fingerprints.items():
+        if count <= N_PLUS_ONE_THRESHOLD:
+            continue
+        flagged.append({'fingerprint': fingerprint, 'count': count})
+        _record_n_plus_one(endpoint, fingerprint)
+        logger.warning(
+            f"N_PLUS_ONE request_id={_get_request_id()} endpoint={endpoint} "
+            f"fingerprint={fingerprint_id(fingerprint)} count={count} "
+            f"stmt={fingerprint[:120]}"
+        )
+    return flagged
+
+
+def setup_query_timing_middleware(app: Flask) -> None:
+    """
+    Set up query timing middleware on Flask app.
+
+    Hooks into SQLAlchemy engine events to time all queries.
+    Injects timing headers into responses, flags N+1 patterns and
+    periodically logs the fingerprint stats.
+
+    Args:
+        app: Flask application instance
+    """
+    if not event.contains(Engine, "before_cursor_execute", _before_execute):
+        event.listen(Engine, "before_cursor_execute", _before_execute)
+        event.listen(Engine, "after_cursor_execute", _after_execute)
 
     @app.before_request
     def reset_query_timing():
         """Reset query timing at start of each request."""
         _timing.queries = []
+        _timing.fingerprints = {}
 
     @app.after_request
     def inject_timing_headers(response):
         """Add timing headers to response for observability."""
+        _maybe_dump_stats()
+
         queries = getattr(_timing, 'queries', [])
         if not queries:
             return response
@@ -94,6 +348,10 @@ def setup_query_timing_middleware(app: Flask) -> None:
         response.headers['X-DB-Time-Ms'] = str(round(total_db_ms, 2))
         response.headers['X-Query-Count'] = str(query_count)
 
+        flagged = _flag_n_plus_one()
+        if flagged:
+            response.headers['X-N-Plus-One'] = str(len(flagged))
+
         # Log significant DB time for monitoring
         if total_db_ms > 200:
             request_id = _get_request_id()
@@ -107,6 +365,8 @@ def setup_query_timing_middleware(app: Flask) -> None:
 
 def _get_request_id() -> str:
     """Get current request ID from Flask context, or 'no-request-id' if unavailable."""
+    if not has_request_context():
+        return 'no-request-id'
     return getattr(g, 'request_id', 'no-request-id')
 
 
@@ -115,11 +375,13 @@ def get_request_timing() -> dict:
     Get timing data for current request.
 
     Returns:
-        dict with total_db_ms, query_count, and individual query timings
+        dict with total_db_ms, query_count, individual query timings and
+        per-fingerprint execution counts
     """
     queries = getattr(_timing, 'queries', [])
     return {
         'total_db_ms': sum(q['elapsed_ms'] for q in queries),
         'query_count': len(queries),
         'queries': queries,
+        'fingerprints': dict(getattr(_timing, 'fingerprints', {})),
     }
@@ -8,17 +8,105 @@ SaaS Features:
 - User authentication (Firebase-only, Bearer token per-request)
 - Ad serving and tracking
 - Analytics API remains public (no authentication required)
+
+Boot path: every gunicorn worker runs create_app(), so only what /api/health
+needs happens inline. Diagnostics, Firebase pre-init and reports run as
+deferred startup tasks (utils.startup) that gate /api/ready; heavy modules
+(pandas, AI SDK, scrapers, alembic) are imported on first use.
 """
 
 from flask import Flask, jsonify, request
 from flask_cors import CORS
 import os
+import sys
 from config import Config
 from models.database import db
-from flask_migrate import Migrate
+from utils.startup import BootProfile, DeferredStartup
+
+
+def _running_flask_cli() -> bool:
+    """True under the `flask` command (e.g. `flask db upgrade`), not gunicorn."""
+    return os.path.basename(sys.argv[0]) in ('flask', 'flask.exe')
+
+
+def _init_migrate(app):
+    """Flask-Migrate pulls in alembic (~100ms); only the flask CLI needs it."""
+    from flask_migrate import Migrate
+    Migrate().init_app(app, db)
+
+
+def _check_primary_view():
+    """Warn if the transactions_primary view is missing (run migrations)."""
+    from sqlalchemy import text
+
+    view_exists = db.session.execute(text("""
+        SELECT to_regclass('public.transactions_primary') IS NOT NULL
+    """)).scalar()
+    if not view_exists:
+        print("WARNING: transactions_primary view not found. Run migrations to create it.")
 
-# Initialize Flask-Migrate (will be initialized in create_app)
-migrate = Migrate()
+
+def _print_database_info():
+    """Print database connection info for verification (non-critical diagnostic)."""
+    from sqlalchemy import text
+
+    db_info = db.session.execute(text(
+        "SELECT current_database(), inet_server_addr(), inet_server_port()"
+    )).fetchone()
+    print(f"   Database: {db_info[0]} @ {db_info[1] or 'localhost'}:{db_info[2] or 5432}")
+
+
+def _preinit_firebase():
+    """
+    Firebase Admin SDK pre-initialization (~200ms).
+
+    Runs after boot so the first /auth/firebase-sync request does not pay
+    for it, without holding up worker startup.
+    """
+    from routes.auth import get_firebase_app
+    firebase_app = get_firebase_app()
+    if firebase_app:
+        print("   ✓ Firebase Admin SDK initialized")
+    else:
+        print("   ℹ️  Firebase Admin SDK not configured")
+
+
+def _verify_data_checksums():
+    """Checksum verification (~500ms): detect tampering of tracked CSV files."""
+    from utils.data_checksums import verify_all
+    violations = verify_all()
+    if violations:
+        print("   ⚠️  DATA INTEGRITY VIOLATIONS:")
+        for v in violations:
+            print(f"      - {v}")
+        print("      Run: python -c \"from utils.data_checksums import save_checksums; save_checksums()\"")
+    else:
+        print("   ✓ Data checksum verification passed")
+
+
+def _warm_caches():
+    """
+    Background cache warming; each gunicorn worker warms its own _dashboard_cache.
+
+    Replays the recorded hot set (services.cache_warming); the hard-coded
+    common queries are only used before any traffic has been recorded.
+    """
+    from services.cache_warming import warm_hot_keys
+    print("[WARM] Starting background cache warming...")
+    report = warm_hot_keys(reason='startup')
+    if report is None:
+        from services.dashboard_service import warm_cache_for_common_queries, warm_kpi_cache
+        print("[WARM] No recorded hot set yet; warming default queries")
+        warm_cache_for_common_queries()
+        warm_kpi_cache()
+    print("[WARM] Background cache warming complete")
+
+
+def _register_post_sync_warming(app):
+    """Replay the hot set when the dataset catalog sees new data (sync/upload)."""
+    from services.cache_warming import schedule_cache_warming
+    from services.dataset_catalog import on_dataset_change
+    on_dataset_change(lambda: schedule_cache_warming(app, 'data_changed'))
 
 
 def _run_startup_validation():
@@ -65,11 +153,66 @@ def _run_startup_validation():
         # Don't fail startup if validation fails
 
 
+def _register_blueprints(app):
+    """Register all API blueprints (route modules import their heavy deps lazily)."""
+    # Analytics routes (PUBLIC - no authentication required)
+    from routes.analytics import analytics_bp
+    app.register_blueprint(analytics_bp, url_prefix='/api')
+
+    # Auth routes (Firebase-only authentication)
+    from routes.auth import auth_bp
+    app.register_blueprint(auth_bp, url_prefix='/api/auth')
+
+    # GLS (Government Land Sales) routes
+    from routes.gls import gls_bp
+    app.register_blueprint(gls_bp, url_prefix='/api/gls')
+
+    # Upcoming Launches (pre-launch condo projects) routes
+    from routes.upcoming_launches import upcoming_launches_bp
+    app.register_blueprint(upcoming_launches_bp, url_prefix='/api/upcoming-launches')
+
+    # Projects routes (school proximity, geocoding)
+    from routes.projects import projects_bp
+    app.register_blueprint(projects_bp, url_prefix='/api')
+
+    # Deal Checker routes (nearby transactions, price comparison)
+    from routes.deal_checker import deal_checker_bp
+    app.register_blueprint(deal_checker_bp, url_prefix='/api')
+
+    # Insights routes (Visual Analytics Map, market intelligence)
+    from routes.insights import insights_bp
+    app.register_blueprint(insights_bp, url_prefix='/api/insights')
+
+    # AI routes (Chart interpretation)
+    from routes.ai import ai_bp
+    app.register_blueprint(ai_bp, url_prefix='/api/ai')
+    print("   ✓ AI routes registered")
+
+    # HDB Resale routes (external data.gov.sg proxy - public)
+    from routes.hdb import hdb_bp
+    app.register_blueprint(hdb_bp, url_prefix='/api/hdb')
+    print("   ✓ HDB routes registered")
+
+    # Supply Pipeline routes (waterfall chart data)
+    try:
+        from routes.supply import supply_bp
+        app.register_blueprint(supply_bp, url_prefix='/api/supply')
+        print("   ✓ Supply routes registered")
+    except Exception as e:
+        print(f"   ⚠️ Failed to register supply routes: {e}")
+        import traceback
+        traceback.print_exc()
+
+
 def create_app():
+    boot = BootProfile()
     app = Flask(__name__)
     app.config.from_object(Config)
 
     is_test = os.getenv("PYTEST_CURRENT_TEST") is not None
+    deferred = DeferredStartup(app)
+    app.extensions['boot_profile'] = boot
+    app.extensions['deferred_startup'] = deferred
 
     # Initialize CORS
     # Note: Flask-CORS handles all CORS headers automatically, no after_request needed
@@ -112,17 +255,18 @@ def create_app():
         )
 
     # === API CONTRACT MIDDLEWARE ===
-    # Request ID injection for request correlation and debugging
-    from api.middleware import setup_request_id_middleware
-    setup_request_id_middleware(app)
+    with boot.phase('middleware'):
+        # Request ID injection for request correlation and debugging
+        from api.middleware import setup_request_id_middleware
+        setup_request_id_middleware(app)
 
-    # Query timing instrumentation (production-safe, no EXPLAIN)
-    from api.middleware import setup_query_timing_middleware
-    setup_query_timing_middleware(app)
+        # Query timing instrumentation (production-safe, no EXPLAIN)
+        from api.middleware import setup_query_timing_middleware
+        setup_query_timing_middleware(app)
 
-    # Request usage logging (sampling + watchlist)
-    from api.middleware import setup_request_logging_middleware
-    setup_request_logging_middleware(app)
+        # Request usage logging (sampling + watchlist)
+        from api.middleware import setup_request_logging_middleware
+        setup_request_logging_middleware(app)
 
     @app.route("/api/csp-report", methods=["POST"])
     def csp_report():
@@ -136,11 +280,12 @@ def create_app():
         return ("", 204)
 
     # Load contract schemas (registers contracts on import)
-    try:
-        from api.contracts import schemas  # noqa: F401
-        print("   ✓ API contracts loaded")
-    except ImportError as e:
-        print(f"   ⚠️  API contracts not loaded: {e}")
+    with boot.phase('contracts'):
+        try:
+            from api.contracts import schemas  # noqa: F401
+            print("   ✓ API contracts loaded")
+        except ImportError as e:
+            print(f"   ⚠️  API contracts not loaded: {e}")
 
     # Global error handlers to ensure CORS headers are present on error responses
     from werkzeug.exceptions import HTTPException
@@ -302,28 +447,22 @@ def create_app():
     # Initialize SQLAlchemy
     db.init_app(app)
 
-    # Fail-fast check: ensure transactions_primary view exists
-    with app.app_context():
-        try:
-            view_exists = db.session.execute(text("""
-                SELECT to_regclass('public.transactions_primary') IS NOT NULL
-            """)).scalar()
-            if not view_exists:
-                print("WARNING: transactions_primary view not found. Run migrations to create it.")
-        except Exception as e:
-            print(f"WARNING: Unable to verify transactions_primary view: {e}")
+    # transactions_primary view check runs deferred (gates /api/ready)
+    deferred.add('primary_view_check', _check_primary_view)
 
-    # Initialize Flask-Migrate for database migrations
-    migrate.init_app(app, db)
+    # Flask-Migrate only for `flask db ...` (SQL migrations run via scripts.run_migrations)
+    if _running_flask_cli():
+        _init_migrate(app)
 
     # Initialize rate limiter for URA compliance (prevents bulk data extraction)
-    from utils.rate_limiter import init_limiter
-    limiter = init_limiter(app)
-    app.limiter = limiter  # Store for route access
-    print("   ✓ Rate limiter initialized")
+    with boot.phase('rate_limiter'):
+        from utils.rate_limiter import init_limiter
+        limiter = init_limiter(app)
+        app.limiter = limiter  # Store for route access
+        print("   ✓ Rate limiter initialized")
 
     # Create database tables and run auto-validation
-    with app.app_context():
+    with boot.phase('database'), app.app_context():
         # Import all models before create_all to ensure tables are created
         from models.transaction import Transaction
         from models.gls_tender import GLSTender
@@ -341,15 +480,8 @@ def create_app():
         else:
             print("✓ Database ready (schema creation disabled in non-dev environments)")
 
-        # Print database connection info for verification
-        try:
-            from sqlalchemy import text
-            db_info = db.session.execute(text(
-                "SELECT current_database(), inet_server_addr(), inet_server_port()"
-            )).fetchone()
-            print(f"   Database: {db_info[0]} @ {db_info[1] or 'localhost'}:{db_info[2] or 5432}")
-        except Exception:
-            pass  # Non-critical diagnostic
+        # Print database connection info for verification (deferred, non-critical)
+        deferred.add('database_info', _print_database_info)
 
         # === STARTUP VALIDATION CHECKS ===
         # Gate behind RUN_STARTUP_CHECKS env var (default: off in production)
@@ -412,9 +544,8 @@ def create_app():
                 # Other errors (e.g., can't connect to check schema) - warn but continue
                 print(f"   ⚠️  Schema check skipped: {e}")
 
-            # Auto-validate data on startup (READ-ONLY, ~100ms)
-            # This runs inside create_app() so it works with gunicorn
-            _run_startup_validation()
+            # Validation report (READ-ONLY, informational) runs deferred
+            deferred.add('validation_report', _run_startup_validation)
         else:
             print("   ⏭️  Startup checks disabled (set RUN_STARTUP_CHECKS=1 to enable)")
 
@@ -426,85 +557,19 @@ def create_app():
         #    background thread (see bottom of create_app). Now on standard plan
         #    (always-on), so warmed caches persist between requests.
         # 3. data_guard subprocess — moved to CI/CD pipeline
+        # 4. Firebase pre-init, diagnostics, validation report and checksum
+        #    verification — deferred startup tasks gating /api/ready
         # =======================================================================
 
-        # Firebase Admin SDK pre-initialization (~200ms, non-blocking)
-        # This prevents 502 timeouts on cold starts by initializing Firebase
-        # during app startup instead of on first /auth/firebase-sync request
-        try:
-            from routes.auth import get_firebase_app
-            firebase_app = get_firebase_app()
-            if firebase_app:
-                print("   ✓ Firebase Admin SDK initialized")
-            else:
-                print("   ℹ️  Firebase Admin SDK not configured")
-        except Exception as e:
-            print(f"   ⚠️  Firebase pre-init skipped: {e}")
+        deferred.add('firebase_preinit', _preinit_firebase)
 
-        # Checksum verification (~500ms): Detect tampering of tracked CSV files
-        # Gated behind RUN_STARTUP_CHECKS (adds startup time, better in cron job)
+        # Checksum verification gated behind RUN_STARTUP_CHECKS (better in cron job)
         if run_checks:
-            try:
-                from utils.data_checksums import verify_all
-                violations = verify_all()
-                if violations:
-                    print("   ⚠️  DATA INTEGRITY VIOLATIONS:")
-                    for v in violations:
-                        print(f"      - {v}")
-                    print("      Run: python -c \"from utils.data_checksums import save_checksums; save_checksums()\"")
-                else:
-                    print("   ✓ Data checksum verification passed")
-            except Exception as e:
-                print(f"   ⚠️  Checksum verification skipped: {e}")
+            deferred.add('data_checksums', _verify_data_checksums)
 
     # Register routes
-    # Analytics routes (PUBLIC - no authentication required)
-    from routes.analytics import analytics_bp
-    app.register_blueprint(analytics_bp, url_prefix='/api')
-
-    # Auth routes (Firebase-only authentication)
-    from routes.auth import auth_bp
-    app.register_blueprint(auth_bp, url_prefix='/api/auth')
-
-    # GLS (Government Land Sales) routes
-    from routes.gls import gls_bp
-    app.register_blueprint(gls_bp, url_prefix='/api/gls')
-
-    # Upcoming Launches (pre-launch condo projects) routes
-    from routes.upcoming_launches import upcoming_launches_bp
-    app.register_blueprint(upcoming_launches_bp, url_prefix='/api/upcoming-launches')
-
-    # Projects routes (school proximity, geocoding)
-    from routes.projects import projects_bp
-    app.register_blueprint(projects_bp, url_prefix='/api')
-
-    # Deal Checker routes (nearby transactions, price comparison)
-    from routes.deal_checker import deal_checker_bp
-    app.register_blueprint(deal_checker_bp, url_prefix='/api')
-
-    # Insights routes (Visual Analytics Map, market intelligence)
-    from routes.insights import insights_bp
-    app.register_blueprint(insights_bp, url_prefix='/api/insights')
-
-    # AI routes (Chart interpretation)
-    from routes.ai import ai_bp
-    app.register_blueprint(ai_bp, url_prefix='/api/ai')
-    print("   ✓ AI routes registered")
-
-    # HDB Resale routes (external data.gov.sg proxy - public)
-    from routes.hdb import hdb_bp
-    app.register_blueprint(hdb_bp, url_prefix='/api/hdb')
-    print("   ✓ HDB routes registered")
-
-    # Supply Pipeline routes (waterfall chart data)
-    try:
-        from routes.supply import supply_bp
-        app.register_blueprint(supply_bp, url_prefix='/api/supply')
-        print("   ✓ Supply routes registered")
-    except Exception as e:
-        print(f"   ⚠️ Failed to register supply routes: {e}")
-        import traceback
-        traceback.print_exc()
+    with boot.phase('blueprints'):
+        _register_blueprints(app)
 
     # Note: Verification is handled by backend/scripts/verify_units.py (one-off CLI)
     # No API routes needed - run: python scripts/verify_units.py --project "PROJECT" --dry-run
@@ -538,28 +603,17 @@ def create_app():
                 "error": str(e)
             })
 
-    # Background cache warming (non-blocking)
+    # Background cache warming (non-blocking, does not gate readiness)
     # Standard plan = always-on, so warmed caches persist between requests.
-    # Each gunicorn worker spawns its own thread, warming its own _dashboard_cache.
-    # Runs after all blueprints are registered so the app can serve /api/health
-    # immediately while warming proceeds in the background.
     if os.getenv('FLASK_ENV') == 'production':
-        import threading
+        deferred.add('cache_warming', _warm_caches, gates_ready=False)
+        _register_post_sync_warming(app)
 
-        def _warm_caches():
-            with app.app_context():
-                try:
-                    from services.dashboard_service import (
-                        warm_cache_for_common_queries, warm_kpi_cache
-                    )
-                    print("[WARM] Starting background cache warming...")
-                    warm_cache_for_common_queries()
-                    warm_kpi_cache()
-                    print("[WARM] Background cache warming complete")
-                except Exception as e:
-                    print(f"[WARM] Cache warming failed (non-fatal): {e}")
-
-        threading.Thread(target=_warm_caches, daemon=True).start()
+    boot.finish()
+
+    # Deferred tasks start once all blueprints are registered, so the app can
+    # serve /api/health immediately. Tests run them inline for determinism.
+    deferred.start(background=not is_test)
 
     return app
 
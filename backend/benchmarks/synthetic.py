@@ -0,0 +1,324 @@
+"""
+Deterministic synthetic URA-like transaction dataset.
+
+Same (scale, seed) always yields the same rows, so benchmark runs on
+different machines or commits hit identical data. Distributions follow the
+real dataset's shape closely enough to exercise the same plans:
+
+- Districts: OCR-heavy (about 55% OCR / 30% RCR / 15% CCR of volume)
+- Bedrooms: 1-5 with 2/3BR dominant; area drawn per bedroom type
+- PSF: per-project base by region, ~5%/year growth, floor premium,
+  lognormal noise; ~0.5% flagged outliers with extreme prices
+- Sale type: New Sale in the months after launch, Resale from TOP onwards
+
+Loading goes through the repo's migrations (scripts.run_migrations) and a
+COPY into transactions, then the same refresh hooks the URA sync runs so
+derived tables (project keys, price growth, snapshots) are populated.
+
+Usage:
+    from benchmarks.synthetic import SCALES, load_dataset
+
+    load_dataset(database_url, rows=SCALES['100k'], seed=42)
+"""
+
+import csv
+import io
+import logging
+import os
+from contextlib import contextmanager
+from datetime import date, timedelta
+from typing import Dict, Iterator, List
+
+import numpy as np
+
+from constants import CCR_DISTRICTS, OCR_DISTRICTS, RCR_DISTRICTS, SALE_TYPE_NEW, SALE_TYPE_RESALE
+from services.classifier_extended import classify_floor_level
+
+logger = logging.getLogger(__name__)
+
+SCALES = {
+    '100k': 100_000,
+    '1m': 1_000_000,
+    '5m': 5_000_000,
+}
+
+DEFAULT_SEED = 42
+CHUNK_ROWS = 200_000
+ROWS_PER_PROJECT = 400
+PROJECT_NAME_PREFIX = 'SYNTH'
+
+DATE_START = date(2019, 1, 1)
+DATE_END = date(2025, 12, 31)
+ANNUAL_GROWTH = 0.05
+OUTLIER_RATE = 0.005
+RESALE_SHARE = 0.8  # of sales after TOP
+
+REGION_SHARE = {'CCR': 0.15, 'RCR': 0.30, 'OCR': 0.55}
+REGION_BASE_PSF = {'CCR': 2600.0, 'RCR': 2000.0, 'OCR': 1500.0}
+REGION_DISTRICTS = {'CCR': CCR_DISTRICTS, 'RCR': RCR_DISTRICTS, 'OCR': OCR_DISTRICTS}
+
+BEDROOM_SHARE = {1: 0.14, 2: 0.30, 3: 0.34, 4: 0.15, 5: 0.07}
+BEDROOM_MEDIAN_SQFT = {1: 500, 2: 720, 3: 1020, 4: 1400, 5: 1950}
+
+FLOOR_BANDS = [(low, low + 4) for low in range(1, 50, 5)]
+
+TRANSACTION_COLUMNS = [
+    'project_name', 'transaction_date', 'contract_date', 'price', 'area_sqft', 'psf',
+    'district', 'bedroom_count', 'property_type', 'sale_type', 'tenure',
+    'lease_start_year', 'street_name', 'floor_range', 'floor_level', 'num_units',
+    'type_of_area', 'market_segment', 'is_outlier', 'source',
+]
+
+PROJECT_LOCATION_COLUMNS = [
+    'project_name', 'district', 'market_segment', 'latitude', 'longitude', 'geocode_status',
+    'geocode_source',
+]
+
+
+def generate_projects(rows: int, seed: int = DEFAULT_SEED) -> List[Dict]:
+    """
+    Generate the project dimension for a dataset of `rows` transactions.
+
+    Returns:
+        List of dicts: name, district, region, base_psf, launch_date, tenure,
+        lease_start_year, latitude, longitude, max_floor
+    """
+    rng = np.random.default_rng(seed)
+    n_projects = max(50, rows // ROWS_PER_PROJECT)
+    regions = list(REGION_SHARE)
+    region_idx = rng.choice(len(regions), size=n_projects, p=list(REGION_SHARE.values()))
+
+    total_days = (DATE_END - DATE_START).days
+    projects = []
+    for i in range(n_projects):
+        region = regions[region_idx[i]]
+        districts = REGION_DISTRICTS[region]
+        district = districts[int(rng.integers(len(districts)))]
+        district_no = int(district[1:])
+        freehold = rng.random() < (0.45 if region == 'CCR' else 0.2)
+        launch_date = DATE_START + timedelta(days=int(rng.integers(-6 * 365, total_days - 180)))
+        lease_start = launch_date.year - 1
+        projects.append({
+            'name': f'{PROJECT_NAME_PREFIX} {district} RESIDENCES {i:05d}',
+            'district': district,
+            'region': region,
+            'base_psf': float(REGION_BASE_PSF[region] * rng.lognormal(0.0, 0.15)),
+            'launch_date': launch_date,
+            'tenure': 'Freehold' if freehold else f'99 yrs lease commencing from {lease_start}',
+            'lease_start_year': None if freehold else lease_start,
+            # Districts laid out on a rough grid across the island
+            'latitude': round(1.27 + (district_no % 7) * 0.025 + float(rng.normal(0, 0.006)), 7),
+            'longitude': round(103.70 + (district_no // 7) * 0.06 + float(rng.normal(0, 0.006)), 7),
+            'max_floor': int(rng.choice([10, 15, 25, 35, 45])),
+        })
+    return projects
+
+
+def generate_transactions(rows: int, seed: int = DEFAULT_SEED) -> Iterator[List[tuple]]:
+    """
+    Yield chunks of transaction tuples in TRANSACTION_COLUMNS order.
+
+    Deterministic for a given (rows, seed).
+    """
+    projects = generate_projects(rows, seed)
+    rng = np.random.default_rng(seed + 1)
+
+    n_projects = len(projects)
+    # Bigger projects sell more units: skew volume with a lognormal weight
+    weights = rng.lognormal(0.0, 0.6, size=n_projects)
+    weights /= weights.sum()
+
+    base_psf = np.array([p['base_psf'] for p in projects])
+    launch_ordinal = np.array([p['launch_date'].toordinal() for p in projects])
+    max_floor = np.array([p['max_floor'] for p in projects])
+    bedrooms = np.array(list(BEDROOM_SHARE))
+    bedroom_p = np.array(list(BEDROOM_SHARE.values()))
+    median_sqft = np.array([BEDROOM_MEDIAN_SQFT[b] for b in bedrooms])
+    floor_labels = {band: classify_floor_level(f'{band[0]:02d} to {band[1]:02d}') for band in FLOOR_BANDS}
+
+    start_ordinal = DATE_START.toordinal()
+    end_ordinal = DATE_END.toordinal()
+
+    emitted = 0
+    while emitted < rows:
+        n = min(CHUNK_ROWS, rows - emitted)
+
+        proj = rng.choice(n_projects, size=n, p=weights)
+        bed_idx = rng.choice(len(bedrooms), size=n, p=bedroom_p)
+        # New sales cluster in the months after launch; resales land anywhere
+        # in the window once the project has TOPed (launch + 3 years), or
+        # anywhere for projects launched before the window
+        launch = launch_ordinal[proj]
+        new_span = np.maximum(end_ordinal - launch, 1)
+        new_ordinal = launch + rng.exponential(300.0, size=n).astype(int) % new_span
+        resale_ordinal = start_ordinal + (rng.random(size=n) * (end_ordinal - start_ordinal)).astype(int)
+        is_resale = (
+            ((rng.random(size=n) < RESALE_SHARE) & (resale_ordinal >= launch + 3 * 365))
+            | (new_ordinal < start_ordinal)  # launched before the window
+        )
+        ordinal = np.where(is_resale, resale_ordinal, np.clip(new_ordinal, start_ordinal, end_ordinal))
+        area = np.round(median_sqft[bed_idx] * rng.lognormal(0.0, 0.12, size=n))
+        floor = np.minimum(rng.integers(1, 50, size=n), max_floor[proj])
+        years = (ordinal - start_ordinal) / 365.25
+        psf = (
+            base_psf[proj]
+            * (1 + ANNUAL_GROWTH) ** years
+            * (1 + 0.004 * floor)
+            * rng.lognormal(0.0, 0.08, size=n)
+        )
+        outlier = rng.random(size=n) < OUTLIER_RATE
+        psf = np.where(outlier, psf * rng.choice([0.3, 4.0], size=n), psf)
+
+        chunk = []
+        for i in range(n):
+            project = projects[proj[i]]
+            tx_date = date.fromordinal(int(ordinal[i]))
+            band_low = ((int(floor[i]) - 1) // 5) * 5 + 1
+            band = (band_low, band_low + 4)
+            row_psf = round(float(psf[i]), 2)
+            row_area = float(area[i])
+            chunk.append((
+                project['name'],
+                tx_date,
+                tx_date.strftime('%m%y'),
+                round(row_psf * row_area),
+                row_area,
+                row_psf,
+                project['district'],
+                int(bedrooms[bed_idx[i]]),
+                'Condominium',
+                SALE_TYPE_RESALE if is_resale[i] else SALE_TYPE_NEW,
+                project['tenure'],
+                project['lease_start_year'],
+                f"{project['name'].split(' RESIDENCES ')[0]} STREET {proj[i] % 97}",
+                f'{band[0]:02d} to {band[1]:02d}',
+                floor_labels[band],
+                1,
+                'Strata',
+                project['region'],
+                bool(outlier[i]),
+                'ura_api',
+            ))
+        emitted += n
+        yield chunk
+
+
+def _copy_rows(cursor, table: str, columns: List[str], rows: List[tuple]) -> None:
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for row in rows:
+        writer.writerow(['' if v is None else v for v in row])
+    buf.seek(0)
+    cursor.copy_expert(
+        f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, NULL '')",
+        buf,
+    )
+
+
+@contextmanager
+def _database_env(database_url: str, *names: str):
+    """Point the given DATABASE_URL* variables at database_url for the block."""
+    previous = {name: os.environ.get(name) for name in names}
+    os.environ.update({name: database_url for name in names})
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def apply_migrations(database_url: str) -> None:
+    """Bring the benchmark database to the current schema with the repo's runner."""
+    from scripts import run_migrations
+
+    with _database_env(database_url, 'DATABASE_URL_MIGRATIONS'):
+        run_migrations.main()
+
+
+def load_dataset(database_url: str, rows: int, seed: int = DEFAULT_SEED) -> Dict[str, int]:
+    """
+    Replace the benchmark database's transactions with a synthetic dataset.
+
+    Refuses to touch a database holding non-synthetic transactions.
+
+    Returns:
+        dict with transactions and projects loaded
+    """
+    from db.engine import dispose_engines, get_engine
+
+    apply_migrations(database_url)
+
+    # Job engine from the canonical factory, pointed at the benchmark database
+    dispose_engines()
+    with _database_env(database_url, 'DATABASE_URL', 'DATABASE_URL_CRON'):
+        try:
+            return _load(get_engine('job'), rows, seed)
+        finally:
+            dispose_engines()
+
+
+def _load(engine, rows: int, seed: int) -> Dict[str, int]:
+    """Truncate, COPY the synthetic rows and run the refresh hooks."""
+    from sqlalchemy import text
+
+    with engine.begin() as conn:
+        foreign = conn.execute(text(
+            "SELECT COUNT(*) FROM transactions WHERE project_name NOT LIKE :prefix"
+        ), {'prefix': f'{PROJECT_NAME_PREFIX} %'}).scalar()
+        if foreign:
+            raise RuntimeError(
+                f"Refusing to load: {foreign} non-synthetic transactions in target database"
+            )
+        conn.execute(text("TRUNCATE transactions RESTART IDENTITY"))
+        conn.execute(text("DELETE FROM project_locations WHERE project_name LIKE :prefix"),
+                     {'prefix': f'{PROJECT_NAME_PREFIX} %'})
+
+    projects = generate_projects(rows, seed)
+    raw = engine.raw_connection()
+    try:
+        cursor = raw.cursor()
+        _copy_rows(cursor, 'project_locations', PROJECT_LOCATION_COLUMNS, [
+            (p['name'], p['district'], p['region'], p['latitude'], p['longitude'], 'success', 'synthetic')
+            for p in projects
+        ])
+        loaded = 0
+        for chunk in generate_transactions(rows, seed):
+            _copy_rows(cursor, 'transactions', TRANSACTION_COLUMNS, chunk)
+            loaded += len(chunk)
+            logger.info(f"Loaded {loaded:,}/{rows:,} synthetic transactions")
+        raw.commit()
+        cursor.close()
+    finally:
+        raw.close()
+
+    _refresh_derived(engine)
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE transactions"))
+
+    return {'transactions': loaded, 'projects': len(projects)}
+
+
+def _refresh_derived(engine) -> None:
+    """Run the post-sync refresh hooks so derived tables match the new rows."""
+    from data_health.core import sync_transaction_project_keys
+    from services.launch_dimension_service import refresh_launch_dimension_for_engine
+    from services.price_growth_service import refresh_price_growth_columns
+    from services.hot_projects_snapshot_service import refresh_hot_projects_snapshot
+    from services.project_snapshot_service import refresh_project_snapshots
+    from services.supply_snapshot_service import refresh_supply_snapshots
+    from sqlalchemy.orm import sessionmaker
+
+    session = sessionmaker(bind=engine)()
+    try:
+        sync_transaction_project_keys(session)
+        refresh_price_growth_columns(session)
+        session.commit()
+        refresh_project_snapshots(engine)
+        refresh_launch_dimension_for_engine(engine)
+        refresh_supply_snapshots(session, 'transactions')
+        refresh_hot_projects_snapshot(engine)
+    finally:
+        session.close()
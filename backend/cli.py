@@ -5,11 +5,13 @@ CLI for Ingestion Orchestrator
 Commands:
     csv-diff    - Compare CSV file against database and show diff report
     csv-upload  - Upload CSV with diff detection and optional promotion
+    startup-profile - Import-time and create_app phase breakdown of worker boot
 
 Usage:
     python cli.py csv-diff upcoming_launches data/upcoming_launches.csv
     python cli.py csv-diff new_launch_units data/new_launch_units.csv
     python cli.py csv-upload upcoming_launches data/upcoming_launches.csv --promote
+    python cli.py startup-profile --budget-ms 1500
 
 Examples:
     # Show diff only (dry run)
@@ -316,5 +318,66 @@ def scrape_diff(scraper_name, year, limit, promote, force, verbose):
             click.echo(f"  Total:    {stats.get('promoted', 0)}")
 
 
+@cli.command("startup-profile")
+@click.option("--top", default=15, show_default=True, help="Rows per table")
+@click.option("--statement", default=None, help="Python statement to profile (default: import app)")
+@click.option("--budget-ms", type=float, default=None,
+              help="Fail if total import time exceeds this budget")
+@click.option("--json", "output_json", is_flag=True, help="Output as JSON")
+def startup_profile(top, statement, budget_ms, output_json):
+    """
+    Profile worker boot: `python -X importtime` breakdown plus create_app phases.
+
+    Runs in a fresh interpreter so nothing is pre-imported. Exits non-zero if
+    the import budget is exceeded or a heavy module (pandas, AI SDK, ...)
+    loads during boot.
+    """
+    from utils.startup import DEFAULT_PROFILE_STATEMENT, profile_imports
+
+    summary = profile_imports(statement or DEFAULT_PROFILE_STATEMENT)
+
+    failures = []
+    if budget_ms is not None and summary["total_ms"] > budget_ms:
+        failures.append(f"import time {summary['total_ms']}ms exceeds budget {budget_ms}ms")
+    if summary["heavy_modules_loaded"]:
+        failures.append(f"heavy modules loaded at boot: {', '.join(summary['heavy_modules_loaded'])}")
+
+    if output_json:
+        click.echo(json.dumps(dict(summary, failures=failures), indent=2))
+        sys.exit(1 if failures else 0)
+
+    click.echo("=" * 60)
+    click.secho("STARTUP PROFILE", fg="cyan", bold=True)
+    click.echo("=" * 60)
+    click.echo(f"Modules imported: {summary['modules']}")
+    click.echo(f"Total import time: {summary['total_ms']}ms")
+    if summary["returncode"]:
+        click.secho(f"Boot failed (imports up to the failure shown): {summary.get('error')}", fg="yellow")
+    click.echo()
+
+    click.secho("Slowest packages (self time)", bold=True)
+    for row in summary["top_packages"][:top]:
+        click.echo(f"  {row['self_ms']:>8.1f}ms  {row['package']}")
+    click.echo()
+
+    click.secho("Slowest imports (cumulative)", bold=True)
+    for row in summary["top_cumulative"][:top]:
+        click.echo(f"  {row['cumulative_ms']:>8.1f}ms  {row['module']}")
+    click.echo()
+
+    boot = summary.get("boot")
+    if boot:
+        click.secho(f"create_app phases (total {boot['total_ms']}ms, target {boot['target_ms']}ms)", bold=True)
+        for phase in boot["phases"]:
+            click.echo(f"  {phase['elapsed_ms']:>8.1f}ms  {phase['name']}")
+        click.echo()
+
+    if failures:
+        for failure in failures:
+            click.secho(f"  FAIL: {failure}", fg="red", bold=True)
+        sys.exit(1)
+    click.secho("  Within startup budget", fg="green", bold=True)
+
+
 if __name__ == "__main__":
     cli()
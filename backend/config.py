@@ -103,6 +103,13 @@ class Config:
     CSV_FOLDER = os.getenv('CSV_FOLDER', 'rawdata')
     DEBUG = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
 
+    # Adaptive cache warming (services/cache_warming.py): replay the top-N
+    # recorded requests within a time and DB connection budget
+    CACHE_WARM_TOP_N = int(os.getenv('CACHE_WARM_TOP_N', '50'))
+    CACHE_WARM_TIME_BUDGET_SECONDS = int(os.getenv('CACHE_WARM_TIME_BUDGET_SECONDS', '120'))
+    CACHE_WARM_MAX_CONNECTIONS = int(os.getenv('CACHE_WARM_MAX_CONNECTIONS', '2'))
+    CACHE_WARM_STATE_PATH = os.getenv('CACHE_WARM_STATE_PATH')  # default: temp dir
+
     # Security headers (Flask-Talisman)
     SECURITY_HEADERS_ENABLED = os.getenv('SECURITY_HEADERS_ENABLED', 'true').lower() in ('1', 'true', 'yes')
     SECURITY_HEADERS_REPORT_ONLY = os.getenv('SECURITY_HEADERS_REPORT_ONLY', 'false').lower() in ('1', 'true', 'yes')
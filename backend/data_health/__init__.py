@@ -33,6 +33,7 @@ from data_health.core import (
     get_all_projects,
     bulk_upsert_from_csv,
     bulk_upsert_from_transactions,
+    sync_transaction_project_keys,
 )
 
 from data_health.checks import (
@@ -61,6 +62,7 @@ __all__ = [
     'get_all_projects',
     'bulk_upsert_from_csv',
     'bulk_upsert_from_transactions',
+    'sync_transaction_project_keys',
     # Checks - types
     'IssueType',
     'Severity',
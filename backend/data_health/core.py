@@ -21,126 +21,14 @@ Examples:
     "  NORMANTON   PARK  "  -> "NORMANTON PARK"     -> "normanton-park"
 """
 
-import re
 import logging
 from typing import Optional, Dict, Any, List
 
-logger = logging.getLogger('data_health.core')
-
-
-# =============================================================================
-# NAME NORMALIZATION
-# =============================================================================
-
-def normalize_name(raw: str) -> str:
-    """
-    Canonicalize project name to a normalized, human-readable form.
-
-    Transformations applied:
-    1. Uppercase
-    2. Collapse whitespace
-    3. "@" -> " AT "
-    4. Remove leading "THE "
-    5. Remove punctuation (keeps alphanumeric + spaces)
-    6. Final whitespace collapse
-
-    Args:
-        raw: Original project name (any casing, with punctuation)
-
-    Returns:
-        Normalized name (uppercase, no punctuation, human-readable)
-
-    Examples:
-        >>> normalize_name("THE SAIL @ MARINA BAY")
-        'SAIL AT MARINA BAY'
-        >>> normalize_name("D'LEEDON")
-        'DLEEDON'
-        >>> normalize_name("8@BT")
-        '8 AT BT'
-    """
-    if not raw:
-        return ''
-
-    s = raw.upper().strip()
-
-    # Collapse whitespace
-    s = re.sub(r'\s+', ' ', s)
-
-    # @ -> AT (with spaces)
-    s = re.sub(r'@', ' AT ', s)
-
-    # Remove leading "THE " (common in Singapore condo names)
-    s = re.sub(r'^THE\s+', '', s)
-
-    # Remove punctuation (keep alphanumeric and spaces)
-    # This handles: apostrophes (D'LEEDON), hyphens, periods, etc.
-    s = re.sub(r'[^\w\s]', '', s)
-
-    # Final whitespace collapse and strip
-    s = re.sub(r'\s+', ' ', s).strip()
-
-    return s
-
-
-def slugify(text: str) -> str:
-    """
-    Convert text to URL-safe slug (lowercase, hyphens instead of spaces).
-
-    Args:
-        text: Input text (typically already normalized)
-
-    Returns:
-        Lowercase slug with hyphens
-
-    Examples:
-        >>> slugify("SAIL AT MARINA BAY")
-        'sail-at-marina-bay'
-        >>> slugify("DLEEDON")
-        'dleedon'
-    """
-    if not text:
-        return ''
+# Name normalization lives in utils.project_name (precompiled + memoized)
+# and is re-exported here for existing callers.
+from utils.project_name import normalize_name, project_key, slugify
 
-    # Lowercase
-    s = text.lower()
-
-    # Replace spaces with hyphens
-    s = re.sub(r'\s+', '-', s)
-
-    # Remove any remaining non-alphanumeric except hyphens
-    s = re.sub(r'[^a-z0-9-]', '', s)
-
-    # Collapse multiple hyphens
-    s = re.sub(r'-+', '-', s)
-
-    # Strip leading/trailing hyphens
-    s = s.strip('-')
-
-    return s
-
-
-def project_key(raw: str) -> str:
-    """
-    Generate stable lookup key for a project name.
-
-    This is the canonical identifier used in the project_units table.
-    Two project names that should match will produce the same key.
-
-    Args:
-        raw: Original project name (any format)
-
-    Returns:
-        Slugified key for database lookup
-
-    Examples:
-        >>> project_key("THE SAIL @ MARINA BAY")
-        'sail-at-marina-bay'
-        >>> project_key("The Sail at Marina Bay")
-        'sail-at-marina-bay'
-        >>> project_key("D'LEEDON")
-        'dleedon'
-    """
-    return slugify(normalize_name(raw))
+logger = logging.getLogger('data_health.core')
 
 
 # =============================================================================
@@ -404,6 +292,52 @@ def bulk_upsert_from_csv(csv_path: str, dry_run: bool = False) -> Dict[str, Any]
     return stats
 
 
+def sync_transaction_project_keys(db_session, commit: bool = True) -> int:
+    """
+    Fill transactions.project_key for rows that don't have one yet.
+
+    Keys are computed in Python (project_key) once per distinct name, then
+    written back with a single set-based UPDATE. Only NULL keys are touched,
+    so this is cheap to call after every ingest.
+
+    Args:
+        db_session: SQLAlchemy session
+        commit: Commit after updating (set False inside a larger transaction)
+
+    Returns:
+        Number of transaction rows updated
+    """
+    from sqlalchemy import text, bindparam
+
+    names = [
+        row[0] for row in db_session.execute(text("""
+            SELECT DISTINCT project_name
+            FROM transactions
+            WHERE project_key IS NULL
+              AND project_name IS NOT NULL
+        """)).fetchall()
+    ]
+    if not names:
+        return 0
+
+    keys = [project_key(name) for name in names]
+    result = db_session.execute(
+        text("""
+            UPDATE transactions t
+            SET project_key = k.project_key
+            FROM unnest(:names, :keys) AS k(project_name, project_key)
+            WHERE t.project_name = k.project_name
+              AND t.project_key IS NULL
+        """).bindparams(bindparam('names'), bindparam('keys')),
+        {'names': names, 'keys': keys},
+    )
+    if commit:
+        db_session.commit()
+
+    logger.info(f"Backfilled project_key for {result.rowcount} transactions ({len(names)} names)")
+    return result.rowcount
+
+
 def bulk_upsert_from_transactions(db_session, dry_run: bool = False) -> Dict[str, Any]:
     """
     Discover projects from transactions table and add to registry.
@@ -411,6 +345,9 @@ def bulk_upsert_from_transactions(db_session, dry_run: bool = False) -> Dict[str
     Only adds projects that don't already exist in the registry.
     New projects are added with units_status='unknown'.
 
+    Existing registry keys are loaded once up front instead of being looked
+    up per distinct name.
+
     Args:
         db_session: SQLAlchemy session
         dry_run: If True, don't commit changes
@@ -438,6 +375,10 @@ def bulk_upsert_from_transactions(db_session, dry_run: bool = False) -> Dict[str
     rows = db_session.execute(query).fetchall()
     logger.info(f"Found {len(rows)} distinct projects in transactions")
 
+    known_keys = {
+        key for (key,) in db_session.query(ProjectUnits.project_key).all()
+    }
+
     for row in rows:
         raw_name = row[0]
         district = row[1]
@@ -445,9 +386,8 @@ def bulk_upsert_from_transactions(db_session, dry_run: bool = False) -> Dict[str
         try:
             key = project_key(raw_name)
 
-            # Check if already exists
-            existing = ProjectUnits.query.filter_by(project_key=key).first()
-            if existing:
+            # Already registered (or created earlier in this pass)
+            if key in known_keys:
                 stats['skipped'] += 1
                 continue
 
@@ -463,6 +403,7 @@ def bulk_upsert_from_transactions(db_session, dry_run: bool = False) -> Dict[str
                 data_source='transactions',
             )
             db.session.add(new_project)
+            known_keys.add(key)
             stats['created'] += 1
 
         except Exception as e:
@@ -0,0 +1,77 @@
+-- Migration 026: Persist canonical project_key on transactions
+--
+-- project_key is the slug produced by utils.project_name.project_key(), the
+-- same key stored in project_units.project_key. Persisting it lets project
+-- lookups and registry joins use indexed equality instead of
+-- UPPER(project_name) comparisons.
+--
+-- The column is filled from Python (normalization rules live in one place):
+--   from data_health import sync_transaction_project_keys
+--   sync_transaction_project_keys(db.session)
+-- URA sync and scripts/upload.py (after publish) call this, so new rows are
+-- keyed on ingest. Existing rows are backfilled below with the same rules
+-- expressed in SQL; the Python sync only touches rows left NULL.
+
+BEGIN;
+
+ALTER TABLE transactions ADD COLUMN IF NOT EXISTS project_key TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_transactions_project_key
+    ON transactions (project_key)
+    WHERE is_outlier = false;
+
+-- Backfill existing rows. Mirrors utils.project_name.project_key():
+-- normalize_name (uppercase, collapse whitespace, "@" -> " AT ", drop a
+-- leading "THE ", strip punctuation) followed by slugify.
+UPDATE transactions
+SET project_key = trim(both '-' from regexp_replace(
+        regexp_replace(
+            regexp_replace(
+                lower(trim(regexp_replace(
+                    regexp_replace(
+                        regexp_replace(
+                            replace(
+                                trim(regexp_replace(upper(project_name), '\s+', ' ', 'g')),
+                                '@', ' AT '),
+                            '^THE\s+', ''),
+                        '[^\w\s]', '', 'g'),
+                    '\s+', ' ', 'g'))),
+                '\s+', '-', 'g'),
+            '[^a-z0-9-]', '', 'g'),
+        '-+', '-', 'g'))
+WHERE project_key IS NULL
+  AND project_name IS NOT NULL;
+
+-- transactions_primary is defined with SELECT *, so it must be re-created to
+-- expose the new column (body unchanged from migration 022).
+CREATE OR REPLACE VIEW transactions_primary AS
+WITH ura_months AS (
+    SELECT DISTINCT transaction_month
+    FROM transactions
+    WHERE source = 'ura_api'
+),
+ura AS (
+    SELECT *
+    FROM transactions
+    WHERE source = 'ura_api'
+),
+csv AS (
+    SELECT *
+    FROM transactions
+    WHERE source IN ('csv', 'csv_offline')
+)
+SELECT * FROM ura
+UNION ALL
+SELECT c.*
+FROM csv c
+LEFT JOIN ura u
+  ON c.row_hash IS NOT NULL
+ AND u.row_hash = c.row_hash
+LEFT JOIN ura_months um
+  ON c.transaction_month IS NOT DISTINCT FROM um.transaction_month
+WHERE
+    (c.row_hash IS NOT NULL AND u.id IS NULL)
+ OR
+    (c.row_hash IS NULL AND um.transaction_month IS NULL);
+
+COMMIT;
@@ -0,0 +1,39 @@
+-- Migration 027: Per-project analytics snapshot
+--
+-- One row per project, rebuilt in a single set-based statement after each
+-- data publish (services/project_snapshot_service.rebuild_project_snapshots).
+-- Project drill-down endpoints (inventory, price-bands, exit-queue) read
+-- this row by primary key and only fall back to live aggregation for
+-- projects that are missing from it.
+
+CREATE TABLE IF NOT EXISTS project_analytics_snapshot (
+    project_name            TEXT PRIMARY KEY,
+    project_key             TEXT,
+
+    -- Latest non-outlier transaction (any sale type)
+    district                VARCHAR(10),
+    tenure                  TEXT,
+
+    -- Inventory counts
+    new_sale_count          INTEGER NOT NULL DEFAULT 0,
+    resale_count            INTEGER NOT NULL DEFAULT 0,
+
+    -- Resale stats for the project's dominant district
+    resale_district         VARCHAR(10),
+    first_resale_date       DATE,
+    resale_total            INTEGER NOT NULL DEFAULT 0,
+    resale_median_psf       DOUBLE PRECISION,
+    resale_date_counts      JSONB NOT NULL DEFAULT '{}'::jsonb,  -- {"YYYY-MM-DD": n}
+    resale_bedroom_types    INTEGER NOT NULL DEFAULT 0,
+
+    -- Monthly resale PSF bands: [{"month", "count", "p25", "p50", "p75"}]
+    monthly_bands           JSONB NOT NULL DEFAULT '[]'::jsonb,
+
+    -- Verified project_units registry entry (NULL = not in registry)
+    unit_data               JSONB,
+
+    computed_at             TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_project_analytics_snapshot_key
+    ON project_analytics_snapshot (project_key);
@@ -0,0 +1,34 @@
+-- Migration 028: Project launch dimension
+--
+-- One row per new-launch project (first New Sale ever), maintained by
+-- services/launch_dimension_service.refresh_launch_dimension(), which
+-- rebuilds it after each sync, upload publish and outlier re-flag.
+--
+-- Serves /api/new-launch-timeline and /api/new-launch-absorption, which
+-- previously recomputed launch cohorts from transactions_primary per request.
+--
+-- name_key is the new-launch canonical key UPPER(TRIM(project_name))
+-- (new_launch_service.PROJECT_KEY_EXPR), not the slug in
+-- transactions.project_key.
+
+CREATE TABLE IF NOT EXISTS project_launches (
+    name_key                TEXT PRIMARY KEY,
+
+    launch_date             DATE NOT NULL,          -- first New Sale
+    launch_district         VARCHAR(10),            -- district of that first sale
+    district                VARCHAR(10),            -- MIN(district) over New Sales
+    segment                 VARCHAR(3),             -- CCR / RCR / OCR of launch_district
+
+    launch_month_units_sold INTEGER NOT NULL DEFAULT 0,
+    new_sale_count          INTEGER NOT NULL DEFAULT 0,
+    cumulative_sold         JSONB NOT NULL DEFAULT '{}'::jsonb,  -- {"YYYY-MM": cumulative}
+    bedroom_counts          INTEGER[] NOT NULL DEFAULT '{}',     -- distinct New Sale bedrooms
+
+    total_units             INTEGER,                -- from new_launch_units CSV
+
+    max_txn_id              BIGINT NOT NULL DEFAULT 0,  -- latest New Sale transaction id
+    updated_at              TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_project_launches_launch_date
+    ON project_launches (launch_date);
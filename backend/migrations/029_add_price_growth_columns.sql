@@ -0,0 +1,83 @@
+-- Migration 029: Persisted price-growth series columns + search indexes
+--
+-- /api/transactions/price-growth used to compute FIRST_VALUE/LAG/ROW_NUMBER
+-- windows over every matching row per request and page with OFFSET. The
+-- per-segment values are now stored on the fact table:
+--
+--   segment = (project_name, bedroom_count, COALESCE(floor_level, 'Unknown'))
+--   ordered by (transaction_date, id) over non-outlier transactions_primary rows
+--
+-- Maintained at ingest by price_growth_service.refresh_price_growth_columns()
+-- (URA sync recomputes the segments of every project it touched; CSV publish
+-- and outlier re-flagging recompute all segments).
+
+ALTER TABLE transactions ADD COLUMN IF NOT EXISTS segment_first_psf NUMERIC;
+ALTER TABLE transactions ADD COLUMN IF NOT EXISTS segment_prev_psf NUMERIC;
+ALTER TABLE transactions ADD COLUMN IF NOT EXISTS segment_txn_sequence INTEGER;
+ALTER TABLE transactions ADD COLUMN IF NOT EXISTS segment_days_since_prev INTEGER;
+
+-- transactions_primary is defined with SELECT *, re-create to expose the
+-- new columns (body unchanged from migration 022).
+CREATE OR REPLACE VIEW transactions_primary AS
+WITH ura_months AS (
+    SELECT DISTINCT transaction_month
+    FROM transactions
+    WHERE source = 'ura_api'
+),
+ura AS (
+    SELECT *
+    FROM transactions
+    WHERE source = 'ura_api'
+),
+csv AS (
+    SELECT *
+    FROM transactions
+    WHERE source IN ('csv', 'csv_offline')
+)
+SELECT * FROM ura
+UNION ALL
+SELECT c.*
+FROM csv c
+LEFT JOIN ura u
+  ON c.row_hash IS NOT NULL
+ AND u.row_hash = c.row_hash
+LEFT JOIN ura_months um
+  ON c.transaction_month IS NOT DISTINCT FROM um.transaction_month
+WHERE
+    (c.row_hash IS NOT NULL AND u.id IS NULL)
+ OR
+    (c.row_hash IS NULL AND um.transaction_month IS NULL);
+
+-- Backfill
+UPDATE transactions t
+SET segment_first_psf = g.first_psf,
+    segment_prev_psf = g.prev_psf,
+    segment_txn_sequence = g.txn_sequence,
+    segment_days_since_prev = g.days_since_prev
+FROM (
+    SELECT
+        id,
+        FIRST_VALUE(psf) OVER w AS first_psf,
+        LAG(psf) OVER w AS prev_psf,
+        ROW_NUMBER() OVER w AS txn_sequence,
+        transaction_date - LAG(transaction_date) OVER w AS days_since_prev
+    FROM transactions_primary
+    WHERE is_outlier = false
+    WINDOW w AS (
+        PARTITION BY project_name, bedroom_count, COALESCE(floor_level, 'Unknown')
+        ORDER BY transaction_date, id
+    )
+) g
+WHERE t.id = g.id;
+
+-- Keyset pagination over (transaction_date, id)
+CREATE INDEX IF NOT EXISTS idx_transactions_active_date_id
+    ON transactions (transaction_date, id)
+    WHERE is_outlier = false;
+
+-- Partial-match project search (ILIKE '%name%')
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS idx_transactions_project_name_trgm
+    ON transactions USING gin (project_name gin_trgm_ops);
+
+ANALYZE transactions;
@@ -0,0 +1,34 @@
+-- Migration 030: Event-driven supply pipeline snapshots
+--
+-- /api/supply/summary merged unsold inventory, upcoming launches and the GLS
+-- pipeline on every request, although those inputs only change when one of
+-- three write paths runs:
+--
+--   gls_tenders        - gls_scraper.scrape_gls_tenders (scheduler / cron)
+--   upcoming_launches  - upcoming_launch_upload.upload_upcoming_launches
+--   transactions       - URA sync (New Sale counts drive unsold inventory)
+--
+-- Each write path bumps its generation in supply_input_generations and
+-- rebuilds supply_snapshots (services/supply_snapshot_service). Every
+-- snapshot row records the generations it was built from, so a row whose
+-- generations lag the current ones is visibly stale.
+
+CREATE TABLE IF NOT EXISTS supply_input_generations (
+    input_name      VARCHAR(50) PRIMARY KEY,
+    generation      BIGINT NOT NULL DEFAULT 0,
+    changed_at      TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+INSERT INTO supply_input_generations (input_name, generation)
+VALUES ('gls_tenders', 0), ('upcoming_launches', 0), ('transactions', 0)
+ON CONFLICT (input_name) DO NOTHING;
+
+-- One row per (launch_year, include_gls) request combination
+CREATE TABLE IF NOT EXISTS supply_snapshots (
+    launch_year         INTEGER NOT NULL,
+    include_gls         BOOLEAN NOT NULL,
+    payload             JSONB NOT NULL,      -- full get_supply_summary() response
+    input_generations   JSONB NOT NULL,      -- {"gls_tenders": n, ...} at build time
+    built_at            TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (launch_year, include_gls)
+);
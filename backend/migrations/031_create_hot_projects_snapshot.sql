@@ -0,0 +1,22 @@
+-- Migration 031: Precomputed hot projects leaderboard
+--
+-- /api/projects/hot aggregated all New Sale and resale transactions, looked
+-- up unit counts and computed sell-through per project on every request,
+-- although the answer only changes when data is published. The leaderboard
+-- is now rebuilt after each URA sync / CSV upload
+-- (services/hot_projects_snapshot_service.rebuild_hot_projects_snapshot),
+-- once per bedroom filter. Region, district and price filters select rows
+-- at read time.
+
+CREATE TABLE IF NOT EXISTS hot_projects_snapshot (
+    bedroom_key     VARCHAR(4) NOT NULL,        -- 'all', '1', '2', '3', '4+', '5+'
+    project_name    TEXT,
+    district        VARCHAR(10) NOT NULL,
+    units_sold      INTEGER NOT NULL,
+    median_price    DOUBLE PRECISION,           -- bedroom-filtered New Sale median
+    project         JSONB NOT NULL,             -- formatted /projects/hot entry (unmasked)
+    built_at        TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_hot_projects_snapshot_leaderboard
+    ON hot_projects_snapshot (bedroom_key, units_sold DESC);
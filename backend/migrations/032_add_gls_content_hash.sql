@@ -0,0 +1,9 @@
+-- Migration 032: Stored content hash on gls_tenders
+--
+-- The scrape diff (scrapers/utils/diff.compute_diff_report) skips the
+-- field-by-field comparison when a row's stored content hash matches the
+-- incoming record's. GLSTender.compute_derived_fields sets the hash on
+-- every write; existing rows get theirs on their next write and are
+-- diffed field by field until then.
+
+ALTER TABLE gls_tenders ADD COLUMN IF NOT EXISTS content_hash VARCHAR(64);
@@ -14,6 +14,36 @@ See backend/constants.py for POSTAL_SECTOR_TO_DISTRICT and PLANNING_AREA_TO_DIST
 from models.database import db
 from datetime import datetime
 
+# Fields the scrape diff compares (ScrapingOrchestrator.compute_diff_for_gls)
+# and that content_hash covers. release_id is the diff key, so it is compared
+# but not hashed.
+GLS_COMPARE_FIELDS = frozenset({
+    "status",
+    "release_id",
+    "release_url",
+    "release_date",
+    "tender_close_date",
+    "location_raw",
+    "latitude",
+    "longitude",
+    "postal_code",
+    "postal_district",
+    "planning_area",
+    "market_segment",
+    "site_area_sqm",
+    "max_gfa_sqm",
+    "estimated_units",
+    "successful_tenderer",
+    "tendered_price_sgd",
+    "num_tenderers",
+    "psm_gfa",
+})
+GLS_CONTENT_HASH_FIELDS = GLS_COMPARE_FIELDS - {"release_id"}
+# Serialized as float (or None when falsy) by to_dict
+_NUMERIC_HASH_FIELDS = frozenset({
+    "latitude", "longitude", "site_area_sqm", "max_gfa_sqm", "tendered_price_sgd", "psm_gfa",
+})
+
 
 class GLSTender(db.Model):
     __tablename__ = 'gls_tenders'
@@ -68,6 +98,11 @@ class GLSTender(db.Model):
     needs_review = db.Column(db.Boolean, default=False)
     review_reason = db.Column(db.Text)
 
+    # compute_record_hash over GLS_CONTENT_HASH_FIELDS, set on every write
+    # (compute_derived_fields, link_awarded_to_launches) so diffs can skip
+    # unchanged rows unhashed
+    content_hash = db.Column(db.String(64))
+
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
     # Add indexes for common query patterns
@@ -229,4 +264,26 @@ class GLSTender(db.Model):
             tender.estimated_units = None
             tender.estimated_units_source = None
 
+        tender.content_hash = GLSTender.compute_content_hash(tender)
+
         return tender
+
+    @staticmethod
+    def compute_content_hash(tender) -> str:
+        """
+        Content hash of the compared fields, serialized as to_dict does.
+
+        Tolerates values assigned but not yet flushed (dates as ISO strings,
+        numerics as floats), so it can run on every write.
+        """
+        from scrapers.utils.hashing import compute_record_hash
+
+        record = {}
+        for field in GLS_CONTENT_HASH_FIELDS:
+            value = getattr(tender, field)
+            if hasattr(value, 'isoformat'):
+                value = value.isoformat()
+            elif field in _NUMERIC_HASH_FIELDS:
+                value = float(value) if value else None
+            record[field] = value
+        return compute_record_hash(record)
@@ -14,7 +14,6 @@ Endpoint:
 import json
 import logging
 import hashlib
-import os
 from flask import Blueprint, request, Response, jsonify, current_app, g
 
 from utils.auth import require_authenticated_access, get_user_from_request
@@ -70,15 +69,9 @@ def _get_cache_key(chart_type: str, data: dict, filters: dict, snapshot_version:
 
 
 def _get_redis_client():
-    """Get Redis client if available."""
-    try:
-        import redis
-        redis_url = os.environ.get('REDIS_URL')
-        if redis_url:
-            return redis.from_url(redis_url)
-    except Exception as e:
-        logger.debug(f"Redis not available for caching: {e}")
-    return None
+    """Get the pooled Redis client, or the process-local fallback store."""
+    from utils.redis_client import get_cache_client
+    return get_cache_client()
 
 
 def _get_cached_response(cache_key: str):
@@ -180,28 +173,35 @@ def interpret_chart():
             }
         )
 
-    # Stream from AI service
+    # Stream from AI service. Identical requests already in progress share
+    # one upstream stream (single-flight); the completed text is cached once.
+    from services.ai_stream_flight import get_stream_flights
+
     ai_service = get_ai_service()
+    app = current_app._get_current_object()
 
-    def generate():
-        full_response = []
-        try:
-            for event in ai_service.interpret_chart(
+    def produce():
+        with app.app_context():
+            yield from ai_service.interpret_chart(
                 chart_type=chart_type,
                 chart_title=chart_title,
                 chart_data=chart_data,
                 filters=filters,
                 kpis=kpis,
-            ):
-                # Collect tokens for caching
-                if event.event_type == 'token':
-                    full_response.append(event.data.get('content', ''))
+            )
 
-                yield event.to_sse()
+    events, is_leader = get_stream_flights().subscribe(
+        cache_key,
+        produce,
+        on_complete=lambda text: _set_cached_response(cache_key, text),
+    )
+    if not is_leader:
+        logger.info(f"Sharing in-progress stream for {cache_key}")
 
-            # Cache the full response
-            if full_response:
-                _set_cached_response(cache_key, ''.join(full_response))
+    def generate():
+        try:
+            for event in events:
+                yield event.to_sse()
 
         except Exception as e:
             logger.error(f"Stream error: {e}")
@@ -114,6 +114,7 @@ def extract_price_growth_params(params: Dict[str, Any]) -> Dict[str, Any]:
         "date_to": date_to,
         "page": params.get("page", 1),
         "per_page": params.get("per_page", 50),
+        "cursor": params.get("cursor"),
     }
 
 
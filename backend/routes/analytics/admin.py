@@ -9,6 +9,7 @@ Health & Readiness:
 Debug (Protected):
 - /debug/health-detailed - Full health metrics with DB queries (requires X-Admin-Secret)
 - /debug/data-status - Data integrity diagnostics (requires X-Admin-Secret)
+- /debug/query-stats - Per endpoint x SQL fingerprint latency stats (requires X-Admin-Secret)
 
 Admin (Protected):
 - /admin/update-metadata - Manual metadata update (requires X-Admin-Secret)
@@ -78,14 +79,20 @@ def health():
 @analytics_bp.route("/ready", methods=["GET"])
 def ready():
     """
-    Readiness probe - fast DB ping with 500ms timeout.
+    Readiness probe - deferred startup tasks done + fast DB ping (500ms timeout).
 
-    Returns 200 if DB responds within 500ms, 503 otherwise.
+    Returns 200 once the worker's deferred startup tasks (utils.startup) have
+    finished and the DB responds within 500ms, 503 otherwise.
     Use this to check if the service can handle requests.
 
     For zero-DB liveness checks, use /health instead.
     """
     from services.health import check_database_ready
+    from utils.startup import get_deferred_startup
+
+    deferred = get_deferred_startup(current_app)
+    if deferred is not None and not deferred.is_ready():
+        return jsonify({"status": "starting", "startup": deferred.report()}), 503
 
     if check_database_ready(timeout_ms=500):
         return jsonify({"status": "ready"}), 200
@@ -271,6 +278,35 @@ def debug_data_status():
         }), 500
 
 
+@analytics_bp.route("/debug/query-stats", methods=["GET", "DELETE"])
+@require_admin_secret
+def debug_query_stats():
+    """
+    Per endpoint x SQL fingerprint query statistics.
+
+    GET: Counts, p50/p95/p99 latency, rows and N+1 flags, sorted by total time
+        Query params: endpoint (e.g. analytics.aggregate), limit (default 50)
+    DELETE: Reset the accumulated stats
+
+    Stats are per worker process.
+    """
+    from api.middleware.query_timing import get_query_stats, reset_query_stats
+
+    if request.method == 'DELETE':
+        reset_query_stats()
+        return jsonify({"status": "query stats reset"})
+
+    try:
+        limit = int(request.args.get("limit", 50))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+
+    return jsonify(get_query_stats(
+        endpoint=request.args.get("endpoint") or None,
+        limit=max(limit, 1),
+    ))
+
+
 @analytics_bp.route("/dashboard/cache", methods=["GET", "DELETE"])
 @require_admin_secret
 def dashboard_cache():
@@ -278,15 +314,23 @@ def dashboard_cache():
     Dashboard cache management endpoint.
 
     GET: Return cache statistics
-    DELETE: Clear cache
+    DELETE: Clear cache (and force a dataset catalog rebuild)
     """
     from services.dashboard_service import get_cache_stats, clear_dashboard_cache
+    from services.dataset_catalog import get_catalog_stats, invalidate_dataset_catalog
+    from utils.single_flight import get_single_flight_stats
+    from utils.revalidation import get_revalidation_stats
+    from services.cache_warming import get_warming_stats
 
     if request.method == 'DELETE':
         clear_dashboard_cache()
+        invalidate_dataset_catalog()
         return jsonify({"status": "cache cleared"})
 
-    return jsonify(get_cache_stats())
+    return jsonify(dict(get_cache_stats(), dataset_catalog=get_catalog_stats(),
+                        single_flight=get_single_flight_stats(),
+                        revalidation=get_revalidation_stats(),
+                        cache_warming=get_warming_stats()))
 
 
 @analytics_bp.route("/metadata", methods=["GET"])
@@ -24,6 +24,7 @@ from utils.normalize import (
 from api.contracts import api_contract
 from api.contracts.contract_schema import PropertyAgeBucket
 from utils.auth import require_authenticated_access
+from utils.single_flight import request_flight_key, single_flight
 
 logger = route_logger("aggregate")
 
@@ -62,6 +63,9 @@ MULTI_DIM_FORBIDDEN_METRICS = frozenset([
 # Time grain hierarchy for auto-downsampling
 TIME_GRAINS = ['month', 'quarter', 'year']
 
+# Filters whose total count the dataset catalog answers without SQL
+_CATALOG_COUNTABLE_FILTERS = frozenset(['district', 'segment', 'sale_type', 'date_from', 'date_to'])
+
 
 def _calculate_time_buckets(date_from: date, date_to: date, grain: str) -> int:
     """Calculate number of time buckets for a date range and grain."""
@@ -233,6 +237,7 @@ def _get_project_lease_info(project_name: str) -> Tuple[Optional[int], Optional[
         from models.database import db
         from sqlalchemy import text
         from db.sql import OUTLIER_FILTER
+        from utils.project_name import project_key
 
         # Get mode (most common) lease_start_year and tenure
         result = db.session.execute(text(f"""
@@ -241,13 +246,13 @@ def _get_project_lease_info(project_name: str) -> Tuple[Optional[int], Optional[
                 tenure,
                 COUNT(*) as cnt
             FROM transactions_primary
-            WHERE UPPER(project_name) = :project_name
+            WHERE project_key = :project_key
               AND {OUTLIER_FILTER}
               AND lease_start_year IS NOT NULL
             GROUP BY lease_start_year, tenure
             ORDER BY cnt DESC
             LIMIT 1
-        """), {"project_name": project_name.upper().strip()}).fetchone()
+        """), {"project_key": project_key(project_name)}).fetchone()
 
         if result:
             return (result[0], result[1])
@@ -297,9 +302,39 @@ def _build_aggregate_cache_key(params: dict) -> str:
     return build_json_cache_key("aggregate", params)
 
 
+def _catalog_row_count(params: dict, filters_applied: dict):
+    """
+    Total matching rows from the dataset catalog, or None if the filters
+    go beyond district / segment / sale type / month-aligned dates.
+    """
+    from constants import get_districts_for_region
+    from services.dataset_catalog import get_dataset_catalog
+
+    if not set(filters_applied) <= _CATALOG_COUNTABLE_FILTERS:
+        return None
+
+    districts = None
+    if "district" in filters_applied:
+        districts = set(filters_applied["district"])
+    if "segment" in filters_applied:
+        segment_districts = set()
+        for seg in filters_applied["segment"]:
+            segment_districts.update(get_districts_for_region(seg))
+        if segment_districts:
+            districts = segment_districts if districts is None else districts & segment_districts
+
+    return get_dataset_catalog().count_rows(
+        sale_type=filters_applied.get("sale_type"),
+        districts=districts,
+        date_from=params.get("date_from"),
+        date_to_exclusive=params.get("date_to_exclusive"),
+    )
+
+
 @analytics_bp.route("/aggregate", methods=["GET"])
 @require_authenticated_access
 @api_contract("aggregate")
+@single_flight(request_flight_key, name='aggregate', share_result=False)
 def aggregate():
     """
     Flexible aggregation endpoint for Power BI-style dynamic filtering.
@@ -441,11 +476,14 @@ def aggregate():
         group_by = [g.strip() for g in effective_group_by.split(",") if g.strip()]
         group_by_param = effective_group_by
 
-    # Get total count first (fast query)
-    count_query = db.session.query(func.count(Transaction.id))
-    if filter_conditions:
-        count_query = count_query.filter(and_(*filter_conditions))
-    total_records = count_query.scalar()
+    # Get total count first: from the dataset catalog when the filters are
+    # ones it can answer exactly, otherwise a COUNT query
+    total_records = _catalog_row_count(params, filters_applied)
+    if total_records is None:
+        count_query = db.session.query(func.count(Transaction.id))
+        if filter_conditions:
+            count_query = count_query.filter(and_(*filter_conditions))
+        total_records = count_query.scalar()
 
     if total_records == 0:
         elapsed = time.time() - start
@@ -669,17 +707,19 @@ def aggregate():
 
     # Post-processing: Add total_units, top_year, and age_band for project grouping
     if needs_total_units and data:
-        from services.new_launch_units import get_project_units
+        from services.new_launch_units import get_project_units_batch
 
         # Determine "as-of" year for age calculation
         # If date_to filter provided, use that year; otherwise use current year
         as_of_year = to_dt.year if to_dt else date.today().year
 
+        # Unit inventory data for every project in one lookup
+        units_by_project = get_project_units_batch(row.get('project') for row in data)
+
         for row in data:
             project_name = row.get('project')
             if project_name:
-                # Get unit inventory data
-                units_info = get_project_units(project_name)
+                units_info = units_by_project[project_name]
                 row['total_units'] = units_info.get('total_units')
                 row['top_year'] = units_info.get('top')
                 row['total_units_source'] = units_info.get('unit_source')
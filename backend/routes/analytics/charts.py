@@ -22,6 +22,7 @@ from utils.normalize import (
 )
 from api.contracts.wrapper import api_contract
 from routes.analytics._route_utils import route_logger, log_success, log_error
+from utils.single_flight import request_flight_key, single_flight
 
 
 logger = route_logger("charts")
@@ -300,6 +301,7 @@ def _build_price_projects_by_district_query(district, bedroom_types, cutoff_date
 
 @analytics_bp.route("/floor-liquidity-heatmap", methods=["GET"])
 @api_contract("charts/floor-liquidity-heatmap")
+@single_flight(request_flight_key, name='floor_liquidity_heatmap', share_result=False)
 def floor_liquidity_heatmap():
     """
     Floor liquidity heatmap data - shows which floor zones resell faster by project.
@@ -340,9 +342,9 @@ def floor_liquidity_heatmap():
     from models.database import db
     from sqlalchemy import func, and_
     from db.sql import exclude_outliers
-    from constants import get_region_for_district
     from services.dashboard_service import _dashboard_cache
-    from services.new_launch_units import get_units_for_project
+    from services.new_launch_units import get_project_units_batch
+    from services.dataset_catalog import get_dataset_catalog
 
     start = time.time()
 
@@ -387,8 +389,7 @@ def floor_liquidity_heatmap():
     segments = params.get('segments')
     if segments:
         segment_list = [s.upper() for s in segments if s]
-        all_districts = db.session.query(Transaction.district).distinct().all()
-        segment_districts = [d[0] for d in all_districts if get_region_for_district(d[0]) in segment_list]
+        segment_districts = get_dataset_catalog().districts_in_segments(segment_list)
         filter_conditions.append(Transaction.district.in_(segment_districts))
         filters_applied['segments'] = segment_list
 
@@ -444,15 +445,20 @@ def floor_liquidity_heatmap():
         excluded_boutique = 0
         projects = []
 
+        # Check minimum transactions
+        candidates = []
         for p in projects_dict.values():
-            # Check minimum transactions
             if p['total_transactions'] < min_transactions:
                 excluded_low_txns += 1
                 continue
+            candidates.append(p)
 
+        # One unit lookup for all remaining projects (registry → CSV → upcoming)
+        units_by_project = get_project_units_batch(p['project_name'] for p in candidates)
+
+        for p in candidates:
             # Check minimum units (exclude boutique projects)
-            project_info = get_units_for_project(p['project_name'], check_resale=False)
-            total_units = project_info.get('total_units')
+            total_units = units_by_project[p['project_name']].get('total_units')
             p['total_units'] = total_units  # Store for reference
 
             if total_units is not None and total_units < min_units:
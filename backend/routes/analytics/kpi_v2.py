@@ -14,27 +14,24 @@ Performance:
 """
 
 import time
-import threading
 import logging
 from datetime import date, timedelta
 from flask import jsonify, g
-from sqlalchemy import text
 from routes.analytics import analytics_bp
 from routes.analytics._route_utils import log_error
-from models.database import db
-from db.sql import OUTLIER_FILTER
 from api.contracts import api_contract
 from utils.auth import require_authenticated_access
 
 # Reuse existing cache infrastructure (CLAUDE.md Rule #4: Reuse-First)
 from services.dashboard_service import _dashboard_cache
 from utils.cache_key import build_json_cache_key
+from utils.single_flight import SingleFlight
+from services.cache_warming import record_request
 
 logger = logging.getLogger('kpi_v2')
 
-# Lock for cache stampede prevention (endpoint-specific)
-_kpi_key_locks = {}
-_kpi_locks_lock = threading.Lock()
+# Cache stampede prevention (endpoint-specific)
+_kpi_flight = SingleFlight('kpi_v2')
 
 
 def _months_back(from_date: date, months: int) -> date:
@@ -48,13 +45,72 @@ def _months_back(from_date: date, months: int) -> date:
 
 
 def _get_max_transaction_date():
-    """Get the latest transaction date from the database."""
-    result = db.session.execute(text(f"""
-        SELECT MAX(transaction_date) as max_date
-        FROM transactions_primary
-        WHERE {OUTLIER_FILTER}
-    """)).fetchone()
-    return result.max_date if result else None
+    """Latest non-outlier transaction date (from the in-memory dataset catalog)."""
+    from services.dataset_catalog import get_dataset_catalog
+    return get_dataset_catalog().primary_max_date
+
+
+# User-supplied params that determine a KPI response (recorded for warming)
+_KPI_REQUEST_KEYS = ('districts', 'bedrooms', 'segments', 'max_date')
+
+
+def _build_kpi_filters(params: dict) -> dict:
+    """KPI filters from normalized request params."""
+    filters = {}
+
+    # District filter (Pydantic normalizes 'district' → 'districts')
+    districts = params.get('districts')
+    if districts:
+        filters['districts'] = districts
+
+    # Bedroom filter (Pydantic normalizes 'bedroom' → 'bedrooms')
+    bedrooms = params.get('bedrooms')
+    if bedrooms:
+        filters['bedrooms'] = bedrooms
+
+    # Segment filter (Pydantic normalizes 'segment' → 'segments')
+    segments = params.get('segments')
+    if segments:
+        filters['segments'] = segments
+
+    # Date filter - use max from DB if not provided (like v1 does)
+    max_date_param = params.get('max_date')
+    if max_date_param:
+        filters['max_date'] = max_date_param
+    else:
+        # Default to latest transaction date in database
+        filters['max_date'] = _get_max_transaction_date()
+
+    # PERFORMANCE: Add date_from to reduce row scans
+    # Max lookback is 36 months (market_momentum volatility) + 4 months buffer
+    # This helps PostgreSQL use indexes more effectively
+    # Reduces scan from 300K rows to ~50K rows
+    if filters['max_date']:
+        filters['date_from'] = _months_back(filters['max_date'], 40)
+
+    return filters
+
+
+def _kpi_cache_key(filters: dict) -> str:
+    # date_from is derived, not user input, so it is not part of the key.
+    # Uses shared cache with "kpi:" prefix to avoid collisions
+    return build_json_cache_key("kpi", filters, include_keys=['districts', 'bedrooms', 'segments', 'max_date'])
+
+
+def replay_kpi_request(params: dict) -> None:
+    """Recompute and cache one recorded KPI request (adaptive warming)."""
+    from services.kpi import run_all_kpis
+
+    filters = _build_kpi_filters(params)
+    result = {
+        "data": {"kpis": run_all_kpis(filters)},
+        "meta": {
+            "elapsedMs": 0,  # Will be updated on cache hit
+            "filtersApplied": filters,
+            "cacheHit": False
+        }
+    }
+    _dashboard_cache.set(_kpi_cache_key(filters), result)
 
 
 @analytics_bp.route("/kpi-summary-v2", methods=["GET"])
@@ -98,44 +154,29 @@ def kpi_summary_v2():
     try:
         # Use normalized params from Pydantic (via @api_contract decorator)
         params = g.normalized_params
-        filters = {}
-
-        # District filter (Pydantic normalizes 'district' → 'districts')
-        districts = params.get('districts')
-        if districts:
-            filters['districts'] = districts
-
-        # Bedroom filter (Pydantic normalizes 'bedroom' → 'bedrooms')
-        bedrooms = params.get('bedrooms')
-        if bedrooms:
-            filters['bedrooms'] = bedrooms
-
-        # Segment filter (Pydantic normalizes 'segment' → 'segments')
-        segments = params.get('segments')
-        if segments:
-            filters['segments'] = segments
+        filters = _build_kpi_filters(params)
+        record_request('kpi', {k: params.get(k) for k in _KPI_REQUEST_KEYS})
 
-        # Date filter - use max from DB if not provided (like v1 does)
-        max_date_param = params.get('max_date')
-        if max_date_param:
-            filters['max_date'] = max_date_param
-        else:
-            # Default to latest transaction date in database
-            filters['max_date'] = _get_max_transaction_date()
-
-        # PERFORMANCE: Add date_from to reduce row scans
-        # Max lookback is 36 months (market_momentum volatility) + 4 months buffer
-        # This helps PostgreSQL use indexes more effectively
-        # Reduces scan from 300K rows to ~50K rows
-        if filters['max_date']:
-            filters['date_from'] = _months_back(filters['max_date'], 40)
+        cache_key = _kpi_cache_key(filters)
 
-        # Build cache key BEFORE adding date_from (it's derived, not user input)
-        # Uses shared cache with "kpi:" prefix to avoid collisions
-        cache_key = build_json_cache_key("kpi", filters, include_keys=['districts', 'bedrooms', 'segments', 'max_date'])
+        def build_result():
+            # Run all KPIs via registry
+            kpi_start = time.time()
+            kpi_results = run_all_kpis(filters)
+            return {
+                "data": {
+                    "kpis": kpi_results
+                },
+                "meta": {
+                    "elapsedMs": round((time.time() - kpi_start) * 1000, 2),
+                    "filtersApplied": filters,
+                    "cacheHit": False
+                }
+            }
 
-        # Check cache first (reuses shared _dashboard_cache)
-        cached = _dashboard_cache.get(cache_key)
+        # Check cache first (reuses shared _dashboard_cache; a hot entry past
+        # its TTL is served stale while it refreshes in the background)
+        cached = _dashboard_cache.get_or_revalidate(cache_key, build_result)
         if cached is not None:
             elapsed = time.time() - start
             logger.info(f"KPI cache hit for {cache_key} in {elapsed*1000:.1f}ms")
@@ -146,14 +187,9 @@ def kpi_summary_v2():
             cached_copy['meta']['cacheHit'] = True
             return jsonify(cached_copy)
 
-        # Cache miss - prevent stampede with per-key locking
-        with _kpi_locks_lock:
-            if cache_key not in _kpi_key_locks:
-                _kpi_key_locks[cache_key] = threading.Lock()
-            key_lock = _kpi_key_locks[cache_key]
-
-        with key_lock:
-            # Double-check cache (another thread may have populated it)
+        # Cache miss - concurrent misses for this key wait on one computation
+        def compute():
+            # Double-check cache (the leader may have populated it)
             cached = _dashboard_cache.get(cache_key)
             if cached is not None:
                 elapsed = time.time() - start
@@ -163,29 +199,16 @@ def kpi_summary_v2():
                 cached_copy['meta']['cacheHit'] = True
                 return jsonify(cached_copy)
 
-            # Run all KPIs via registry
-            kpi_results = run_all_kpis(filters)
-
-            elapsed = time.time() - start
-            logger.info(f"KPI computed for {cache_key} in {elapsed*1000:.1f}ms")
-
-            # Build result
-            result = {
-                "data": {
-                    "kpis": kpi_results
-                },
-                "meta": {
-                    "elapsedMs": round(elapsed * 1000, 2),
-                    "filtersApplied": filters,
-                    "cacheHit": False
-                }
-            }
+            result = build_result()
+            logger.info(f"KPI computed for {cache_key} in {result['meta']['elapsedMs']:.1f}ms")
 
             # Cache the result (shared cache, 10 min TTL)
             _dashboard_cache.set(cache_key, result)
 
             return jsonify(result)
 
+        return _kpi_flight.do(cache_key, compute, share_result=False)
+
     except Exception as e:
         log_error(logger, "/api/kpi-summary-v2", start, e)
         return jsonify({"error": str(e)}), 500
@@ -28,6 +28,7 @@ def get_project_inventory(project_name):
 
     Uses CSV file (rawdata/new_launch_units.csv) for total_units lookup.
     Calculates unsold from total_units - count(New Sale transactions).
+    Sale counts come from project_analytics_snapshot when available.
 
     Returns:
         - total_units: Total units in the development
@@ -37,6 +38,7 @@ def get_project_inventory(project_name):
     start = time.perf_counter()
     from models.database import db
     from services.new_launch_units import get_units_for_project
+    from services.project_snapshot_service import get_project_snapshot
     from sqlalchemy import text
     from db.sql import OUTLIER_FILTER
 
@@ -45,20 +47,25 @@ def get_project_inventory(project_name):
         lookup = get_units_for_project(project_name)
         total_units = lookup.get("total_units")
 
-        # Count sales from transactions_primary (de-duplicated view)
-        result = db.session.execute(
-            text(f"""
-                SELECT
-                    COUNT(CASE WHEN sale_type = :sale_type_new THEN 1 END) AS new_sale_count,
-                    COUNT(CASE WHEN sale_type = :sale_type_resale THEN 1 END) AS resale_count
-                FROM transactions_primary
-                WHERE project_name = :project_name
-                  AND {OUTLIER_FILTER}
-            """),
-            {"project_name": project_name, "sale_type_new": SALE_TYPE_NEW, "sale_type_resale": SALE_TYPE_RESALE}
-        ).fetchone()
-        new_sale_count = result[0] or 0
-        resale_count = result[1] or 0
+        snapshot = get_project_snapshot(project_name)
+        if snapshot:
+            new_sale_count = snapshot["new_sale_count"]
+            resale_count = snapshot["resale_count"]
+        else:
+            # Count sales from transactions_primary (de-duplicated view)
+            result = db.session.execute(
+                text(f"""
+                    SELECT
+                        COUNT(CASE WHEN sale_type = :sale_type_new THEN 1 END) AS new_sale_count,
+                        COUNT(CASE WHEN sale_type = :sale_type_resale THEN 1 END) AS resale_count
+                    FROM transactions_primary
+                    WHERE project_name = :project_name
+                      AND {OUTLIER_FILTER}
+                """),
+                {"project_name": project_name, "sale_type_new": SALE_TYPE_NEW, "sale_type_resale": SALE_TYPE_RESALE}
+            ).fetchone()
+            new_sale_count = result[0] or 0
+            resale_count = result[1] or 0
 
         # Build response
         result = {
@@ -278,15 +285,18 @@ def get_project_exit_queue(project_name):
         from sqlalchemy import text
         from services.new_launch_units import get_project_units
         from services.exit_queue_service import get_exit_queue_analysis
+        from services.project_snapshot_service import get_project_snapshot
         from api.contracts.contract_schema import serialize_exit_queue_v2
 
         # Call the service - returns (result, error_response, status_code)
-        # Uses hybrid lookup: CSV → database → estimation
+        # Reads the precomputed snapshot; live queries + hybrid unit lookup
+        # (registry → CSV → database) only when the project has none
         result, error_response, status_code = get_exit_queue_analysis(
             db=db,
             text=text,
             project_name=project_name,
-            get_units_for_project=get_project_units  # Hybrid lookup with confidence
+            get_units_for_project=get_project_units,  # Hybrid lookup with confidence
+            snapshot=get_project_snapshot(project_name),
         )
 
         log_success(
@@ -49,12 +49,17 @@ def get_transaction_price_growth():
         Pagination:
         - page: Page number (default 1)
         - per_page: Records per page (default 50, max 500)
+        - cursor: Keyset cursor (meta.nextCursor from the previous page);
+          takes precedence over page
 
     Example:
         GET /api/transactions/price-growth?project=THE%20ORIE&bedroom=2&page=1
     """
     start = time.perf_counter()
-    from services.price_growth_service import get_transaction_price_growth as compute_growth
+    from services.price_growth_service import (
+        get_transaction_price_growth as compute_growth,
+        decode_cursor,
+    )
 
     try:
         params = getattr(g, "normalized_params", {}) or {}
@@ -68,6 +73,9 @@ def get_transaction_price_growth():
         date_to = parsed["date_to"]
         page = parsed["page"]
         per_page = parsed["per_page"]
+        cursor = parsed["cursor"]
+        if cursor:
+            decode_cursor(cursor)
 
     except NormalizeValidationError as e:
         return validation_error_response(e)
@@ -85,7 +93,8 @@ def get_transaction_price_growth():
             date_to=date_to,
             sale_type=sale_type,
             page=page,
-            per_page=per_page
+            per_page=per_page,
+            cursor=cursor
         )
 
         # Serialize via Pydantic response model (snake_case → camelCase)
@@ -101,6 +110,7 @@ def get_transaction_price_growth():
                 "sale_type": sale_type,
                 "page": page,
                 "per_page": per_page,
+                "cursor": bool(cursor),
                 "items": len(response.get("data", [])) if isinstance(response, dict) else None,
             },
         )
@@ -143,6 +143,8 @@ def auth_health():
     elif _firebase_error_type == 'transient':
         firebase_status = 'transient_error'
 
+    from utils.auth import get_identity_cache_stats
+
     last_attempt_age = None
     if _firebase_last_attempt is not None:
         last_attempt_age = max(0, int(time.time() - _firebase_last_attempt))
@@ -154,4 +156,5 @@ def auth_health():
             "last_attempt_age_s": last_attempt_age,
             "retry_delay_s": _firebase_retry_delay_s,
         },
+        "identity_cache": get_identity_cache_stats(),
     }), 200
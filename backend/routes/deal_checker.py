@@ -33,6 +33,7 @@ deal_checker_bp = Blueprint('deal_checker', __name__)
 # Import contract versioning for HTTP header
 from api.contracts.contract_schema import API_CONTRACT_HEADER, CURRENT_API_CONTRACT_VERSION
 from api.contracts.wrapper import api_contract
+from utils.single_flight import single_flight
 
 
 @deal_checker_bp.after_request
@@ -218,6 +219,11 @@ def get_bedroom_filter(bedroom):
     return t.bedroom_count == bedroom
 
 
+@single_flight(
+    lambda project_names, bedroom, buyer_price, sqft=None: (
+        tuple(sorted(project_names)), bedroom, buyer_price, sqft),
+    name='deal_checker.scope_stats',
+)
 def compute_scope_stats(project_names, bedroom, buyer_price, sqft=None):
     """
     Compute histogram and percentile for a set of projects.
@@ -21,7 +21,6 @@ import json
 import os
 import time
 import threading
-import requests
 from flask import Blueprint, jsonify
 
 hdb_bp = Blueprint('hdb', __name__)
@@ -87,6 +86,8 @@ _HDB_TOWN_TO_DISTRICT = {
 
 def _fetch_page(offset):
     """Fetch one page with 429 retry/exponential backoff. Raises exception if fails after retries."""
+    import requests  # Lazy: only needed on cache refresh, keeps worker boot light
+
     headers = {'Authorization': _API_KEY} if _API_KEY else {}
     for attempt in range(_MAX_RETRIES):
         resp = requests.get(
@@ -9,10 +9,8 @@ from flask import Blueprint, jsonify, g
 from sqlalchemy import func
 import time
 from models.project_location import ProjectLocation
-from models.popular_school import PopularSchool
 from models.database import db
-from constants import DISTRICT_NAMES, SALE_TYPE_NEW, SALE_TYPE_RESALE
-from services.school_distance import get_schools_within_distance
+from constants import SALE_TYPE_NEW
 from db.sql import OUTLIER_FILTER, exclude_outliers, get_outlier_filter_sql
 from utils.normalize import (
     to_int,
@@ -137,18 +135,6 @@ def get_project_locations():
         return jsonify({"error": str(e)}), 500
 
 
-# District to Region mapping
-DISTRICT_TO_REGION = {
-    'D01': 'Central', 'D02': 'Central', 'D03': 'Central', 'D04': 'Central',
-    'D05': 'West', 'D06': 'Central', 'D07': 'Central', 'D08': 'Central',
-    'D09': 'Central', 'D10': 'Central', 'D11': 'Central', 'D12': 'Central',
-    'D13': 'Central', 'D14': 'East', 'D15': 'East', 'D16': 'East',
-    'D17': 'East', 'D18': 'East', 'D19': 'North-East', 'D20': 'North',
-    'D21': 'Central', 'D22': 'West', 'D23': 'West', 'D24': 'West',
-    'D25': 'North', 'D26': 'North', 'D27': 'North', 'D28': 'North-East',
-}
-
-
 @projects_bp.route("/projects/hot", methods=["GET"])
 @api_contract("projects/hot")
 def get_hot_projects():
@@ -165,6 +151,9 @@ def get_hot_projects():
     - total_units: Static JSON file (new_launch_units.json) - AUTHORITATIVE
     - has_popular_school: from project_locations table
 
+    Served from hot_projects_snapshot (rebuilt after each sync/upload) and
+    computed live only when no snapshot is available.
+
     Calculation:
     - percent_sold = (units_sold / total_units) * 100
     - unsold_inventory = total_units - units_sold
@@ -187,10 +176,14 @@ def get_hot_projects():
     start = time.time()
 
     try:
-        from db.transaction_primary import get_transactions_primary_table
-        from services.new_launch_units import get_units_for_project
-        from sqlalchemy import func, case, text, literal_column
-        from constants import get_region_for_district, get_districts_for_region
+        from constants import get_districts_for_region
+        from services.hot_projects_snapshot_service import (
+            bedroom_filter_key,
+            bedroom_sql_params,
+            get_hot_projects_snapshot,
+            parse_bedroom_filter,
+            query_hot_projects,
+        )
 
         normalized_params = getattr(g, "normalized_params", {}) or {}
 
@@ -204,16 +197,11 @@ def get_hot_projects():
         price_min = normalized_params.get("price_min")
         price_max = normalized_params.get("price_max")
 
-        # Build param-guarded filters (static SQL with NULL checks).
+        # Param-guarded filters (static SQL with NULL checks).
         # IMPORTANT: units_sold is a HARD FACT - total confirmed New Sale transactions
         # It should NOT be affected by bedroom/district/segment filters
         # Filters only affect: which projects are shown, and median_price/psf calculations
-        sql_params = {
-            "limit": limit,
-            "sale_type_new": SALE_TYPE_NEW,
-            "sale_type_resale": SALE_TYPE_RESALE,
-            "bedroom_exact": None,
-            "bedroom_min": None,
+        filter_params = {
             "districts": None,
             "segment_districts": None,
             "price_min": None,
@@ -222,23 +210,7 @@ def get_hot_projects():
 
         # Bedroom filter - affects which projects are shown (must have sales in this bedroom type)
         # but does NOT affect the units_sold count
-        if bedrooms:
-            bedroom_values = []
-            for item in bedrooms:
-                if isinstance(item, str) and "," in item:
-                    bedroom_values.extend([v.strip() for v in item.split(",") if v.strip()])
-                else:
-                    bedroom_values.append(item)
-            bedroom_val = bedroom_values[0] if bedroom_values else None
-            try:
-                bedroom_val = int(bedroom_val) if bedroom_val is not None else None
-            except (TypeError, ValueError):
-                bedroom_val = None
-            if bedroom_val is not None:
-                if bedroom_val >= 4:
-                    sql_params["bedroom_min"] = bedroom_val
-                else:
-                    sql_params["bedroom_exact"] = bedroom_val
+        bedroom_val = parse_bedroom_filter(bedrooms)
 
         # District filter - can be comma-separated
         if districts:
@@ -249,189 +221,46 @@ def get_hot_projects():
                     d = f"D{d.zfill(2)}"
                 normalized.append(d)
             if normalized:
-                sql_params["districts"] = normalized
+                filter_params["districts"] = normalized
 
         # Market segment (region) filter - expand to districts
         if market_segment and market_segment.upper() in ('CCR', 'RCR', 'OCR'):
             segment_districts = get_districts_for_region(market_segment.upper())
             if segment_districts:
-                sql_params["segment_districts"] = segment_districts
+                # ANY() needs an array; psycopg2 adapts tuples to records
+                filter_params["segment_districts"] = list(segment_districts)
 
-        # Price filters - applied in outer query on median_price
+        # Price filters - applied to the filtered median_price
         if price_min:
             try:
-                sql_params["price_min"] = float(price_min)
+                filter_params["price_min"] = float(price_min)
             except ValueError:
                 pass
 
         if price_max:
             try:
-                sql_params["price_max"] = float(price_max)
+                filter_params["price_max"] = float(price_max)
             except ValueError:
                 pass
 
-        # Query with TWO CTEs:
-        # 1. total_project_sales: UNFILTERED units_sold (HARD FACT - confirmed transactions)
-        # 2. filtered_stats: Filtered median_price/psf for relevance + determines which projects to show
-        sql = text("""
-            WITH total_project_sales AS (
-                -- HARD FACT: Total confirmed New Sale transactions per project
-                -- This count is NEVER affected by bedroom/district/segment filters
-                SELECT
-                    t.project_name,
-                    t.district,
-                    COUNT(*) as units_sold,
-                    SUM(t.price) as total_value,
-                    MIN(t.transaction_date) as first_new_sale,
-                    MAX(t.transaction_date) as last_new_sale
-                FROM transactions_primary t
-                WHERE t.is_outlier = false
-                  AND t.sale_type = :sale_type_new
-                GROUP BY t.project_name, t.district
-            ),
-            resale_project_sales AS (
-                -- Resale presence across the full project (unfiltered)
-                SELECT
-                    t.project_name,
-                    t.district,
-                    COUNT(*) as resale_count
-                FROM transactions_primary t
-                WHERE t.is_outlier = false
-                  AND t.sale_type = :sale_type_resale
-                GROUP BY t.project_name, t.district
-            ),
-            filtered_stats AS (
-                -- Filtered stats: median_price/psf based on user filters
-                -- Also determines which projects to show (must have matching transactions)
-                SELECT
-                    t.project_name,
-                    t.district,
-                    COUNT(CASE WHEN t.sale_type = :sale_type_new THEN 1 END) as filtered_count,
-                    AVG(CASE WHEN t.sale_type = :sale_type_new THEN t.psf END) as avg_psf,
-                    PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY CASE WHEN t.sale_type = :sale_type_new THEN t.price END) as median_price,
-                    PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY CASE WHEN t.sale_type = :sale_type_new THEN t.psf END) as median_psf
-                FROM transactions_primary t
-                WHERE t.is_outlier = false
-                  AND (
-                    (:bedroom_exact IS NULL AND :bedroom_min IS NULL)
-                    OR (:bedroom_exact IS NOT NULL AND t.bedroom_count = :bedroom_exact)
-                    OR (:bedroom_min IS NOT NULL AND t.bedroom_count >= :bedroom_min)
-                  )
-                  AND (:districts IS NULL OR t.district = ANY(:districts))
-                  AND (:segment_districts IS NULL OR t.district = ANY(:segment_districts))
-                GROUP BY t.project_name, t.district
-                HAVING COUNT(CASE WHEN t.sale_type = :sale_type_new THEN 1 END) > 0
-            )
-            SELECT
-                tps.project_name,
-                tps.district,
-                tps.units_sold,
-                tps.total_value,
-                fs.avg_psf,
-                fs.median_price,
-                fs.median_psf,
-                tps.first_new_sale,
-                tps.last_new_sale,
-                pl.has_popular_school_1km,
-                pl.market_segment,
-                pl.latitude,
-                pl.longitude
-            FROM total_project_sales tps
-            INNER JOIN filtered_stats fs
-                ON tps.project_name = fs.project_name AND tps.district = fs.district
-            LEFT JOIN resale_project_sales rps
-                ON tps.project_name = rps.project_name AND tps.district = rps.district
-            LEFT JOIN project_locations pl
-                ON LOWER(TRIM(tps.project_name)) = LOWER(TRIM(pl.project_name))
-            WHERE (:price_min IS NULL OR fs.median_price >= :price_min)
-              AND (:price_max IS NULL OR fs.median_price <= :price_max)
-              AND COALESCE(rps.resale_count, 0) = 0
-            ORDER BY tps.units_sold DESC
-            LIMIT :limit
-        """)
-
-        # Pre-load all school data for nearby school lookup
-        schools = db.session.query(
-            PopularSchool.school_name,
-            PopularSchool.latitude,
-            PopularSchool.longitude
-        ).filter(
-            PopularSchool.latitude.isnot(None),
-            PopularSchool.longitude.isnot(None)
-        ).all()
-        school_data = [
-            (s.school_name, float(s.latitude), float(s.longitude))
-            for s in schools
-        ]
-
-        results = db.session.execute(sql, sql_params).fetchall()
-
-        # Format response - use JSON lookup for total_units
-        projects = []
-        for row in results:
-            district = row.district or ''
-            market_seg = row.market_segment or get_region_for_district(district)
-            units_sold = row.units_sold or 0
-
-            # Lookup total_units and developer from static CSV file (runtime lookup, no DB)
-            lookup = get_units_for_project(row.project_name)
-            total_units = lookup.get("total_units") or 0
-            developer = lookup.get("developer") or None
-
-            # Calculate percent_sold and unsold if total_units available
-            # Flag data discrepancy when units_sold > total_units (indicates URA data issues)
-            data_discrepancy = False
-            if total_units > 0:
-                if units_sold > total_units:
-                    # Data discrepancy: more transactions than official units
-                    # This could be due to sub-sales, serviced apartments, or URA data issues
-                    data_discrepancy = True
-                    percent_sold = 100.0  # Cap at 100%
-                    unsold_inventory = 0  # No unsold units known
-                else:
-                    percent_sold = round((units_sold * 100.0 / total_units), 1)
-                    unsold_inventory = total_units - units_sold
-            else:
-                # No total_units data - can't calculate percent
-                percent_sold = None
-                unsold_inventory = None
-
-            # Get nearby schools if project has coordinates and school flag
-            nearby_schools = []
-            if row.has_popular_school_1km and row.latitude and row.longitude:
-                try:
-                    nearby_schools = get_schools_within_distance(
-                        float(row.latitude),
-                        float(row.longitude),
-                        school_data
-                    )
-                except (ValueError, TypeError):
-                    nearby_schools = []
-
-            # Get district name from constants
-            district_name = DISTRICT_NAMES.get(district, '')
-
-            projects.append({
-                "project_name": row.project_name,
-                "developer": developer,
-                "region": DISTRICT_TO_REGION.get(district, None),
-                "district": district,
-                "district_name": district_name,
-                "market_segment": market_seg,
-                "total_units": total_units if total_units > 0 else None,
-                "units_sold": units_sold,
-                "percent_sold": percent_sold,
-                "unsold_inventory": unsold_inventory,
-                "data_discrepancy": data_discrepancy,  # True if units_sold > total_units
-                "total_value": float(row.total_value) if row.total_value else 0,
-                "avg_psf": round(float(row.avg_psf), 2) if row.avg_psf else 0,
-                "median_price": round(float(row.median_price)) if row.median_price else None,
-                "median_psf": round(float(row.median_psf), 2) if row.median_psf else None,
-                "has_popular_school": row.has_popular_school_1km or False,
-                "nearby_schools": nearby_schools,  # List of school names within 1km
-                "first_new_sale": row.first_new_sale.isoformat() if row.first_new_sale else None,
-                "last_new_sale": row.last_new_sale.isoformat() if row.last_new_sale else None,
+        # Precomputed leaderboard (rebuilt after each sync/upload); live
+        # aggregation when there is no snapshot or it has no such bedroom filter
+        snapshot = None
+        bedroom_key = bedroom_filter_key(bedroom_val)
+        if bedroom_key is not None:
+            snapshot = get_hot_projects_snapshot(bedroom_key, limit=limit, **filter_params)
+
+        if snapshot is not None:
+            projects, built_at = snapshot
+            source = "snapshot"
+        else:
+            projects = query_hot_projects(db.session, {
+                **filter_params,
+                **bedroom_sql_params(bedroom_val),
+                "limit": limit,
             })
+            built_at = None
+            source = "live"
 
         # SECURITY: Mask sensitive data for anonymous users
         from utils.auth import has_authenticated_access
@@ -467,7 +296,12 @@ def get_hot_projects():
         # Sort by units_sold descending (most active first)
         projects.sort(key=lambda x: -x['units_sold'])
 
-        from datetime import datetime
+        from datetime import datetime, timezone
+        if built_at is not None:
+            last_updated = built_at.astimezone(timezone.utc).replace(tzinfo=None).isoformat() + "Z"
+        else:
+            last_updated = datetime.utcnow().isoformat() + "Z"
+
         result = {
             "projects": projects,
             "total_count": len(projects),
@@ -481,11 +315,12 @@ def get_hot_projects():
             },
             "data_note": "Only shows projects with New Sale transactions and ZERO resales (true new launches). " +
                         "Projects without total_units data show N/A for % sold.",
-            "last_updated": datetime.utcnow().isoformat() + "Z"
+            "last_updated": last_updated,
+            "source": source,
         }
 
         elapsed = time.time() - start
-        print(f"GET /api/projects/hot took: {elapsed:.4f} seconds (returned {len(projects)} projects)")
+        print(f"GET /api/projects/hot took: {elapsed:.4f} seconds (returned {len(projects)} projects from {source})")
 
         return jsonify(result)
 
@@ -578,10 +413,14 @@ def compute_school_flags():
     try:
         from flask import current_app
         from services.school_distance import compute_school_flags_batch
+        from services.hot_projects_snapshot_service import refresh_hot_projects_snapshot
 
         # Run the batch computation
         stats = compute_school_flags_batch(current_app._get_current_object())
 
+        # The hot projects leaderboard stores school flags per project
+        refresh_hot_projects_snapshot(db.engine)
+
         elapsed = time.time() - start
 
         return jsonify({
@@ -45,9 +45,13 @@ def get_supply_summary():
             },
             "byDistrict": { "D01": {...}, ... },
             "totals": { unsoldInventory, upcomingLaunches, glsPipeline, totalEffectiveSupply },
-            "meta": { launchYear, includeGls, computedAs, asOfDate, warnings }
+            "meta": { launchYear, includeGls, computedAs, asOfDate, warnings,
+                      snapshotBuiltAt, inputGenerations, stale }
         }
 
+    Served from the precomputed supply snapshot (rebuilt when GLS tenders,
+    upcoming launches or transactions change); computed live if missing.
+
     Example:
         GET /api/supply/summary?includeGls=true&launchYear=2026
     """
@@ -12,9 +12,10 @@ Note: This orchestrator is for WEB SCRAPING only.
 For CSV/file uploads, use the ETL pipeline (etl-pipeline agent).
 """
 import logging
+import time
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set, Type
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
 
 from .base import BaseScraper, ScrapeMode, ScrapeResult
 from .tier_system import SourceTier, get_tier_config
@@ -22,6 +23,7 @@ from .field_authority import FieldAuthorityChecker
 from .utils.hashing import compute_json_hash
 from .utils.schema_diff import detect_schema_changes
 from .utils.diff import (
+    CONTENT_HASH_FIELD,
     DiffStatus,
     DiffReport,
     EntityDiff,
@@ -32,6 +34,11 @@ from .utils.diff import (
 logger = logging.getLogger(__name__)
 
 
+def _elapsed_ms(start: float) -> float:
+    """Milliseconds since a time.perf_counter() reading."""
+    return round((time.perf_counter() - start) * 1000, 2)
+
+
 class PromotionResult:
     """Result of promoting a scraped entity to canonical."""
 
@@ -137,15 +144,20 @@ class ScrapingOrchestrator:
 
         return run
 
-    def promote_run(self, run_id: str) -> Dict[str, int]:
+    def promote_run(self, run_id: str) -> Dict[str, Any]:
         """
         Promote all entities from a scrape run.
 
+        Runs as a bulk pass: existing canonicals and previous scraped versions
+        for every key in the run are prefetched in one query each, diffs and
+        conflict checks run in memory, and all new canonicals, candidates and
+        schema-change rows go out in a single flush.
+
         Args:
             run_id: ID of the scrape run
 
         Returns:
-            Dict with promotion statistics
+            Dict with promotion statistics and per-phase timings (ms)
         """
         from .models import ScrapedEntity
 
@@ -156,29 +168,123 @@ class ScrapingOrchestrator:
             "candidate": 0,
             "skipped": 0,
         }
+        timings: Dict[str, float] = {}
 
+        phase_start = time.perf_counter()
         entities = self.db_session.query(ScrapedEntity).filter_by(
             run_id=run_id
         ).all()
+        timings["load"] = _elapsed_ms(phase_start)
+
+        phase_start = time.perf_counter()
+        canonicals = self._prefetch_canonicals(entities)
+        previous_versions = self._prefetch_previous_versions(entities)
+        timings["prefetch"] = _elapsed_ms(phase_start)
 
+        phase_start = time.perf_counter()
+        pending: List[Tuple[PromotionResult, Any]] = []
         for entity in entities:
             stats["total"] += 1
-            result = self._promote_entity(entity)
-
-            if result.action == "created":
-                stats["created"] += 1
-            elif result.action == "updated":
-                stats["updated"] += 1
-            elif result.action == "candidate":
-                stats["candidate"] += 1
+            result = self._promote_entity(
+                entity, canonicals, previous_versions, pending
+            )
+
+            if result.action in ("created", "updated", "candidate"):
+                stats[result.action] += 1
             else:
                 stats["skipped"] += 1
+        timings["diff"] = _elapsed_ms(phase_start)
 
+        phase_start = time.perf_counter()
+        self.db_session.flush()
+        for result, obj in pending:
+            if result.action == "candidate":
+                result.candidate_id = obj.id
+            else:
+                result.canonical_id = obj.id
+        timings["write"] = _elapsed_ms(phase_start)
+
+        phase_start = time.perf_counter()
         self.db_session.commit()
+        timings["commit"] = _elapsed_ms(phase_start)
+
+        stats["timings_ms"] = timings
         logger.info(f"Promotion complete for run {run_id}: {stats}")
         return stats
 
-    def _promote_entity(self, scraped) -> PromotionResult:
+    def _prefetch_canonicals(self, entities) -> Dict[Tuple[str, str], Any]:
+        """
+        Load existing canonicals for every (entity_type, entity_key) in a run.
+
+        One query for the whole run instead of one lookup per entity.
+        """
+        from .models import CanonicalEntity
+
+        keys = {(e.entity_type, e.entity_key) for e in entities}
+        if not keys:
+            return {}
+
+        rows = self.db_session.query(CanonicalEntity).filter(
+            CanonicalEntity.entity_type.in_(sorted({t for t, _ in keys})),
+            CanonicalEntity.entity_key.in_(sorted({k for _, k in keys})),
+        ).all()
+
+        return {
+            (row.entity_type, row.entity_key): row
+            for row in rows
+            if (row.entity_type, row.entity_key) in keys
+        }
+
+    def _prefetch_previous_versions(
+        self, entities
+    ) -> Dict[Tuple[str, str, str], List[Any]]:
+        """
+        Load the two newest scraped versions for every key in a run.
+
+        Grouped by (entity_type, entity_key, source_domain), newest first.
+        The schema change check wants the latest row that is not the entity
+        itself, which is always one of the two newest, so older history is
+        never loaded however many runs a source has accumulated.
+        """
+        from sqlalchemy import func, tuple_
+        from .models import ScrapedEntity
+
+        keys = {(e.entity_type, e.entity_key, e.source_domain) for e in entities}
+        if not keys:
+            return {}
+
+        key_columns = (
+            ScrapedEntity.entity_type,
+            ScrapedEntity.entity_key,
+            ScrapedEntity.source_domain,
+        )
+        ranked = self.db_session.query(
+            ScrapedEntity.id.label("id"),
+            func.row_number().over(
+                partition_by=key_columns,
+                order_by=ScrapedEntity.scraped_at.desc(),
+            ).label("version_rank"),
+        ).filter(tuple_(*key_columns).in_(sorted(keys))).subquery()
+
+        rows = self.db_session.query(ScrapedEntity).join(
+            ranked, ranked.c.id == ScrapedEntity.id
+        ).filter(
+            ranked.c.version_rank <= 2
+        ).order_by(ScrapedEntity.scraped_at.desc()).all()
+
+        versions: Dict[Tuple[str, str, str], List[Any]] = {}
+        for row in rows:
+            key = (row.entity_type, row.entity_key, row.source_domain)
+            versions.setdefault(key, []).append(row)
+        return versions
+
+    def _promote_entity(
+        self,
+        scraped,
+        canonicals: Dict[Tuple[str, str], Any],
+        previous_versions: Dict[Tuple[str, str, str], List[Any]],
+        pending: List[Tuple[PromotionResult, Any]],
+    ) -> PromotionResult:
         """
         Promote a single scraped entity to canonical.
 
@@ -186,38 +292,43 @@ class ScrapingOrchestrator:
         1. Tier A: Direct promotion, can create or update
         2. Tier B: Promote with validation, restricted fields
         3. Tier C: Candidate only
-        """
-        from .models import CanonicalEntity, EntityCandidate
 
+        New rows are added to the session without flushing; their IDs are
+        filled in on the returned result once the batch is flushed.
+        """
         tier = SourceTier(scraped.source_tier)
         tier_config = get_tier_config(tier)
 
         # Tier C cannot update canonical
         if not tier_config.can_update_canonical:
             candidate = self._create_candidate(scraped, reason="tier_c_only")
-            return PromotionResult(
+            result = PromotionResult(
                 entity_key=scraped.entity_key,
                 action="candidate",
-                candidate_id=candidate.id,
                 reason="tier_c_only",
             )
+            pending.append((result, candidate))
+            return result
 
         # Check for schema changes
-        self._check_schema_change(scraped)
+        self._check_schema_change(scraped, previous_versions)
 
-        # Find existing canonical
-        existing = self.db_session.query(CanonicalEntity).filter_by(
-            entity_type=scraped.entity_type,
-            entity_key=scraped.entity_key,
-        ).first()
+        # Find existing canonical (including ones created earlier in this batch)
+        key = (scraped.entity_type, scraped.entity_key)
+        existing = canonicals.get(key)
 
         if existing:
-            return self._update_canonical(existing, scraped, tier)
+            result, obj = self._update_canonical(existing, scraped, tier)
         else:
-            return self._create_canonical(scraped, tier)
+            result, obj = self._create_canonical(scraped, tier)
+            canonicals[key] = obj
+
+        if obj is not None:
+            pending.append((result, obj))
+        return result
 
-    def _create_canonical(self, scraped, tier: SourceTier) -> PromotionResult:
-        """Create new canonical entity."""
+    def _create_canonical(self, scraped, tier: SourceTier):
+        """Create new canonical entity (added to the session, not flushed)."""
         from .models import CanonicalEntity
 
         # Filter fields based on authority
@@ -245,21 +356,38 @@ class ScrapingOrchestrator:
             last_promoted_at=datetime.utcnow(),
         )
         self.db_session.add(canonical)
-        self.db_session.flush()  # Get ID
 
         logger.debug(f"Created canonical: {scraped.entity_key}")
-        return PromotionResult(
+        result = PromotionResult(
             entity_key=scraped.entity_key,
             action="created",
-            canonical_id=canonical.id,
         )
+        return result, canonical
 
-    def _update_canonical(
-        self, existing, scraped, tier: SourceTier
-    ) -> PromotionResult:
-        """Update existing canonical with new data."""
-        from .models import EntityCandidate
+    def _find_conflicts(
+        self, existing, allowed_data: Dict[str, Any], entity_type: str,
+        tier: SourceTier, existing_tier: SourceTier,
+    ) -> List[str]:
+        """
+        Fields whose incoming value differs from canonical and cannot be overridden.
+
+        Uses exact equality (not the tolerant comparison in utils.diff) so
+        conflict gating matches what has always been promoted.
+        """
+        conflicts = []
+        for field, value in allowed_data.items():
+            existing_value = existing.canonical.get(field)
+            if existing_value is not None and existing_value != value:
+                # Check if this tier can override
+                can_override = self.field_authority.can_update(
+                    entity_type, field, tier, existing_tier
+                )
+                if not can_override:
+                    conflicts.append(field)
+        return conflicts
 
+    def _update_canonical(self, existing, scraped, tier: SourceTier):
+        """Update existing canonical with new data."""
         existing_tier = SourceTier(existing.highest_tier)
 
         # Filter fields based on authority and existing tier
@@ -271,16 +399,9 @@ class ScrapingOrchestrator:
         )
 
         # Check for conflicts
-        conflicts = []
-        for field, value in allowed_data.items():
-            existing_value = existing.canonical.get(field)
-            if existing_value is not None and existing_value != value:
-                # Check if this tier can override
-                can_override = self.field_authority.can_update(
-                    scraped.entity_type, field, tier, existing_tier
-                )
-                if not can_override:
-                    conflicts.append(field)
+        conflicts = self._find_conflicts(
+            existing, allowed_data, scraped.entity_type, tier, existing_tier
+        )
 
         if conflicts:
             # Create candidate for conflicting updates
@@ -292,12 +413,12 @@ class ScrapingOrchestrator:
                     for f in conflicts
                 },
             )
-            return PromotionResult(
+            result = PromotionResult(
                 entity_key=scraped.entity_key,
                 action="candidate",
-                candidate_id=candidate.id,
                 reason=f"field_conflicts: {conflicts}",
             )
+            return result, candidate
 
         if allowed_data:
             # Update canonical
@@ -310,17 +431,19 @@ class ScrapingOrchestrator:
             )
 
             logger.debug(f"Updated canonical: {scraped.entity_key}")
-            return PromotionResult(
+            result = PromotionResult(
                 entity_key=scraped.entity_key,
                 action="updated",
                 canonical_id=existing.id,
             )
+            return result, existing
 
-        return PromotionResult(
+        result = PromotionResult(
             entity_key=scraped.entity_key,
             action="skipped",
             reason="no_new_data",
         )
+        return result, None
 
     def _create_candidate(
         self,
@@ -328,7 +451,7 @@ class ScrapingOrchestrator:
         reason: str,
         conflict_details: Optional[Dict] = None,
     ):
-        """Create a candidate for manual review."""
+        """Create a candidate for manual review (added to the session, not flushed)."""
         from .models import EntityCandidate
 
         candidate = EntityCandidate(
@@ -343,22 +466,19 @@ class ScrapingOrchestrator:
             conflict_details=conflict_details,
         )
         self.db_session.add(candidate)
-        self.db_session.flush()
 
         logger.debug(f"Created candidate: {scraped.entity_key} reason={reason}")
         return candidate
 
-    def _check_schema_change(self, entity):
-        """Check for schema changes and log if detected."""
-        from .models import ScrapedEntity, ScraperSchemaChange
+    def _check_schema_change(self, entity, previous_versions):
+        """Check for schema changes against the prefetched previous version."""
+        from .models import ScraperSchemaChange
 
-        # Find previous version
-        previous = self.db_session.query(ScrapedEntity).filter(
-            ScrapedEntity.entity_type == entity.entity_type,
-            ScrapedEntity.entity_key == entity.entity_key,
-            ScrapedEntity.source_domain == entity.source_domain,
-            ScrapedEntity.id != entity.id,
-        ).order_by(ScrapedEntity.scraped_at.desc()).first()
+        # Latest prior version from the same source (excluding this row)
+        versions = previous_versions.get(
+            (entity.entity_type, entity.entity_key, entity.source_domain), []
+        )
+        previous = next((v for v in versions if v.id != entity.id), None)
 
         if previous and previous.extracted_hash != entity.extracted_hash:
             changes = detect_schema_changes(previous.extracted, entity.extracted)
@@ -483,39 +603,21 @@ class ScrapingOrchestrator:
         Returns:
             DiffReport with unchanged/changed/new/missing and conflicts
         """
-        from models.gls_tender import GLSTender
+        from models.gls_tender import GLSTender, GLS_COMPARE_FIELDS
 
         run_id = run_id or str(uuid.uuid4())
 
-        # Load existing records as dict keyed by release_id
+        # Load existing records as dict keyed by release_id, with the content
+        # hash stored at write time so unchanged tenders skip the field diff
         existing_tenders = self.db_session.query(GLSTender).all()
         existing_dict = {}
         for tender in existing_tenders:
             tender_dict = tender.to_dict(include_status_label=False)
+            tender_dict[CONTENT_HASH_FIELD] = tender.content_hash
             existing_dict[tender.release_id] = tender_dict
 
         # Fields to compare (skip computed/derived fields)
-        compare_fields = {
-            "status",
-            "release_id",
-            "release_url",
-            "release_date",
-            "tender_close_date",
-            "location_raw",
-            "latitude",
-            "longitude",
-            "postal_code",
-            "postal_district",
-            "planning_area",
-            "market_segment",
-            "site_area_sqm",
-            "max_gfa_sqm",
-            "estimated_units",
-            "successful_tenderer",
-            "tendered_price_sgd",
-            "num_tenderers",
-            "psm_gfa",
-        }
+        compare_fields = set(GLS_COMPARE_FIELDS)
 
         return compute_diff_report(
             source_name="ura_gls",
@@ -106,6 +106,8 @@ class GLSTenderPromoter(BasePromoter):
 
     def _compute_derived_fields(self, tender):
         """Compute derived fields on the tender."""
+        from models.gls_tender import GLSTender
+
         SQM_TO_SQFT = Decimal("10.7639")
 
         # Site area sqft
@@ -136,3 +138,5 @@ class GLSTenderPromoter(BasePromoter):
             if tender.psf_ppr:
                 tender.implied_launch_psf_low = tender.psf_ppr * Decimal("2.5")
                 tender.implied_launch_psf_high = tender.psf_ppr * Decimal("3.0")
+
+        tender.content_hash = GLSTender.compute_content_hash(tender)
@@ -1,6 +1,6 @@
 """Scraper utility functions."""
 
-from .hashing import compute_json_hash, normalize_json_for_hash
+from .hashing import compute_json_hash, compute_record_hash, normalize_json_for_hash
 from .schema_diff import detect_schema_changes, SchemaChange
 from .diff import (
     DiffStatus,
@@ -8,12 +8,14 @@ from .diff import (
     FieldChange,
     EntityDiff,
     DiffReport,
+    CONTENT_HASH_FIELD,
     compute_entity_diff,
     compute_diff_report,
 )
 
 __all__ = [
     "compute_json_hash",
+    "compute_record_hash",
     "normalize_json_for_hash",
     "detect_schema_changes",
     "SchemaChange",
@@ -22,6 +24,7 @@ __all__ = [
     "FieldChange",
     "EntityDiff",
     "DiffReport",
+    "CONTENT_HASH_FIELD",
     "compute_entity_diff",
     "compute_diff_report",
 ]
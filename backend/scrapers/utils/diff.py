@@ -15,6 +15,11 @@ from decimal import Decimal
 from enum import Enum
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+from .hashing import compute_record_hash
+
+# Key under which a record's content hash is carried alongside its fields
+CONTENT_HASH_FIELD = "_content_hash"
+
 
 class DiffStatus(Enum):
     """Status of a record in the diff."""
@@ -389,10 +394,15 @@ def compute_entity_diff(
     existing_data: Optional[Dict[str, Any]],
     existing_id: Optional[int] = None,
     compare_fields: Optional[Set[str]] = None,
+    incoming_hash: Optional[str] = None,
+    existing_hash: Optional[str] = None,
 ) -> EntityDiff:
     """
     Compute diff for a single entity.
 
+    When both content hashes are supplied (see compute_record_hash) and
+    match, the record is UNCHANGED without any field-level comparison.
+
     Args:
         entity_key: Unique identifier for the entity
         entity_type: Type of entity (e.g., 'gls_tender')
@@ -400,6 +410,8 @@ def compute_entity_diff(
         existing_data: Current data from database (None if new)
         existing_id: Database ID of existing record
         compare_fields: Optional set of fields to compare (defaults to all)
+        incoming_hash: Content hash of incoming_data over compare_fields
+        existing_hash: Content hash of existing_data over compare_fields
 
     Returns:
         EntityDiff with status and changes
@@ -414,6 +426,16 @@ def compute_entity_diff(
             incoming_data=incoming_data,
         )
 
+    # Content hash short-circuit: identical hashes mean identical fields
+    if incoming_hash is not None and incoming_hash == existing_hash:
+        return EntityDiff(
+            entity_key=entity_key,
+            entity_type=entity_type,
+            status=DiffStatus.UNCHANGED,
+            existing_id=existing_id,
+            incoming_data=incoming_data,
+        )
+
     # Compare fields
     changes = []
     blocking = 0
@@ -424,6 +446,7 @@ def compute_entity_diff(
         fields_to_check = compare_fields
     else:
         fields_to_check = set(incoming_data.keys()) | set(existing_data.keys())
+        fields_to_check.discard(CONTENT_HASH_FIELD)
 
     for field_name in fields_to_check:
         old_value = existing_data.get(field_name)
@@ -497,6 +520,12 @@ def compute_diff_report(
     """
     Compute diff report comparing incoming records against existing.
 
+    Existing records stored with a content hash (under CONTENT_HASH_FIELD,
+    computed with compute_record_hash over the compared fields minus
+    key_field and id_field) are UNCHANGED when the incoming record hashes
+    the same; only the incoming side is hashed, and only for those rows.
+    Rows without a stored hash, and hash mismatches, get a full field diff.
+
     Args:
         source_name: Name of the data source
         source_type: Type of ingestion ('scrape', 'csv_upload', 'api')
@@ -520,6 +549,9 @@ def compute_diff_report(
     # Track which existing records we've seen
     seen_keys = set()
 
+    # The key matches by construction and ids are not content
+    hash_exclude = (CONTENT_HASH_FIELD, key_field, id_field)
+
     # Process incoming records
     for record in incoming_records:
         entity_key = record.get(key_field)
@@ -530,6 +562,15 @@ def compute_diff_report(
         existing = existing_records.get(entity_key)
         existing_id = existing.get(id_field) if existing else None
 
+        # Only rows stored with a hash can short-circuit; rehashing an
+        # unhashed row costs more than comparing its fields
+        incoming_hash = None
+        existing_hash = existing.get(CONTENT_HASH_FIELD) if existing else None
+        if existing_hash:
+            incoming_hash = record.get(CONTENT_HASH_FIELD) or compute_record_hash(
+                record, fields=compare_fields or None, exclude=hash_exclude
+            )
+
         diff = compute_entity_diff(
             entity_key=entity_key,
             entity_type=entity_type,
@@ -537,6 +578,8 @@ def compute_diff_report(
             existing_data=existing,
             existing_id=existing_id,
             compare_fields=compare_fields,
+            incoming_hash=incoming_hash,
+            existing_hash=existing_hash,
         )
         report.add_diff(diff)
 
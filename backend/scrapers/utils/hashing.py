@@ -8,7 +8,7 @@ Provides deterministic hashing of JSON data for:
 """
 import hashlib
 import json
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, Iterable, List, Optional, Union
 from decimal import Decimal
 from datetime import date, datetime
 
@@ -103,6 +103,62 @@ def compute_field_hashes(data: Dict[str, Any]) -> Dict[str, str]:
     }
 
 
+def _normalize_record_value(value: Any) -> Any:
+    """
+    Normalize a single field value for record content hashing.
+
+    Mirrors utils.diff._normalize_value (strip strings, blank -> None,
+    Decimal -> float) so equal hashes imply equal field values. Non-JSON
+    types are tagged with their type name so e.g. a date never hashes the
+    same as its ISO string.
+    """
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, str):
+        stripped = value.strip()
+        return stripped if stripped else None
+    if isinstance(value, (datetime, date)):
+        return f"{type(value).__name__}:{value.isoformat()}"
+    return value
+
+
+def compute_record_hash(
+    record: Dict[str, Any],
+    fields: Optional[Iterable[str]] = None,
+    exclude: Iterable[str] = (),
+) -> str:
+    """
+    Compute a canonical content hash of a flat record.
+
+    Used by the diff engine to skip field-level comparison when incoming and
+    existing rows hash the same. Fields whose normalized value is None are
+    dropped, matching how missing and null fields compare as equal.
+
+    Args:
+        record: Flat dictionary of field values
+        fields: Fields to include (defaults to all keys in the record)
+        exclude: Fields to always leave out (e.g. the stored hash itself)
+
+    Returns:
+        64-character hex SHA256 hash
+    """
+    excluded = set(exclude)
+    keys = record.keys() if fields is None else fields
+
+    normalized = {}
+    for key in keys:
+        if key in excluded:
+            continue
+        value = _normalize_record_value(record.get(key))
+        if value is not None:
+            normalized[key] = value
+
+    json_str = json.dumps(
+        normalized, sort_keys=True, ensure_ascii=False, default=repr
+    )
+    return hashlib.sha256(json_str.encode("utf-8")).hexdigest()
+
+
 def compute_raw_html_hash(html: str) -> str:
     """
     Compute hash of raw HTML content.
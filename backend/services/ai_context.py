@@ -13,20 +13,28 @@ Design principles:
 Context types:
 - Chart types (absolute_psf, beads, etc.): Single chart interpretation
 - Argus: Comprehensive project/unit analysis using all relevant context
+
+Documents are held in memory by ContextStore: each file is read and indexed
+by heading once, and reloaded only when its mtime or the manifest changes.
 """
 
 import json
 import hashlib
 import logging
+import threading
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 # Base path for AI context documents
 AI_CONTEXT_DIR = Path(__file__).parent.parent.parent / "docs" / "ai-context"
 
+# Minimum seconds between freshness checks (stat of manifest + loaded files)
+CONTEXT_RECHECK_SECONDS = 5.0
+
 
 @dataclass
 class ContextBundle:
@@ -51,6 +59,159 @@ class ContextBundle:
         return f"ai:interpret:{self.chart_type}:{snapshot_version}:{payload_hash}:{filter_hash}"
 
 
+def _mtime(path: Path) -> Optional[float]:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return None
+
+
+@dataclass
+class _ContextFile:
+    """One loaded document with its heading index."""
+    mtime: Optional[float]
+    content: Optional[str]
+    lines: List[str] = field(default_factory=list)
+    # (line number, heading level, lowercased heading line)
+    headings: List[Tuple[int, int, str]] = field(default_factory=list)
+    sections: Dict[str, Optional[str]] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path) -> '_ContextFile':
+        mtime = _mtime(path)
+        if mtime is None:
+            logger.warning(f"Context file not found: {path}")
+            return cls(mtime=None, content=None)
+        try:
+            with open(path, "r") as f:
+                content = f.read()
+        except Exception as e:
+            logger.error(f"Error loading {path}: {e}")
+            return cls(mtime=mtime, content=None)
+
+        lines = content.split("\n")
+        headings = [
+            (i, len(line) - len(line.lstrip("#")), line.lower())
+            for i, line in enumerate(lines)
+            if line.strip().startswith("#")
+        ]
+        return cls(mtime=mtime, content=content, lines=lines, headings=headings)
+
+    def section(self, section: str) -> Optional[str]:
+        """
+        Extract a section by heading (memoized).
+
+        Starts at the first heading containing `section` (case-insensitive),
+        keeps later matching headings and all body lines, and stops at the
+        next non-matching heading at the same or a higher level.
+        """
+        if section in self.sections:
+            return self.sections[section]
+
+        needle = section.lower()
+        section_level = section.count("#")
+        start = next((i for i, _, text in self.headings if needle in text), None)
+
+        result = None
+        if start is not None:
+            heading_at = {i: (level, text) for i, level, text in self.headings}
+            section_lines = []
+            for i in range(start, len(self.lines)):
+                if i in heading_at:
+                    level, text = heading_at[i]
+                    if needle in text:
+                        section_lines.append(self.lines[i])
+                    elif level <= section_level:
+                        break
+                else:
+                    section_lines.append(self.lines[i])
+            result = "\n".join(section_lines) if section_lines else None
+
+        self.sections[section] = result
+        return result
+
+
+class ContextStore:
+    """
+    In-memory, heading-indexed view of the AI context directory.
+
+    Files load on first use. At most every `recheck_seconds` the store stats
+    manifest.json and every loaded file: a changed manifest (mtime or any
+    file version) drops all files, a changed file mtime reloads that file.
+    """
+
+    def __init__(self, context_dir: Path, recheck_seconds: float = CONTEXT_RECHECK_SECONDS):
+        self.context_dir = context_dir
+        self.recheck_seconds = recheck_seconds
+        self._manifest: dict = {}
+        self._manifest_mtime: Optional[float] = None
+        self._files: Dict[str, _ContextFile] = {}
+        self._checked_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    def manifest(self) -> dict:
+        self._refresh()
+        return self._manifest
+
+    def file(self, relative_path: str) -> Optional[str]:
+        return self._get(relative_path).content
+
+    def section(self, relative_path: str, section: str) -> Optional[str]:
+        entry = self._get(relative_path)
+        if entry.content is None:
+            return None
+        return entry.section(section)
+
+    def _get(self, relative_path: str) -> _ContextFile:
+        self._refresh()
+        entry = self._files.get(relative_path)
+        if entry is None:
+            with self._lock:
+                entry = self._files.get(relative_path)
+                if entry is None:
+                    entry = _ContextFile.load(self.context_dir / relative_path)
+                    self._files[relative_path] = entry
+                    self.loads += 1
+        return entry
+
+    def _refresh(self) -> None:
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < self.recheck_seconds:
+            return
+
+        with self._lock:
+            if self._checked_at is not None and now - self._checked_at < self.recheck_seconds:
+                return
+
+            manifest_path = self.context_dir / "manifest.json"
+            manifest_mtime = _mtime(manifest_path)
+            if self._checked_at is None or manifest_mtime != self._manifest_mtime:
+                manifest = self._read_manifest(manifest_path)
+                if manifest.get("files") != self._manifest.get("files"):
+                    self._files.clear()
+                self._manifest = manifest
+                self._manifest_mtime = manifest_mtime
+
+            for relative_path, entry in list(self._files.items()):
+                if _mtime(self.context_dir / relative_path) != entry.mtime:
+                    del self._files[relative_path]
+
+            self._checked_at = now
+
+    @staticmethod
+    def _read_manifest(manifest_path: Path) -> dict:
+        if not manifest_path.exists():
+            logger.warning(f"Manifest not found at {manifest_path}")
+            return {}
+        try:
+            with open(manifest_path, "r") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.error(f"Error loading {manifest_path}: {e}")
+            return {}
+
+
 class PropertyContext:
     """
     Context assembly for Singapore property market AI agent.
@@ -132,33 +293,16 @@ class PropertyContext:
 
     def __init__(self, context_dir: Optional[Path] = None):
         self.context_dir = context_dir or AI_CONTEXT_DIR
-        self._manifest = None
+        self._store = ContextStore(self.context_dir)
 
     @property
     def manifest(self) -> dict:
-        """Load and cache manifest.json."""
-        if self._manifest is None:
-            manifest_path = self.context_dir / "manifest.json"
-            if manifest_path.exists():
-                with open(manifest_path, "r") as f:
-                    self._manifest = json.load(f)
-            else:
-                logger.warning(f"Manifest not found at {manifest_path}")
-                self._manifest = {}
-        return self._manifest
+        """Current manifest.json (reloaded when it changes on disk)."""
+        return self._store.manifest()
 
     def _load_file(self, relative_path: str) -> Optional[str]:
-        """Load a context file by relative path."""
-        file_path = self.context_dir / relative_path
-        if not file_path.exists():
-            logger.warning(f"Context file not found: {file_path}")
-            return None
-        try:
-            with open(file_path, "r") as f:
-                return f.read()
-        except Exception as e:
-            logger.error(f"Error loading {file_path}: {e}")
-            return None
+        """Load a context file by relative path (from the in-memory store)."""
+        return self._store.file(relative_path)
 
     def _load_section(self, file_path: str, section: Optional[str] = None) -> Optional[str]:
         """
@@ -171,28 +315,9 @@ class PropertyContext:
         Returns:
             File content or section content
         """
-        content = self._load_file(file_path)
-        if content is None or section is None:
-            return content
-
-        # Extract section by heading
-        lines = content.split("\n")
-        in_section = False
-        section_lines = []
-        section_level = section.count("#")
-
-        for line in lines:
-            if line.strip().startswith("#"):
-                current_level = len(line) - len(line.lstrip("#"))
-                if section.lower() in line.lower():
-                    in_section = True
-                    section_lines.append(line)
-                elif in_section and current_level <= section_level:
-                    break
-            elif in_section:
-                section_lines.append(line)
-
-        return "\n".join(section_lines) if section_lines else None
+        if section is None:
+            return self._store.file(file_path)
+        return self._store.section(file_path, section)
 
     def get_relevant_static(self, context_type: str) -> list:
         """
@@ -0,0 +1,186 @@
+"""
+AI Stream Single-Flight - one upstream LLM stream per cache key
+
+Identical chart interpretation requests (same chart, data, filters and
+snapshot version, i.e. the same routes.ai._get_cache_key) arriving while a
+stream is in progress subscribe to that stream instead of starting another
+model call:
+
+- The first request (leader) starts the upstream stream in a background
+  thread, so a leader disconnect does not starve its subscribers
+- Every event is recorded; subscribers replay what was already produced,
+  then receive new events as they arrive
+- On a clean finish the full text is handed to on_complete (cache write)
+  once, before the flight is retired, so later requests hit the cache
+
+Flights are per process (each gunicorn worker has its own registry); the
+Redis cache still dedupes across workers once a response completes.
+
+Usage:
+    from services.ai_stream_flight import get_stream_flights
+
+    events, is_leader = get_stream_flights().subscribe(
+        cache_key, produce, on_complete=lambda text: cache(cache_key, text)
+    )
+    for event in events:
+        yield event.to_sse()
+"""
+
+import logging
+import threading
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from services.ai_service import StreamEvent
+
+logger = logging.getLogger(__name__)
+
+# Subscribers give up if the upstream stream produces nothing for this long
+STREAM_IDLE_TIMEOUT_SECONDS = 120
+
+
+class _Flight:
+    """Recorded events of one in-progress upstream stream."""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.events: List[StreamEvent] = []
+        self.done = False
+        self.failed = False
+        self.subscribers = 0
+        self._cond = threading.Condition()
+
+    def publish(self, event: StreamEvent) -> None:
+        with self._cond:
+            self.events.append(event)
+            if event.event_type == 'error':
+                self.failed = True
+            self._cond.notify_all()
+
+    def finish(self) -> None:
+        with self._cond:
+            self.done = True
+            self._cond.notify_all()
+
+    def text(self) -> str:
+        return ''.join(
+            e.data.get('content', '') for e in self.events if e.event_type == 'token'
+        )
+
+    def replay(self, idle_timeout: float) -> Iterator[StreamEvent]:
+        """Yield every event from the start, blocking for new ones until done."""
+        index = 0
+        while True:
+            with self._cond:
+                while index >= len(self.events) and not self.done:
+                    if not self._cond.wait(timeout=idle_timeout):
+                        logger.warning(f"AI stream {self.key} idle for {idle_timeout}s")
+                        yield StreamEvent(
+                            event_type="error",
+                            data={"type": "error", "message": "Stream interrupted"}
+                        )
+                        return
+                pending = self.events[index:]
+                index = len(self.events)
+                finished = self.done
+
+            yield from pending
+
+            if finished and index >= len(self.events):
+                return
+
+
+class StreamSingleFlight:
+    """Registry of in-progress upstream streams keyed by cache key."""
+
+    def __init__(self, idle_timeout: float = STREAM_IDLE_TIMEOUT_SECONDS):
+        self.idle_timeout = idle_timeout
+        self._flights: Dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+        self.stats = {"leaders": 0, "followers": 0}
+
+    def subscribe(
+        self,
+        key: str,
+        produce: Callable[[], Iterable[StreamEvent]],
+        on_complete: Optional[Callable[[str], None]] = None,
+    ) -> Tuple[Iterator[StreamEvent], bool]:
+        """
+        Join the in-progress stream for key, or start one.
+
+        Args:
+            key: Cache key identifying identical requests
+            produce: Called once per flight to create the upstream event stream
+            on_complete: Called with the full text after a clean finish
+
+        Returns:
+            (event iterator, True if this call started the upstream stream)
+        """
+        with self._lock:
+            flight = self._flights.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = _Flight(key)
+                self._flights[key] = flight
+                self.stats["leaders"] += 1
+            else:
+                self.stats["followers"] += 1
+            flight.subscribers += 1
+
+        if is_leader:
+            threading.Thread(
+                target=self._run,
+                args=(flight, produce, on_complete),
+                name=f"ai-stream:{key}",
+                daemon=True,
+            ).start()
+        else:
+            logger.info(f"Joined in-progress AI stream {key} ({flight.subscribers} subscribers)")
+
+        return flight.replay(self.idle_timeout), is_leader
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._flights)
+
+    def _run(
+        self,
+        flight: _Flight,
+        produce: Callable[[], Iterable[StreamEvent]],
+        on_complete: Optional[Callable[[str], None]],
+    ) -> None:
+        try:
+            for event in produce():
+                flight.publish(event)
+
+            text = flight.text()
+            if on_complete and text and not flight.failed:
+                on_complete(text)
+
+        except Exception as e:
+            logger.error(f"AI stream {flight.key} failed: {e}")
+            flight.publish(StreamEvent(
+                event_type="error",
+                data={"type": "error", "message": "Stream interrupted"}
+            ))
+
+        finally:
+            # Retire before waking subscribers' final read: requests arriving
+            # from here on find the cached text instead of this flight
+            with self._lock:
+                self._flights.pop(flight.key, None)
+            flight.finish()
+
+
+# Module-level singleton
+_stream_flights: Optional[StreamSingleFlight] = None
+_stream_flights_lock = threading.Lock()
+
+
+def get_stream_flights() -> StreamSingleFlight:
+    """Get the process-wide StreamSingleFlight registry."""
+    global _stream_flights
+    if _stream_flights is None:
+        with _stream_flights_lock:
+            if _stream_flights is None:
+                _stream_flights = StreamSingleFlight()
+    return _stream_flights
@@ -6,14 +6,17 @@ showing how prices vary across regions (CCR, RCR, OCR) and bedroom types (1-5+).
 
 Key Features:
 - Volume-weighted median price (transaction value as weight)
+- Volume-weighted P25/P75 for whiskers, from the same pass
 - SQL-only aggregation (no pandas, stays within 512MB RAM)
 - Grouped by region and bedroom type
 - Respects all standard filters (date, district, sale_type, etc.)
 
-Volume-Weighted Median Algorithm:
-1. Sort transactions by price within each (region, bedroom) group
-2. Calculate cumulative sum of transaction values (the "weights")
-3. Find the price where cumulative weight >= 50% of total weight
+Weighted Quantile Engine (single pass):
+1. Read (region, bedroom, price) once, sorted by price within each group
+2. One window pass yields the running weight and the group's total weight
+   (both windows share the partition, so Postgres sorts once)
+3. One streaming GROUP BY picks, per quantile q, the first price whose
+   running weight reaches q * total, alongside count and total value
 """
 
 import logging
@@ -27,46 +30,34 @@ from utils.filter_builder import build_sql_where
 
 logger = logging.getLogger('beads_chart')
 
+# Weighted quantiles computed per (region, bedroom): column -> q
+WEIGHTED_QUANTILES = {
+    'weighted_p25': 0.25,
+    'volume_weighted_median': 0.5,
+    'weighted_p75': 0.75,
+}
 
-def query_beads_chart(filters: Dict[str, Any], options: Dict[str, Any]) -> List[Dict]:
-    """
-    Query volume-weighted median prices by region and bedroom type.
-
-    Uses PostgreSQL window functions to calculate weighted median where
-    the weight is the transaction price (representing capital volume).
-
-    Args:
-        filters: Dict with date_from, date_to, districts, segments, bedrooms, etc.
-        options: Dict with query options (currently unused)
 
-    Returns:
-        List of dicts with:
-        - region: 'CCR', 'RCR', or 'OCR'
-        - bedroom: 1-5 (5 represents 5+)
-        - volumeWeightedMedian: Median price (float)
-        - transactionCount: Number of transactions (int)
-        - totalValue: Sum of all transaction prices (float)
+def _build_beads_sql(where_clause: str):
     """
-    where_parts, params = build_sql_where(filters)
-    where_clause = " AND ".join(where_parts) if where_parts else "1=1"
+    Build the single-pass weighted quantile query.
 
+    The running weight uses a ROWS frame: for tied prices the first qualifying
+    price is the same as with the peer-inclusive RANGE frame, without the
+    peer lookahead.
+    """
     # Build CCR/RCR district lists for the CASE expression
     ccr_list = ", ".join([f"'{d}'" for d in CCR_DISTRICTS])
     rcr_list = ", ".join([f"'{d}'" for d in RCR_DISTRICTS])
 
-    # Volume-Weighted Median Query
-    #
-    # Algorithm:
-    # 1. Map districts to regions and cap bedroom at 5+
-    # 2. For each (region, bedroom) group, calculate cumulative price sum
-    # 3. Find the first price where cumsum >= 50% of total (this is the weighted median)
-    # 4. Aggregate counts and totals
-    #
-    # Note: This uses DISTINCT ON which is PostgreSQL-specific
-    sql = text(f"""
+    quantile_columns = ",\n        ".join(
+        f"MIN(price) FILTER (WHERE cum_weight >= total_weight * {q}) AS {column}"
+        for column, q in WEIGHTED_QUANTILES.items()
+    )
+
+    return text(f"""
     WITH region_mapped AS (
         SELECT
-            id,
             price,
             CASE
                 WHEN district IN ({ccr_list}) THEN 'CCR'
@@ -81,39 +72,58 @@ def query_beads_chart(filters: Dict[str, Any], options: Dict[str, Any]) -> List[
           AND bedroom_count IS NOT NULL
           AND bedroom_count > 0
     ),
-    ranked AS (
+    weighted AS (
         SELECT
-            id,
             region,
             bedroom,
             price,
-            SUM(price) OVER (PARTITION BY region, bedroom ORDER BY price) as cumsum,
+            SUM(price) OVER (
+                PARTITION BY region, bedroom ORDER BY price
+                ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+            ) as cum_weight,
             SUM(price) OVER (PARTITION BY region, bedroom) as total_weight
         FROM region_mapped
-    ),
-    medians AS (
-        SELECT DISTINCT ON (region, bedroom)
-            region,
-            bedroom,
-            price as volume_weighted_median
-        FROM ranked
-        WHERE cumsum >= total_weight * 0.5
-        ORDER BY region, bedroom, price
     )
     SELECT
-        m.region,
-        m.bedroom,
-        m.volume_weighted_median,
-        COUNT(r.id) as transaction_count,
-        SUM(r.price) as total_value
-    FROM region_mapped r
-    JOIN medians m ON r.region = m.region AND r.bedroom = m.bedroom
-    GROUP BY m.region, m.bedroom, m.volume_weighted_median
+        region,
+        bedroom,
+        {quantile_columns},
+        COUNT(*) as transaction_count,
+        MAX(total_weight) as total_value
+    FROM weighted
+    GROUP BY region, bedroom
     ORDER BY
-        CASE m.region WHEN 'CCR' THEN 1 WHEN 'RCR' THEN 2 ELSE 3 END,
-        m.bedroom
+        CASE region WHEN 'CCR' THEN 1 WHEN 'RCR' THEN 2 ELSE 3 END,
+        bedroom
     """)
 
+
+def query_beads_chart(filters: Dict[str, Any], options: Dict[str, Any]) -> List[Dict]:
+    """
+    Query volume-weighted median prices by region and bedroom type.
+
+    The weight is the transaction price (representing capital volume).
+    Medians, P25/P75, counts and totals come from one scan and one sort.
+
+    Args:
+        filters: Dict with date_from, date_to, districts, segments, bedrooms, etc.
+        options: Dict with query options (currently unused)
+
+    Returns:
+        List of dicts with:
+        - region: 'CCR', 'RCR', or 'OCR'
+        - bedroom: 1-5 (5 represents 5+)
+        - volumeWeightedMedian: Median price (float)
+        - volumeWeightedP25: Weighted 25th percentile price (float)
+        - volumeWeightedP75: Weighted 75th percentile price (float)
+        - transactionCount: Number of transactions (int)
+        - totalValue: Sum of all transaction prices (float)
+    """
+    where_parts, params = build_sql_where(filters)
+    where_clause = " AND ".join(where_parts) if where_parts else "1=1"
+
+    sql = _build_beads_sql(where_clause)
+
     try:
         result = db.session.execute(sql, params).fetchall()
     except Exception as e:
@@ -129,6 +139,8 @@ def query_beads_chart(filters: Dict[str, Any], options: Dict[str, Any]) -> List[
             'region': row.region,
             'bedroom': row.bedroom,
             'volumeWeightedMedian': float(row.volume_weighted_median),
+            'volumeWeightedP25': float(row.weighted_p25),
+            'volumeWeightedP75': float(row.weighted_p75),
             'transactionCount': row.transaction_count,
             'totalValue': float(row.total_value)
         }
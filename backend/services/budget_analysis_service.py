@@ -2,25 +2,37 @@
 Budget Analysis Service - Market Activity Heatmap by Bedroom & Property Age
 
 Provides transaction count matrix for budget-based property search.
-Designed for 512MB memory constraint - SQL aggregation only.
+Designed for 512MB memory constraint: each worker keeps at most
+PRICE_INDEX_MAX_BYTES of price indexes. An index costs ~148 bytes per
+distinct price (35 int32 counts + one float64 price); a 24-month all-island
+cell (~50K transactions, ~7.5K distinct prices) measures ~1.1MB, so the
+default 32MB budget holds every commonly requested cell with headroom.
 
 Key features:
 - Row percentages (each row sums to 100%)
 - K-anonymity: row_total < 15 → low_sample, cell_count < 5 → suppressed
-- Caching with budget rounded to nearest $10K
+- Price-sorted prefix-count index per filter cell (see BudgetPriceIndex):
+  any budget ± tolerance window is answered with two binary searches,
+  without a database round-trip
+- Caching with budget rounded to nearest $10K; indexes and cached
+  responses are dropped when the dataset catalog sees new data
 """
 
+from collections import OrderedDict
 from datetime import date, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import hashlib
 import json
 import logging
 import threading
+import time
 
+import numpy as np
 from sqlalchemy import text
 
 from models.database import db
 from db.sql import OUTLIER_FILTER, get_outlier_filter_sql
+from services.dataset_catalog import get_dataset_catalog, on_dataset_change
 from constants import SALE_TYPE_NEW
 
 logger = logging.getLogger(__name__)
@@ -50,6 +62,11 @@ CACHE_TTL_SECONDS = 6 * 60 * 60  # 6 hours
 CACHE_MAX_SIZE = 200
 BUDGET_ROUND_TO = 10000  # Round budget to nearest $10K for cache key
 
+# Price index settings (one index per segment/district/tenure/lookback cell)
+PRICE_INDEX_MAX_CELLS = 64
+PRICE_INDEX_MAX_BYTES = 32 * 1024 * 1024
+PRICE_INDEX_TTL_SECONDS = CACHE_TTL_SECONDS
+
 
 # =============================================================================
 # SIMPLE TTL CACHE (reuse pattern from dashboard_service)
@@ -69,13 +86,12 @@ class BudgetHeatmapCache:
             if key not in self._cache:
                 return None
             value, expiry = self._cache[key]
-            if expiry < date.today().toordinal() * 86400:  # Rough expiry check
+            if expiry < time.time():
                 del self._cache[key]
                 return None
             return value
 
     def set(self, key: str, value: Any) -> None:
-        import time
         with self._lock:
             if len(self._cache) >= self._maxsize:
                 # Evict oldest entries
@@ -124,72 +140,147 @@ def _build_cache_key(
 
 
 # =============================================================================
-# MAIN QUERY FUNCTION
+# PRICE-SORTED PREFIX-COUNT INDEX
 # =============================================================================
 
-def get_market_activity_heatmap(
-    budget: int,
-    tolerance: int = 100000,
-    bedroom: Optional[int] = None,
-    segment: Optional[str] = None,
-    district: Optional[str] = None,
-    tenure: Optional[str] = None,
-    months_lookback: int = 24,
-    skip_cache: bool = False
-) -> Dict[str, Any]:
-    """
-    Get transaction distribution by bedroom type and property age band.
+# Bedroom classes kept in the index. Classes 1-4 are exact counts, 5 is 5+,
+# 0 is "< 1" and 6 is NULL. NULL folds into the 5+ column when no bedroom
+# filter is applied (LEAST(NULL, 5) = 5 in Postgres) but is excluded by an
+# explicit 5+ filter (NULL >= 5 is not true) - the index mirrors both.
+_BEDROOM_CLASS_OTHER = 0
+_BEDROOM_CLASS_NULL = 6
+_N_BEDROOM_CLASSES = 7
+_BAND_INDEX = {band['key']: i for i, band in enumerate(PROPERTY_AGE_BANDS)}
 
-    Args:
-        budget: Target budget in SGD
-        tolerance: +/- range around budget (default $100K)
-        bedroom: Optional bedroom filter (1-5)
-        segment: Optional market segment filter (CCR/RCR/OCR)
-        district: Optional district filter (D01-D28)
-        tenure: Optional tenure filter (Freehold/99-year/999-year)
-        months_lookback: Number of months to look back (default 24)
-        skip_cache: Bypass cache (default False)
 
-    Returns:
-        Dict with matrix data (percentages), summary stats, and insight text
+class BudgetPriceIndex:
     """
-    # Check cache
-    cache_key = _build_cache_key(
-        budget, tolerance, segment, district, bedroom, tenure, months_lookback
-    )
+    Cumulative transaction counts by (age band, bedroom class) over every
+    distinct price in one filter cell.
 
-    if not skip_cache:
-        cached = _heatmap_cache.get(cache_key)
-        if cached is not None:
-            logger.debug(f"Cache hit for {cache_key}")
-            return cached
+    counts[i] holds, per (band, bedroom class), the number of transactions
+    priced strictly below prices[i]; counts[-1] is the cell total. A price
+    window [lo, hi] is two searchsorted() lookups and one subtraction.
+    Buckets are the distinct prices themselves, so results are exact.
+    """
 
-    # Build query
-    price_min = budget - tolerance
-    price_max = budget + tolerance
+    __slots__ = ('prices', 'counts', 'built_at', 'built_on')
+
+    def __init__(self, prices: np.ndarray, counts: np.ndarray):
+        self.prices = prices
+        self.counts = counts
+        self.built_at = time.time()
+        self.built_on = date.today()
+
+    @classmethod
+    def from_rows(cls, rows) -> 'BudgetPriceIndex':
+        """
+        Build from (price, bedroom_count, age_band) rows.
+
+        Rows with an age band outside PROPERTY_AGE_BANDS are ignored.
+        """
+        n_cols = len(PROPERTY_AGE_BANDS) * _N_BEDROOM_CLASSES
+        prices: List[float] = []
+        cols: List[int] = []
+        for price, bedroom_count, age_band in rows:
+            band_idx = _BAND_INDEX.get(age_band)
+            if band_idx is None or price is None:
+                continue
+            if bedroom_count is None:
+                br_class = _BEDROOM_CLASS_NULL
+            elif bedroom_count >= 5:
+                br_class = 5
+            elif bedroom_count >= 1:
+                br_class = int(bedroom_count)
+            else:
+                br_class = _BEDROOM_CLASS_OTHER
+            prices.append(float(price))
+            cols.append(band_idx * _N_BEDROOM_CLASSES + br_class)
+
+        if not prices:
+            return cls(np.empty(0, dtype=np.float64), np.zeros((1, n_cols), dtype=np.int32))
+
+        unique_prices, price_idx = np.unique(np.asarray(prices, dtype=np.float64), return_inverse=True)
+        per_price = np.zeros((len(unique_prices), n_cols), dtype=np.int32)
+        np.add.at(per_price, (price_idx, np.asarray(cols)), 1)
+
+        counts = np.zeros((len(unique_prices) + 1, n_cols), dtype=np.int32)
+        np.cumsum(per_price, axis=0, out=counts[1:])
+        return cls(unique_prices, counts)
+
+    @property
+    def nbytes(self) -> int:
+        return self.prices.nbytes + self.counts.nbytes
+
+    def is_fresh(self) -> bool:
+        # Lookback windows are anchored on today, so a new day means a new cell
+        return (
+            self.built_on == date.today()
+            and time.time() - self.built_at < PRICE_INDEX_TTL_SECONDS
+        )
+
+    def count_matrix(
+        self,
+        price_min: float,
+        price_max: float,
+        bedroom: Optional[int] = None,
+    ) -> Dict[str, Dict[int, int]]:
+        """Raw counts per age band x bedroom type for min <= price <= max."""
+        lo = np.searchsorted(self.prices, price_min, side='left')
+        hi = np.searchsorted(self.prices, price_max, side='right')
+        window = (self.counts[max(hi, lo)] - self.counts[lo]).reshape(
+            len(PROPERTY_AGE_BANDS), _N_BEDROOM_CLASSES
+        )
+
+        matrix: Dict[str, Dict[int, int]] = {}
+        for band_idx, band in enumerate(PROPERTY_AGE_BANDS):
+            row = window[band_idx]
+            cells = {br: 0 for br in BEDROOM_TYPES}
+            if bedroom:
+                if bedroom >= 5:
+                    cells[5] = int(row[5])
+                elif bedroom >= 1:
+                    cells[bedroom] = int(row[bedroom])
+            else:
+                for br in BEDROOM_TYPES:
+                    cells[br] = int(row[br])
+                cells[5] += int(row[_BEDROOM_CLASS_NULL])
+            matrix[band['key']] = cells
+        return matrix
+
+
+_price_indexes: 'OrderedDict[Tuple, BudgetPriceIndex]' = OrderedDict()
+_price_index_lock = threading.Lock()
+
+
+def _tenure_category(tenure: Optional[str]) -> str:
+    """Collapse tenure filter input to 'freehold' / '99' / '999' / ''."""
+    if not tenure:
+        return ''
+    tenure_lower = tenure.lower().replace('-', '_').replace(' ', '_')
+    if 'freehold' in tenure_lower:
+        return 'freehold'
+    if '99' in tenure_lower and '999' not in tenure_lower:
+        return '99'
+    if '999' in tenure_lower:
+        return '999'
+    return ''
+
+
+def _build_index_rows_query(
+    segment: Optional[str],
+    district: Optional[str],
+    tenure_category: str,
+    months_lookback: int,
+):
+    """SQL + params returning (price, bedroom_count, age_band) for one cell."""
     date_from = date.today() - timedelta(days=months_lookback * 30)
 
-    # Build WHERE conditions
     where_parts = [
         get_outlier_filter_sql('t'),
-        "t.price >= :price_min",
-        "t.price <= :price_max",
         "t.transaction_date >= :date_from",
     ]
-
-    params: Dict[str, Any] = {
-        'price_min': price_min,
-        'price_max': price_max,
-        'date_from': date_from,
-    }
-
-    # Optional filters
-    if bedroom:
-        if bedroom >= 5:
-            where_parts.append("t.bedroom_count >= 5")
-        else:
-            where_parts.append("t.bedroom_count = :bedroom")
-            params['bedroom'] = bedroom
+    params: Dict[str, Any] = {'date_from': date_from}
 
     if segment:
         from constants import get_districts_for_region
@@ -204,25 +295,23 @@ def get_market_activity_heatmap(
         where_parts.append("t.district = :district")
         params['district'] = district
 
-    if tenure:
-        tenure_lower = tenure.lower().replace('-', '_').replace(' ', '_')
-        if 'freehold' in tenure_lower:
-            where_parts.append(
-                "(t.tenure ILIKE '%freehold%' OR (t.remaining_lease = 999 AND t.tenure NOT ILIKE '%999%'))"
-            )
-        elif '99' in tenure_lower and '999' not in tenure_lower:
-            where_parts.append("(t.remaining_lease < 999 AND t.remaining_lease > 0)")
-        elif '999' in tenure_lower:
-            where_parts.append("t.tenure ILIKE '%999%'")
+    if tenure_category == 'freehold':
+        where_parts.append(
+            "(t.tenure ILIKE '%freehold%' OR (t.remaining_lease = 999 AND t.tenure NOT ILIKE '%999%'))"
+        )
+    elif tenure_category == '99':
+        where_parts.append("(t.remaining_lease < 999 AND t.remaining_lease > 0)")
+    elif tenure_category == '999':
+        where_parts.append("t.tenure ILIKE '%999%'")
 
     where_clause = " AND ".join(where_parts)
 
-    # SQL with CASE statements for age bands
     # Property age = transaction_year - lease_start_year
     # Note: lease_start_year is approximate for many properties
     sql = text(f"""
         WITH age_calc AS (
             SELECT
+                t.price,
                 t.bedroom_count,
                 t.sale_type,
                 CASE
@@ -235,7 +324,8 @@ def get_market_activity_heatmap(
         ),
         classified AS (
             SELECT
-                LEAST(bedroom_count, 5) as bedroom,
+                price,
+                bedroom_count,
                 CASE
                     WHEN sale_type = '{SALE_TYPE_NEW}' THEN 'new_sale'
                     WHEN property_age IS NULL THEN 'unknown'
@@ -247,32 +337,121 @@ def get_market_activity_heatmap(
                 END as age_band
             FROM age_calc
         )
-        SELECT
-            bedroom,
-            age_band,
-            COUNT(*) as count
+        SELECT price, bedroom_count, age_band
         FROM classified
         WHERE age_band != 'unknown'
-        GROUP BY bedroom, age_band
-        ORDER BY bedroom, age_band
     """)
+    return sql, params
 
-    result = db.session.execute(sql, params).fetchall()
 
-    # Build matrix structure with raw counts
-    raw_matrix: Dict[str, Dict[int, int]] = {
-        band['key']: {br: 0 for br in BEDROOM_TYPES}
-        for band in PROPERTY_AGE_BANDS
-    }
-    total_count = 0
+def get_price_index(
+    segment: Optional[str] = None,
+    district: Optional[str] = None,
+    tenure: Optional[str] = None,
+    months_lookback: int = 24,
+    rebuild: bool = False,
+) -> BudgetPriceIndex:
+    """
+    Get (or build) the price index for one filter cell.
+
+    Built from a single scan of the cell's transactions; cached per process
+    (LRU, bounded by PRICE_INDEX_MAX_CELLS and PRICE_INDEX_MAX_BYTES) until
+    the data changes, the TTL lapses or the day rolls over.
+    """
+    key = (segment or '', district or '', _tenure_category(tenure), months_lookback)
+
+    if not rebuild:
+        with _price_index_lock:
+            index = _price_indexes.get(key)
+            if index is not None and index.is_fresh():
+                _price_indexes.move_to_end(key)
+                return index
+
+    start = time.perf_counter()
+    sql, params = _build_index_rows_query(segment, district, key[2], months_lookback)
+    rows = db.session.execute(sql, params).fetchall()
+    index = BudgetPriceIndex.from_rows(rows)
+    logger.info(
+        f"Built budget price index {key}: {len(rows)} rows, "
+        f"{len(index.prices)} price points in {(time.perf_counter() - start) * 1000:.1f}ms"
+    )
+
+    with _price_index_lock:
+        _price_indexes[key] = index
+        _price_indexes.move_to_end(key)
+        _evict_price_indexes()
+    return index
+
+
+def _evict_price_indexes() -> None:
+    """Drop least recently used indexes until within the cell and byte caps.
+
+    Caller holds _price_index_lock. The newest index is always kept.
+    """
+    total = sum(index.nbytes for index in _price_indexes.values())
+    while len(_price_indexes) > 1 and (
+        len(_price_indexes) > PRICE_INDEX_MAX_CELLS or total > PRICE_INDEX_MAX_BYTES
+    ):
+        _, evicted = _price_indexes.popitem(last=False)
+        total -= evicted.nbytes
+
+
+# =============================================================================
+# MAIN QUERY FUNCTION
+# =============================================================================
+
+def get_market_activity_heatmap(
+    budget: int,
+    tolerance: int = 100000,
+    bedroom: Optional[int] = None,
+    segment: Optional[str] = None,
+    district: Optional[str] = None,
+    tenure: Optional[str] = None,
+    months_lookback: int = 24,
+    skip_cache: bool = False
+) -> Dict[str, Any]:
+    """
+    Get transaction distribution by bedroom type and property age band.
+
+    Args:
+        budget: Target budget in SGD
+        tolerance: +/- range around budget (default $100K)
+        bedroom: Optional bedroom filter (1-5)
+        segment: Optional market segment filter (CCR/RCR/OCR)
+        district: Optional district filter (D01-D28)
+        tenure: Optional tenure filter (Freehold/99-year/999-year)
+        months_lookback: Number of months to look back (default 24)
+        skip_cache: Bypass cache (default False)
+
+    Returns:
+        Dict with matrix data (percentages), summary stats, and insight text
+    """
+    # Notices new data (sync/upload) and clears stale indexes via the listener
+    _check_data_version()
+
+    # Check cache
+    cache_key = _build_cache_key(
+        budget, tolerance, segment, district, bedroom, tenure, months_lookback
+    )
 
-    for row in result:
-        bedroom_val = row.bedroom
-        age_band = row.age_band
-        count = row.count
-        if age_band in raw_matrix and bedroom_val in raw_matrix[age_band]:
-            raw_matrix[age_band][bedroom_val] = count
-            total_count += count
+    if not skip_cache:
+        cached = _heatmap_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Cache hit for {cache_key}")
+            return cached
+
+    price_min = budget - tolerance
+    price_max = budget + tolerance
+
+    index = get_price_index(
+        segment=segment,
+        district=district,
+        tenure=tenure,
+        months_lookback=months_lookback,
+        rebuild=skip_cache,
+    )
+    raw_matrix = index.count_matrix(price_min, price_max, bedroom)
+    total_count = sum(sum(row.values()) for row in raw_matrix.values())
 
     # Calculate row totals and percentages with k-anonymity
     matrix_response: Dict[str, Any] = {}
@@ -424,6 +603,20 @@ def serialize_heatmap_v2(result: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def clear_heatmap_cache() -> None:
-    """Clear the budget heatmap cache."""
+    """Clear the budget heatmap cache and price indexes (e.g. after new data)."""
     _heatmap_cache.clear()
+    with _price_index_lock:
+        _price_indexes.clear()
     logger.info("Budget heatmap cache cleared")
+
+
+def _check_data_version() -> None:
+    """Let the dataset catalog probe for new data (free between probes)."""
+    try:
+        get_dataset_catalog()
+    except Exception as e:
+        db.session.rollback()
+        logger.debug(f"Dataset version check unavailable: {e}")
+
+
+on_dataset_change(clear_heatmap_cache)
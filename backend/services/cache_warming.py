@@ -0,0 +1,325 @@
+"""
+Adaptive Cache Warming - replay the filter combinations users actually request
+
+The startup warmers used to replay a hard-coded list of filter combinations
+that drifted from real traffic. Instead, cached endpoints report each
+request here (kind + normalized params) and the warmer replays the hottest
+ones:
+
+- Popularity is an exponentially decayed hit count per key
+  (HOT_KEY_HALF_LIFE_SECONDS), capped at MAX_TRACKED_KEYS per process
+- The top keys are persisted to a local JSON file (CACHE_WARM_STATE_PATH)
+  at most every PERSIST_INTERVAL_SECONDS; gunicorn workers merge into the
+  same file, so a restarted worker starts from the fleet's hot set
+- warm_hot_keys() replays the top N within a wall-clock budget on a small
+  thread pool (the connection budget), recomputing even if cached so
+  post-sync warming replaces stale entries
+- After a warm, requests for warmed keys are counted; the warm hit rate
+  (warmed keys requested since / warmed keys) is in get_warming_stats()
+
+Each kind names a replay function that recomputes and caches one request
+from its recorded params. Replayers are imported lazily.
+
+Usage:
+    from services.cache_warming import record_request, warm_hot_keys
+
+    record_request('kpi', {'segments': ['CCR']})   # in the endpoint
+    report = warm_hot_keys()                       # in an app context
+"""
+
+import importlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.cache_key import build_json_cache_key, normalize_cache_params
+
+logger = logging.getLogger('cache_warming')
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+HOT_KEY_HALF_LIFE_SECONDS = 6 * 3600
+MAX_TRACKED_KEYS = 2000
+MAX_PERSISTED_KEYS = 500
+PERSIST_INTERVAL_SECONDS = 60
+
+# Defaults for the app config keys read by warm_hot_keys()
+DEFAULT_WARM_TOP_N = 50
+DEFAULT_WARM_TIME_BUDGET_SECONDS = 120
+DEFAULT_WARM_MAX_CONNECTIONS = 2
+
+# kind -> "module:function" taking the recorded params
+_REPLAYERS = {
+    'dashboard': 'services.dashboard_service:replay_dashboard_request',
+    'kpi': 'routes.analytics.kpi_v2:replay_kpi_request',
+    'district_liquidity': 'routes.insights:replay_district_liquidity_request',
+}
+
+_DATE_KEYS = {'date_from', 'date_to', 'date_to_exclusive', 'max_date'}
+
+
+def state_path() -> str:
+    """Hot key file: app config CACHE_WARM_STATE_PATH, else the temp dir."""
+    from flask import current_app, has_app_context
+
+    if has_app_context() and current_app.config.get('CACHE_WARM_STATE_PATH'):
+        return current_app.config['CACHE_WARM_STATE_PATH']
+    return os.path.join(tempfile.gettempdir(), 'sg_property_hot_keys.json')
+
+
+# =============================================================================
+# POPULARITY TRACKING
+# =============================================================================
+
+class HotKeyTracker:
+    """Decayed request counts per (kind, params) key."""
+
+    def __init__(self, half_life: float = HOT_KEY_HALF_LIFE_SECONDS, max_keys: int = MAX_TRACKED_KEYS):
+        self.half_life = half_life
+        self.max_keys = max_keys
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def _decayed(self, entry: Dict[str, Any], now: float) -> float:
+        return entry['score'] * 0.5 ** ((now - entry['ts']) / self.half_life)
+
+    def record(self, key: str, kind: str, params: Dict[str, Any], now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                if len(self._entries) >= self.max_keys:
+                    coldest = min(self._entries, key=lambda k: self._decayed(self._entries[k], now))
+                    del self._entries[coldest]
+                entry = {'kind': kind, 'params': params, 'score': 0.0, 'ts': now}
+                self._entries[key] = entry
+            entry['score'] = self._decayed(entry, now) + 1.0
+            entry['ts'] = now
+
+    def merge(self, entries: Dict[str, Dict[str, Any]], now: Optional[float] = None) -> None:
+        """Fold in entries from another worker, keeping the higher decayed score."""
+        now = time.time() if now is None else now
+        with self._lock:
+            for key, other in entries.items():
+                if other.get('kind') not in _REPLAYERS:
+                    continue
+                mine = self._entries.get(key)
+                if mine is None or self._decayed(other, now) > self._decayed(mine, now):
+                    self._entries[key] = dict(other)
+
+    def top(self, n: int, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """The n hottest entries (with 'key' and decayed 'score'), hottest first."""
+        now = time.time() if now is None else now
+        with self._lock:
+            ranked = sorted(
+                ({**e, 'key': k, 'score': self._decayed(e, now), 'ts': now} for k, e in self._entries.items()),
+                key=lambda e: e['score'],
+                reverse=True,
+            )
+        return ranked[:n]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_tracker = HotKeyTracker()
+_persisted_at = time.time()
+
+# Keys replayed by the last warm, and those requested since
+_warmed: set = set()
+_warm_hits: set = set()
+_last_report: Optional[Dict[str, Any]] = None
+_warm_lock = threading.Lock()
+
+
+def record_request(kind: str, params: Dict[str, Any]) -> None:
+    """
+    Count one request for a replayable cache entry.
+
+    Never raises: popularity tracking must not affect the request.
+    """
+    global _persisted_at
+    try:
+        normalized = normalize_cache_params(params)
+        key = build_json_cache_key(kind, normalized)
+        _tracker.record(key, kind, normalized)
+        if key in _warmed:
+            _warm_hits.add(key)
+
+        if time.time() - _persisted_at >= PERSIST_INTERVAL_SECONDS:
+            _persisted_at = time.time()
+            persist_hot_keys()
+    except Exception as e:
+        logger.debug(f"Hot key tracking skipped for {kind}: {e}")
+
+
+def load_hot_keys(path: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    path = path or state_path()
+    try:
+        with open(path) as f:
+            return json.load(f).get('keys', {})
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable hot key file {path}: {e}")
+        return {}
+
+
+def persist_hot_keys(path: Optional[str] = None) -> int:
+    """Merge this worker's hot keys into the state file; returns keys written."""
+    path = path or state_path()
+    _tracker.merge(load_hot_keys(path))
+    entries = {
+        e['key']: {'kind': e['kind'], 'params': e['params'], 'score': e['score'], 'ts': e['ts']}
+        for e in _tracker.top(MAX_PERSISTED_KEYS)
+    }
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump({'saved_at': time.time(), 'keys': entries}, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning(f"Could not persist hot keys to {path}: {e}")
+        return 0
+    return len(entries)
+
+
+# =============================================================================
+# REPLAY
+# =============================================================================
+
+def _restore_dates(value: Any, key: Optional[str] = None) -> Any:
+    """Undo the ISO-string normalization of date params."""
+    if isinstance(value, dict):
+        return {k: _restore_dates(v, k) for k, v in value.items()}
+    if key in _DATE_KEYS and isinstance(value, str):
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _get_replayer(kind: str) -> Callable[[Dict[str, Any]], Any]:
+    module_name, func_name = _REPLAYERS[kind].split(':')
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def warm_hot_keys(
+    top_n: Optional[int] = None,
+    time_budget_seconds: Optional[float] = None,
+    max_connections: Optional[int] = None,
+    reason: str = 'startup',
+) -> Optional[Dict[str, Any]]:
+    """
+    Replay the hottest recorded requests. Must run inside an app context.
+
+    Args:
+        top_n: Keys to replay (app config CACHE_WARM_TOP_N)
+        time_budget_seconds: Stop starting replays after this long
+            (CACHE_WARM_TIME_BUDGET_SECONDS)
+        max_connections: Concurrent replays, i.e. DB connections used
+            (CACHE_WARM_MAX_CONNECTIONS)
+        reason: Label for logs and stats ('startup', 'data_changed', ...)
+
+    Returns:
+        Warm report, or None when no hot set has been recorded yet
+    """
+    global _last_report, _warmed, _warm_hits
+    from flask import current_app
+
+    app = current_app._get_current_object()
+    top_n = top_n or app.config.get('CACHE_WARM_TOP_N', DEFAULT_WARM_TOP_N)
+    time_budget_seconds = time_budget_seconds or app.config.get(
+        'CACHE_WARM_TIME_BUDGET_SECONDS', DEFAULT_WARM_TIME_BUDGET_SECONDS)
+    max_connections = max_connections or app.config.get(
+        'CACHE_WARM_MAX_CONNECTIONS', DEFAULT_WARM_MAX_CONNECTIONS)
+
+    if not _warm_lock.acquire(blocking=False):
+        logger.info(f"Cache warming ({reason}) skipped: a warm is already running")
+        return None
+    try:
+        previous = get_warming_stats()
+        if previous.get('warm_hit_rate') is not None:
+            logger.info(f"Previous warm hit rate: {previous['warm_hit_rate']:.0%} "
+                        f"({previous['warm_hits']}/{previous['warmed_keys']} keys)")
+
+        _tracker.merge(load_hot_keys())
+        candidates = [e for e in _tracker.top(top_n) if e['kind'] in _REPLAYERS]
+        if not candidates:
+            return None
+
+        start = time.monotonic()
+        deadline = start + time_budget_seconds
+        outcome = {'warmed': [], 'failed': 0, 'skipped_budget': 0}
+        outcome_lock = threading.Lock()
+
+        def replay(entry):
+            if time.monotonic() >= deadline:
+                with outcome_lock:
+                    outcome['skipped_budget'] += 1
+                return
+            try:
+                with app.app_context():
+                    _get_replayer(entry['kind'])(_restore_dates(entry['params']))
+                with outcome_lock:
+                    outcome['warmed'].append(entry['key'])
+            except Exception as e:
+                logger.warning(f"Warm replay failed for {entry['key']}: {e}")
+                with outcome_lock:
+                    outcome['failed'] += 1
+
+        with ThreadPoolExecutor(max_workers=max_connections, thread_name_prefix='cache-warm') as pool:
+            list(pool.map(replay, candidates))
+
+        _warmed = set(outcome['warmed'])
+        _warm_hits = set()
+        _last_report = {
+            'reason': reason,
+            'candidates': len(candidates),
+            'warmed': len(outcome['warmed']),
+            'failed': outcome['failed'],
+            'skipped_budget': outcome['skipped_budget'],
+            'elapsed_seconds': round(time.monotonic() - start, 1),
+            'finished_at': time.time(),
+        }
+        logger.info(
+            f"Cache warming ({reason}): {_last_report['warmed']}/{len(candidates)} hot keys in "
+            f"{_last_report['elapsed_seconds']}s ({outcome['failed']} failed, "
+            f"{outcome['skipped_budget']} over budget)"
+        )
+        return _last_report
+    finally:
+        _warm_lock.release()
+
+
+def schedule_cache_warming(app, reason: str) -> None:
+    """Run warm_hot_keys in a background thread (e.g. after a data change)."""
+    def run():
+        with app.app_context():
+            try:
+                warm_hot_keys(reason=reason)
+            except Exception as e:
+                logger.warning(f"Cache warming ({reason}) failed: {e}")
+
+    threading.Thread(target=run, name=f'cache-warm:{reason}', daemon=True).start()
+
+
+def get_warming_stats() -> Dict[str, Any]:
+    warmed = len(_warmed)
+    return {
+        'tracked_keys': len(_tracker),
+        'last_warm': _last_report,
+        'warmed_keys': warmed,
+        'warm_hits': len(_warm_hits),
+        'warm_hit_rate': round(len(_warm_hits) / warmed, 3) if warmed else None,
+    }
@@ -13,14 +13,13 @@ Three-tier classification system:
 Note: classifier_extended.py handles TENURE/LEASE classification, not bedrooms.
 """
 
-from datetime import date
+from datetime import date, datetime
 from typing import Optional, Union
-import pandas as pd
 
 from constants import SALE_TYPE_NEW, SALE_TYPE_RESALE
 
 # Harmonization date when AC ledge rules changed (affects unit sizes)
-HARMONIZATION_DATE = pd.Timestamp('2023-06-01')
+HARMONIZATION_DATE = date(2023, 6, 1)
 
 # =============================================================================
 # BEDROOM CLASSIFICATION THRESHOLDS
@@ -110,10 +109,36 @@ def classify_bedroom(area_sqft: float) -> int:
     return _classify_with_thresholds(area_sqft, SIMPLE_THRESHOLDS)
 
 
+def _to_date(value) -> Optional[date]:
+    """
+    Coerce a transaction date to datetime.date, or None if missing/unparseable.
+
+    pd.Timestamp is a datetime subclass, so DataFrame rows work without this
+    module importing pandas; only non-ISO strings fall back to pandas parsing.
+    """
+    if value is None or value != value:  # None or NaT/NaN
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = str(value).strip()
+    try:
+        return date.fromisoformat(text[:10])
+    except ValueError:
+        pass
+    try:
+        import pandas as pd
+        parsed = pd.to_datetime(text, errors='coerce')
+        return None if pd.isna(parsed) else parsed.date()
+    except Exception:
+        return None
+
+
 def classify_bedroom_three_tier(
     area_sqft: float,
     sale_type: Optional[str] = None,
-    transaction_date: Optional[Union[pd.Timestamp, date, str]] = None
+    transaction_date: Optional[Union[datetime, date, str]] = None
 ) -> int:
     """
     Three-tier bedroom classification based on sale type and date.
@@ -126,7 +151,7 @@ def classify_bedroom_three_tier(
     Args:
         area_sqft: Unit area in square feet
         sale_type: 'New Sale' or 'Resale' (defaults to Resale if None)
-        transaction_date: Transaction date (pd.Timestamp, date, or string)
+        transaction_date: Transaction date (datetime/pd.Timestamp, date, or string)
 
     Returns:
         Estimated bedroom count (1-5)
@@ -134,20 +159,7 @@ def classify_bedroom_three_tier(
     # Normalize sale_type
     sale_type_str = str(sale_type).strip() if sale_type else SALE_TYPE_RESALE
 
-    # Parse transaction_date if needed
-    if transaction_date is None:
-        sale_date = None
-    elif isinstance(transaction_date, pd.Timestamp):
-        sale_date = transaction_date
-    elif isinstance(transaction_date, date):
-        sale_date = pd.Timestamp(transaction_date)
-    else:
-        try:
-            sale_date = pd.to_datetime(transaction_date, errors='coerce')
-            if pd.isna(sale_date):
-                sale_date = None
-        except:
-            sale_date = None
+    sale_date = _to_date(transaction_date)
 
     # Determine which tier to use
     if sale_type_str == SALE_TYPE_NEW and sale_date is not None:
@@ -186,7 +198,7 @@ def get_bedroom_label(bedroom_count: int) -> str:
         return f"{bedroom_count}-Bedroom+"
 
 
-def get_tier_name(sale_type: Optional[str], transaction_date: Optional[pd.Timestamp]) -> str:
+def get_tier_name(sale_type: Optional[str], transaction_date: Optional[Union[datetime, date, str]]) -> str:
     """
     Get the classification tier name for debugging/logging.
 
@@ -199,8 +211,10 @@ def get_tier_name(sale_type: Optional[str], transaction_date: Optional[pd.Timest
     """
     sale_type_str = str(sale_type).strip() if sale_type else SALE_TYPE_RESALE
 
-    if sale_type_str == SALE_TYPE_NEW and transaction_date is not None:
-        if transaction_date >= HARMONIZATION_DATE:
+    sale_date = _to_date(transaction_date)
+
+    if sale_type_str == SALE_TYPE_NEW and sale_date is not None:
+        if sale_date >= HARMONIZATION_DATE:
             return "Tier 1: New Sale Post-Harmonization (Ultra Compact)"
         else:
             return "Tier 2: New Sale Pre-Harmonization (Modern Compact)"
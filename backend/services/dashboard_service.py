@@ -27,7 +27,7 @@ import hashlib
 import json
 import logging
 from datetime import date, datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional
 from functools import wraps
 import threading
 
@@ -38,6 +38,9 @@ from models.database import db
 from models.transaction import Transaction
 from db.sql import OUTLIER_FILTER
 from utils.filter_builder import build_sqlalchemy_filters, build_sql_where
+from services.cache_warming import record_request
+from utils.revalidation import submit_refresh
+from utils.single_flight import SingleFlight
 
 # Configure logging
 logger = logging.getLogger('dashboard')
@@ -58,6 +61,10 @@ MAX_LOCATION_RESULTS = 50
 # Extended TTL for better performance under load (data changes infrequently)
 CACHE_TTL_SECONDS = 600  # 10 minutes (was 5)
 CACHE_MAX_SIZE = 1000    # Increased capacity (was 500)
+# Stale-while-revalidate: past the TTL, hot entries are served for this much
+# longer while a background refresh runs (see TTLCache.get_or_revalidate)
+CACHE_STALE_TTL_SECONDS = 600
+SWR_MIN_HITS = 2
 
 # District to region mapping - import from centralized constants (SINGLE SOURCE OF TRUTH)
 from constants import (
@@ -71,31 +78,77 @@ from constants import (
 # ============================================================================
 
 class TTLCache:
-    """Simple TTL cache with max size limit."""
+    """
+    Simple TTL cache with max size limit and optional stale-while-revalidate.
+
+    Entries are fresh for `ttl` seconds. With stale_ttl > 0 an entry is
+    kept a further stale_ttl seconds; get() treats it as expired, while
+    get_or_revalidate() returns it and refreshes it in the background if
+    the key is hot (hit at least SWR_MIN_HITS times since it was set).
+    """
 
-    def __init__(self, maxsize: int = 500, ttl: int = 300):
-        self._cache = {}
+    def __init__(self, maxsize: int = 500, ttl: int = 300, stale_ttl: int = 0):
+        self._cache = {}  # key -> [value, timestamp, hits]
         self._maxsize = maxsize
         self._ttl = ttl
+        self._stale_ttl = stale_ttl
         self._lock = threading.Lock()
+        self._stale_served = 0
+
+    def _lookup(self, key: str):
+        """Entry and its age, dropping it once past the hard TTL. Caller holds the lock."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None, 0.0
+        age = time.time() - entry[1]
+        if age >= self._ttl + self._stale_ttl:
+            del self._cache[key]
+            return None, 0.0
+        return entry, age
 
     def get(self, key: str) -> Optional[Any]:
         with self._lock:
-            if key in self._cache:
-                value, timestamp = self._cache[key]
-                if time.time() - timestamp < self._ttl:
-                    return value
-                else:
-                    del self._cache[key]
+            entry, age = self._lookup(key)
+            if entry is not None and age < self._ttl:
+                entry[2] += 1
+                return entry[0]
             return None
 
+    def get_or_revalidate(self, key: str, refresh: Callable[[], Any]) -> Optional[Any]:
+        """
+        Fresh value; or, for a hot key past its soft TTL, the stale value
+        while refresh() recomputes it in the background. None otherwise.
+
+        refresh() runs at most once per key at a time (utils.revalidation);
+        its return value is stored unless it is None.
+        """
+        with self._lock:
+            entry, age = self._lookup(key)
+            if entry is None:
+                return None
+            if age < self._ttl:
+                entry[2] += 1
+                return entry[0]
+            if entry[2] < SWR_MIN_HITS:
+                return None
+            self._stale_served += 1
+            value = entry[0]
+
+        def run():
+            fresh = refresh()
+            if fresh is not None:
+                self.set(key, fresh)
+
+        submit_refresh((id(self), key), run)
+        return value
+
     def set(self, key: str, value: Any) -> None:
         with self._lock:
             # Evict oldest entries if at capacity
-            if len(self._cache) >= self._maxsize:
+            if key not in self._cache and len(self._cache) >= self._maxsize:
                 oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k][1])
                 del self._cache[oldest_key]
-            self._cache[key] = (value, time.time())
+            self._cache[key] = [value, time.time(), 0]
 
     def clear(self) -> None:
         with self._lock:
@@ -105,16 +158,17 @@ class TTLCache:
         return {
             'size': len(self._cache),
             'maxsize': self._maxsize,
-            'ttl': self._ttl
+            'ttl': self._ttl,
+            'stale_ttl': self._stale_ttl,
+            'stale_served': self._stale_served,
         }
 
 
 # Global cache instance
-_dashboard_cache = TTLCache(maxsize=CACHE_MAX_SIZE, ttl=CACHE_TTL_SECONDS)
+_dashboard_cache = TTLCache(maxsize=CACHE_MAX_SIZE, ttl=CACHE_TTL_SECONDS, stale_ttl=CACHE_STALE_TTL_SECONDS)
 
-# Locks for cache stampede prevention
-_key_locks = {}
-_key_locks_lock = threading.Lock()
+# Cache stampede prevention (state held only while a key is being computed)
+_dashboard_flight = SingleFlight('dashboard')
 
 
 def get_cache_stats() -> Dict[str, Any]:
@@ -913,9 +967,15 @@ def get_dashboard_data(
     # Build cache key
     cache_key = build_cache_key(filters, panels, options)
 
+    if not skip_cache:
+        record_request('dashboard', {'filters': filters, 'panels': panels, 'options': options})
+
     # Check cache (unless skip_cache)
+    # (a hot entry past its TTL is served stale while it refreshes in the background)
     if not skip_cache:
-        cached = _dashboard_cache.get(cache_key)
+        cached = _dashboard_cache.get_or_revalidate(
+            cache_key, lambda: get_dashboard_data(filters, panels, options, skip_cache=True)
+        )
         if cached is not None:
             elapsed = (time.perf_counter() - start_time) * 1000
             logger.info(f"Cache hit for {cache_key} in {elapsed:.1f}ms")
@@ -924,14 +984,9 @@ def get_dashboard_data(
             cached['meta']['elapsed_ms'] = round(elapsed, 1)
             return cached
 
-    # Prevent cache stampede with per-key locking
-    with _key_locks_lock:
-        if cache_key not in _key_locks:
-            _key_locks[cache_key] = threading.Lock()
-        key_lock = _key_locks[cache_key]
-
-    with key_lock:
-        # Double-check cache (another thread may have populated it)
+    # Prevent cache stampede: concurrent misses for this key wait on one computation
+    def compute():
+        # Double-check cache (the leader may have populated it)
         if not skip_cache:
             cached = _dashboard_cache.get(cache_key)
             if cached is not None:
@@ -994,6 +1049,8 @@ def get_dashboard_data(
 
         return result
 
+    return _dashboard_flight.do(cache_key, compute, share_result=False)
+
 
 # ============================================================================
 # PSF BY PRICE BAND QUERY
@@ -1146,6 +1203,16 @@ def query_psf_by_price_band(
 # CACHE WARMING (OPTIONAL)
 # ============================================================================
 
+def replay_dashboard_request(params: Dict[str, Any]) -> None:
+    """Recompute and cache one recorded dashboard request (adaptive warming)."""
+    get_dashboard_data(
+        filters=params.get('filters', {}),
+        panels=params.get('panels'),
+        options=params.get('options'),
+        skip_cache=True
+    )
+
+
 def warm_cache_for_common_queries():
     """
     Pre-populate cache with common query patterns.
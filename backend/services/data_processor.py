@@ -16,6 +16,7 @@ from typing import Optional, Dict, Any, List, Union
 from datetime import datetime, timedelta, date
 from calendar import monthrange
 from utils.normalize import coerce_to_date
+from utils.project_name import display_name
 from services.classifier import get_bedroom_label
 from services.classifier_extended import (
     classify_tenure,
@@ -956,12 +957,7 @@ def normalize_project_name(name: str) -> str:
     """
     if not name or pd.isna(name):
         return ""
-    # Convert to string, strip whitespace, convert to uppercase
-    normalized = str(name).strip().upper()
-    # Normalize common variations
-    normalized = normalized.replace("'", "'")  # Normalize apostrophes
-    normalized = normalized.replace("  ", " ")  # Multiple spaces to single
-    return normalized
+    return display_name(name)
 
 
 def get_project_aggregation_by_district(district: str, bedroom_types: list = [2, 3, 4], segment: Optional[str] = None) -> dict:
@@ -153,6 +153,7 @@ def filter_outliers_sql(column: str = 'price', dry_run: bool = False) -> Tuple[i
     """)
     result = db.session.execute(mark_sql, {'lower_bound': lower_bound, 'upper_bound': upper_bound})
     db.session.commit()
+    _refresh_after_outlier_change()
 
     outliers_marked = result.rowcount
 
@@ -192,9 +193,33 @@ def unmark_outliers() -> int:
         UPDATE transactions SET is_outlier = false WHERE is_outlier = true
     """))
     db.session.commit()
+    _refresh_after_outlier_change()
     return result.rowcount
 
 
+def _refresh_after_outlier_change() -> None:
+    """
+    Rebuild tables derived from non-outlier rows after is_outlier changes.
+
+    Failures are logged, not raised: the outlier flags are already committed.
+    """
+    from services.launch_dimension_service import refresh_launch_dimension
+    from services.price_growth_service import refresh_price_growth_columns
+
+    try:
+        refresh_price_growth_columns(db.session)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        print(f"   ⚠️  Price growth refresh failed: {e}")
+
+    try:
+        refresh_launch_dimension(db.session)
+    except Exception as e:
+        db.session.rollback()
+        print(f"   ⚠️  Launch dimension refresh failed: {e}")
+
+
 def remove_duplicates_sql() -> int:
     """
     Remove duplicate transactions using SQL.
@@ -0,0 +1,288 @@
+"""
+Dataset Catalog - In-Memory Answers to Per-Request Metadata Questions
+
+Several endpoints ask the same bookkeeping questions on every call (latest
+transaction date, total row counts, which districts exist, earliest date).
+The catalog answers them from one grouped scan held in process memory:
+
+- cells: non-outlier row counts per (sale_type, district, month) from
+  `transactions`, which answer COUNT(*) for any district / segment /
+  sale-type filter with month-aligned date bounds
+- min_date / max_date / earliest_by_district over non-outlier rows
+- districts: every district present (outliers included)
+- primary_min_date / primary_max_date: non-outlier date range of
+  `transactions_primary`
+
+Freshness: a catalog is served with zero SQL for CATALOG_CHECK_INTERVAL_SECONDS.
+After that the next caller probes the table's write counters in
+pg_stat_user_tables (one catalog row, no table scan) and rebuilds only
+when they moved. Where the probe is unavailable the catalog is rebuilt
+after CATALOG_MAX_AGE_SECONDS. Syncs and CSV uploads run in their own
+processes, so web workers pick them up through that probe rather than an
+explicit call. invalidate_dataset_catalog() forces an in-process rebuild
+(admin cache clear). on_dataset_change() listeners run when a probe finds
+the data changed (post-sync cache warming).
+
+Usage:
+    from services.dataset_catalog import get_dataset_catalog
+
+    catalog = get_dataset_catalog()
+    catalog.primary_max_date
+    catalog.count_rows(districts=['D09'], date_from=date(2024, 1, 1))
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import text
+
+from models.database import db
+from db.sql import OUTLIER_FILTER
+
+logger = logging.getLogger('dataset_catalog')
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+CATALOG_CHECK_INTERVAL_SECONDS = 60
+CATALOG_MAX_AGE_SECONDS = 600
+
+_CELLS_SQL = text("""
+    SELECT
+        sale_type,
+        district,
+        date_trunc('month', transaction_date)::date AS month,
+        COUNT(*) FILTER (WHERE COALESCE(is_outlier, false) = false) AS row_count,
+        MIN(transaction_date) FILTER (WHERE COALESCE(is_outlier, false) = false) AS min_date,
+        MAX(transaction_date) FILTER (WHERE COALESCE(is_outlier, false) = false) AS max_date
+    FROM transactions
+    GROUP BY 1, 2, 3
+""")
+
+_PRIMARY_DATE_RANGE_SQL = text(f"""
+    SELECT MIN(transaction_date) AS min_date, MAX(transaction_date) AS max_date
+    FROM transactions_primary
+    WHERE {OUTLIER_FILTER}
+""")
+
+_VERSION_SQL = text("""
+    SELECT n_tup_ins + n_tup_upd + n_tup_del AS writes
+    FROM pg_stat_user_tables
+    WHERE relname = 'transactions'
+""")
+
+
+# =============================================================================
+# DATA CLASSES
+# =============================================================================
+
+@dataclass
+class DatasetCatalog:
+    """Snapshot of dataset metadata; treat as read-only once built."""
+    cells: Dict[Tuple[Optional[str], Optional[str], Optional[date]], int]
+    districts: Tuple[str, ...]
+    min_date: Optional[date]
+    max_date: Optional[date]
+    primary_max_date: Optional[date]
+    earliest_by_district: Dict[str, date]
+    primary_min_date: Optional[date] = None
+    version: Optional[int] = None
+    built_at: float = field(default_factory=time.time)
+
+    @classmethod
+    def from_rows(cls, rows, primary_max_date: Optional[date], version: Optional[int] = None,
+                  primary_min_date: Optional[date] = None) -> 'DatasetCatalog':
+        cells = {}
+        districts = set()
+        earliest: Dict[str, date] = {}
+        min_date = max_date = None
+        for row in rows:
+            if row.district:
+                districts.add(row.district)
+            cells[(row.sale_type, row.district, row.month)] = int(row.row_count)
+            if row.min_date is None:
+                continue
+            min_date = row.min_date if min_date is None else min(min_date, row.min_date)
+            max_date = row.max_date if max_date is None else max(max_date, row.max_date)
+            if row.district and (row.district not in earliest or row.min_date < earliest[row.district]):
+                earliest[row.district] = row.min_date
+        return cls(
+            cells=cells,
+            districts=tuple(sorted(districts)),
+            min_date=min_date,
+            max_date=max_date,
+            primary_max_date=primary_max_date,
+            earliest_by_district=earliest,
+            primary_min_date=primary_min_date,
+            version=version,
+        )
+
+    @property
+    def total_rows(self) -> int:
+        return sum(self.cells.values())
+
+    def row_counts_by_sale_type(self) -> Dict[Optional[str], int]:
+        counts: Dict[Optional[str], int] = {}
+        for (sale_type, _, _), n in self.cells.items():
+            counts[sale_type] = counts.get(sale_type, 0) + n
+        return counts
+
+    def districts_in_segments(self, segments: Iterable[str]) -> List[str]:
+        """Districts present in the data that fall in any of the segments."""
+        from constants import get_region_for_district
+
+        wanted = {s.upper() for s in segments}
+        return [d for d in self.districts if get_region_for_district(d) in wanted]
+
+    def count_rows(
+        self,
+        sale_type: Optional[str] = None,
+        districts: Optional[Iterable[str]] = None,
+        date_from: Optional[date] = None,
+        date_to_exclusive: Optional[date] = None,
+    ) -> Optional[int]:
+        """
+        Non-outlier row count for a filter, or None when it cannot be exact.
+
+        sale_type matches case-insensitively (as /api/aggregate does). Date
+        bounds must fall on the 1st of a month, since counts are held per
+        month.
+        """
+        if isinstance(date_from, datetime):
+            date_from = date_from.date()
+        if isinstance(date_to_exclusive, datetime):
+            date_to_exclusive = date_to_exclusive.date()
+        for bound in (date_from, date_to_exclusive):
+            if bound is not None and bound.day != 1:
+                return None
+
+        sale_type_lower = sale_type.lower() if sale_type else None
+        district_set = set(districts) if districts is not None else None
+        total = 0
+        for (cell_sale_type, cell_district, month), n in self.cells.items():
+            if sale_type_lower is not None and (cell_sale_type or '').lower() != sale_type_lower:
+                continue
+            if district_set is not None and cell_district not in district_set:
+                continue
+            if date_from is not None and (month is None or month < date_from):
+                continue
+            if date_to_exclusive is not None and (month is None or month >= date_to_exclusive):
+                continue
+            total += n
+        return total
+
+
+# =============================================================================
+# PROCESS-LEVEL CATALOG
+# =============================================================================
+
+_catalog: Optional[DatasetCatalog] = None
+_checked_at = 0.0
+_catalog_lock = threading.Lock()
+_catalog_stats = {'builds': 0, 'probes': 0}
+_change_listeners: List[Callable[[], None]] = []
+
+
+def _probe_version() -> Optional[int]:
+    """Write counter for `transactions`, or None where pg_stat is unavailable."""
+    _catalog_stats['probes'] += 1
+    try:
+        row = db.session.execute(_VERSION_SQL).fetchone()
+    except Exception as e:
+        db.session.rollback()
+        logger.debug(f"Dataset catalog version probe unavailable: {e}")
+        return None
+    return int(row.writes) if row and row.writes is not None else None
+
+
+def _build_catalog(version: Optional[int]) -> DatasetCatalog:
+    start = time.perf_counter()
+    rows = db.session.execute(_CELLS_SQL).fetchall()
+    primary = db.session.execute(_PRIMARY_DATE_RANGE_SQL).fetchone()
+    catalog = DatasetCatalog.from_rows(
+        rows,
+        primary.max_date if primary else None,
+        version,
+        primary_min_date=primary.min_date if primary else None,
+    )
+    _catalog_stats['builds'] += 1
+    logger.info(
+        f"Built dataset catalog: {len(catalog.cells)} cells, {catalog.total_rows} rows, "
+        f"{len(catalog.districts)} districts in {(time.perf_counter() - start) * 1000:.1f}ms"
+    )
+    return catalog
+
+
+def _is_current(catalog: DatasetCatalog, version: Optional[int]) -> bool:
+    if version is None or catalog.version is None:
+        return time.time() - catalog.built_at < CATALOG_MAX_AGE_SECONDS
+    return version == catalog.version
+
+
+def get_dataset_catalog() -> DatasetCatalog:
+    """Return the current catalog, rebuilding it if the data has changed."""
+    global _catalog, _checked_at
+
+    catalog = _catalog
+    if catalog is not None and time.time() - _checked_at < CATALOG_CHECK_INTERVAL_SECONDS:
+        return catalog
+
+    with _catalog_lock:
+        # Another thread may have checked/rebuilt while we waited
+        catalog = _catalog
+        if catalog is not None and time.time() - _checked_at < CATALOG_CHECK_INTERVAL_SECONDS:
+            return catalog
+
+        version = _probe_version()
+        changed = False
+        if catalog is None or not _is_current(catalog, version):
+            changed = (catalog is not None and version is not None
+                       and catalog.version is not None and version != catalog.version)
+            catalog = _build_catalog(version)
+            _catalog = catalog
+        _checked_at = time.time()
+
+    if changed:
+        _notify_change()
+    return catalog
+
+
+def on_dataset_change(listener: Callable[[], None]) -> None:
+    """
+    Call listener (no args) when a probe finds the table's write counters
+    moved, i.e. after a sync or upload. Called on the request thread that
+    noticed the change; listeners should hand long work to a thread.
+    """
+    _change_listeners.append(listener)
+
+
+def _notify_change() -> None:
+    for listener in list(_change_listeners):
+        try:
+            listener()
+        except Exception as e:
+            logger.warning(f"Dataset change listener failed: {e}")
+
+
+def invalidate_dataset_catalog() -> None:
+    """Force the next get_dataset_catalog() call to rebuild."""
+    global _catalog, _checked_at
+    with _catalog_lock:
+        _catalog = None
+        _checked_at = 0.0
+
+
+def get_catalog_stats() -> Dict:
+    catalog = _catalog
+    return dict(
+        _catalog_stats,
+        loaded=catalog is not None,
+        version=catalog.version if catalog else None,
+        age_seconds=round(time.time() - catalog.built_at, 1) if catalog else None,
+    )
@@ -175,6 +175,26 @@ def query_bedroom_diversity(db, text, project_name: str, sale_type_db: str = Non
     return result[0] if result and result[0] else 0
 
 
+def basic_stats_from_snapshot(snapshot: Dict[str, Any], twelve_months_ago: date) -> Optional[BasicStats]:
+    """
+    BasicStats from a project_analytics_snapshot row (same shape as
+    query_basic_stats). Returns None if the project has no resales.
+    """
+    from services.project_snapshot_service import snapshot_resales_since
+
+    if not snapshot.get('resale_total'):
+        return None
+
+    median_psf = snapshot.get('resale_median_psf')
+    return BasicStats(
+        district=snapshot['resale_district'],
+        first_resale_date=snapshot['first_resale_date'],
+        total_resale_transactions=snapshot['resale_total'],
+        resales_12m=snapshot_resales_since(snapshot, twelve_months_ago),
+        median_psf=float(median_psf) if median_psf else None
+    )
+
+
 # =============================================================================
 # METRIC CALCULATION - Pure functions
 # =============================================================================
@@ -366,11 +386,15 @@ def get_exit_queue_analysis(
     db,
     text,
     project_name: str,
-    get_units_for_project
+    get_units_for_project,
+    snapshot: Optional[Dict[str, Any]] = None
 ) -> Tuple[Optional[ExitQueueResult], Optional[Dict[str, Any]], Optional[int]]:
     """
     Main orchestrator for exit queue analysis.
 
+    When a project_analytics_snapshot row is passed, resale stats, bedroom
+    diversity and registry unit data come from it instead of live queries.
+
     Returns:
         (result, error_response, status_code)
         - On success: (ExitQueueResult, None, None)
@@ -380,8 +404,14 @@ def get_exit_queue_analysis(
     current_date = datetime.now().date()
     twelve_months_ago = current_date - timedelta(days=365)
 
-    # Get unit data from hybrid lookup (CSV → database → estimation)
-    unit_data_raw = get_units_for_project(project_name)
+    # Get unit data: verified registry entry from the snapshot, otherwise
+    # the hybrid lookup (registry → CSV → database)
+    unit_data_raw = None
+    if snapshot is not None:
+        from services.project_snapshot_service import snapshot_unit_data
+        unit_data_raw = snapshot_unit_data(snapshot)
+    if unit_data_raw is None:
+        unit_data_raw = get_units_for_project(project_name)
     unit_data = UnitData(
         total_units=unit_data_raw.get('total_units') if unit_data_raw else None,
         top_year=unit_data_raw.get('top') if unit_data_raw else None,
@@ -393,7 +423,10 @@ def get_exit_queue_analysis(
     )
 
     # Query basic stats
-    basic_stats = query_basic_stats(db, text, project_name, twelve_months_ago)
+    if snapshot is not None:
+        basic_stats = basic_stats_from_snapshot(snapshot, twelve_months_ago)
+    else:
+        basic_stats = query_basic_stats(db, text, project_name, twelve_months_ago)
 
     if not basic_stats:
         return (None, {
@@ -403,7 +436,10 @@ def get_exit_queue_analysis(
         }, 404)
 
     # Query bedroom diversity
-    bedroom_types = query_bedroom_diversity(db, text, project_name)
+    if snapshot is not None:
+        bedroom_types = snapshot.get('resale_bedroom_types') or 0
+    else:
+        bedroom_types = query_bedroom_diversity(db, text, project_name)
 
     # Calculate property age
     property_age, age_source = calculate_property_age(
@@ -9,6 +9,7 @@ Two-phase model:
 Pipeline: Location -> Geocode (OneMap API) -> Postal Code -> District -> Region
 Fallback: Location -> Planning Area -> District -> Region
 """
+import bisect
 import re
 import requests
 from datetime import datetime
@@ -1119,7 +1120,242 @@ def parse_price(text: str) -> Optional[Decimal]:
 # LINK AWARDED TO LAUNCH RECORDS
 # =============================================================================
 
-def find_matching_launch_record(location_raw: str, planning_area: str, db_session, site_area_sqm: float = None) -> Optional[Dict]:
+# Common road suffixes to EXCLUDE from key place tokens (these don't distinguish sites)
+_PLACE_TOKEN_SUFFIXES = frozenset({
+    'road', 'drive', 'walk', 'close', 'central', 'way', 'avenue',
+    'lane', 'rise', 'park', 'view', 'street', 'boulevard', 'grove',
+    'crescent', 'place', 'terrace', 'link', 'loop', 'lorong', 'jalan',
+})
+
+# Road suffixes whose preceding one/two words form a road token
+_ROAD_TOKEN_SUFFIXES = ['road', 'drive', 'walk', 'close', 'central', 'way', 'avenue',
+                        'lane', 'rise', 'park', 'view', 'street', 'boulevard', 'grove']
+_ROAD_TOKEN_PATTERNS = [
+    re.compile(rf'(\w+(?:\s+\w+)?)\s+{suffix}') for suffix in _ROAD_TOKEN_SUFFIXES
+]
+
+_PARCEL_LABEL_RE = re.compile(r'\s*\(?parcel\s*[a-z0-9]+\)?', re.IGNORECASE)
+_AT_PREFIX_RE = re.compile(r'^at\s+')
+_WHITESPACE_RE = re.compile(r'\s+')
+_WORD_4PLUS_RE = re.compile(r'\b[a-z]{4,}\b')
+
+# Site areas within this ratio are considered the same parcel (20%)
+SITE_AREA_TOLERANCE = 0.20
+
+
+def _normalize_location(loc: str) -> str:
+    """Normalize location for fuzzy matching."""
+    if not loc:
+        return ""
+    loc = loc.lower().strip()
+    # Remove parcel labels like "(Parcel A)", "Parcel B", etc.
+    loc = _PARCEL_LABEL_RE.sub('', loc)
+    # Remove "at " prefix
+    loc = _AT_PREFIX_RE.sub('', loc)
+    # Remove extra whitespace
+    loc = _WHITESPACE_RE.sub(' ', loc)
+    return loc.strip()
+
+
+def _extract_key_place_tokens(loc: str) -> set:
+    """
+    Extract key place name tokens from location.
+    These are the unique identifiers that distinguish different sites.
+    E.g., "Chuan Grove" -> {"chuan"}, "Tengah Garden Avenue" -> {"tengah", "garden"}
+
+    SCALABLE: Automatically extracts meaningful words, excluding common suffixes.
+    """
+    loc = (loc or "").lower()
+    # Extract words that are at least 4 chars and not road suffixes
+    words = _WORD_4PLUS_RE.findall(loc)
+    return {w for w in words if w not in _PLACE_TOKEN_SUFFIXES}
+
+
+def _extract_road_tokens(loc: str) -> set:
+    """Extract key road/place tokens from location for fuzzy matching."""
+    loc = (loc or "").lower()
+    # Extract the base name before the suffix
+    tokens = set()
+    for pattern in _ROAD_TOKEN_PATTERNS:
+        match = pattern.search(loc)
+        if match:
+            tokens.add(match.group(1).strip())
+    # Also add individual words (for places like "Dairy Farm", "Dover")
+    tokens.update(_WORD_4PLUS_RE.findall(loc))
+    return tokens
+
+
+def _site_area_similar(area1, area2, tolerance=SITE_AREA_TOLERANCE) -> bool:
+    """Check if two site areas are within tolerance (20% by default)."""
+    if not area1 or not area2:
+        return False
+    try:
+        a1, a2 = float(area1), float(area2)
+        if a1 == 0 or a2 == 0:
+            return False
+        ratio = max(a1, a2) / min(a1, a2)
+        return ratio <= (1 + tolerance)
+    except (ValueError, TypeError):
+        return False
+
+
+def _launch_match(launch, source: Optional[str] = None) -> Dict:
+    """Build the match payload returned for a launch record."""
+    return {
+        'estimated_units': launch.estimated_units,
+        'estimated_units_source': source or launch.estimated_units_source or 'ura_stated',
+        'launch_release_id': launch.release_id
+    }
+
+
+class LaunchMatchIndex:
+    """
+    In-memory index over 'launched' tenders for awarded -> launch linking.
+
+    Built once per linking run from a single query. Normalized locations and
+    token sets are computed once per launch, tokens are indexed per planning
+    area (token -> launch positions), and site areas are kept sorted per
+    planning area for tolerance lookups. Launch positions preserve query order
+    so every pass picks the same record the linear scan would.
+    """
+
+    def __init__(self, launches: List[Any]):
+        self.launches = list(launches)
+        self.by_location_raw: Dict[str, int] = {}
+        self.by_normalized: Dict[str, int] = {}
+        self.normalized: List[str] = []
+        self.by_planning_area: Dict[Any, List[int]] = {}
+        self.road_token_index: Dict[Any, Dict[str, List[int]]] = {}
+        self.place_token_index: Dict[Any, Dict[str, List[int]]] = {}
+        self.site_areas: Dict[Any, List[Tuple[float, int]]] = {}
+
+        for pos, launch in enumerate(self.launches):
+            normalized = _normalize_location(launch.location_raw)
+            self.normalized.append(normalized)
+            self.by_location_raw.setdefault(launch.location_raw, pos)
+            self.by_normalized.setdefault(normalized, pos)
+
+            area = launch.planning_area
+            self.by_planning_area.setdefault(area, []).append(pos)
+
+            road_index = self.road_token_index.setdefault(area, {})
+            for token in _extract_road_tokens(launch.location_raw):
+                road_index.setdefault(token, []).append(pos)
+
+            place_index = self.place_token_index.setdefault(area, {})
+            for token in _extract_key_place_tokens(launch.location_raw):
+                place_index.setdefault(token, []).append(pos)
+
+            try:
+                site_area = float(launch.site_area_sqm) if launch.site_area_sqm else 0.0
+            except (ValueError, TypeError):
+                site_area = 0.0
+            if site_area > 0:
+                self.site_areas.setdefault(area, []).append((site_area, pos))
+
+        for entries in self.site_areas.values():
+            entries.sort()
+
+    @classmethod
+    def build(cls, db_session) -> "LaunchMatchIndex":
+        """Load all launched tenders with unit estimates and index them."""
+        from models.gls_tender import GLSTender
+
+        launches = db_session.query(GLSTender).filter(
+            GLSTender.status == 'launched',
+            GLSTender.estimated_units.isnot(None)
+        ).all()
+        return cls(launches)
+
+    def _token_candidates(self, index, planning_area, tokens) -> Dict[int, int]:
+        """Launch positions in a planning area sharing tokens -> shared count."""
+        area_index = index.get(planning_area, {})
+        counts: Dict[int, int] = {}
+        for token in tokens:
+            for pos in area_index.get(token, ()):
+                counts[pos] = counts.get(pos, 0) + 1
+        return counts
+
+    def match(self, location_raw: str, planning_area: str, site_area_sqm: float = None) -> Optional[Dict]:
+        """Find the launch record for an awarded tender (see find_matching_launch_record)."""
+        if not location_raw:
+            return None
+
+        # Pass 1: Exact location_raw match (any planning area)
+        pos = self.by_location_raw.get(location_raw)
+        if pos is not None:
+            return _launch_match(self.launches[pos])
+
+        # Pass 2: Exact normalized match (any planning area)
+        normalized = _normalize_location(location_raw)
+        pos = self.by_normalized.get(normalized)
+        if pos is not None:
+            return _launch_match(self.launches[pos])
+
+        if not planning_area:
+            return None
+
+        # Pass 3: Same planning area + containment match (requires shared road token)
+        awarded_tokens = _extract_road_tokens(location_raw)
+        candidates = self._token_candidates(self.road_token_index, planning_area, awarded_tokens)
+        for pos in sorted(candidates):
+            launch_normalized = self.normalized[pos]
+            if (normalized in launch_normalized) or (launch_normalized in normalized):
+                return _launch_match(self.launches[pos])
+
+        # Pass 4: Same planning area + key place token match (most overlap, first wins ties)
+        awarded_place_tokens = _extract_key_place_tokens(location_raw)
+        if awarded_place_tokens:
+            overlaps = self._token_candidates(
+                self.place_token_index, planning_area, awarded_place_tokens
+            )
+            if overlaps:
+                best_pos = min(overlaps, key=lambda p: (-overlaps[p], p))
+                return _launch_match(self.launches[best_pos])
+
+        # Pass 5: Same planning area + site area similarity (within tolerance)
+        if site_area_sqm:
+            match_pos = self._site_area_match(planning_area, site_area_sqm)
+            if match_pos is not None:
+                return _launch_match(self.launches[match_pos], 'inferred_from_site_area')
+
+        # Pass 6: Single launch in same planning area (last resort)
+        positions = self.by_planning_area.get(planning_area, [])
+        if len(positions) == 1:
+            return _launch_match(self.launches[positions[0]], 'inferred_from_planning_area')
+
+        return None
+
+    def _site_area_match(self, planning_area, site_area_sqm) -> Optional[int]:
+        """Earliest launch in the planning area whose site area is within tolerance."""
+        entries = self.site_areas.get(planning_area)
+        if not entries:
+            return None
+        try:
+            target = float(site_area_sqm)
+        except (ValueError, TypeError):
+            return None
+        if target <= 0:
+            return None
+
+        # Bisect a slightly widened window, then confirm with the exact ratio test
+        factor = 1 + SITE_AREA_TOLERANCE
+        lo = bisect.bisect_left(entries, (target / factor * (1 - 1e-9), -1))
+        hi = bisect.bisect_right(entries, (target * factor * (1 + 1e-9), len(self.launches)))
+        matches = [
+            pos for area, pos in entries[lo:hi]
+            if _site_area_similar(target, area)
+        ]
+        return min(matches) if matches else None
+
+
+def find_matching_launch_record(
+    location_raw: str,
+    planning_area: str,
+    db_session,
+    site_area_sqm: float = None,
+    index: Optional[LaunchMatchIndex] = None,
+) -> Optional[Dict]:
     """
     Find a matching 'launched' tender for an awarded tender.
 
@@ -1138,200 +1374,18 @@ def find_matching_launch_record(location_raw: str, planning_area: str, db_sessio
     The algorithm is designed to handle location name variations automatically
     without hardcoded road-specific mappings.
 
+    Pass a prebuilt LaunchMatchIndex when matching many tenders; otherwise
+    one is built from db_session for this call.
+
     Returns dict with estimated_units and source, or None if no match.
     """
-    from models.gls_tender import GLSTender
-
     if not location_raw:
         return None
 
-    # Normalize location for matching
-    def normalize_location(loc: str) -> str:
-        """Normalize location for fuzzy matching."""
-        if not loc:
-            return ""
-        loc = loc.lower().strip()
-        # Remove parcel labels like "(Parcel A)", "Parcel B", etc.
-        loc = re.sub(r'\s*\(?parcel\s*[a-z0-9]+\)?', '', loc, flags=re.IGNORECASE)
-        # Remove "at " prefix
-        loc = re.sub(r'^at\s+', '', loc)
-        # Remove extra whitespace
-        loc = re.sub(r'\s+', ' ', loc)
-        return loc.strip()
-
-    def extract_key_place_tokens(loc: str) -> set:
-        """
-        Extract key place name tokens from location.
-        These are the unique identifiers that distinguish different sites.
-        E.g., "Chuan Grove" -> {"chuan"}, "Tengah Garden Avenue" -> {"tengah", "garden"}
-
-        SCALABLE: Automatically extracts meaningful words, excluding common suffixes.
-        """
-        loc = loc.lower()
-        # Common road suffixes to EXCLUDE from tokens (these don't distinguish sites)
-        suffixes = {'road', 'drive', 'walk', 'close', 'central', 'way', 'avenue',
-                    'lane', 'rise', 'park', 'view', 'street', 'boulevard', 'grove',
-                    'crescent', 'place', 'terrace', 'link', 'loop', 'lorong', 'jalan'}
-        # Extract words that are at least 4 chars and not road suffixes
-        words = re.findall(r'\b[a-z]{4,}\b', loc)
-        tokens = {w for w in words if w not in suffixes}
-        return tokens
-
-    def extract_road_tokens(loc: str) -> set:
-        """Extract key road/place tokens from location for fuzzy matching."""
-        loc = loc.lower()
-        # Common road suffixes
-        suffixes = ['road', 'drive', 'walk', 'close', 'central', 'way', 'avenue',
-                    'lane', 'rise', 'park', 'view', 'street', 'boulevard', 'grove']
-        # Extract the base name before the suffix
-        tokens = set()
-        for suffix in suffixes:
-            match = re.search(rf'(\w+(?:\s+\w+)?)\s+{suffix}', loc)
-            if match:
-                tokens.add(match.group(1).strip())
-        # Also add individual words (for places like "Dairy Farm", "Dover")
-        words = re.findall(r'\b[a-z]{4,}\b', loc)
-        tokens.update(words)
-        return tokens
-
-    def site_area_similar(area1, area2, tolerance=0.20) -> bool:
-        """Check if two site areas are within tolerance (20% by default)."""
-        if not area1 or not area2:
-            return False
-        try:
-            a1, a2 = float(area1), float(area2)
-            if a1 == 0 or a2 == 0:
-                return False
-            ratio = max(a1, a2) / min(a1, a2)
-            return ratio <= (1 + tolerance)
-        except (ValueError, TypeError):
-            return False
-
-    normalized = normalize_location(location_raw)
-    awarded_tokens = extract_road_tokens(location_raw)
-    awarded_place_tokens = extract_key_place_tokens(location_raw)
-
-    # =========================================================================
-    # Pass 1: Exact location_raw match (any planning area)
-    # =========================================================================
-    exact_match = db_session.query(GLSTender).filter(
-        GLSTender.status == 'launched',
-        GLSTender.location_raw == location_raw,
-        GLSTender.estimated_units.isnot(None)
-    ).first()
-
-    if exact_match:
-        return {
-            'estimated_units': exact_match.estimated_units,
-            'estimated_units_source': exact_match.estimated_units_source or 'ura_stated',
-            'launch_release_id': exact_match.release_id
-        }
-
-    # Get all launched records with units for fuzzy matching
-    launched_records = db_session.query(GLSTender).filter(
-        GLSTender.status == 'launched',
-        GLSTender.estimated_units.isnot(None)
-    ).all()
-
-    # =========================================================================
-    # Pass 2: Exact normalized match (any planning area)
-    # =========================================================================
-    for launch in launched_records:
-        if normalize_location(launch.location_raw) == normalized:
-            return {
-                'estimated_units': launch.estimated_units,
-                'estimated_units_source': launch.estimated_units_source or 'ura_stated',
-                'launch_release_id': launch.release_id
-            }
-
-    # =========================================================================
-    # Pass 3: Same planning area + containment match
-    # ROBUST: Only matches within same planning area to avoid false positives
-    # =========================================================================
-    if planning_area:
-        for launch in launched_records:
-            if launch.planning_area != planning_area:
-                continue
-
-            launch_normalized = normalize_location(launch.location_raw)
-            launch_tokens = extract_road_tokens(launch.location_raw)
-
-            # Check containment
-            is_contained = (normalized in launch_normalized) or (launch_normalized in normalized)
-
-            # Check token overlap
-            shared_tokens = awarded_tokens & launch_tokens
-
-            if is_contained and shared_tokens:
-                return {
-                    'estimated_units': launch.estimated_units,
-                    'estimated_units_source': launch.estimated_units_source or 'ura_stated',
-                    'launch_release_id': launch.release_id
-                }
-
-    # =========================================================================
-    # Pass 4: Same planning area + key place token match
-    # SCALABLE: Automatically handles variations like "Chuan Grove" vs "Lorong Chuan"
-    # Both share the "chuan" token and are in Serangoon planning area
-    # =========================================================================
-    if planning_area and awarded_place_tokens:
-        best_match = None
-        best_overlap = 0
-        for launch in launched_records:
-            if launch.planning_area != planning_area:
-                continue
-
-            launch_place_tokens = extract_key_place_tokens(launch.location_raw)
-            shared = awarded_place_tokens & launch_place_tokens
-
-            # Require at least one shared token, prefer more overlap
-            if len(shared) > best_overlap:
-                best_match = launch
-                best_overlap = len(shared)
-
-        # If we found a match with token overlap in same planning area
-        if best_match and best_overlap >= 1:
-            return {
-                'estimated_units': best_match.estimated_units,
-                'estimated_units_source': best_match.estimated_units_source or 'ura_stated',
-                'launch_release_id': best_match.release_id
-            }
+    if index is None:
+        index = LaunchMatchIndex.build(db_session)
 
-    # =========================================================================
-    # Pass 5: Same planning area + site area similarity (within 20%)
-    # ROBUST: Uses site area as additional confirmation signal
-    # =========================================================================
-    if planning_area and site_area_sqm:
-        for launch in launched_records:
-            if launch.planning_area != planning_area:
-                continue
-
-            if site_area_similar(site_area_sqm, launch.site_area_sqm):
-                return {
-                    'estimated_units': launch.estimated_units,
-                    'estimated_units_source': 'inferred_from_site_area',
-                    'launch_release_id': launch.release_id
-                }
-
-    # =========================================================================
-    # Pass 6: Single launch in same planning area (last resort)
-    # =========================================================================
-    if planning_area:
-        planning_matches = db_session.query(GLSTender).filter(
-            GLSTender.status == 'launched',
-            GLSTender.planning_area == planning_area,
-            GLSTender.estimated_units.isnot(None)
-        ).all()
-
-        # If only one match in same planning area, use it
-        if len(planning_matches) == 1:
-            return {
-                'estimated_units': planning_matches[0].estimated_units,
-                'estimated_units_source': 'inferred_from_planning_area',
-                'launch_release_id': planning_matches[0].release_id
-            }
-
-    return None
+    return index.match(location_raw, planning_area, site_area_sqm=site_area_sqm)
 
 
 def link_awarded_to_launches(db_session) -> Dict[str, int]:
@@ -1353,17 +1407,23 @@ def link_awarded_to_launches(db_session) -> Dict[str, int]:
         GLSTender.estimated_units.is_(None)
     ).all()
 
+    # Build the launch index once for the whole linking run
+    index = LaunchMatchIndex.build(db_session) if awarded_missing_units else None
+
     for tender in awarded_missing_units:
         match = find_matching_launch_record(
             tender.location_raw,
             tender.planning_area,
             db_session,
-            site_area_sqm=float(tender.site_area_sqm) if tender.site_area_sqm else None
+            site_area_sqm=float(tender.site_area_sqm) if tender.site_area_sqm else None,
+            index=index,
         )
 
         if match:
             tender.estimated_units = match['estimated_units']
             tender.estimated_units_source = match['estimated_units_source']
+            # estimated_units is hashed; keep the stored hash current
+            tender.content_hash = GLSTender.compute_content_hash(tender)
             stats['linked'] += 1
         else:
             stats['no_match'] += 1
@@ -1653,6 +1713,11 @@ def scrape_gls_tenders(
     except Exception as e:
         print(f"Supply units linking error: {e}")
 
+    # Open tenders feed the supply pipeline snapshot
+    if not dry_run:
+        from services.supply_snapshot_service import refresh_supply_snapshots
+        refresh_supply_snapshots(db_session, 'gls_tenders')
+
     return stats
 
 
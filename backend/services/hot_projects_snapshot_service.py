@@ -0,0 +1,439 @@
+"""
+Hot Projects Snapshot Service - precomputed active new-launch leaderboard
+
+Maintains hot_projects_snapshot (migration 031): the /api/projects/hot
+leaderboard (projects with New Sale transactions and zero resales),
+materialized once per bedroom filter at ingest time. Each row holds one
+formatted project - unit counts, sell-through and nearby schools included -
+so a request is a single indexed read:
+
+- bedroom filter     -> bedroom_key column ('all', '1', '2', '3', '4+', '5+')
+- district / region  -> district column (projects are grouped per district,
+                        so filtering rows is the same as filtering the
+                        transactions they were built from)
+- price_min / max    -> median_price column (filtered-stats median, as live)
+
+The table is rebuilt after each data publish (URA sync and CSV upload call
+refresh_hot_projects_snapshot). Requests the snapshot cannot answer (a
+bedroom filter outside 1-5, or no snapshot built yet) are computed live
+with the same SQL and formatting.
+
+Usage:
+    from services.hot_projects_snapshot_service import get_hot_projects_snapshot
+
+    snapshot = get_hot_projects_snapshot('all', districts=None, segment_districts=None,
+                                         price_min=None, price_max=None, limit=100)
+    if snapshot is not None:
+        projects, built_at = snapshot
+"""
+
+import json
+import logging
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+
+from constants import DISTRICT_NAMES, SALE_TYPE_NEW, SALE_TYPE_RESALE, get_region_for_district
+
+logger = logging.getLogger('hot_projects_snapshot')
+
+# One leaderboard per /projects/hot bedroom filter (4 and 5 are minimums)
+HOT_PROJECTS_BEDROOM_KEYS = ('all', '1', '2', '3', '4+', '5+')
+
+# District to Region mapping
+DISTRICT_TO_REGION = {
+    'D01': 'Central', 'D02': 'Central', 'D03': 'Central', 'D04': 'Central',
+    'D05': 'West', 'D06': 'Central', 'D07': 'Central', 'D08': 'Central',
+    'D09': 'Central', 'D10': 'Central', 'D11': 'Central', 'D12': 'Central',
+    'D13': 'Central', 'D14': 'East', 'D15': 'East', 'D16': 'East',
+    'D17': 'East', 'D18': 'East', 'D19': 'North-East', 'D20': 'North',
+    'D21': 'Central', 'D22': 'West', 'D23': 'West', 'D24': 'West',
+    'D25': 'North', 'D26': 'North', 'D27': 'North', 'D28': 'North-East',
+}
+
+
+# =============================================================================
+# LEADERBOARD QUERY (shared by the snapshot build and the live path)
+# =============================================================================
+
+# Query with TWO CTEs:
+# 1. total_project_sales: UNFILTERED units_sold (HARD FACT - confirmed transactions)
+# 2. filtered_stats: Filtered median_price/psf for relevance + determines which projects to show
+HOT_PROJECTS_SQL = """
+    WITH total_project_sales AS (
+        -- HARD FACT: Total confirmed New Sale transactions per project
+        -- This count is NEVER affected by bedroom/district/segment filters
+        SELECT
+            t.project_name,
+            t.district,
+            COUNT(*) as units_sold,
+            SUM(t.price) as total_value,
+            MIN(t.transaction_date) as first_new_sale,
+            MAX(t.transaction_date) as last_new_sale
+        FROM transactions_primary t
+        WHERE t.is_outlier = false
+          AND t.sale_type = :sale_type_new
+        GROUP BY t.project_name, t.district
+    ),
+    resale_project_sales AS (
+        -- Resale presence across the full project (unfiltered)
+        SELECT
+            t.project_name,
+            t.district,
+            COUNT(*) as resale_count
+        FROM transactions_primary t
+        WHERE t.is_outlier = false
+          AND t.sale_type = :sale_type_resale
+        GROUP BY t.project_name, t.district
+    ),
+    filtered_stats AS (
+        -- Filtered stats: median_price/psf based on user filters
+        -- Also determines which projects to show (must have matching transactions)
+        SELECT
+            t.project_name,
+            t.district,
+            COUNT(CASE WHEN t.sale_type = :sale_type_new THEN 1 END) as filtered_count,
+            AVG(CASE WHEN t.sale_type = :sale_type_new THEN t.psf END) as avg_psf,
+            PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY CASE WHEN t.sale_type = :sale_type_new THEN t.price END) as median_price,
+            PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY CASE WHEN t.sale_type = :sale_type_new THEN t.psf END) as median_psf
+        FROM transactions_primary t
+        WHERE t.is_outlier = false
+          AND (
+            (:bedroom_exact IS NULL AND :bedroom_min IS NULL)
+            OR (:bedroom_exact IS NOT NULL AND t.bedroom_count = :bedroom_exact)
+            OR (:bedroom_min IS NOT NULL AND t.bedroom_count >= :bedroom_min)
+          )
+          AND (:districts IS NULL OR t.district = ANY(:districts))
+          AND (:segment_districts IS NULL OR t.district = ANY(:segment_districts))
+        GROUP BY t.project_name, t.district
+        HAVING COUNT(CASE WHEN t.sale_type = :sale_type_new THEN 1 END) > 0
+    )
+    SELECT
+        tps.project_name,
+        tps.district,
+        tps.units_sold,
+        tps.total_value,
+        fs.avg_psf,
+        fs.median_price,
+        fs.median_psf,
+        tps.first_new_sale,
+        tps.last_new_sale,
+        pl.has_popular_school_1km,
+        pl.market_segment,
+        pl.latitude,
+        pl.longitude
+    FROM total_project_sales tps
+    INNER JOIN filtered_stats fs
+        ON tps.project_name = fs.project_name AND tps.district = fs.district
+    LEFT JOIN resale_project_sales rps
+        ON tps.project_name = rps.project_name AND tps.district = rps.district
+    LEFT JOIN project_locations pl
+        ON LOWER(TRIM(tps.project_name)) = LOWER(TRIM(pl.project_name))
+    WHERE (:price_min IS NULL OR fs.median_price >= :price_min)
+      AND (:price_max IS NULL OR fs.median_price <= :price_max)
+      AND COALESCE(rps.resale_count, 0) = 0
+    ORDER BY tps.units_sold DESC
+    LIMIT :limit
+"""
+
+
+def parse_bedroom_filter(bedrooms: Optional[Sequence[Any]]) -> Optional[int]:
+    """
+    Bedroom count from the /projects/hot bedroom param.
+
+    Only the first value is used (comma-separated values are split).
+    """
+    values = []
+    for item in bedrooms or []:
+        if isinstance(item, str) and "," in item:
+            values.extend([v.strip() for v in item.split(",") if v.strip()])
+        else:
+            values.append(item)
+    try:
+        return int(values[0]) if values else None
+    except (TypeError, ValueError):
+        return None
+
+
+def bedroom_filter_key(bedroom: Optional[int]) -> Optional[str]:
+    """
+    Snapshot bedroom_key for a bedroom count (4 and above are minimums).
+
+    Returns None for counts the snapshot does not cover.
+    """
+    if bedroom is None:
+        return 'all'
+    key = f"{bedroom}+" if bedroom >= 4 else str(bedroom)
+    return key if key in HOT_PROJECTS_BEDROOM_KEYS else None
+
+
+def bedroom_sql_params(bedroom: Optional[int]) -> Dict[str, Optional[int]]:
+    """bedroom_exact / bedroom_min parameters for HOT_PROJECTS_SQL."""
+    if bedroom is None:
+        return {"bedroom_exact": None, "bedroom_min": None}
+    if bedroom >= 4:
+        return {"bedroom_exact": None, "bedroom_min": bedroom}
+    return {"bedroom_exact": bedroom, "bedroom_min": None}
+
+
+def _load_school_data(session) -> List[Tuple[str, float, float]]:
+    """All geocoded popular schools for nearby-school lookup."""
+    from models.popular_school import PopularSchool
+
+    schools = session.query(
+        PopularSchool.school_name,
+        PopularSchool.latitude,
+        PopularSchool.longitude
+    ).filter(
+        PopularSchool.latitude.isnot(None),
+        PopularSchool.longitude.isnot(None)
+    ).all()
+    return [
+        (s.school_name, float(s.latitude), float(s.longitude))
+        for s in schools
+    ]
+
+
+def format_hot_project(row, school_data: List[Tuple[str, float, float]]) -> Dict[str, Any]:
+    """One leaderboard row as returned by /api/projects/hot (unmasked)."""
+    from services.new_launch_units import get_units_for_project
+    from services.school_distance import get_schools_within_distance
+
+    district = row.district or ''
+    market_seg = row.market_segment or get_region_for_district(district)
+    units_sold = row.units_sold or 0
+
+    # Lookup total_units and developer from static CSV file (runtime lookup, no DB)
+    lookup = get_units_for_project(row.project_name, check_resale=False)
+    total_units = lookup.get("total_units") or 0
+    developer = lookup.get("developer") or None
+
+    # Calculate percent_sold and unsold if total_units available
+    # Flag data discrepancy when units_sold > total_units (indicates URA data issues)
+    data_discrepancy = False
+    if total_units > 0:
+        if units_sold > total_units:
+            # Data discrepancy: more transactions than official units
+            # This could be due to sub-sales, serviced apartments, or URA data issues
+            data_discrepancy = True
+            percent_sold = 100.0  # Cap at 100%
+            unsold_inventory = 0  # No unsold units known
+        else:
+            percent_sold = round((units_sold * 100.0 / total_units), 1)
+            unsold_inventory = total_units - units_sold
+    else:
+        # No total_units data - can't calculate percent
+        percent_sold = None
+        unsold_inventory = None
+
+    # Get nearby schools if project has coordinates and school flag
+    nearby_schools = []
+    if row.has_popular_school_1km and row.latitude and row.longitude:
+        try:
+            nearby_schools = get_schools_within_distance(
+                float(row.latitude),
+                float(row.longitude),
+                school_data
+            )
+        except (ValueError, TypeError):
+            nearby_schools = []
+
+    return {
+        "project_name": row.project_name,
+        "developer": developer,
+        "region": DISTRICT_TO_REGION.get(district, None),
+        "district": district,
+        "district_name": DISTRICT_NAMES.get(district, ''),
+        "market_segment": market_seg,
+        "total_units": total_units if total_units > 0 else None,
+        "units_sold": units_sold,
+        "percent_sold": percent_sold,
+        "unsold_inventory": unsold_inventory,
+        "data_discrepancy": data_discrepancy,  # True if units_sold > total_units
+        "total_value": float(row.total_value) if row.total_value else 0,
+        "avg_psf": round(float(row.avg_psf), 2) if row.avg_psf else 0,
+        "median_price": round(float(row.median_price)) if row.median_price else None,
+        "median_psf": round(float(row.median_psf), 2) if row.median_psf else None,
+        "has_popular_school": row.has_popular_school_1km or False,
+        "nearby_schools": nearby_schools,  # List of school names within 1km
+        "first_new_sale": row.first_new_sale.isoformat() if row.first_new_sale else None,
+        "last_new_sale": row.last_new_sale.isoformat() if row.last_new_sale else None,
+    }
+
+
+def query_hot_projects(session, sql_params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Compute the leaderboard live.
+
+    Args:
+        session: SQLAlchemy session
+        sql_params: HOT_PROJECTS_SQL filter parameters (bedroom_exact,
+            bedroom_min, districts, segment_districts, price_min, price_max, limit)
+
+    Returns:
+        Formatted projects, most units sold first
+    """
+    rows = _query_hot_project_rows(session, sql_params, _load_school_data(session))
+    return [project for _, project in rows]
+
+
+def _query_hot_project_rows(
+    session,
+    sql_params: Dict[str, Any],
+    school_data: List[Tuple[str, float, float]],
+) -> List[Tuple[Optional[float], Dict[str, Any]]]:
+    """(unrounded median_price, formatted project) per leaderboard row."""
+    rows = session.execute(text(HOT_PROJECTS_SQL), {
+        "sale_type_new": SALE_TYPE_NEW,
+        "sale_type_resale": SALE_TYPE_RESALE,
+        **sql_params,
+    }).fetchall()
+    return [
+        (float(row.median_price) if row.median_price is not None else None,
+         format_hot_project(row, school_data))
+        for row in rows
+    ]
+
+
+# =============================================================================
+# BUILD
+# =============================================================================
+
+def rebuild_hot_projects_snapshot(session) -> int:
+    """
+    Rebuild the leaderboard for every bedroom filter in one transaction.
+
+    Readers keep seeing the previous generation until the commit.
+
+    Args:
+        session: SQLAlchemy session (Flask-SQLAlchemy or plain sessionmaker)
+
+    Returns:
+        Number of snapshot rows written
+    """
+    start = time.perf_counter()
+    school_data = _load_school_data(session)
+    unfiltered = {
+        "districts": None,
+        "segment_districts": None,
+        "price_min": None,
+        "price_max": None,
+        "limit": None,
+    }
+
+    rows = []
+    for bedroom_key in HOT_PROJECTS_BEDROOM_KEYS:
+        bedroom = None if bedroom_key == 'all' else int(bedroom_key.rstrip('+'))
+        # median_price is kept unrounded so price filters match the live query
+        projects = _query_hot_project_rows(
+            session, {**unfiltered, **bedroom_sql_params(bedroom)}, school_data)
+        for median_price, project in projects:
+            rows.append({
+                "bedroom_key": bedroom_key,
+                "project_name": project["project_name"],
+                "district": project["district"],
+                "units_sold": project["units_sold"],
+                "median_price": median_price,
+                "project": json.dumps(project),
+            })
+
+    session.execute(text("DELETE FROM hot_projects_snapshot"))
+    if rows:
+        session.execute(text("""
+            INSERT INTO hot_projects_snapshot
+                (bedroom_key, project_name, district, units_sold, median_price, project, built_at)
+            VALUES
+                (:bedroom_key, :project_name, :district, :units_sold, :median_price,
+                 CAST(:project AS JSONB), NOW())
+        """), rows)
+    session.commit()
+
+    logger.info(
+        f"Rebuilt {len(rows)} hot project rows ({len(HOT_PROJECTS_BEDROOM_KEYS)} bedroom filters) in "
+        f"{(time.perf_counter() - start) * 1000:.0f}ms"
+    )
+    return len(rows)
+
+
+def refresh_hot_projects_snapshot(engine=None) -> bool:
+    """
+    Rebuild the leaderboard outside a Flask request (e.g. after URA sync).
+
+    Returns:
+        True on success, False on failure (logged, never raised).
+    """
+    from sqlalchemy.orm import sessionmaker
+
+    try:
+        if engine is None:
+            from services.ura_sync_engine import get_database_engine
+            engine = get_database_engine()
+
+        session = sessionmaker(bind=engine)()
+        try:
+            rebuild_hot_projects_snapshot(session)
+        finally:
+            session.close()
+        return True
+
+    except Exception as e:
+        logger.exception(f"Failed to refresh hot projects snapshot: {e}")
+        return False
+
+
+# =============================================================================
+# READ
+# =============================================================================
+
+_READ_SQL = """
+    SELECT project, built_at
+    FROM hot_projects_snapshot
+    WHERE bedroom_key = :bedroom_key
+      AND (:districts IS NULL OR district = ANY(:districts))
+      AND (:segment_districts IS NULL OR district = ANY(:segment_districts))
+      AND (:price_min IS NULL OR median_price >= :price_min)
+      AND (:price_max IS NULL OR median_price <= :price_max)
+    ORDER BY units_sold DESC, project_name
+    LIMIT :limit
+"""
+
+
+def get_hot_projects_snapshot(
+    bedroom_key: str,
+    districts: Optional[List[str]],
+    segment_districts: Optional[List[str]],
+    price_min: Optional[float],
+    price_max: Optional[float],
+    limit: int,
+) -> Optional[Tuple[List[Dict[str, Any]], Any]]:
+    """
+    Leaderboard rows for one request from the snapshot.
+
+    Returns:
+        (projects, built_at), or None when no snapshot has been built (or
+        the table is not available yet), in which case callers compute live.
+    """
+    from models.database import db
+
+    try:
+        rows = db.session.execute(text(_READ_SQL), {
+            "bedroom_key": bedroom_key,
+            "districts": districts,
+            "segment_districts": segment_districts,
+            "price_min": price_min,
+            "price_max": price_max,
+            "limit": limit,
+        }).fetchall()
+        if rows:
+            return [row.project for row in rows], rows[0].built_at
+
+        built_at = db.session.execute(
+            text("SELECT MAX(built_at) FROM hot_projects_snapshot")
+        ).scalar()
+    except Exception as e:
+        db.session.rollback()
+        logger.debug(f"Hot projects snapshot lookup failed: {e}")
+        return None
+
+    return ([], built_at) if built_at is not None else None
@@ -9,31 +9,14 @@ Routes handle: param normalization (@api_contract), caching, jsonify.
 """
 
 import time
-import statistics
 from datetime import date as date_type
 from typing import Dict, Any, Optional, List
-from sqlalchemy import func, and_, case
 
-from models.transaction import Transaction
+import numpy as np
+from sqlalchemy import text
+
 from models.database import db
 from constants import CCR_DISTRICTS, RCR_DISTRICTS, DISTRICT_NAMES, SALE_TYPE_NEW, SALE_TYPE_RESALE
-from services.new_launch_units import get_district_units_for_resale
-
-
-def _apply_bedroom_filter(conditions: list, bed_filter: str) -> None:
-    """Add bedroom filter conditions to a list."""
-    if bed_filter == "1":
-        conditions.append(Transaction.bedroom_count == 1)
-    elif bed_filter == "2":
-        conditions.append(Transaction.bedroom_count == 2)
-    elif bed_filter == "3":
-        conditions.append(Transaction.bedroom_count == 3)
-    elif bed_filter == "4":
-        conditions.append(Transaction.bedroom_count == 4)
-    elif bed_filter == "5":
-        conditions.append(Transaction.bedroom_count >= 5)
-    elif bed_filter in ["4+"]:
-        conditions.append(Transaction.bedroom_count >= 4)
 
 
 def _get_district_region(district_id: str) -> str:
@@ -56,6 +39,96 @@ def _get_district_names(district_id: str) -> tuple:
 # DISTRICT PSF COMPUTATION
 # =============================================================================
 
+# "4" and "5" have always meant 4+ on the map (few 5BR sales per district)
+_PSF_BEDROOM_FILTER_SQL = {
+    "1": "bedroom_count = 1",
+    "2": "bedroom_count = 2",
+    "3": "bedroom_count = 3",
+    "4": "bedroom_count >= 4",
+    "4+": "bedroom_count >= 4",
+    "5": "bedroom_count >= 4",
+}
+
+# Property age = transaction year - lease start year
+_PROPERTY_AGE = "(EXTRACT(YEAR FROM transaction_date) - lease_start_year)"
+_PROPERTY_AGE_FILTER_SQL = {
+    "new": f"lease_start_year IS NOT NULL AND {_PROPERTY_AGE} BETWEEN 0 AND 5",
+    "young": f"lease_start_year IS NOT NULL AND {_PROPERTY_AGE} > 5 AND {_PROPERTY_AGE} <= 10",
+    "resale": f"lease_start_year IS NOT NULL AND {_PROPERTY_AGE} > 10",
+}
+
+
+def _district_psf_sql(
+    date_from: Optional[date_type],
+    date_to_exclusive: Optional[date_type],
+    bed_filter: str,
+    age_filter: str,
+    sale_type_filter: Optional[str],
+):
+    """
+    SQL + params for the district PSF scan with its YoY comparison.
+
+    Both windows come from one pass: the WHERE spans [yoy_from,
+    date_to_exclusive) and each window's count/median is a FILTERed
+    aggregate. yoy_pct is computed against the rounded current median, as
+    the map displays it. Without both date bounds there is no comparison
+    window and yoy_median_psf / yoy_pct are NULL.
+    """
+    params: Dict[str, Any] = {}
+    where = ["COALESCE(is_outlier, false) = false"]
+    if bed_filter in _PSF_BEDROOM_FILTER_SQL:
+        where.append(_PSF_BEDROOM_FILTER_SQL[bed_filter])
+    if age_filter in _PROPERTY_AGE_FILTER_SQL:
+        where.append(_PROPERTY_AGE_FILTER_SQL[age_filter])
+    if sale_type_filter:
+        where.append("sale_type = :sale_type")
+        params["sale_type"] = sale_type_filter
+
+    current = []
+    if date_from:
+        current.append("transaction_date >= :date_from")
+        params["date_from"] = date_from
+    if date_to_exclusive:
+        current.append("transaction_date < :date_to_exclusive")
+        params["date_to_exclusive"] = date_to_exclusive
+
+    if date_from and date_to_exclusive:
+        from dateutil.relativedelta import relativedelta
+        params["yoy_from"] = date_from - relativedelta(years=1)
+        params["yoy_to_exclusive"] = date_to_exclusive - relativedelta(years=1)
+        where.append("transaction_date >= :yoy_from AND transaction_date < :date_to_exclusive")
+        comparison_sql = "transaction_date >= :yoy_from AND transaction_date < :yoy_to_exclusive"
+        current_sql = "transaction_date >= :date_from"
+    else:
+        where.extend(current)
+        comparison_sql = "FALSE"
+        current_sql = "TRUE"
+
+    sql = text(f"""
+        SELECT
+            district,
+            tx_count,
+            median_psf,
+            yoy_median_psf,
+            (NULLIF(ROUND(median_psf), 0) - yoy_median_psf)
+                / NULLIF(yoy_median_psf, 0) * 100 AS yoy_pct
+        FROM (
+            SELECT
+                district,
+                COUNT(*) FILTER (WHERE {current_sql}) AS tx_count,
+                percentile_cont(0.5) WITHIN GROUP (ORDER BY psf)
+                    FILTER (WHERE {current_sql}) AS median_psf,
+                percentile_cont(0.5) WITHIN GROUP (ORDER BY psf)
+                    FILTER (WHERE {comparison_sql}) AS yoy_median_psf
+            FROM transactions_primary
+            WHERE {" AND ".join(where)}
+            GROUP BY district
+        ) windows
+        WHERE tx_count > 0
+    """)
+    return sql, params
+
+
 def compute_district_psf(
     date_from: Optional[date_type],
     date_to_exclusive: Optional[date_type],
@@ -68,84 +141,25 @@ def compute_district_psf(
     """
     Compute district PSF metrics.
 
+    Current and YoY windows are read in a single grouped query over
+    transactions_primary (see _district_psf_sql).
+
     Args:
         date_from: Start date (inclusive)
         date_to_exclusive: End date (exclusive)
         bed_filter: Bedroom filter ("all", "1", "2", "3", "4", "4+", "5")
         age_filter: Property age filter ("all", "new", "young", "resale")
-        sale_type_filter: Sale type in DB format ("New Sale", "Resale", or None for all)
+        sale_type_filter: Sale type in DB format (see SALE_TYPE_* constants, None for all)
         timeframe: Timeframe code for response ("Y1", "Y3", etc.)
         months_in_period: Number of months in the period
 
     Returns:
         Dict with "districts" list and "meta" dict
     """
-    from routes.insights import build_property_age_filter
-
     start = time.time()
 
-    # Build base filter conditions
-    filter_conditions = [Transaction.outlier_filter()]
-
-    if date_from:
-        filter_conditions.append(Transaction.transaction_date >= date_from)
-    if date_to_exclusive:
-        filter_conditions.append(Transaction.transaction_date < date_to_exclusive)
-
-    # Apply bedroom filter
-    if bed_filter != "all":
-        _apply_bedroom_filter(filter_conditions, bed_filter)
-
-    # Apply property age filter
-    age_condition = build_property_age_filter(age_filter)
-    if age_condition is not None:
-        filter_conditions.append(age_condition)
-
-    # Apply sale type filter
-    if sale_type_filter:
-        filter_conditions.append(Transaction.sale_type == sale_type_filter)
-
-    # Query current period data
-    current_query = db.session.query(
-        Transaction.district,
-        func.count(Transaction.id).label("tx_count"),
-        func.percentile_cont(0.5).within_group(Transaction.psf).label("median_psf")
-    ).filter(
-        and_(*filter_conditions)
-    ).group_by(
-        Transaction.district
-    )
-
-    current_results = {row.district: row for row in current_query.all()}
-
-    # Query YoY comparison data
-    yoy_data = {}
-    if date_from and date_to_exclusive:
-        from dateutil.relativedelta import relativedelta
-        yoy_from = date_from - relativedelta(years=1)
-        yoy_to_exclusive = date_to_exclusive - relativedelta(years=1)
-
-        yoy_conditions = [Transaction.outlier_filter()]
-        yoy_conditions.append(Transaction.transaction_date >= yoy_from)
-        yoy_conditions.append(Transaction.transaction_date < yoy_to_exclusive)
-
-        if bed_filter != "all":
-            _apply_bedroom_filter(yoy_conditions, bed_filter)
-        if age_condition is not None:
-            yoy_conditions.append(age_condition)
-        if sale_type_filter:
-            yoy_conditions.append(Transaction.sale_type == sale_type_filter)
-
-        yoy_query = db.session.query(
-            Transaction.district,
-            func.percentile_cont(0.5).within_group(Transaction.psf).label("median_psf")
-        ).filter(
-            and_(*yoy_conditions)
-        ).group_by(
-            Transaction.district
-        )
-
-        yoy_data = {row.district: row.median_psf for row in yoy_query.all()}
+    sql, params = _district_psf_sql(date_from, date_to_exclusive, bed_filter, age_filter, sale_type_filter)
+    current_results = {row.district: row for row in db.session.execute(sql, params).fetchall()}
 
     # Build response
     all_districts = [f"D{str(i).zfill(2)}" for i in range(1, 29)]
@@ -159,12 +173,7 @@ def compute_district_psf(
         if district_id in current_results:
             row = current_results[district_id]
             median_psf = round(row.median_psf, 0) if row.median_psf else None
-            tx_count = row.tx_count or 0
-
-            yoy_pct = None
-            if district_id in yoy_data and yoy_data[district_id] and median_psf:
-                old_psf = yoy_data[district_id]
-                yoy_pct = round(((median_psf - old_psf) / old_psf) * 100, 1)
+            yoy_pct = round(float(row.yoy_pct), 1) if row.yoy_pct is not None else None
 
             districts_response.append({
                 "district_id": district_id,
@@ -172,7 +181,7 @@ def compute_district_psf(
                 "full_name": full_name,
                 "region": region,
                 "median_psf": median_psf,
-                "tx_count": tx_count,
+                "tx_count": row.tx_count or 0,
                 "yoy_pct": yoy_pct,
                 "has_data": True
             })
@@ -212,6 +221,165 @@ def compute_district_psf(
 # =============================================================================
 # DISTRICT LIQUIDITY COMPUTATION
 # =============================================================================
+#
+# One scan of transactions_primary produces every per-district measure:
+# GROUPING SETS ((district, project_name), (district, bedroom_count)) with
+# COUNT(*) FILTER (...) columns for the three slices the map uses:
+#   - combined: window + bedroom + the user's sale type (market structure)
+#   - exit:     window + bedroom + resale only (velocity, PSF CV, Gini)
+#   - units:    resale since date_from, no upper bound / bedroom filter
+#               (projects whose unit counts normalize turnover)
+# PSF CV is rebuilt from per-project sums (n, Σpsf, Σpsf²); scoring is
+# vectorized with NumPy.
+
+_BEDROOM_FILTER_SQL = {
+    "1": "bedroom_count = 1",
+    "2": "bedroom_count = 2",
+    "3": "bedroom_count = 3",
+    "4": "bedroom_count = 4",
+    "5": "bedroom_count >= 5",
+    "4+": "bedroom_count >= 4",
+}
+
+_LIQUIDITY_METHODOLOGY_NOTES = {
+    "liquidity_score": "Composite 0-100 score: Exit Safety (60%) + Market Health (40%)",
+    "exit_safety_metrics": "Velocity (35%), Breadth (15%), Concentration (10%) - RESALE only",
+    "market_health_metrics": "Volume (18%), Diversity (9%), Stability (8%), Organic (5%)",
+    "concentration_metrics": "Gini, Fragility, Top Share calculated on RESALE only (avoids developer release distortion)",
+    "market_structure_metrics": "Transactions, Projects, New%/Resale% include all sale types (total activity)",
+    "turnover_rate": "Resales per 100 units per period - normalized for district size",
+    "z_score": "Robust Z-score using median/MAD - handles skewed distributions"
+}
+
+
+def _liquidity_scan_sql(
+    date_from: Optional[date_type],
+    date_to_exclusive: Optional[date_type],
+    bed_filter: str,
+    sale_type_filter: Optional[str],
+):
+    """SQL + params for the fused district liquidity scan."""
+    params: Dict[str, Any] = {"new_sale": SALE_TYPE_NEW, "resale": SALE_TYPE_RESALE}
+
+    where = ["COALESCE(is_outlier, false) = false"]
+    if date_from:
+        where.append("transaction_date >= :date_from")
+        params["date_from"] = date_from
+
+    window = []
+    if date_to_exclusive:
+        window.append("transaction_date < :date_to_exclusive")
+        params["date_to_exclusive"] = date_to_exclusive
+    if bed_filter in _BEDROOM_FILTER_SQL:
+        window.append(_BEDROOM_FILTER_SQL[bed_filter])
+
+    combined = list(window)
+    if sale_type_filter:
+        combined.append("sale_type = :sale_type")
+        params["sale_type"] = sale_type_filter
+    exit_ = window + ["sale_type = :resale"]
+
+    combined_sql = " AND ".join(combined) or "TRUE"
+    exit_sql = " AND ".join(exit_)
+
+    sql = text(f"""
+        SELECT
+            district,
+            project_name,
+            bedroom_count,
+            GROUPING(project_name) AS by_bedroom,
+            COUNT(*) FILTER (WHERE {combined_sql}) AS tx_count,
+            COUNT(*) FILTER (WHERE {combined_sql} AND sale_type = :new_sale) AS new_sale_count,
+            COUNT(*) FILTER (WHERE {combined_sql} AND sale_type = :resale) AS resale_count,
+            COUNT(*) FILTER (WHERE {exit_sql}) AS resale_tx_count,
+            COUNT(psf) FILTER (WHERE {exit_sql}) AS psf_n,
+            SUM(psf) FILTER (WHERE {exit_sql}) AS psf_sum,
+            SUM(psf * psf) FILTER (WHERE {exit_sql}) AS psf_sq_sum,
+            COUNT(*) FILTER (WHERE sale_type = :resale) AS units_resale_count
+        FROM transactions_primary
+        WHERE {" AND ".join(where)}
+        GROUP BY GROUPING SETS ((district, project_name), (district, bedroom_count))
+    """)
+    return sql, params
+
+
+def _gini_by_group(group_idx: np.ndarray, values: np.ndarray, n_groups: int) -> np.ndarray:
+    """
+    Gini coefficient of values within each group (0 for < 2 values or zero total).
+
+    G = 2·Σ(i·x_i) / (n·Σx) - (n + 1) / n over each group's ascending values.
+    """
+    gini = np.zeros(n_groups)
+    if len(values) == 0:
+        return gini
+    order = np.lexsort((values, group_idx))
+    groups, sorted_values = group_idx[order], values[order].astype(float)
+    sizes = np.bincount(groups, minlength=n_groups)
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    ranks = np.arange(len(sorted_values)) - starts[groups] + 1
+    totals = np.bincount(groups, weights=sorted_values, minlength=n_groups)
+    weighted = np.bincount(groups, weights=ranks * sorted_values, minlength=n_groups)
+    valid = (sizes >= 2) & (totals > 0)
+    n = sizes[valid]
+    gini[valid] = (2 * weighted[valid]) / (n * totals[valid]) - (n + 1) / n
+    return gini
+
+
+def _robust_z_scores(values: np.ndarray) -> np.ndarray:
+    """(x - median) / MAD; zeros for < 3 values or MAD < 0.001."""
+    if len(values) < 3:
+        return np.zeros(len(values))
+    median_val = np.median(values)
+    mad = np.median(np.abs(values - median_val))
+    if mad < 0.001:
+        return np.zeros(len(values))
+    return (values - median_val) / mad
+
+
+def _percentile_scores(values, population) -> np.ndarray:
+    """0-100 rank of each value within population (share strictly below); 50 if unknown."""
+    values = np.array([np.nan if v is None else v for v in values], dtype=float)
+    pool = np.sort(np.array([v for v in population if v is not None], dtype=float))
+    scores = np.full(len(values), 50.0)
+    if len(pool):
+        known = ~np.isnan(values)
+        scores[known] = np.searchsorted(pool, values[known], side="left") / len(pool) * 100
+    return scores
+
+
+def _liquidity_tier(z_score: float) -> str:
+    if z_score >= 1.5:
+        return "Very High"
+    elif z_score >= 0.5:
+        return "High"
+    elif z_score >= -0.5:
+        return "Neutral"
+    elif z_score >= -1.5:
+        return "Low"
+    return "Very Low"
+
+
+def _fragility_label(gini: float) -> str:
+    if gini < 0.4:
+        return "Robust"
+    elif gini < 0.7:
+        return "Moderate"
+    return "Fragile"
+
+
+def _score_tier(score: Optional[float]) -> Optional[str]:
+    if score is None:
+        return None
+    if score >= 80:
+        return "Excellent"
+    elif score >= 60:
+        return "Good"
+    elif score >= 40:
+        return "Average"
+    elif score >= 20:
+        return "Below Average"
+    return "Poor"
+
 
 def compute_district_liquidity(
     date_from: Optional[date_type],
@@ -227,7 +395,7 @@ def compute_district_liquidity(
     Args:
         date_from: Start date (inclusive)
         date_to_exclusive: End date (exclusive)
-        bed_filter: Bedroom filter ("all", "1", "2", "3", "4", "5")
+        bed_filter: Bedroom filter ("all", "1", "2", "3", "4", "4+", "5")
         sale_type_filter: Sale type in DB format ("New Sale", "Resale", or None for all)
         timeframe: Timeframe code for response
         months_in_period: Number of months in period (computed from data if None)
@@ -235,13 +403,14 @@ def compute_district_liquidity(
     Returns:
         Dict with "districts" list and "meta" dict
     """
+    from services.dataset_catalog import get_dataset_catalog
+    from services.new_launch_units import build_district_units
+
     start = time.time()
 
     # Handle "all" timeframe - compute months from data
     if months_in_period is None:
-        earliest = db.session.query(func.min(Transaction.transaction_date)).filter(
-            Transaction.outlier_filter()
-        ).scalar()
+        earliest = get_dataset_catalog().primary_min_date
         if earliest and date_to_exclusive:
             earliest = date_type(earliest.year, earliest.month, 1)
             months_in_period = (date_to_exclusive.year - earliest.year) * 12 + (date_to_exclusive.month - earliest.month)
@@ -250,253 +419,157 @@ def compute_district_liquidity(
         else:
             months_in_period = 12
 
-    # Build base filter conditions
-    filter_conditions = [Transaction.outlier_filter()]
-    if date_from:
-        filter_conditions.append(Transaction.transaction_date >= date_from)
-    if date_to_exclusive:
-        filter_conditions.append(Transaction.transaction_date < date_to_exclusive)
-    if bed_filter != "all":
-        _apply_bedroom_filter(filter_conditions, bed_filter)
-    if sale_type_filter:
-        filter_conditions.append(Transaction.sale_type == sale_type_filter)
-
-    # Market structure query
-    query = db.session.query(
-        Transaction.district,
-        func.count(Transaction.id).label("tx_count"),
-        func.count(case((Transaction.sale_type == SALE_TYPE_NEW, 1))).label("new_sale_count"),
-        func.count(case((Transaction.sale_type == SALE_TYPE_RESALE, 1))).label("resale_count"),
-        func.count(func.distinct(Transaction.project_name)).label("project_count"),
-    ).filter(and_(*filter_conditions)).group_by(Transaction.district)
-
-    results = query.all()
-    district_data = {row.district: row for row in results}
-
-    # Bedroom breakdown query
-    bedroom_query = db.session.query(
-        Transaction.district,
-        Transaction.bedroom_count,
-        func.count(Transaction.id).label("count")
-    ).filter(and_(*filter_conditions)).group_by(Transaction.district, Transaction.bedroom_count)
-
-    bedroom_results = bedroom_query.all()
-    bedroom_by_district = {}
-    for row in bedroom_results:
-        if row.district not in bedroom_by_district:
-            bedroom_by_district[row.district] = {}
-        bedroom_by_district[row.district][str(row.bedroom_count)] = row.count
-
-    # Resale-only filter for exit safety metrics
-    resale_filter_conditions = [
-        Transaction.outlier_filter(),
-        Transaction.sale_type == SALE_TYPE_RESALE
-    ]
-    if date_from:
-        resale_filter_conditions.append(Transaction.transaction_date >= date_from)
-    if date_to_exclusive:
-        resale_filter_conditions.append(Transaction.transaction_date < date_to_exclusive)
-    if bed_filter != "all":
-        _apply_bedroom_filter(resale_filter_conditions, bed_filter)
-
-    # Resale velocity query
-    resale_velocity_query = db.session.query(
-        Transaction.district,
-        func.count(Transaction.id).label("resale_tx_count"),
-    ).filter(and_(*resale_filter_conditions)).group_by(Transaction.district)
-
-    resale_velocity_results = resale_velocity_query.all()
-    resale_velocity_data = {row.district: row.resale_tx_count for row in resale_velocity_results}
-
-    # District units data
-    district_units_data = get_district_units_for_resale(
-        db_session=db.session,
-        date_from=date_from,
-        date_to=None
-    )
-
-    # PSF CV query
-    psf_cv_query = db.session.query(
-        Transaction.district,
-        (func.stddev(Transaction.psf) / func.nullif(func.avg(Transaction.psf), 0)).label("psf_cv")
-    ).filter(and_(*resale_filter_conditions)).group_by(Transaction.district)
-
-    psf_cv_results = psf_cv_query.all()
-    psf_cv_by_district = {row.district: float(row.psf_cv) if row.psf_cv else None for row in psf_cv_results}
-
-    # Project concentration query
-    project_query = db.session.query(
-        Transaction.district,
-        Transaction.project_name,
-        func.count(Transaction.id).label("count")
-    ).filter(and_(*resale_filter_conditions)).group_by(Transaction.district, Transaction.project_name)
-
-    project_results = project_query.all()
-    projects_by_district = {}
-    for row in project_results:
-        if row.district not in projects_by_district:
-            projects_by_district[row.district] = []
-        projects_by_district[row.district].append(row.count)
-
-    # Helper functions
-    def calculate_gini(values):
-        if not values or len(values) < 2:
-            return 0.0
-        sorted_values = sorted(values)
-        n = len(sorted_values)
-        total = sum(sorted_values)
-        if total == 0:
-            return 0.0
-        cumsum = sum((i + 1) * v for i, v in enumerate(sorted_values))
-        return (2 * cumsum) / (n * total) - (n + 1) / n
-
-    def get_fragility_label(gini):
-        if gini < 0.4:
-            return "Robust"
-        elif gini < 0.7:
-            return "Moderate"
-        return "Fragile"
-
-    def compute_robust_z_scores(values_dict):
-        if len(values_dict) < 3:
-            return {k: 0.0 for k in values_dict}
-        values = list(values_dict.values())
-        median_val = statistics.median(values)
-        deviations = [abs(v - median_val) for v in values]
-        mad = statistics.median(deviations)
-        if mad < 0.001:
-            return {k: 0.0 for k in values_dict}
-        return {k: (v - median_val) / mad for k, v in values_dict.items()}
-
-    def get_liquidity_tier(z_score):
-        if z_score >= 1.5:
-            return "Very High"
-        elif z_score >= 0.5:
-            return "High"
-        elif z_score >= -0.5:
-            return "Neutral"
-        elif z_score >= -1.5:
-            return "Low"
-        return "Very Low"
-
-    def percentile_score(value, all_values):
-        if value is None or not all_values:
-            return 50
-        valid_values = [v for v in all_values if v is not None]
-        if not valid_values:
-            return 50
-        sorted_vals = sorted(valid_values)
-        rank = sum(1 for v in sorted_vals if v < value)
-        return (rank / len(sorted_vals)) * 100
-
-    def get_score_tier(score):
-        if score is None:
-            return None
-        if score >= 80:
-            return "Excellent"
-        elif score >= 60:
-            return "Good"
-        elif score >= 40:
-            return "Average"
-        elif score >= 20:
-            return "Below Average"
-        return "Poor"
-
-    # Calculate concentration metrics
-    concentration_by_district = {}
-    for district, project_counts in projects_by_district.items():
-        gini = calculate_gini(project_counts)
-        concentration_by_district[district] = {
-            "gini": round(gini, 3),
-            "fragility": get_fragility_label(gini),
-            "project_count": len(project_counts),
-            "top_project_share": round(max(project_counts) / sum(project_counts) * 100, 1) if project_counts else 0
+    sql, params = _liquidity_scan_sql(date_from, date_to_exclusive, bed_filter, sale_type_filter)
+    rows = db.session.execute(sql, params).fetchall()
+
+    # Fold the scan into per-district measures
+    district_data: Dict[str, Dict[str, int]] = {}      # combined slice
+    bedroom_by_district: Dict[str, Dict[str, int]] = {}
+    resale_velocity_data: Dict[str, int] = {}          # exit slice
+    psf_moments: Dict[str, List[float]] = {}           # [n, Σpsf, Σpsf²]
+    project_groups, project_counts = [], []            # exit slice, per project
+    unit_projects = []                                 # units slice
+
+    for row in rows:
+        district = row.district
+        if row.by_bedroom:
+            if row.tx_count:
+                bedroom_by_district.setdefault(district, {})[str(row.bedroom_count)] = row.tx_count
+            continue
+
+        if row.tx_count:
+            data = district_data.setdefault(district, {
+                "tx_count": 0, "new_sale_count": 0, "resale_count": 0, "project_count": 0,
+            })
+            data["tx_count"] += row.tx_count
+            data["new_sale_count"] += row.new_sale_count
+            data["resale_count"] += row.resale_count
+            if row.project_name is not None:
+                data["project_count"] += 1
+
+        if row.resale_tx_count:
+            resale_velocity_data[district] = resale_velocity_data.get(district, 0) + row.resale_tx_count
+            project_groups.append(district)
+            project_counts.append(row.resale_tx_count)
+            moments = psf_moments.setdefault(district, [0, 0.0, 0.0])
+            moments[0] += row.psf_n or 0
+            moments[1] += float(row.psf_sum or 0)
+            moments[2] += float(row.psf_sq_sum or 0)
+
+        if row.units_resale_count and district and row.project_name:
+            unit_projects.append((district, row.project_name))
+
+    district_units_data = build_district_units(unit_projects)
+
+    # PSF coefficient of variation (sample stddev / mean), resale only
+    psf_cv_by_district = {}
+    for district, (n, total, total_sq) in psf_moments.items():
+        cv = None
+        if n >= 2 and total:
+            mean = total / n
+            variance = max((total_sq - total * total / n) / (n - 1), 0.0)
+            cv = float(np.sqrt(variance) / mean)
+        psf_cv_by_district[district] = cv if cv else None
+
+    # Concentration metrics (resale only)
+    concentration_districts = list(dict.fromkeys(project_groups))
+    group_index = {d: i for i, d in enumerate(concentration_districts)}
+    group_idx = np.array([group_index[d] for d in project_groups], dtype=int)
+    counts = np.array(project_counts, dtype=float)
+    ginis = _gini_by_group(group_idx, counts, len(concentration_districts))
+    sizes = np.bincount(group_idx, minlength=len(concentration_districts))
+    totals = np.bincount(group_idx, weights=counts, minlength=len(concentration_districts))
+    maxima = np.zeros(len(concentration_districts))
+    np.maximum.at(maxima, group_idx, counts)
+    concentration_by_district = {
+        district: {
+            "gini": round(float(ginis[i]), 3),
+            "fragility": _fragility_label(ginis[i]),
+            "project_count": int(sizes[i]),
+            "top_project_share": round(float(maxima[i] / totals[i] * 100), 1) if totals[i] else 0,
         }
+        for i, district in enumerate(concentration_districts)
+    }
+
+    # Velocities and turnover rates
+    velocity_districts = list(resale_velocity_data)
+    resale_counts = np.array([resale_velocity_data[d] for d in velocity_districts], dtype=float)
+    velocities = resale_counts / months_in_period
+    units = np.array([district_units_data.get(d, {}).get("total_units", 0) or 0 for d in velocity_districts],
+                     dtype=float)
+    has_units = units > 0
+    turnover = np.divide(resale_counts * 100, units, out=np.zeros_like(resale_counts), where=has_units)
 
-    # Calculate velocities and turnover rates
     velocities_data = {}
-    for district, resale_tx_count in resale_velocity_data.items():
-        velocity = resale_tx_count / months_in_period
+    for i, district in enumerate(velocity_districts):
         units_info = district_units_data.get(district, {})
-        total_units = units_info.get("total_units", 0)
         coverage_pct = units_info.get("coverage_pct", 0)
-
-        if total_units and total_units > 0:
-            turnover_rate = (resale_tx_count / total_units) * 100
-        else:
-            turnover_rate = None
-
         velocities_data[district] = {
-            "velocity": velocity,
-            "turnover_rate": turnover_rate,
-            "tx_count": resale_tx_count,
-            "total_units": total_units,
+            "velocity": float(velocities[i]),
+            "turnover_rate": float(turnover[i]) if has_units[i] else None,
+            "tx_count": resale_velocity_data[district],
+            "total_units": units_info.get("total_units", 0),
             "coverage_pct": coverage_pct,
             "low_units_confidence": coverage_pct < 50 if coverage_pct else True
         }
 
-    # Calculate velocity stats
-    velocity_values = [d["velocity"] for d in velocities_data.values()]
-    if velocity_values:
-        mean_velocity = statistics.mean(velocity_values)
-        stddev_velocity = statistics.stdev(velocity_values) if len(velocity_values) > 1 else 1
+    if len(velocities):
+        mean_velocity = float(velocities.mean())
+        stddev_velocity = float(velocities.std(ddof=1)) if len(velocities) > 1 else 1
     else:
         mean_velocity = 0
         stddev_velocity = 1
 
-    # Calculate turnover stats
-    turnover_values = {k: v["turnover_rate"] for k, v in velocities_data.items() if v["turnover_rate"] is not None}
-    if turnover_values:
-        mean_turnover_rate = statistics.mean(turnover_values.values())
-        median_turnover_rate = statistics.median(turnover_values.values())
+    if has_units.any():
+        mean_turnover_rate = float(turnover[has_units].mean())
+        median_turnover_rate = float(np.median(turnover[has_units]))
     else:
         mean_turnover_rate = 0
         median_turnover_rate = 0
 
-    # Calculate Z-scores
-    z_scores = {}
-    if turnover_values:
-        robust_z = compute_robust_z_scores(turnover_values)
-        z_scores.update(robust_z)
-
-    for district, data in velocities_data.items():
-        if district not in z_scores:
-            if stddev_velocity > 0:
-                z_scores[district] = (data["velocity"] - mean_velocity) / stddev_velocity
-            else:
-                z_scores[district] = 0
+    # Z-scores: robust (median/MAD) on turnover; velocity z-score where units are unknown
+    z_values = np.zeros(len(velocity_districts))
+    z_values[has_units] = _robust_z_scores(turnover[has_units])
+    if stddev_velocity > 0:
+        z_values[~has_units] = (velocities[~has_units] - mean_velocity) / stddev_velocity
+    z_scores = dict(zip(velocity_districts, z_values.tolist()))
 
-    resale_velocities = {k: v["velocity"] for k, v in velocities_data.items()}
     total_housing_stock = sum(d["total_units"] for d in velocities_data.values() if d["total_units"])
 
-    # Collect values for percentile normalization
-    all_velocities = list(resale_velocities.values())
-    all_resale_counts = [c["project_count"] for c in concentration_by_district.values()]
-    all_tx_counts = [row.tx_count for row in results if row.tx_count]
-    all_project_counts = [row.project_count for row in results if row.project_count]
-
-    def calculate_liquidity_score(
-        monthly_velocity, resale_project_count, concentration_gini,
-        tx_count, project_count, psf_cv, resale_pct
-    ):
-        velocity_score = percentile_score(monthly_velocity, all_velocities) * 0.35
-        breadth_score = percentile_score(resale_project_count, all_resale_counts) * 0.15
-        gini = concentration_gini if concentration_gini is not None else 0.5
-        concentration_score = (1 - gini) * 100 * 0.10
-        exit_safety = velocity_score + breadth_score + concentration_score
-
-        volume_score = percentile_score(tx_count, all_tx_counts) * 0.18
-        diversity_score = percentile_score(project_count, all_project_counts) * 0.09
-        cv = min(psf_cv, 0.5) if psf_cv is not None else 0.25
-        stability_score = (1 - cv * 2) * 100 * 0.08
-        organic_score = (resale_pct or 0) * 0.05
-        market_health = volume_score + diversity_score + stability_score + organic_score
-
-        score = exit_safety + market_health
-        return round(max(0, min(100, score)), 1)
+    # Composite liquidity score for every district with data
+    all_districts = [f"D{str(i).zfill(2)}" for i in range(1, 29)]
+    scored = [d for d in all_districts if d in district_data or d in resale_velocity_data]
+    empty_combined = {"tx_count": 0, "new_sale_count": 0, "resale_count": 0, "project_count": 0}
+    empty_concentration = {"gini": 0, "fragility": "Unknown", "project_count": 0, "top_project_share": 0}
+
+    combined = [district_data.get(d, empty_combined) for d in scored]
+    concentration = [concentration_by_district.get(d, empty_concentration) for d in scored]
+    monthly_velocity = [round(velocities_data[d]["velocity"], 2) if d in velocities_data else 0 for d in scored]
+    resale_pct = np.array([
+        round((c["resale_count"] / c["tx_count"]) * 100, 1) if c["tx_count"] > 0 else 0 for c in combined
+    ], dtype=float)
+    gini = np.array([c["gini"] if c["gini"] is not None else 0.5 for c in concentration], dtype=float)
+    cv = np.array([min(psf_cv_by_district[d], 0.5) if psf_cv_by_district.get(d) is not None else 0.25
+                   for d in scored], dtype=float)
+
+    exit_safety = (
+        _percentile_scores(monthly_velocity, velocities.tolist()) * 0.35
+        + _percentile_scores([c["project_count"] for c in concentration],
+                             [c["project_count"] for c in concentration_by_district.values()]) * 0.15
+        + (1 - gini) * 100 * 0.10
+    )
+    market_health = (
+        _percentile_scores([c["tx_count"] for c in combined],
+                           [c["tx_count"] for c in district_data.values() if c["tx_count"]]) * 0.18
+        + _percentile_scores([c["project_count"] for c in combined],
+                             [c["project_count"] for c in district_data.values() if c["project_count"]]) * 0.09
+        + (1 - cv * 2) * 100 * 0.08
+        + resale_pct * 0.05
+    )
+    liquidity_scores = np.round(np.clip(exit_safety + market_health, 0, 100), 1)
+    score_index = {d: i for i, d in enumerate(scored)}
 
     # Build response
-    all_districts = [f"D{str(i).zfill(2)}" for i in range(1, 29)]
     districts_response = []
     total_transactions = 0
 
@@ -504,43 +577,19 @@ def compute_district_liquidity(
         region = _get_district_region(district_id)
         short_name, full_name = _get_district_names(district_id)
 
-        has_combined = district_id in district_data
-        has_resale = district_id in resale_velocities
-
-        if has_combined or has_resale:
-            if has_combined:
-                row = district_data[district_id]
-                tx_count = row.tx_count or 0
-                new_sale_count = row.new_sale_count or 0
-                resale_count = row.resale_count or 0
-                project_count = row.project_count or 0
-                total_transactions += tx_count
-            else:
-                tx_count = new_sale_count = resale_count = project_count = 0
-
-            monthly_velocity = round(resale_velocities.get(district_id, 0), 2)
-            z_score = round(z_scores.get(district_id, 0), 2)
-            liquidity_tier = get_liquidity_tier(z_score)
+        if district_id in score_index:
+            i = score_index[district_id]
+            row = combined[i]
+            tx_count = row["tx_count"]
+            new_sale_count = row["new_sale_count"]
+            resale_count = row["resale_count"]
+            total_transactions += tx_count
 
+            z_score = round(z_scores.get(district_id, 0), 2)
             district_turnover_data = velocities_data.get(district_id, {})
             turnover_rate = district_turnover_data.get("turnover_rate")
-            total_units = district_turnover_data.get("total_units", 0)
-            units_coverage_pct = district_turnover_data.get("coverage_pct", 0)
-            low_units_confidence = district_turnover_data.get("low_units_confidence", True)
-
-            new_sale_pct = round((new_sale_count / tx_count) * 100, 1) if tx_count > 0 else 0
-            resale_pct = round((resale_count / tx_count) * 100, 1) if tx_count > 0 else 0
-
-            concentration = concentration_by_district.get(district_id, {
-                "gini": 0, "fragility": "Unknown", "project_count": 0, "top_project_share": 0
-            })
             psf_cv = psf_cv_by_district.get(district_id)
-
-            liquidity_score = calculate_liquidity_score(
-                monthly_velocity, concentration["project_count"], concentration["gini"],
-                tx_count, project_count, psf_cv, resale_pct
-            )
-            score_tier = get_score_tier(liquidity_score)
+            liquidity_score = float(liquidity_scores[i])
 
             districts_response.append({
                 "district_id": district_id,
@@ -550,24 +599,24 @@ def compute_district_liquidity(
                 "has_data": True,
                 "liquidity_metrics": {
                     "liquidity_score": liquidity_score,
-                    "score_tier": score_tier,
+                    "score_tier": _score_tier(liquidity_score),
                     "tx_count": tx_count,
                     "new_sale_count": new_sale_count,
                     "resale_count": resale_count,
-                    "new_sale_pct": new_sale_pct,
-                    "resale_pct": resale_pct,
-                    "project_count": project_count,
-                    "monthly_velocity": monthly_velocity,
+                    "new_sale_pct": round((new_sale_count / tx_count) * 100, 1) if tx_count > 0 else 0,
+                    "resale_pct": float(resale_pct[i]) if tx_count > 0 else 0,
+                    "project_count": row["project_count"],
+                    "monthly_velocity": monthly_velocity[i],
                     "z_score": z_score,
-                    "liquidity_tier": liquidity_tier,
+                    "liquidity_tier": _liquidity_tier(z_score),
                     "turnover_rate": round(turnover_rate, 2) if turnover_rate else None,
-                    "total_units": total_units,
-                    "units_coverage_pct": round(units_coverage_pct, 1),
-                    "low_units_confidence": low_units_confidence,
-                    "concentration_gini": concentration["gini"],
-                    "fragility_label": concentration["fragility"],
-                    "resale_project_count": concentration["project_count"],
-                    "top_project_share": concentration["top_project_share"],
+                    "total_units": district_turnover_data.get("total_units", 0),
+                    "units_coverage_pct": round(district_turnover_data.get("coverage_pct", 0), 1),
+                    "low_units_confidence": district_turnover_data.get("low_units_confidence", True),
+                    "concentration_gini": concentration[i]["gini"],
+                    "fragility_label": concentration[i]["fragility"],
+                    "resale_project_count": concentration[i]["project_count"],
+                    "top_project_share": concentration[i]["top_project_share"],
                     "psf_cv": round(psf_cv, 3) if psf_cv else None
                 },
                 "bedroom_breakdown": bedroom_by_district.get(district_id, {})
@@ -611,14 +660,7 @@ def compute_district_liquidity(
             "mean_turnover_rate": round(mean_turnover_rate, 2),
             "median_turnover_rate": round(median_turnover_rate, 2),
             "total_housing_stock": total_housing_stock,
-            "methodology_notes": {
-                "liquidity_score": "Composite 0-100 score: Exit Safety (60%) + Market Health (40%)",
-                "exit_safety_metrics": "Velocity (35%), Breadth (15%), Concentration (10%) - RESALE only",
-                "market_health_metrics": "Volume (18%), Diversity (9%), Stability (8%), Organic (5%)",
-                "concentration_metrics": "Gini, Fragility, Top Share calculated on RESALE only",
-                "turnover_rate": "Resales per 100 units per period - normalized for district size",
-                "z_score": "Robust Z-score using median/MAD - handles skewed distributions"
-            },
+            "methodology_notes": dict(_LIQUIDITY_METHODOLOGY_NOTES),
             "elapsed_ms": int(elapsed * 1000),
             "cache_hit": False
         }
@@ -0,0 +1,225 @@
+"""
+Launch Dimension Service - maintains the project_launches table
+
+One row per new-launch project (migration 028): global launch date (first
+New Sale), launch-month units sold, cumulative New Sales by month,
+district/segment, New Sale bedroom types and CSV total_units.
+
+Each refresh rebuilds the table in one transaction (one INSERT ... SELECT
+over New Sale rows), so deletes and outlier re-flags are picked up the same
+way as new rows. Writers refresh it after they change transactions: URA
+sync, scripts/upload.py after publish, and outlier (un)marking in
+data_validation.
+
+Readers check availability once per process; the cached answer is dropped
+when the dataset catalog sees new data (on_dataset_change).
+
+Launch semantics match new_launch_service:
+- key is UPPER(TRIM(project_name))
+- launch_district is the first sale's district (ordered by date, then id)
+- district is MIN(district), used by the timeline cohort filter
+
+Usage:
+    from services.launch_dimension_service import refresh_launch_dimension
+
+    refresh_launch_dimension(db.session)
+"""
+
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import text
+
+from constants import SALE_TYPE_NEW, CCR_DISTRICTS, RCR_DISTRICTS, OCR_DISTRICTS
+from db.sql import get_outlier_filter_sql
+from services.dataset_catalog import on_dataset_change
+
+logger = logging.getLogger('launch_dimension')
+
+
+# Every New Sale project, recomputed from transactions_primary
+_REBUILD_SQL = f"""
+    WITH new_sales AS (
+        SELECT
+            UPPER(TRIM(t.project_name)) AS name_key,
+            t.id,
+            t.transaction_date,
+            t.district,
+            t.bedroom_count
+        FROM transactions_primary t
+        WHERE t.sale_type = :sale_type_new
+          AND {get_outlier_filter_sql('t')}
+    ),
+    firsts AS (
+        SELECT DISTINCT ON (name_key)
+            name_key,
+            transaction_date AS launch_date,
+            district AS launch_district
+        FROM new_sales
+        ORDER BY name_key, transaction_date ASC, id ASC
+    ),
+    agg AS (
+        SELECT
+            name_key,
+            MIN(district) AS district,
+            COUNT(*) AS new_sale_count,
+            MAX(id) AS max_txn_id,
+            COALESCE(
+                ARRAY_AGG(DISTINCT bedroom_count) FILTER (WHERE bedroom_count IS NOT NULL),
+                '{{}}'
+            ) AS bedroom_counts
+        FROM new_sales
+        GROUP BY name_key
+    ),
+    monthly AS (
+        SELECT name_key, DATE_TRUNC('month', transaction_date)::date AS month_start, COUNT(*) AS n
+        FROM new_sales
+        GROUP BY name_key, DATE_TRUNC('month', transaction_date)
+    ),
+    cumulative AS (
+        SELECT name_key, jsonb_object_agg(TO_CHAR(month_start, 'YYYY-MM'), cum) AS cumulative_sold
+        FROM (
+            SELECT
+                name_key, month_start,
+                SUM(n) OVER (PARTITION BY name_key ORDER BY month_start) AS cum
+            FROM monthly
+        ) c
+        GROUP BY name_key
+    )
+    INSERT INTO project_launches (
+        name_key, launch_date, launch_district, district, segment,
+        launch_month_units_sold, new_sale_count, cumulative_sold, bedroom_counts,
+        max_txn_id, updated_at
+    )
+    SELECT
+        f.name_key,
+        f.launch_date,
+        f.launch_district,
+        a.district,
+        CASE
+            WHEN f.launch_district = ANY(:ccr) THEN 'CCR'
+            WHEN f.launch_district = ANY(:rcr) THEN 'RCR'
+            WHEN f.launch_district = ANY(:ocr) THEN 'OCR'
+        END,
+        COALESCE(m.n, 0),
+        a.new_sale_count,
+        cu.cumulative_sold,
+        a.bedroom_counts,
+        a.max_txn_id,
+        NOW()
+    FROM firsts f
+    JOIN agg a ON a.name_key = f.name_key
+    JOIN cumulative cu ON cu.name_key = f.name_key
+    LEFT JOIN monthly m
+      ON m.name_key = f.name_key
+     AND m.month_start = DATE_TRUNC('month', f.launch_date)::date
+"""
+
+
+def _sync_total_units(session, units_map: Dict[str, int]) -> None:
+    """Set total_units from the CSV units map in one statement."""
+    session.execute(text("""
+        UPDATE project_launches pl
+        SET total_units = u.total_units
+        FROM (
+            SELECT pl2.name_key, m.total_units
+            FROM project_launches pl2
+            LEFT JOIN unnest(CAST(:keys AS TEXT[]), CAST(:units AS INTEGER[]))
+                AS m(name_key, total_units)
+              ON m.name_key = pl2.name_key
+        ) u
+        WHERE u.name_key = pl.name_key
+          AND u.total_units IS DISTINCT FROM pl.total_units
+    """), {"keys": list(units_map.keys()), "units": list(units_map.values())})
+
+
+def refresh_launch_dimension(session) -> Dict[str, Any]:
+    """
+    Rebuild project_launches in one transaction.
+
+    Args:
+        session: SQLAlchemy session (Flask-SQLAlchemy or plain sessionmaker)
+
+    Returns:
+        Dict with projects refreshed and elapsed_ms
+    """
+    from services.new_launch_service import _get_units_map_cached
+
+    start = time.perf_counter()
+
+    session.execute(text("DELETE FROM project_launches"))
+    result = session.execute(text(_REBUILD_SQL), {
+        "sale_type_new": SALE_TYPE_NEW,
+        "ccr": CCR_DISTRICTS,
+        "rcr": RCR_DISTRICTS,
+        "ocr": OCR_DISTRICTS,
+    })
+
+    _sync_total_units(session, _get_units_map_cached())
+    session.commit()
+
+    stats = {
+        "projects_refreshed": result.rowcount,
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+    }
+    logger.info(f"Launch dimension refreshed: {stats}")
+    return stats
+
+
+def refresh_launch_dimension_for_engine(engine=None) -> bool:
+    """
+    Refresh outside a Flask request (e.g. after URA sync or upload).
+
+    Returns:
+        True on success, False on failure (logged, never raised).
+    """
+    from sqlalchemy.orm import sessionmaker
+
+    try:
+        if engine is None:
+            from services.ura_sync_engine import get_database_engine
+            engine = get_database_engine()
+
+        session = sessionmaker(bind=engine)()
+        try:
+            refresh_launch_dimension(session)
+        finally:
+            session.close()
+        return True
+
+    except Exception as e:
+        logger.exception(f"Failed to refresh launch dimension: {e}")
+        return False
+
+
+_available: Optional[bool] = None
+
+
+def launch_dimension_available(session) -> bool:
+    """
+    True when project_launches exists and has been populated.
+
+    Once populated the answer is cached per process until a data change.
+    """
+    global _available
+    if _available:
+        return True
+    try:
+        _available = bool(session.execute(
+            text("SELECT EXISTS (SELECT 1 FROM project_launches)")
+        ).scalar())
+    except Exception as e:
+        session.rollback()
+        logger.debug(f"project_launches unavailable: {e}")
+        return False
+    return _available
+
+
+def invalidate_launch_dimension_availability() -> None:
+    """Re-check project_launches on the next read."""
+    global _available
+    _available = None
+
+
+on_dataset_change(invalidate_launch_dimension_availability)
@@ -11,6 +11,10 @@ CRITICAL CORRECTNESS RULES:
 3. Project key is canonical: UPPER(TRIM(project_name))
 4. Join with new_launch_units CSV for total_units (loaded once, lookup by key)
 
+Both endpoints read the project_launches dimension (one row per project,
+maintained by launch_dimension_service) when it is populated, and fall
+back to the cohort CTEs over transactions_primary otherwise.
+
 Usage:
     from services.new_launch_service import get_new_launch_timeline
 
@@ -31,6 +35,7 @@ from models.database import db
 from db.sql import get_outlier_filter_sql
 from constants import SALE_TYPE_NEW, get_districts_for_region
 from services.new_launch_units import list_all_projects
+from services.launch_dimension_service import launch_dimension_available
 
 import logging
 
@@ -72,6 +77,38 @@ def _get_units_map_cached() -> Dict[str, int]:
     return _build_units_map()
 
 
+# Dimension reads: same boolean-guarded params as the live SQL below.
+# Timeline filters on MIN(district), absorption on the first sale's district,
+# matching their live counterparts.
+_TIMELINE_DIMENSION_SQL = """
+    SELECT
+        DATE_TRUNC(:time_grain, pl.launch_date) AS period_start,
+        COUNT(*) AS project_count,
+        SUM(COALESCE(pl.total_units, 0)) AS total_units
+    FROM project_launches pl
+    WHERE (:date_from_is_null OR pl.launch_date >= :date_from)
+      AND (:date_to_is_null OR pl.launch_date < :date_to_exclusive)
+      AND (:districts_is_null OR pl.district = ANY(:districts))
+      AND (:bedrooms_is_null OR pl.bedroom_counts && CAST(:bedrooms AS INTEGER[]))
+    GROUP BY DATE_TRUNC(:time_grain, pl.launch_date)
+    ORDER BY period_start
+"""
+
+_ABSORPTION_DIMENSION_SQL = """
+    SELECT
+        DATE_TRUNC(:time_grain, pl.launch_date) AS period_start,
+        pl.name_key,
+        pl.launch_month_units_sold,
+        pl.total_units
+    FROM project_launches pl
+    WHERE (:date_from_is_null OR pl.launch_date >= :date_from)
+      AND (:date_to_is_null OR pl.launch_date < :date_to_exclusive)
+      AND (:districts_is_null OR pl.launch_district = ANY(:districts))
+      AND (:bedrooms_is_null OR pl.bedroom_counts && CAST(:bedrooms AS INTEGER[]))
+    ORDER BY period_start, pl.name_key
+"""
+
+
 def get_new_launch_timeline(
     time_grain: str = 'quarter',
     districts: Optional[List[str]] = None,
@@ -153,6 +190,17 @@ def get_new_launch_timeline(
     else:
         params["bedrooms"] = []  # Empty array, guarded by is_null
 
+    if launch_dimension_available(db.session):
+        result = db.session.execute(text(_TIMELINE_DIMENSION_SQL), params).fetchall()
+        return [
+            {
+                "periodStart": row[0].isoformat() if hasattr(row[0], 'isoformat') else str(row[0]),
+                "projectCount": row[1],
+                "totalUnits": int(row[2] or 0),
+            }
+            for row in result
+        ]
+
     # Static SQL with boolean-param guards (no f-string injection of clauses)
     # Uses MIN(district) instead of MODE() for determinism and compatibility
     sql = f"""
@@ -269,8 +317,6 @@ def get_new_launch_absorption(
         date_from: Inclusive start date for launch_date
         date_to_exclusive: Exclusive end date for launch_date
     """
-    from collections import defaultdict
-
     if time_grain not in VALID_TIME_GRAINS:
         raise ValueError(f"time_grain must be one of {VALID_TIME_GRAINS}, got '{time_grain}'")
 
@@ -299,6 +345,12 @@ def get_new_launch_absorption(
         "bedrooms": bedrooms or [],
     }
 
+    if launch_dimension_available(db.session):
+        result = db.session.execute(text(_ABSORPTION_DIMENSION_SQL), params).fetchall()
+        return _aggregate_absorption(
+            [(row[0], row[1], row[2], row[3]) for row in result], time_grain
+        )
+
     # SQL uses f-string for outlier filter (matches existing pattern)
     # DISTINCT ON with id tie-breaker for determinism (URA dates are month-bucketed)
     # LEFT JOIN ensures projectCount includes projects with 0 launch-month sales
@@ -360,13 +412,28 @@ def get_new_launch_absorption(
     # Load units map ONCE - keys match SQL: UPPER(TRIM(name))
     units_map = _get_units_map_cached()
 
+    return _aggregate_absorption(
+        [(row[0], row[1], row[2], units_map.get(row[1])) for row in result], time_grain
+    )
+
+
+def _aggregate_absorption(rows, time_grain: str) -> List[Dict[str, Any]]:
+    """
+    Average launch-month absorption per period.
+
+    Args:
+        rows: (period_start, project_key, units_sold, total_units) tuples
+        time_grain: 'month', 'quarter', or 'year'
+    """
+    from collections import defaultdict
+
     # Group by period
     periods: Dict[date, List[Dict[str, Any]]] = defaultdict(list)
-    for row in result:
-        periods[row[0]].append({
-            'project_key': row[1],
-            'units_sold': row[2],
-            'total_units': units_map.get(row[1]),
+    for period_start, project_key, units_sold, total_units in rows:
+        periods[period_start].append({
+            'project_key': project_key,
+            'units_sold': units_sold,
+            'total_units': total_units,
         })
 
     # Aggregate per period
@@ -35,8 +35,12 @@ Legacy functions still available:
 
 import os
 import csv
+import time
 import logging
-from typing import Dict, Any, List, Set, Optional
+import threading
+from typing import Dict, Any, Iterable, List, Set, Optional, Tuple
+
+from services.dataset_catalog import on_dataset_change
 
 logger = logging.getLogger('new_launch_units')
 
@@ -54,6 +58,10 @@ CSV_FILE = os.path.join(
 _data_cache = None
 # Cache for projects with resale transactions
 _resale_projects_cache = None
+# Cache for the verified registry units map: (map, loaded_at)
+_registry_units_cache = None
+_registry_units_lock = threading.Lock()
+REGISTRY_UNITS_TTL_SECONDS = 600
 
 
 def _load_data() -> Dict[str, Dict[str, Any]]:
@@ -315,6 +323,20 @@ def get_project_units(project_name: str) -> Dict[str, Any]:
         - tenure: Tenure type if available
     """
     normalized = project_name.upper().strip()
+    registry_result = _lookup_project_registry(project_name)
+    db_result = None
+    if not registry_result and not _load_data().get(normalized, {}).get('total_units'):
+        db_result = _lookup_upcoming_launches(normalized)
+    return _build_units_result(project_name, registry_result, db_result)
+
+
+def _build_units_result(
+    project_name: str,
+    registry_result: Optional[Dict[str, Any]],
+    db_result: Optional[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Apply the registry → CSV → upcoming_launches hierarchy to looked-up rows."""
+    normalized = project_name.upper().strip()
 
     # Base response structure
     result = {
@@ -332,7 +354,6 @@ def get_project_units(project_name: str) -> Dict[str, Any]:
     # -------------------------------------------------------------------------
     # Source 1: project_units registry (PRIMARY - single source of truth)
     # -------------------------------------------------------------------------
-    registry_result = _lookup_project_registry(project_name)
     if registry_result and registry_result.get('total_units'):
         result.update({
             "total_units": registry_result['total_units'],
@@ -370,7 +391,6 @@ def get_project_units(project_name: str) -> Dict[str, Any]:
     # -------------------------------------------------------------------------
     # Source 3: upcoming_launches database table
     # -------------------------------------------------------------------------
-    db_result = _lookup_upcoming_launches(normalized)
     if db_result and db_result.get('total_units'):
         db_confidence = db_result.get('data_confidence', CONFIDENCE_MEDIUM)
         result.update({
@@ -417,20 +437,109 @@ def _lookup_upcoming_launches(project_name_upper: str) -> Optional[Dict[str, Any
     return None
 
 
-def get_project_units_batch(project_names: List[str]) -> Dict[str, Dict[str, Any]]:
+def get_project_units_batch(project_names: Iterable[str]) -> Dict[str, Dict[str, Any]]:
     """
     Get units for multiple projects efficiently.
 
+    Same result per project as get_project_units(), but with one registry
+    query (project_key = ANY) for all names, the in-memory CSV index, and
+    one upcoming_launches query for names neither source covers.
+
     Args:
-        project_names: List of project names
+        project_names: Project names (duplicates are looked up once)
 
     Returns:
         Dict mapping project names to their unit data
     """
-    results = {}
-    for name in project_names:
-        results[name] = get_project_units(name)
-    return results
+    names = list(dict.fromkeys(n for n in project_names if n))
+    if not names:
+        return {}
+
+    from utils.project_name import project_key
+
+    keys = {name: project_key(name) for name in names}
+    registry = _lookup_project_registry_bulk(set(keys.values()))
+
+    csv_data = _load_data()
+    unresolved = {
+        name.upper().strip() for name in names
+        if keys[name] not in registry
+        and not csv_data.get(name.upper().strip(), {}).get('total_units')
+    }
+    upcoming = _lookup_upcoming_launches_bulk(unresolved) if unresolved else {}
+
+    return {
+        name: _build_units_result(
+            name, registry.get(keys[name]), upcoming.get(name.upper().strip()))
+        for name in names
+    }
+
+
+def _lookup_project_registry_bulk(keys: Set[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Verified registry rows for many project keys in one query.
+
+    Returns:
+        Dict mapping project_key to the same shape as _lookup_project_registry()
+    """
+    if not keys:
+        return {}
+    try:
+        from sqlalchemy import text
+        from models.database import db
+        from models.project_units import UNITS_STATUS_VERIFIED
+
+        rows = db.session.execute(text("""
+            SELECT project_key, total_units, district, developer, tenure,
+                   top_year, data_source, confidence_score
+            FROM project_units
+            WHERE project_key = ANY(:keys)
+              AND units_status = :verified
+              AND total_units > 0
+        """), {"keys": list(keys), "verified": UNITS_STATUS_VERIFIED}).mappings().all()
+
+        return {
+            row['project_key']: {
+                "total_units": row['total_units'],
+                "district": row['district'],
+                "developer": row['developer'],
+                "tenure": row['tenure'],
+                "top_year": row['top_year'],
+                "data_source": row['data_source'],
+                "confidence_score": float(row['confidence_score']) if row['confidence_score'] else 0.9,
+            }
+            for row in rows
+        }
+    except Exception as e:
+        logger.warning(f"Bulk registry lookup failed for {len(keys)} projects: {e}")
+        return {}
+
+
+def _lookup_upcoming_launches_bulk(project_names_upper: Set[str]) -> Dict[str, Dict[str, Any]]:
+    """upcoming_launches rows for many upper-cased names in one query."""
+    try:
+        from models.database import db
+        from models.upcoming_launch import UpcomingLaunch
+
+        launches = UpcomingLaunch.query.filter(
+            db.func.upper(UpcomingLaunch.project_name).in_(list(project_names_upper))
+        ).all()
+
+        results = {}
+        for launch in launches:
+            results.setdefault(launch.project_name.upper(), {
+                "total_units": launch.total_units,
+                "data_source": launch.data_source,
+                "data_confidence": launch.data_confidence,
+                "expected_top_date": launch.expected_top_date.year if launch.expected_top_date else None,
+                "developer": launch.developer,
+                "district": launch.district,
+                "tenure": launch.tenure,
+            })
+        return results
+    except Exception as e:
+        logger.warning(f"Error looking up upcoming_launches for {len(project_names_upper)} projects: {e}")
+        return {}
 
 
 # =============================================================================
@@ -439,11 +548,43 @@ def get_project_units_batch(project_names: List[str]) -> Dict[str, Dict[str, Any
 
 def _load_registry_units_map() -> Dict[str, Dict[str, Any]]:
     """
-    Load all verified unit counts from project_units registry.
+    Verified unit counts from the project_units registry.
+
+    Cached per process for REGISTRY_UNITS_TTL_SECONDS, and dropped early
+    when the dataset catalog sees new data (registry rows are added with
+    each sync or upload). An empty result (registry unavailable) is not
+    cached.
 
     Returns:
         Dict mapping normalized project name to {total_units, district}
     """
+    global _registry_units_cache
+
+    cached = _registry_units_cache
+    if cached is not None and time.time() - cached[1] < REGISTRY_UNITS_TTL_SECONDS:
+        return cached[0]
+
+    with _registry_units_lock:
+        cached = _registry_units_cache
+        if cached is not None and time.time() - cached[1] < REGISTRY_UNITS_TTL_SECONDS:
+            return cached[0]
+        result = _query_registry_units_map()
+        if result:
+            _registry_units_cache = (result, time.time())
+        return result
+
+
+def invalidate_registry_units_map() -> None:
+    """Drop the cached registry units map (after registry updates)."""
+    global _registry_units_cache
+    _registry_units_cache = None
+
+
+on_dataset_change(invalidate_registry_units_map)
+
+
+def _query_registry_units_map() -> Dict[str, Dict[str, Any]]:
+    """Load all verified unit counts from project_units registry."""
     try:
         from models.project_units import ProjectUnits, UNITS_STATUS_VERIFIED
         from data_health.core import normalize_name
@@ -509,17 +650,6 @@ def get_district_units_for_resale(
     from db.sql import OUTLIER_FILTER
     from constants import SALE_TYPE_RESALE
 
-    # Load unit data sources
-    if use_registry:
-        registry_data = _load_registry_units_map()
-        data_source = "registry" if registry_data else "csv"
-    else:
-        registry_data = {}
-        data_source = "csv"
-
-    # Fallback to CSV if registry is empty
-    csv_data = _load_data()
-
     # Build date filter clause
     date_clause = ""
     params = {"sale_type": SALE_TYPE_RESALE}
@@ -546,13 +676,45 @@ def get_district_units_for_resale(
     """)
 
     rows = db_session.execute(query, params).fetchall()
+    return build_district_units([(row[0], row[1]) for row in rows], use_registry=use_registry)
+
+
+def build_district_units(
+    district_projects: Iterable[Tuple[str, str]],
+    use_registry: bool = True,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Aggregate unit totals per district for (district, project_name) pairs.
+
+    Project names are matched upper-cased and trimmed; duplicate pairs are
+    counted once. Registry and CSV sources are cached per process, so this
+    runs no SQL once they are warm.
+
+    Returns:
+        Same shape as get_district_units_for_resale()
+    """
+    # Load unit data sources
+    if use_registry:
+        registry_data = _load_registry_units_map()
+        data_source = "registry" if registry_data else "csv"
+    else:
+        registry_data = {}
+        data_source = "csv"
+
+    # Fallback to CSV if registry is empty
+    csv_data = _load_data()
 
     # Aggregate by district
     district_data: Dict[str, Dict[str, Any]] = {}
-
-    for row in rows:
-        district = row[0]
-        project_name = row[1]
+    seen: Set[Tuple[str, str]] = set()
+
+    for district, project_name in district_projects:
+        if not district or not project_name:
+            continue
+        project_name = project_name.strip().upper()
+        if (district, project_name) in seen:
+            continue
+        seen.add((district, project_name))
 
         if district not in district_data:
             district_data[district] = {
@@ -29,6 +29,7 @@ from typing import Dict, Any, List, Optional, Tuple
 from sqlalchemy import text
 
 from models.database import db
+from utils.single_flight import single_flight
 from api.contracts.contract_schema import SaleType
 from constants import (
     get_region_for_district, get_districts_for_region,
@@ -77,6 +78,10 @@ TREND_MONTHS = 6  # Look back 6 months for floor trend
 # MAIN ENTRY POINT
 # =============================================================================
 
+@single_flight(
+    lambda project_name, window_months=24, unit_psf=None: (project_name, window_months, unit_psf),
+    name='price_bands',
+)
 def get_project_price_bands(
     project_name: str,
     window_months: int = 24,
@@ -93,8 +98,18 @@ def get_project_price_bands(
     Returns:
         Dict with bands, latest, trend, verdict (if unit_psf), and data_quality
     """
+    # Precomputed snapshot (single-row lookup); live queries if missing
+    from services.project_snapshot_service import get_project_snapshot
+    snapshot = get_project_snapshot(project_name)
+
     # Get project info (district, tenure)
-    project_info = _get_project_info(project_name)
+    if snapshot:
+        project_info = {
+            "district": snapshot['district'],
+            "tenure": normalize_tenure(snapshot['tenure']) if snapshot['tenure'] else None
+        }
+    else:
+        project_info = _get_project_info(project_name)
     if not project_info:
         return _empty_response(project_name, "Project not found")
 
@@ -108,7 +123,7 @@ def get_project_price_bands(
 
     # Check project validity and get bands
     is_valid, validity_reason, bands_raw = _check_and_get_project_bands(
-        project_name, date_from, date_to
+        project_name, date_from, date_to, snapshot=snapshot
     )
 
     data_source = "project"
@@ -218,20 +233,27 @@ def _get_project_info(project_name: str) -> Optional[Dict[str, Any]]:
 def _check_and_get_project_bands(
     project_name: str,
     date_from: date,
-    date_to: date
+    date_to: date,
+    snapshot: Optional[Dict[str, Any]] = None
 ) -> Tuple[bool, Optional[str], List[Dict]]:
     """
     Check if project meets validity thresholds and return raw bands.
 
+    Uses the project's snapshot bands when given, else computes live.
+
     Returns:
         Tuple of (is_valid, validity_reason, bands_raw)
     """
     # Get raw percentile bands
-    bands_raw = _compute_monthly_percentiles(
-        project_name=project_name,
-        date_from=date_from,
-        date_to=date_to
-    )
+    if snapshot:
+        from services.project_snapshot_service import snapshot_bands
+        bands_raw = snapshot_bands(snapshot, date_from, date_to)
+    else:
+        bands_raw = _compute_monthly_percentiles(
+            project_name=project_name,
+            date_from=date_from,
+            date_to=date_to
+        )
 
     # Calculate validity metrics
     total_trades = sum(b.get('count', 0) for b in bands_raw if b.get('count'))
@@ -6,11 +6,14 @@ Computes price growth metrics for individual transactions within market segments
 appreciation patterns and identify pricing trends at granular level.
 
 Key Features:
-- Window functions with PARTITION BY for segment-level analysis
+- Segment series values (first/previous PSF, sequence, days since previous)
+  persisted on transactions at ingest (migration 029), refreshed by
+  refresh_price_growth_columns() after URA sync, CSV publish and outlier
+  re-flagging
 - Cumulative growth from first transaction in segment
 - Incremental growth from previous transaction
 - Annualized growth calculations
-- Days between transactions
+- Keyset pagination over (transaction_date, id) via an opaque cursor
 
 Usage:
     from services.price_growth_service import get_transaction_price_growth
@@ -22,9 +25,10 @@ Usage:
     )
 """
 
+import base64
 import logging
 from datetime import date, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from dataclasses import dataclass
 
 from sqlalchemy import text
@@ -68,6 +72,29 @@ class TransactionGrowth:
 # MAIN ENTRY POINT
 # =============================================================================
 
+def encode_cursor(transaction_date: date, txn_id: int) -> str:
+    """Opaque keyset cursor for the row after (transaction_date, id)."""
+    raw = f"{transaction_date.isoformat()}|{txn_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[date, int]:
+    """
+    Decode a cursor from encode_cursor().
+
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    from utils.normalize import ValidationError
+
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        date_part, id_part = base64.urlsafe_b64decode(padded.encode()).decode().split('|')
+        return date.fromisoformat(date_part), int(id_part)
+    except (ValueError, UnicodeDecodeError):
+        raise ValidationError("Invalid cursor", field="cursor", received_value=cursor)
+
+
 def get_transaction_price_growth(
     project_name: Optional[str] = None,
     bedroom_count: Optional[int] = None,
@@ -77,11 +104,20 @@ def get_transaction_price_growth(
     date_to: Optional[date] = None,
     sale_type: Optional[str] = None,
     page: int = 1,
-    per_page: int = DEFAULT_PAGE_SIZE
+    per_page: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Get transaction-level price growth metrics.
 
+    Growth is measured within the transaction's full segment history
+    (project + bedroom + floor level); filters select which rows are
+    returned, they do not re-base the series.
+
+    Rows are ordered by (transaction_date, id). Pass the previous response's
+    pagination.next_cursor as `cursor` to page by keyset - every page then
+    costs the same. `page` (OFFSET) is still honoured when no cursor is given.
+
     Args:
         project_name: Filter by project name (partial match)
         bedroom_count: Filter by bedroom count (1-5)
@@ -90,21 +126,29 @@ def get_transaction_price_growth(
         date_from: Start date for transaction filter
         date_to: End date for transaction filter
         sale_type: Filter by sale type (enum value from SaleType)
-        page: Page number (1-indexed)
+        page: Page number (1-indexed), ignored when cursor is set
         per_page: Records per page (max 500)
+        cursor: Keyset cursor from a previous response
 
     Returns:
         Dict with data (list of transactions), pagination metadata
+
+    Raises:
+        ValidationError: If cursor is malformed
     """
     # Validate pagination
     page = max(1, page)
     per_page = min(per_page, MAX_PAGE_SIZE)
-    offset = (page - 1) * per_page
+    cursor_date, cursor_id = decode_cursor(cursor) if cursor else (None, None)
+    offset = 0 if cursor else (page - 1) * per_page
 
     # Build param-guarded filters (static SQL)
+    # One extra row tells whether another page follows
     params = {
-        "limit": per_page,
+        "limit": per_page + 1,
         "offset": offset,
+        "cursor_date": cursor_date,
+        "cursor_id": cursor_id,
         "project_name": f"%{project_name}%" if project_name else None,
         "bedroom_count": bedroom_count,
         "floor_level": floor_level,
@@ -115,119 +159,63 @@ def get_transaction_price_growth(
         "sale_type": sale_type,
     }
 
-    # Execute main query
+    # Execute main query - segment series columns are precomputed
     query = text("""
-        WITH transaction_growth AS (
-            SELECT
-                id,
-                project_name,
-                bedroom_count,
-                COALESCE(floor_level, 'Unknown') as floor_level,
-                transaction_date,
-                psf,
-
-                -- First PSF in this segment (project + bedroom + floor)
-                -- Secondary sort by id ensures deterministic ordering for same-date transactions
-                FIRST_VALUE(psf) OVER (
-                    PARTITION BY
-                        project_name,
-                        bedroom_count,
-                        COALESCE(floor_level, 'Unknown')
-                    ORDER BY transaction_date, id
-                    ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
-                ) as first_psf,
-
-                -- Previous transaction PSF
-                LAG(psf) OVER (
-                    PARTITION BY
-                        project_name,
-                        bedroom_count,
-                        COALESCE(floor_level, 'Unknown')
-                    ORDER BY transaction_date, id
-                ) as prev_psf,
-
-                -- Previous transaction date
-                LAG(transaction_date) OVER (
-                    PARTITION BY
-                        project_name,
-                        bedroom_count,
-                        COALESCE(floor_level, 'Unknown')
-                    ORDER BY transaction_date, id
-                ) as prev_date,
-
-                -- Row number within segment (for identifying first transaction)
-                ROW_NUMBER() OVER (
-                    PARTITION BY
-                        project_name,
-                        bedroom_count,
-                        COALESCE(floor_level, 'Unknown')
-                    ORDER BY transaction_date, id
-                ) as txn_sequence
-
-            FROM transactions_primary
-            WHERE is_outlier = false
-              AND (:project_name IS NULL OR project_name ILIKE :project_name)
-              AND (:bedroom_count IS NULL OR bedroom_count = :bedroom_count)
-              AND (:floor_level IS NULL OR COALESCE(floor_level, 'Unknown') = :floor_level)
-              AND (:district IS NULL OR district = :district)
-              AND (:date_from IS NULL OR transaction_date >= :date_from)
-              AND (:date_to_exclusive IS NULL OR transaction_date < :date_to_exclusive)
-              AND (:sale_type IS NULL OR sale_type = :sale_type)
-        )
         SELECT
             id,
             project_name,
             bedroom_count,
-            floor_level,
+            COALESCE(floor_level, 'Unknown') as floor_level,
             transaction_date,
             psf,
-            txn_sequence,
+            segment_txn_sequence as txn_sequence,
 
             -- Cumulative growth % from first transaction in segment
             CASE
-                WHEN first_psf > 0 AND txn_sequence > 1 THEN
-                    ROUND(((psf - first_psf) / first_psf * 100)::numeric, 2)
+                WHEN segment_first_psf > 0 AND segment_txn_sequence > 1 THEN
+                    ROUND(((psf - segment_first_psf) / segment_first_psf * 100)::numeric, 2)
                 ELSE NULL
             END as cumulative_growth_pct,
 
             -- Incremental growth % from previous transaction
             CASE
-                WHEN prev_psf > 0 THEN
-                    ROUND(((psf - prev_psf) / prev_psf * 100)::numeric, 2)
+                WHEN segment_prev_psf > 0 THEN
+                    ROUND(((psf - segment_prev_psf) / segment_prev_psf * 100)::numeric, 2)
                 ELSE NULL
             END as incremental_growth_pct,
 
             -- Days since previous transaction
-            CASE
-                WHEN prev_date IS NOT NULL THEN
-                    (transaction_date - prev_date)
-                ELSE NULL
-            END as days_since_prev,
+            segment_days_since_prev as days_since_prev,
 
             -- Annualized incremental growth %
             CASE
-                WHEN prev_psf > 0
-                 AND prev_date IS NOT NULL
-                 AND (transaction_date - prev_date) > 0 THEN
+                WHEN segment_prev_psf > 0
+                 AND segment_days_since_prev > 0 THEN
                     ROUND((
-                        ((psf - prev_psf) / prev_psf) *
-                        (365.0 / (transaction_date - prev_date)) *
+                        ((psf - segment_prev_psf) / segment_prev_psf) *
+                        (365.0 / segment_days_since_prev) *
                         100
                     )::numeric, 2)
                 ELSE NULL
             END as annualized_growth_pct
 
-        FROM transaction_growth
-        ORDER BY
-            project_name,
-            bedroom_count,
-            floor_level,
-            transaction_date,
-            id
+        FROM transactions_primary
+        WHERE is_outlier = false
+          AND (:project_name IS NULL OR project_name ILIKE :project_name)
+          AND (:bedroom_count IS NULL OR bedroom_count = :bedroom_count)
+          AND (:floor_level IS NULL OR COALESCE(floor_level, 'Unknown') = :floor_level)
+          AND (:district IS NULL OR district = :district)
+          AND (:date_from IS NULL OR transaction_date >= :date_from)
+          AND (:date_to_exclusive IS NULL OR transaction_date < :date_to_exclusive)
+          AND (:sale_type IS NULL OR sale_type = :sale_type)
+          AND (:cursor_date IS NULL OR (transaction_date, id) > (:cursor_date, :cursor_id))
+        ORDER BY transaction_date, id
         LIMIT :limit OFFSET :offset
     """)
 
     results = db.session.execute(query, params).fetchall()
+    has_more = len(results) > per_page
+    results = results[:per_page]
 
     # Get total count for pagination
     count_query = text("""
@@ -243,7 +231,10 @@ def get_transaction_price_growth(
           AND (:sale_type IS NULL OR sale_type = :sale_type)
     """)
     # Remove pagination params for count query
-    count_params = {k: v for k, v in params.items() if k not in ['limit', 'offset']}
+    count_params = {
+        k: v for k, v in params.items()
+        if k not in ['limit', 'offset', 'cursor_date', 'cursor_id']
+    }
     total_count = db.session.execute(count_query, count_params).scalar()
 
     # Convert to list of dicts
@@ -265,6 +256,11 @@ def get_transaction_price_growth(
 
     # Calculate pagination metadata
     total_pages = (total_count + per_page - 1) // per_page
+    has_next = has_more
+    next_cursor = (
+        encode_cursor(results[-1].transaction_date, results[-1].id)
+        if results and has_next else None
+    )
 
     return {
         "data": data,
@@ -273,8 +269,9 @@ def get_transaction_price_growth(
             "per_page": per_page,
             "total_count": total_count,
             "total_pages": total_pages,
-            "has_next": page < total_pages,
-            "has_prev": page > 1
+            "has_next": has_next,
+            "has_prev": bool(cursor) or page > 1,
+            "next_cursor": next_cursor,
         },
         "filters_applied": {
             "project_name": project_name,
@@ -288,6 +285,64 @@ def get_transaction_price_growth(
     }
 
 
+# =============================================================================
+# INGEST-TIME SERIES MAINTENANCE
+# =============================================================================
+
+def refresh_price_growth_columns(session, project_names: Optional[Iterable[str]] = None) -> int:
+    """
+    Recompute persisted segment series columns on transactions.
+
+    A new or revised row shifts first/previous PSF and sequence for every
+    later row in its segment, so whole projects are recomputed. Only rows
+    whose values changed are written.
+
+    Args:
+        session: SQLAlchemy session (caller commits)
+        project_names: Projects to refresh; None recomputes everything
+
+    Returns:
+        Number of transaction rows updated
+    """
+    names = sorted({n for n in project_names if n}) if project_names is not None else None
+    if names is not None and not names:
+        return 0
+
+    result = session.execute(text("""
+        UPDATE transactions t
+        SET segment_first_psf = g.first_psf,
+            segment_prev_psf = g.prev_psf,
+            segment_txn_sequence = g.txn_sequence,
+            segment_days_since_prev = g.days_since_prev
+        FROM (
+            SELECT
+                id,
+                FIRST_VALUE(psf) OVER w AS first_psf,
+                LAG(psf) OVER w AS prev_psf,
+                ROW_NUMBER() OVER w AS txn_sequence,
+                transaction_date - LAG(transaction_date) OVER w AS days_since_prev
+            FROM transactions_primary
+            WHERE is_outlier = false
+              AND (:all_projects OR project_name = ANY(:project_names))
+            WINDOW w AS (
+                PARTITION BY project_name, bedroom_count, COALESCE(floor_level, 'Unknown')
+                ORDER BY transaction_date, id
+            )
+        ) g
+        WHERE t.id = g.id
+          AND (t.segment_first_psf IS DISTINCT FROM g.first_psf
+               OR t.segment_prev_psf IS DISTINCT FROM g.prev_psf
+               OR t.segment_txn_sequence IS DISTINCT FROM g.txn_sequence
+               OR t.segment_days_since_prev IS DISTINCT FROM g.days_since_prev)
+    """), {"all_projects": names is None, "project_names": names or []})
+
+    logger.info(
+        f"Refreshed price growth columns for {result.rowcount} transactions "
+        f"({'all projects' if names is None else f'{len(names)} projects'})"
+    )
+    return result.rowcount
+
+
 # =============================================================================
 # SEGMENT SUMMARY (AGGREGATED VIEW)
 # =============================================================================
@@ -0,0 +1,301 @@
+"""
+Project Analytics Snapshot Service
+
+Maintains project_analytics_snapshot (migration 027): one precomputed row per
+project holding everything the project drill-down endpoints need -
+inventory counts, resale stats, bedroom diversity, monthly P25/P50/P75 PSF
+bands and verified registry unit data.
+
+The table is rebuilt with a single INSERT ... SELECT after each data publish
+(URA sync and scripts/upload.py call refresh_project_snapshots). Readers do
+a primary-key lookup and fall back to live aggregation when a project is
+missing.
+
+Usage:
+    from services.project_snapshot_service import get_project_snapshot
+
+    snapshot = get_project_snapshot("NORMANTON PARK")
+    if snapshot:
+        bands = snapshot_bands(snapshot, date_from, date_to)
+"""
+
+import logging
+import time
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import text
+
+from constants import SALE_TYPE_NEW, SALE_TYPE_RESALE
+
+logger = logging.getLogger('project_snapshot')
+
+# Monthly bands kept per project. Covers the 60-month max price-bands window
+# with headroom for the time between rebuilds.
+SNAPSHOT_BAND_MONTHS = 72
+
+
+# =============================================================================
+# BUILD
+# =============================================================================
+
+# Band guardrails mirror price_bands_service (PSF_MIN/PSF_MAX,
+# MIN_TRADES_PER_BUCKET); passed in as parameters at build time.
+_REBUILD_SQL = """
+    WITH base AS (
+        SELECT
+            project_name, project_key, district, tenure, sale_type,
+            transaction_date, price, area_sqft, psf, bedroom_count
+        FROM transactions_primary
+        WHERE is_outlier = false
+          AND project_name IS NOT NULL
+    ),
+    latest AS (
+        SELECT DISTINCT ON (project_name)
+            project_name, project_key, district, tenure
+        FROM base
+        ORDER BY project_name, transaction_date DESC
+    ),
+    counts AS (
+        SELECT
+            project_name,
+            COUNT(*) FILTER (WHERE sale_type = :sale_type_new) AS new_sale_count,
+            COUNT(*) FILTER (WHERE sale_type = :sale_type_resale) AS resale_count,
+            COUNT(DISTINCT COALESCE(bedroom_count, 0))
+                FILTER (WHERE sale_type = :sale_type_resale) AS resale_bedroom_types
+        FROM base
+        GROUP BY project_name
+    ),
+    resale_by_district AS (
+        SELECT
+            project_name,
+            district,
+            MIN(transaction_date) AS first_resale_date,
+            COUNT(*) AS resale_total,
+            PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY price / NULLIF(area_sqft, 0)) AS median_psf,
+            ROW_NUMBER() OVER (
+                PARTITION BY project_name ORDER BY COUNT(*) DESC, district
+            ) AS rn
+        FROM base
+        WHERE sale_type = :sale_type_resale
+        GROUP BY project_name, district
+    ),
+    resale_dates AS (
+        SELECT project_name, district, jsonb_object_agg(txn_date, n) AS date_counts
+        FROM (
+            SELECT project_name, district, transaction_date::text AS txn_date, COUNT(*) AS n
+            FROM base
+            WHERE sale_type = :sale_type_resale
+            GROUP BY project_name, district, transaction_date
+        ) d
+        GROUP BY project_name, district
+    ),
+    bands AS (
+        SELECT
+            project_name,
+            jsonb_agg(
+                jsonb_build_object('month', month, 'count', n, 'p25', p25, 'p50', p50, 'p75', p75)
+                ORDER BY month
+            ) AS monthly_bands
+        FROM (
+            SELECT
+                project_name,
+                TO_CHAR(transaction_date, 'YYYY-MM') AS month,
+                COUNT(*) AS n,
+                PERCENTILE_CONT(0.25) WITHIN GROUP (ORDER BY psf) AS p25,
+                PERCENTILE_CONT(0.50) WITHIN GROUP (ORDER BY psf) AS p50,
+                PERCENTILE_CONT(0.75) WITHIN GROUP (ORDER BY psf) AS p75
+            FROM base
+            WHERE sale_type = :sale_type_resale
+              AND psf > :psf_min AND psf < :psf_max
+              AND transaction_date >= :bands_from
+            GROUP BY project_name, TO_CHAR(transaction_date, 'YYYY-MM')
+            HAVING COUNT(*) >= :min_trades
+        ) m
+        GROUP BY project_name
+    )
+    INSERT INTO project_analytics_snapshot (
+        project_name, project_key, district, tenure,
+        new_sale_count, resale_count,
+        resale_district, first_resale_date, resale_total, resale_median_psf,
+        resale_date_counts, resale_bedroom_types,
+        monthly_bands, unit_data, computed_at
+    )
+    SELECT
+        l.project_name,
+        l.project_key,
+        l.district,
+        l.tenure,
+        c.new_sale_count,
+        c.resale_count,
+        r.district,
+        r.first_resale_date,
+        COALESCE(r.resale_total, 0),
+        r.median_psf,
+        COALESCE(rd.date_counts, '{}'::jsonb),
+        c.resale_bedroom_types,
+        COALESCE(b.monthly_bands, '[]'::jsonb),
+        CASE WHEN pu.id IS NOT NULL THEN jsonb_build_object(
+            'total_units', pu.total_units,
+            'unit_source', 'registry',
+            'confidence', :confidence_high,
+            'note', 'Verified in project_units registry (source: '
+                    || COALESCE(pu.data_source, 'registry') || ')',
+            'top', pu.top_year,
+            'developer', pu.developer,
+            'district', pu.district,
+            'tenure', pu.tenure
+        ) END,
+        NOW()
+    FROM latest l
+    JOIN counts c ON c.project_name = l.project_name
+    LEFT JOIN resale_by_district r ON r.project_name = l.project_name AND r.rn = 1
+    LEFT JOIN resale_dates rd ON rd.project_name = r.project_name AND rd.district = r.district
+    LEFT JOIN bands b ON b.project_name = l.project_name
+    LEFT JOIN project_units pu
+        ON pu.project_key = l.project_key
+       AND pu.units_status = :units_verified
+       AND pu.total_units > 0
+"""
+
+
+def rebuild_project_snapshots(session) -> int:
+    """
+    Rebuild every project's snapshot row in one transaction.
+
+    Readers keep seeing the previous generation until the commit.
+
+    Args:
+        session: SQLAlchemy session (Flask-SQLAlchemy or plain sessionmaker)
+
+    Returns:
+        Number of snapshot rows written
+    """
+    from data_health.core import sync_transaction_project_keys
+    from models.project_units import UNITS_STATUS_VERIFIED
+    from services.new_launch_units import CONFIDENCE_HIGH
+    from services.price_bands_service import PSF_MIN, PSF_MAX, MIN_TRADES_PER_BUCKET
+
+    start = time.perf_counter()
+
+    # Registry join needs transactions.project_key populated
+    sync_transaction_project_keys(session, commit=False)
+
+    bands_from = date.today().replace(day=1) - relativedelta(months=SNAPSHOT_BAND_MONTHS)
+
+    session.execute(text("DELETE FROM project_analytics_snapshot"))
+    result = session.execute(text(_REBUILD_SQL), {
+        "sale_type_new": SALE_TYPE_NEW,
+        "sale_type_resale": SALE_TYPE_RESALE,
+        "psf_min": PSF_MIN,
+        "psf_max": PSF_MAX,
+        "min_trades": MIN_TRADES_PER_BUCKET,
+        "bands_from": bands_from,
+        "confidence_high": CONFIDENCE_HIGH,
+        "units_verified": UNITS_STATUS_VERIFIED,
+    })
+    session.commit()
+
+    logger.info(
+        f"Rebuilt {result.rowcount} project snapshots in "
+        f"{(time.perf_counter() - start) * 1000:.0f}ms"
+    )
+    return result.rowcount
+
+
+def refresh_project_snapshots(engine=None) -> bool:
+    """
+    Rebuild snapshots outside a Flask request (e.g. after URA sync or upload).
+
+    Returns:
+        True on success, False on failure (logged, never raised).
+    """
+    from sqlalchemy.orm import sessionmaker
+
+    try:
+        if engine is None:
+            from services.ura_sync_engine import get_database_engine
+            engine = get_database_engine()
+
+        session = sessionmaker(bind=engine)()
+        try:
+            rebuild_project_snapshots(session)
+        finally:
+            session.close()
+        return True
+
+    except Exception as e:
+        logger.exception(f"Failed to refresh project snapshots: {e}")
+        return False
+
+
+# =============================================================================
+# READ
+# =============================================================================
+
+def get_project_snapshot(project_name: str) -> Optional[Dict[str, Any]]:
+    """
+    Single-row lookup of a project's snapshot.
+
+    Returns None when the project has no snapshot (or the table is not
+    available yet), in which case callers compute live.
+    """
+    from models.database import db
+
+    try:
+        row = db.session.execute(
+            text("SELECT * FROM project_analytics_snapshot WHERE project_name = :project_name"),
+            {"project_name": project_name}
+        ).fetchone()
+    except Exception as e:
+        db.session.rollback()
+        logger.debug(f"Snapshot lookup failed for {project_name}: {e}")
+        return None
+
+    return dict(row._mapping) if row else None
+
+
+def snapshot_resales_since(snapshot: Dict[str, Any], since: date) -> int:
+    """Resale count on or after `since` (dominant district, as resale_total)."""
+    cutoff = since.isoformat()
+    return sum(
+        n for txn_date, n in (snapshot.get('resale_date_counts') or {}).items()
+        if txn_date >= cutoff
+    )
+
+
+def snapshot_bands(
+    snapshot: Dict[str, Any],
+    date_from: date,
+    date_to: date
+) -> List[Dict[str, Any]]:
+    """
+    Monthly bands within [date_from, date_to], shaped like
+    price_bands_service._compute_monthly_percentiles output.
+
+    Bands are per calendar month; a month is in the window when its first
+    day is (transaction_date is stored as the first of the month).
+    """
+    bands = []
+    for band in snapshot.get('monthly_bands') or []:
+        year, month = band['month'].split('-')
+        month_start = date(int(year), int(month), 1)
+        if month_start < date_from or month_start >= date_to + timedelta(days=1):
+            continue
+        bands.append({
+            "month": band['month'],
+            "count": int(band['count']),
+            "p25": round(float(band['p25']), 0) if band.get('p25') else None,
+            "p50": round(float(band['p50']), 0) if band.get('p50') else None,
+            "p75": round(float(band['p75']), 0) if band.get('p75') else None,
+        })
+    return bands
+
+
+def snapshot_unit_data(snapshot: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Registry unit data in get_project_units() shape, or None if not verified."""
+    unit_data = snapshot.get('unit_data')
+    if not unit_data:
+        return None
+    return {"project_name": snapshot['project_name'], **unit_data}
@@ -22,6 +22,11 @@ Response contract:
 - All three regions (CCR, RCR, OCR) always present
 - totals match sum of components (invariant)
 
+Snapshots:
+- get_supply_summary() serves the precomputed row from supply_snapshots
+  (services/supply_snapshot_service), rebuilt whenever GLS tenders, upcoming
+  launches or transactions change; compute_supply_summary() is the live path
+
 Usage:
     from services.supply_service import get_supply_summary
 
@@ -75,6 +80,9 @@ def get_supply_summary(
     """
     Get aggregated supply pipeline data for waterfall visualization.
 
+    Serves the precomputed supply snapshot; computes live when no snapshot
+    exists for this (launch_year, include_gls) combination.
+
     Args:
         include_gls: Whether to include GLS pipeline in totals
         launch_year: Year filter for upcoming launches (default 2026)
@@ -91,21 +99,74 @@ def get_supply_summary(
                 ...
             },
             "totals": { unsoldInventory, upcomingLaunches, glsPipeline, totalEffectiveSupply },
-            "meta": { launchYear, includeGls, computedAs, asOfDate, warnings }
+            "meta": { launchYear, includeGls, computedAs, asOfDate, warnings,
+                      snapshotBuiltAt, inputGenerations, stale }
         }
     """
+    from services.supply_snapshot_service import get_supply_snapshot
+
+    snapshot = get_supply_snapshot(launch_year, include_gls)
+    if snapshot is not None:
+        return snapshot
+
+    return compute_supply_summary(include_gls=include_gls, launch_year=launch_year)
+
+
+def compute_supply_summary(
+    include_gls: bool = True,
+    launch_year: int = 2026,
+    session=None
+) -> Dict[str, Any]:
+    """
+    Compute the supply summary live from source tables.
+
+    Args:
+        include_gls: Whether to include GLS pipeline in totals
+        launch_year: Year filter for upcoming launches
+        session: SQLAlchemy session (defaults to db.session)
+
+    Returns:
+        Same shape as get_supply_summary()
+    """
     # Fetch each category with project-level detail
-    unsold_by_district, unsold_projects = _get_unsold_inventory_with_projects()
-    upcoming_by_district, upcoming_projects = _get_upcoming_launches_with_projects(launch_year)
+    unsold = _get_unsold_inventory_with_projects(session)
+    upcoming = _get_upcoming_launches_with_projects(launch_year, session)
 
     # Fetch GLS pipeline data (both region and district level)
     gls_by_region = {}
-    gls_by_district = {}
-    gls_projects = []
+    gls_district = ({}, [])
 
     if include_gls:
-        gls_by_region = _get_gls_pipeline_by_region()
-        gls_by_district, gls_projects = _get_gls_pipeline_by_district()
+        gls_by_region = _get_gls_pipeline_by_region(session)
+        gls_district = _get_gls_pipeline_by_district(session)
+
+    return _assemble_summary(
+        unsold, upcoming, gls_by_region, gls_district, include_gls, launch_year
+    )
+
+
+def _assemble_summary(
+    unsold: tuple,
+    upcoming: tuple,
+    gls_by_region: Dict[str, int],
+    gls_district: tuple,
+    include_gls: bool,
+    launch_year: int
+) -> Dict[str, Any]:
+    """
+    Merge fetched inputs into the response shape.
+
+    Args:
+        unsold: (unsold_by_district, unsold_projects)
+        upcoming: (upcoming_by_district, upcoming_projects)
+        gls_by_region: Region -> open GLS units
+        gls_district: (gls_by_district, gls_projects)
+        include_gls: Whether to include GLS pipeline in totals
+        launch_year: Year the upcoming launches were filtered by
+    """
+    unsold_by_district, unsold_projects = unsold
+    upcoming_by_district, upcoming_projects = upcoming
+    gls_by_district, gls_projects = gls_district
 
     # Merge into district-level data (now includes GLS with district granularity)
     by_district = _merge_district_data_with_projects(
@@ -122,7 +183,10 @@ def get_supply_summary(
     totals = _compute_totals(by_region)
 
     # Detect any potential overlaps (for debugging)
-    warnings = _detect_overlaps(unsold_by_district, upcoming_by_district, gls_by_region)
+    warnings = _detect_overlaps(
+        unsold_by_district, upcoming_by_district,
+        gls_by_region if include_gls else {}
+    )
 
     return {
         "byRegion": by_region,
@@ -264,18 +328,22 @@ def _get_upcoming_launches_by_district(launch_year: int) -> Dict[str, int]:
         return {}
 
 
-def _get_gls_pipeline_by_region() -> Dict[str, int]:
+def _get_gls_pipeline_by_region(session=None, strict: bool = False) -> Dict[str, int]:
     """
     Get GLS pipeline supply by region (open tenders only).
 
     DEFINITION: GLS tenders with status='launched' (open for bidding, not yet awarded).
     These are UNASSIGNED sites - not yet linked to any upcoming_launch project.
 
+    Args:
+        session: Optional session (defaults to db.session)
+        strict: Re-raise query errors instead of returning empty results
+
     Returns:
         Dict mapping region → estimated units (e.g., {"CCR": 2000, "RCR": 3000, "OCR": 1500})
     """
     imports = _get_imports()
-    db = imports['db']
+    session = session if session is not None else imports['db'].session
     func = imports['func']
 
     try:
@@ -287,12 +355,12 @@ def _get_gls_pipeline_by_region() -> Dict[str, int]:
         # 2. NOT linked to any upcoming_launch (unassigned)
 
         # First, get IDs of GLS tenders that ARE linked to upcoming_launches
-        linked_gls_ids_subquery = db.session.query(UpcomingLaunch.gls_tender_id).filter(
+        linked_gls_ids_subquery = session.query(UpcomingLaunch.gls_tender_id).filter(
             UpcomingLaunch.gls_tender_id.isnot(None)
         ).subquery()
 
         # Query GLS tenders: launched AND not linked
-        results = db.session.query(
+        results = session.query(
             GLSTender.market_segment,
             func.sum(GLSTender.estimated_units).label('total_units')
         ).filter(
@@ -310,11 +378,13 @@ def _get_gls_pipeline_by_region() -> Dict[str, int]:
 
         return region_units
     except Exception as e:
+        if strict:
+            raise
         logger.warning(f"Could not fetch GLS pipeline: {e}")
         return {}
 
 
-def _get_gls_pipeline_by_district() -> tuple:
+def _get_gls_pipeline_by_district(session=None, strict: bool = False) -> tuple:
     """
     Get GLS pipeline supply by district (open tenders only).
 
@@ -323,13 +393,17 @@ def _get_gls_pipeline_by_district() -> tuple:
 
     Uses postal_district derived from postal_code (primary) or planning_area (fallback).
 
+    Args:
+        session: Optional session (defaults to db.session)
+        strict: Re-raise query errors instead of returning empty results
+
     Returns:
         Tuple of (district_totals: Dict[str, int], gls_projects: List[Dict])
         district_totals: {"D01": 500, "D21": 800, ...}
         gls_projects: [{ name, district, region, units, location }]
     """
     imports = _get_imports()
-    db = imports['db']
+    session = session if session is not None else imports['db'].session
     func = imports['func']
     get_region_for_district = imports['get_region_for_district']
 
@@ -338,12 +412,12 @@ def _get_gls_pipeline_by_district() -> tuple:
         from models.upcoming_launch import UpcomingLaunch
 
         # First, get IDs of GLS tenders that ARE linked to upcoming_launches
-        linked_gls_ids_subquery = db.session.query(UpcomingLaunch.gls_tender_id).filter(
+        linked_gls_ids_subquery = session.query(UpcomingLaunch.gls_tender_id).filter(
             UpcomingLaunch.gls_tender_id.isnot(None)
         ).subquery()
 
         # Query GLS tenders with district info: launched AND not linked
-        results = db.session.query(
+        results = session.query(
             GLSTender.postal_district,
             GLSTender.market_segment,
             GLSTender.location_raw,
@@ -391,6 +465,8 @@ def _get_gls_pipeline_by_district() -> tuple:
         return dict(district_totals), gls_projects
 
     except Exception as e:
+        if strict:
+            raise
         logger.warning(f"Could not fetch GLS pipeline by district: {e}")
         import traceback
         logger.warning(traceback.format_exc())
@@ -582,17 +658,21 @@ def _build_meta(
 # PROJECT-LEVEL HELPERS
 # =============================================================================
 
-def _get_unsold_inventory_with_projects() -> tuple:
+def _get_unsold_inventory_with_projects(session=None, strict: bool = False) -> tuple:
     """
     Get unsold inventory with project-level breakdown.
 
+    Args:
+        session: Optional session (defaults to db.session)
+        strict: Re-raise query errors instead of returning empty results
+
     Returns:
         Tuple of (district_totals: Dict[str, int], projects: List[Dict])
         projects: [{ name, district, region, unsold, total_units, sold }]
     """
     try:
         imports = _get_imports()
-        db = imports['db']
+        session = session if session is not None else imports['db'].session
         func = imports['func']
         SALE_TYPE_NEW = imports['SALE_TYPE_NEW']
         get_region_for_district = imports['get_region_for_district']
@@ -634,7 +714,7 @@ def _get_unsold_inventory_with_projects() -> tuple:
         project_names = list(project_data.keys())
 
         # Single bulk query: count New Sale transactions per project
-        results = db.session.query(
+        results = session.query(
             func.upper(Transaction.project_name).label('project_name'),
             func.count(Transaction.id).label('sold_count')
         ).filter(
@@ -671,25 +751,28 @@ def _get_unsold_inventory_with_projects() -> tuple:
 
         return dict(district_totals), projects
     except Exception as e:
+        if strict:
+            raise
         logger.warning(f"Could not fetch unsold inventory with projects: {e}")
         import traceback
         logger.warning(traceback.format_exc())
         return {}, []
 
 
-def _get_upcoming_launches_with_projects(launch_year: int) -> tuple:
+def _get_upcoming_launches_with_projects(launch_year: int, session=None, strict: bool = False) -> tuple:
     """
     Get upcoming launches with project-level breakdown.
 
     Args:
         launch_year: Filter by launch year
+        strict: Re-raise query errors instead of returning empty results
 
     Returns:
         Tuple of (district_totals: Dict[str, int], projects: List[Dict])
         projects: [{ name, district, region, units, expected_launch_date }]
     """
     imports = _get_imports()
-    db = imports['db']
+    session = session if session is not None else imports['db'].session
     func = imports['func']
     get_region_for_district = imports['get_region_for_district']
 
@@ -697,7 +780,7 @@ def _get_upcoming_launches_with_projects(launch_year: int) -> tuple:
         from models.upcoming_launch import UpcomingLaunch
 
         # Query all projects for the year
-        results = db.session.query(
+        results = session.query(
             UpcomingLaunch.project_name,
             UpcomingLaunch.district,
             UpcomingLaunch.total_units,
@@ -738,6 +821,8 @@ def _get_upcoming_launches_with_projects(launch_year: int) -> tuple:
 
         return dict(district_totals), projects
     except Exception as e:
+        if strict:
+            raise
         logger.warning(f"Could not fetch upcoming launches with projects: {e}")
         return {}, []
 
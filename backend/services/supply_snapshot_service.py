@@ -0,0 +1,218 @@
+"""
+Supply Snapshot Service - event-driven supply pipeline snapshots
+
+Maintains supply_snapshots (migration 030): the full /api/supply/summary
+response for every (launch_year, include_gls) combination the endpoint
+accepts, rebuilt only when one of its inputs changes:
+
+- gls_tenders        - gls_scraper.scrape_gls_tenders
+- upcoming_launches  - upcoming_launch_upload.upload_upcoming_launches
+- transactions       - URA sync and scripts/upload.py publish (New Sale
+                       counts drive unsold inventory)
+
+Each write path calls refresh_supply_snapshots(session, changed_input),
+which bumps that input's generation and rebuilds every combination from a
+single fetch of each input. Snapshot rows record the generations they were
+built from; a row whose generations lag supply_input_generations is served
+with meta.stale = true (its rebuild failed and needs a retry). A failed
+rebuild rolls back and leaves the previous snapshot in place; input fetch
+errors are raised, never saved as an empty pipeline.
+
+Usage:
+    from services.supply_snapshot_service import refresh_supply_snapshots
+
+    refresh_supply_snapshots(db_session, 'gls_tenders')
+"""
+
+import json
+import logging
+import time
+from datetime import date
+from typing import Any, Dict, Optional
+
+from sqlalchemy import text
+
+logger = logging.getLogger('supply_snapshot')
+
+SUPPLY_INPUTS = ('gls_tenders', 'upcoming_launches', 'transactions')
+
+# Matches the launchYear range accepted by /api/supply/summary
+SNAPSHOT_LAUNCH_YEARS = range(2020, 2036)
+
+
+# =============================================================================
+# BUILD
+# =============================================================================
+
+def bump_input_generation(session, input_name: str) -> None:
+    """Record that a supply input changed (caller commits)."""
+    if input_name not in SUPPLY_INPUTS:
+        raise ValueError(f"Unknown supply input: {input_name}")
+
+    session.execute(text("""
+        INSERT INTO supply_input_generations (input_name, generation, changed_at)
+        VALUES (:input_name, 1, NOW())
+        ON CONFLICT (input_name) DO UPDATE
+        SET generation = supply_input_generations.generation + 1,
+            changed_at = NOW()
+    """), {"input_name": input_name})
+
+
+def _current_generations(session) -> Dict[str, int]:
+    rows = session.execute(
+        text("SELECT input_name, generation FROM supply_input_generations")
+    ).fetchall()
+    return {row[0]: int(row[1]) for row in rows}
+
+
+def rebuild_supply_snapshots(session) -> int:
+    """
+    Rebuild every (launch_year, include_gls) snapshot in one transaction.
+
+    Unsold inventory and the GLS pipeline are fetched once and shared by all
+    rows; upcoming launches are fetched per launch year. Fetch errors
+    propagate before anything is written, so the caller's rollback keeps
+    the previous snapshot.
+
+    Args:
+        session: SQLAlchemy session (Flask-SQLAlchemy or plain sessionmaker)
+
+    Returns:
+        Number of snapshot rows written
+    """
+    from services.supply_service import (
+        _assemble_summary,
+        _get_gls_pipeline_by_district,
+        _get_gls_pipeline_by_region,
+        _get_unsold_inventory_with_projects,
+        _get_upcoming_launches_with_projects,
+    )
+
+    start = time.perf_counter()
+    generations = _current_generations(session)
+
+    unsold = _get_unsold_inventory_with_projects(session, strict=True)
+    gls_by_region = _get_gls_pipeline_by_region(session, strict=True)
+    gls_district = _get_gls_pipeline_by_district(session, strict=True)
+
+    rows = []
+    for launch_year in SNAPSHOT_LAUNCH_YEARS:
+        upcoming = _get_upcoming_launches_with_projects(launch_year, session, strict=True)
+        for include_gls in (True, False):
+            payload = _assemble_summary(
+                unsold, upcoming, gls_by_region, gls_district, include_gls, launch_year
+            )
+            rows.append({
+                "launch_year": launch_year,
+                "include_gls": include_gls,
+                "payload": json.dumps(payload),
+                "input_generations": json.dumps(generations),
+            })
+
+    session.execute(text("DELETE FROM supply_snapshots"))
+    session.execute(text("""
+        INSERT INTO supply_snapshots (launch_year, include_gls, payload, input_generations, built_at)
+        VALUES (:launch_year, :include_gls, CAST(:payload AS JSONB), CAST(:input_generations AS JSONB), NOW())
+    """), rows)
+    session.commit()
+
+    logger.info(
+        f"Rebuilt {len(rows)} supply snapshots (generations={generations}) in "
+        f"{(time.perf_counter() - start) * 1000:.0f}ms"
+    )
+    return len(rows)
+
+
+def refresh_supply_snapshots(session, changed_input: Optional[str] = None) -> bool:
+    """
+    Bump the changed input's generation, then rebuild snapshots.
+
+    The bump is committed first so that a failed rebuild leaves the
+    snapshots visibly stale rather than silently out of date.
+
+    Args:
+        session: SQLAlchemy session used by the write path
+        changed_input: One of SUPPLY_INPUTS, or None to just rebuild
+
+    Returns:
+        True on success, False on failure (logged, never raised).
+    """
+    try:
+        if changed_input:
+            bump_input_generation(session, changed_input)
+            session.commit()
+        rebuild_supply_snapshots(session)
+        return True
+
+    except Exception as e:
+        session.rollback()
+        logger.exception(f"Failed to refresh supply snapshots ({changed_input}): {e}")
+        return False
+
+
+# =============================================================================
+# READ
+# =============================================================================
+
+def get_supply_snapshot(launch_year: int, include_gls: bool) -> Optional[Dict[str, Any]]:
+    """
+    Snapshot payload for one request combination, with staleness in meta.
+
+    Returns None when no snapshot exists (or the table is not available
+    yet, or there is no app context), in which case callers compute live.
+    """
+    from flask import has_app_context
+    from models.database import db
+
+    if not has_app_context():
+        return None
+
+    try:
+        row = db.session.execute(text("""
+            SELECT
+                s.payload,
+                s.input_generations,
+                s.built_at,
+                (SELECT jsonb_object_agg(input_name, generation)
+                 FROM supply_input_generations) AS current_generations
+            FROM supply_snapshots s
+            WHERE s.launch_year = :launch_year
+              AND s.include_gls = :include_gls
+        """), {"launch_year": launch_year, "include_gls": include_gls}).fetchone()
+    except Exception as e:
+        db.session.rollback()
+        logger.debug(f"Supply snapshot lookup failed: {e}")
+        return None
+
+    if row is None:
+        return None
+
+    return annotate_snapshot(row.payload, row.input_generations, row.built_at, row.current_generations)
+
+
+def annotate_snapshot(
+    payload: Dict[str, Any],
+    built_from: Dict[str, int],
+    built_at,
+    current: Optional[Dict[str, int]]
+) -> Dict[str, Any]:
+    """
+    Add snapshot provenance and staleness to the payload's meta.
+
+    asOfDate is today while the snapshot is current (no input has changed
+    since it was built), and the build date once it is stale.
+    """
+    current = current or {}
+    stale = any(
+        int(generation) > int(built_from.get(name, 0))
+        for name, generation in current.items()
+    )
+    as_of = built_at.date() if stale and built_at else date.today()
+    payload["meta"] = {
+        **payload.get("meta", {}),
+        "asOfDate": as_of.isoformat(),
+        "snapshotBuiltAt": built_at.isoformat() if built_at else None,
+        "inputGenerations": built_from,
+        "stale": stale,
+    }
+    return payload
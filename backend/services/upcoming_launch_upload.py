@@ -326,6 +326,11 @@ def upload_upcoming_launches(
             stats['errors'].append(f"{project_name}: {str(e)}")
             print(f"  Error: {project_name} - {e}")
 
+    # Upcoming launches feed the supply pipeline snapshot
+    if reset or stats['inserted'] or stats['updated']:
+        from services.supply_snapshot_service import refresh_supply_snapshots
+        refresh_supply_snapshots(db_session, 'upcoming_launches')
+
     print(f"\n{'='*60}")
     print("Upload Complete")
     print(f"{'='*60}")
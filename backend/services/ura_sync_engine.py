@@ -50,6 +50,10 @@ from services.ura_sync_config import (
     ALLOWED_PROPERTY_TYPES_DISPLAY,
 )
 from services.ai_snapshot_service import refresh_market_snapshot
+from services.project_snapshot_service import refresh_project_snapshots
+from services.hot_projects_snapshot_service import refresh_hot_projects_snapshot
+from services.launch_dimension_service import refresh_launch_dimension_for_engine
+from services.supply_snapshot_service import refresh_supply_snapshots
 
 logger = logging.getLogger(__name__)
 
@@ -213,6 +217,16 @@ class URASyncEngine:
                 # 6. Refresh AI market snapshot with new data
                 refresh_market_snapshot(self.engine)
 
+                # 7. Rebuild per-project analytics snapshots, bring the
+                #    launch dimension up to date with new New Sale rows,
+                #    rebuild supply snapshots (unsold inventory) and the
+                #    hot projects leaderboard
+                if self.mode != 'dry_run':
+                    refresh_project_snapshots(self.engine)
+                    refresh_launch_dimension_for_engine(self.engine)
+                    refresh_supply_snapshots(self.session, 'transactions')
+                    refresh_hot_projects_snapshot(self.engine)
+
                 duration = (datetime.now(UTC) - start_time).total_seconds()
 
                 # Enhanced end logging
@@ -418,6 +432,18 @@ class URASyncEngine:
 
         logger.info(f"Upsert complete: {inserted} inserted, {updated} updated")
 
+        # Key new rows by canonical project_key (one set-based UPDATE)
+        from data_health.core import sync_transaction_project_keys
+        sync_transaction_project_keys(self.session, commit=False)
+
+        # Recompute persisted price-growth series for touched projects
+        if inserted or updated:
+            from services.price_growth_service import refresh_price_growth_columns
+            refresh_price_growth_columns(
+                self.session, {row.get('project_name') for row in rows}
+            )
+        self.session.commit()
+
     def _upsert_chunk(self, rows: List[Dict[str, Any]]) -> Tuple[int, int]:
         """
         Upsert a chunk of rows.
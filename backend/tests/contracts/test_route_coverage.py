@@ -23,6 +23,7 @@ EXEMPT_ROUTES = [
     ("/ping", "Health check - no payload"),
     ("/health", "Health check - no payload"),
     ("/debug/data-status", "Admin debug endpoint"),
+    ("/debug/query-stats", "Admin debug endpoint"),
     ("/dashboard/cache", "Admin cache management"),
     ("/metadata", "Internal metadata endpoint"),
     ("/admin/update-metadata", "Admin operation"),
@@ -0,0 +1,170 @@
+"""
+Tests for the in-memory AI context store and the AI cache client.
+"""
+
+import json
+import os
+import time
+
+import pytest
+
+from services.ai_context import AI_CONTEXT_DIR, ContextStore, PropertyContext
+from utils.redis_client import LocalTTLStore, get_cache_client
+
+
+def _section_by_scan(content, section):
+    """Line-scan section extraction the store's heading index must match."""
+    section_lines = []
+    in_section = False
+    section_level = section.count("#")
+    for line in content.split("\n"):
+        if line.strip().startswith("#"):
+            current_level = len(line) - len(line.lstrip("#"))
+            if section.lower() in line.lower():
+                in_section = True
+                section_lines.append(line)
+            elif in_section and current_level <= section_level:
+                break
+        elif in_section:
+            section_lines.append(line)
+    return "\n".join(section_lines) if section_lines else None
+
+
+@pytest.fixture
+def context_dir(tmp_path):
+    (tmp_path / "static").mkdir()
+    (tmp_path / "static" / "guide.md").write_text(
+        "# Guide\nintro\n## Time Series Charts\nts body\n### Detail\nmore\n"
+        "## Beads Charts\nbeads body\n## Time Series Charts (cont)\ntail\n"
+    )
+    (tmp_path / "manifest.json").write_text(json.dumps({
+        "files": {"static/guide.md": {"updated_at": "2026-01-01"}}
+    }))
+    return tmp_path
+
+
+def _touch(path, text):
+    path.write_text(text)
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+
+
+@pytest.mark.parametrize("section", [
+    "## Time Series Charts", "## Beads Charts", "### Detail", "# Guide", "## Missing",
+])
+def test_section_matches_line_scan(context_dir, section):
+    store = ContextStore(context_dir)
+    content = (context_dir / "static" / "guide.md").read_text()
+    assert store.section("static/guide.md", section) == _section_by_scan(content, section)
+
+
+def test_real_context_sections_match_line_scan():
+    store = ContextStore(AI_CONTEXT_DIR)
+    content = store.file("static/reasoning-guide.md")
+    if content is None:
+        pytest.skip("AI context docs not present")
+    headings = [line.strip() for line in content.split("\n") if line.startswith("## ")]
+    for heading in headings:
+        assert store.section("static/reasoning-guide.md", heading) == _section_by_scan(content, heading)
+
+
+def test_files_load_once(context_dir):
+    store = ContextStore(context_dir, recheck_seconds=0)
+    for _ in range(5):
+        store.file("static/guide.md")
+        store.section("static/guide.md", "## Beads Charts")
+    assert store.loads == 1
+
+
+def test_reload_on_file_mtime_change(context_dir):
+    store = ContextStore(context_dir, recheck_seconds=0)
+    assert "beads body" in store.section("static/guide.md", "## Beads Charts")
+
+    _touch(context_dir / "static" / "guide.md", "## Beads Charts\nrevised\n")
+
+    assert store.section("static/guide.md", "## Beads Charts") == "## Beads Charts\nrevised\n"
+    assert store.loads == 2
+
+
+def test_manifest_version_change_drops_files(context_dir):
+    store = ContextStore(context_dir, recheck_seconds=0)
+    store.file("static/guide.md")
+
+    _touch(context_dir / "manifest.json", json.dumps({
+        "files": {"static/guide.md": {"updated_at": "2026-02-01"}}
+    }))
+
+    assert store.manifest()["files"]["static/guide.md"]["updated_at"] == "2026-02-01"
+    store.file("static/guide.md")
+    assert store.loads == 2
+
+
+def test_recheck_interval_skips_stat(context_dir):
+    store = ContextStore(context_dir, recheck_seconds=60)
+    store.file("static/guide.md")
+
+    _touch(context_dir / "static" / "guide.md", "changed")
+
+    # Within the interval the loaded copy is served
+    assert "intro" in store.file("static/guide.md")
+
+
+def test_property_context_assembles_from_store():
+    context = PropertyContext()
+    first = context.assemble("beads", "Beads", {"a": 1}, {})
+    second = context.assemble("beads", "Beads", {"a": 1}, {})
+    assert first.static_snippets == second.static_snippets
+    assert first.snapshot_snippets == second.snapshot_snippets
+
+
+class TestLocalTTLStore:
+
+    def test_get_setex_round_trip(self):
+        store = LocalTTLStore()
+        store.setex("k", 60, "v")
+        assert store.get("k") == "v"
+
+    def test_expiry(self):
+        store = LocalTTLStore()
+        store.setex("k", 0.01, "v")
+        time.sleep(0.02)
+        assert store.get("k") is None
+
+    def test_bounded_lru(self):
+        store = LocalTTLStore(max_entries=2)
+        store.setex("a", 60, 1)
+        store.setex("b", 60, 2)
+        store.get("a")
+        store.setex("c", 60, 3)
+        assert store.get("b") is None
+        assert store.get("a") == 1 and store.get("c") == 3
+
+
+def test_cache_client_falls_back_without_redis(monkeypatch):
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    client = get_cache_client()
+    assert isinstance(client, LocalTTLStore)
+    assert get_cache_client() is client
+
+
+def test_cache_client_falls_back_on_connection_error(monkeypatch):
+    import redis
+
+    from utils import redis_client
+
+    class DeadRedis:
+        def get(self, key):
+            raise redis.exceptions.ConnectionError("connection reset")
+
+        def setex(self, key, ttl, value):
+            raise redis.exceptions.TimeoutError("timed out")
+
+    monkeypatch.setenv("REDIS_URL", "redis://cache:6379/0")
+    monkeypatch.setattr(redis_client, "_redis", DeadRedis())
+    monkeypatch.setattr(redis_client, "_redis_failed_at", 0.0)
+    monkeypatch.setattr(redis_client, "_local_store", LocalTTLStore())
+
+    client = get_cache_client()
+    assert client.setex("k", 60, "v") is True
+    assert redis_client._redis is None  # dropped, reconnect waits for the backoff
+    assert get_cache_client().get("k") == "v"
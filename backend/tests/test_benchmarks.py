@@ -0,0 +1,105 @@
+"""
+Tests for the synthetic benchmark dataset and baseline comparison.
+
+The endpoint runs themselves need a Postgres benchmark database and are
+driven by `python -m benchmarks.runner`; these cover the pure parts.
+"""
+
+from collections import Counter
+
+import pytest
+
+from benchmarks.runner import BASELINE_PATH, compare, load_baseline, summarize
+from benchmarks.synthetic import TRANSACTION_COLUMNS, generate_projects, generate_transactions
+from constants import CCR_DISTRICTS, SALE_TYPE_NEW, SALE_TYPE_RESALE
+
+ROWS = 20_000
+
+
+def _rows(rows=ROWS, seed=42):
+    return [row for chunk in generate_transactions(rows, seed) for row in chunk]
+
+
+def test_dataset_is_deterministic():
+    assert _rows(2_000) == _rows(2_000)
+    assert _rows(2_000, seed=1) != _rows(2_000, seed=2)
+
+
+def test_dataset_shape():
+    rows = _rows()
+    assert len(rows) == ROWS
+    assert all(len(row) == len(TRANSACTION_COLUMNS) for row in rows)
+
+    col = {name: i for i, name in enumerate(TRANSACTION_COLUMNS)}
+    regions = Counter(row[col['market_segment']] for row in rows)
+    assert regions['OCR'] > regions['RCR'] > regions['CCR']
+
+    bedrooms = Counter(row[col['bedroom_count']] for row in rows)
+    assert set(bedrooms) == {1, 2, 3, 4, 5}
+    assert bedrooms[3] > bedrooms[1] > bedrooms[5]
+
+    sale_types = Counter(row[col['sale_type']] for row in rows)
+    assert set(sale_types) == {SALE_TYPE_NEW, SALE_TYPE_RESALE}
+    assert 0.3 < sale_types[SALE_TYPE_RESALE] / ROWS < 0.7
+
+    outliers = sum(row[col['is_outlier']] for row in rows)
+    assert 0 < outliers < ROWS * 0.02
+
+    for row in rows[:500]:
+        assert abs(row[col['price']] - row[col['psf']] * row[col['area_sqft']]) <= 1
+        if row[col['district']] in CCR_DISTRICTS:
+            assert row[col['market_segment']] == 'CCR'
+
+
+def test_projects_scale_with_rows():
+    assert len(generate_projects(100_000)) == 250
+    assert len({p['name'] for p in generate_projects(100_000)}) == 250
+
+
+def _result(p50=10.0, p95=20.0, queries=3, errors=0, rss=200.0):
+    return {
+        'peak_rss_mb': rss,
+        'scenarios': {
+            'aggregate:cold': {'p50_ms': p50, 'p95_ms': p95, 'query_count': queries, 'errors': errors},
+        },
+    }
+
+
+def test_summarize_percentiles():
+    samples = [{'ms': float(ms), 'status': 200, 'queries': 2, 'db_ms': 1.0} for ms in range(1, 101)]
+    summary = summarize(samples)
+    assert summary['p50_ms'] == 51.0
+    assert summary['p95_ms'] == 95.0
+    assert summary['query_count'] == 2
+    assert summary['errors'] == 0
+
+
+def test_compare_within_tolerance():
+    assert compare(_result(p50=12.0, p95=24.0), _result()) == []
+
+
+@pytest.mark.parametrize("current,fragment", [
+    (_result(p50=40.0), 'p50_ms'),
+    (_result(p95=60.0), 'p95_ms'),
+    (_result(queries=4), 'query_count'),
+    (_result(errors=1), 'errors'),
+    (_result(rss=300.0), 'peak_rss_mb'),
+])
+def test_compare_flags_regressions(current, fragment):
+    regressions = compare(current, _result())
+    assert len(regressions) == 1
+    assert fragment in regressions[0]
+
+
+def test_compare_flags_missing_scenario():
+    current = {'peak_rss_mb': 200.0, 'scenarios': {}}
+    assert compare(current, _result()) == ['aggregate:cold: scenario missing from run']
+
+
+def test_committed_baseline_loads():
+    baseline = load_baseline(BASELINE_PATH)
+    assert set(baseline) == {'scales', 'tolerance'}
+
+    scenarios = baseline['scales']['100k']['scenarios']
+    assert scenarios
+    assert all(result['errors'] == 0 for result in scenarios.values())
@@ -0,0 +1,129 @@
+"""
+Tests for the budget heatmap price index.
+
+BudgetPriceIndex must reproduce the counts of the original per-request SQL
+(price BETWEEN min AND max, optional bedroom filter, LEAST(bedroom, 5)
+grouping) for any budget window. Checked against a brute-force count over
+randomized synthetic rows.
+"""
+
+import random
+from collections import OrderedDict
+
+import pytest
+
+from services import budget_analysis_service, dataset_catalog
+from services.budget_analysis_service import (
+    BEDROOM_TYPES,
+    PROPERTY_AGE_BANDS,
+    BudgetPriceIndex,
+    _tenure_category,
+)
+
+BAND_KEYS = [b['key'] for b in PROPERTY_AGE_BANDS]
+
+
+def _brute_force(rows, price_min, price_max, bedroom=None):
+    """Mirror of the SQL: filter, then LEAST(bedroom_count, 5) grouping."""
+    matrix = {k: {br: 0 for br in BEDROOM_TYPES} for k in BAND_KEYS}
+    for price, bedroom_count, band in rows:
+        if not (price_min <= price <= price_max):
+            continue
+        if bedroom:
+            if bedroom >= 5:
+                if bedroom_count is None or bedroom_count < 5:
+                    continue
+            elif bedroom_count != bedroom:
+                continue
+        grouped = 5 if bedroom_count is None else min(bedroom_count, 5)
+        if band in matrix and grouped in matrix[band]:
+            matrix[band][grouped] += 1
+    return matrix
+
+
+@pytest.fixture(scope="module")
+def rows():
+    rng = random.Random(42)
+    bedrooms = [None, 0, 1, 2, 3, 4, 5, 6]
+    bands = BAND_KEYS + ['unknown']
+    return [
+        (
+            rng.choice([rng.randrange(500_000, 5_000_000, 10_000), rng.uniform(500_000, 5_000_000)]),
+            rng.choice(bedrooms),
+            rng.choice(bands),
+        )
+        for _ in range(3000)
+    ]
+
+
+class TestBudgetPriceIndex:
+
+    @pytest.mark.parametrize("budget,tolerance", [
+        (1_500_000, 100_000),
+        (2_000_000, 10_000),
+        (2_000_000, 500_000),
+        (480_000, 20_000),      # window straddles the lowest price
+        (9_000_000, 100_000),   # window above every price
+    ])
+    @pytest.mark.parametrize("bedroom", [None, 1, 3, 5, 6])
+    def test_matches_brute_force(self, rows, budget, tolerance, bedroom):
+        index = BudgetPriceIndex.from_rows(rows)
+        lo, hi = budget - tolerance, budget + tolerance
+        assert index.count_matrix(lo, hi, bedroom) == _brute_force(rows, lo, hi, bedroom)
+
+    def test_bounds_are_inclusive(self):
+        index = BudgetPriceIndex.from_rows([
+            (1_000_000, 2, 'resale'),
+            (1_200_000, 2, 'resale'),
+        ])
+        assert index.count_matrix(1_000_000, 1_200_000)['resale'][2] == 2
+        assert index.count_matrix(1_000_001, 1_199_999)['resale'][2] == 0
+
+    def test_empty_index(self):
+        index = BudgetPriceIndex.from_rows([])
+        matrix = index.count_matrix(0, 10_000_000)
+        assert all(v == 0 for row in matrix.values() for v in row.values())
+        assert index.is_fresh()
+
+
+@pytest.mark.parametrize("tenure,expected", [
+    (None, ''),
+    ('Freehold', 'freehold'),
+    ('99-year', '99'),
+    ('999-year', '999'),
+    ('leasehold', ''),
+])
+def test_tenure_category(tenure, expected):
+    assert _tenure_category(tenure) == expected
+
+
+class CellRows:
+    def fetchall(self):
+        return [(price, 2, 'resale') for price in range(1_000_000, 1_100_000, 1000)]
+
+
+class TestPriceIndexCache:
+
+    @pytest.fixture
+    def indexes(self, monkeypatch):
+        monkeypatch.setattr(budget_analysis_service, '_price_indexes', OrderedDict())
+        monkeypatch.setattr(budget_analysis_service.db.session, 'execute',
+                            lambda sql, params: CellRows(), raising=False)
+        return budget_analysis_service._price_indexes
+
+    def test_byte_cap_evicts_least_recently_used(self, indexes, monkeypatch):
+        one = budget_analysis_service.get_price_index(district='D01').nbytes
+        monkeypatch.setattr(budget_analysis_service, 'PRICE_INDEX_MAX_BYTES', one * 2)
+
+        budget_analysis_service.get_price_index(district='D02')
+        budget_analysis_service.get_price_index(district='D01')  # D02 is now oldest
+        budget_analysis_service.get_price_index(district='D03')
+
+        assert [key[1] for key in indexes] == ['D01', 'D03']
+
+    def test_data_change_clears_indexes(self, indexes):
+        budget_analysis_service.get_price_index(district='D01')
+        assert indexes
+
+        dataset_catalog._notify_change()
+        assert not indexes
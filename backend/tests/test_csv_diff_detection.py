@@ -21,9 +21,11 @@ from scrapers.utils.diff import (
     DiffReport,
     EntityDiff,
     FieldChange,
+    CONTENT_HASH_FIELD,
     compute_entity_diff,
     compute_diff_report,
 )
+from scrapers.utils.hashing import compute_record_hash
 
 
 class TestDiffStatus:
@@ -296,6 +298,176 @@ class TestComputeDiffReport:
         assert report.diffs[0].entity_key == "KEY-001"
 
 
+class TestContentHashShortCircuit:
+    """Tests for content-hash short-circuit in compute_entity_diff/compute_diff_report"""
+
+    def test_record_hash_ignores_key_order_whitespace_and_nulls(self):
+        a = {"name": "Test ", "units": 100, "extra": None}
+        b = {"units": 100, "name": "Test"}
+
+        assert compute_record_hash(a) == compute_record_hash(b)
+
+    def test_record_hash_distinguishes_internal_whitespace(self):
+        """Hash must not collapse differences the field diff would report"""
+        a = {"name": "Test  Project"}
+        b = {"name": "Test Project"}
+
+        assert compute_record_hash(a) != compute_record_hash(b)
+
+    def test_record_hash_respects_fields(self):
+        a = {"name": "Test", "units": 100, "extra": "old"}
+        b = {"name": "Test", "units": 100, "extra": "new"}
+
+        assert compute_record_hash(a, fields={"name", "units"}) == \
+            compute_record_hash(b, fields={"name", "units"})
+
+    def test_matching_hashes_skip_field_comparison(self):
+        """Equal hashes return UNCHANGED without calling the field comparator"""
+        data = {"name": "Test", "units": 100}
+
+        with patch("scrapers.utils.diff._values_equal") as values_equal:
+            diff = compute_entity_diff(
+                entity_key="test-1",
+                entity_type="upcoming_launch",
+                incoming_data=data,
+                existing_data=dict(data),
+                incoming_hash="abc",
+                existing_hash="abc",
+            )
+
+        assert diff.status == DiffStatus.UNCHANGED
+        values_equal.assert_not_called()
+
+    def test_report_uses_stored_existing_hash(self):
+        """A precomputed hash on the existing row is used instead of rehashing"""
+        fields = {"name", "units"}
+        incoming = [{"name": "Project A", "units": 100}]
+        existing = {
+            "Project A": {
+                "id": 1,
+                "name": "Project A",
+                "units": 100,
+                # Stored at write time; the key field is not part of the hash
+                CONTENT_HASH_FIELD: compute_record_hash(incoming[0], fields={"units"}),
+            },
+        }
+
+        with patch("scrapers.utils.diff._values_equal") as values_equal:
+            report = compute_diff_report(
+                source_name="test",
+                source_type="csv_upload",
+                run_id="test-run-1",
+                entity_type="upcoming_launch",
+                incoming_records=incoming,
+                existing_records=existing,
+                key_field="name",
+                compare_fields=fields,
+            )
+
+        assert report.unchanged_count == 1
+        values_equal.assert_not_called()
+
+    def test_report_without_stored_hash_does_not_hash(self):
+        """Unhashed rows are diffed field by field, never rehashed"""
+        existing = {"Project A": {"id": 1, "name": "Project A", "units": 100}}
+        incoming = [{"name": "Project A", "units": 100}]
+
+        with patch("scrapers.utils.diff.compute_record_hash") as record_hash:
+            report = compute_diff_report(
+                source_name="test",
+                source_type="csv_upload",
+                run_id="test-run-1",
+                entity_type="upcoming_launch",
+                incoming_records=incoming,
+                existing_records=existing,
+                key_field="name",
+                compare_fields={"name", "units"},
+            )
+
+        assert report.unchanged_count == 1
+        record_hash.assert_not_called()
+
+    def test_stored_hash_excludes_id_without_compare_fields(self):
+        """Without compare_fields the id field does not defeat the hash match"""
+        stored = compute_record_hash({"units": 100, "developer": "X"})
+        existing = {
+            "Project A": {"id": 7, "name": "Project A", "units": 100, "developer": "X",
+                          CONTENT_HASH_FIELD: stored},
+        }
+        incoming = [{"id": 99, "name": "Project A", "units": 100, "developer": "X"}]
+
+        with patch("scrapers.utils.diff._values_equal") as values_equal:
+            report = compute_diff_report(
+                source_name="test",
+                source_type="csv_upload",
+                run_id="test-run-1",
+                entity_type="upcoming_launch",
+                incoming_records=incoming,
+                existing_records=existing,
+                key_field="name",
+            )
+
+        assert report.unchanged_count == 1
+        values_equal.assert_not_called()
+
+    def test_gls_stored_hash_matches_scraped_record(self):
+        """GLSTender.content_hash, set at write time, matches the incoming scrape"""
+        from datetime import date
+        from models.gls_tender import GLSTender, GLS_COMPARE_FIELDS
+
+        scraped = {
+            "release_id": "pr25-66", "status": "awarded", "release_url": "https://ura/pr25-66",
+            "release_date": "2025-06-01", "location_raw": "Dairy Farm Walk",
+            "site_area_sqm": 12000.5, "max_gfa_sqm": 30000.0, "estimated_units": 300,
+            "tendered_price_sgd": 300000000.0, "num_tenderers": 4,
+        }
+        tender = GLSTender(**{**scraped, "release_date": date(2025, 6, 1)})
+        GLSTender.compute_derived_fields(tender)
+
+        existing = {"pr25-66": {**tender.to_dict(include_status_label=False),
+                                CONTENT_HASH_FIELD: tender.content_hash}}
+        with patch("scrapers.utils.diff._values_equal") as values_equal:
+            report = compute_diff_report(
+                source_name="ura_gls",
+                source_type="scrape",
+                run_id="test-run-1",
+                entity_type="gls_tender",
+                incoming_records=[scraped],
+                existing_records=existing,
+                key_field="release_id",
+                compare_fields=set(GLS_COMPARE_FIELDS),
+            )
+
+        assert report.unchanged_count == 1
+        values_equal.assert_not_called()
+
+    def test_report_matches_full_diff_on_mismatch(self):
+        """Hash mismatches still produce field-level changes"""
+        existing = {
+            "Project A": {"id": 1, "name": "Project A", "units": 100},
+            "Project B": {"id": 2, "name": "Project B", "units": 200.0},
+        }
+        incoming = [
+            {"name": "Project A", "units": 120},
+            {"name": "Project B", "units": 200},  # int vs float: hash differs, values equal
+        ]
+
+        report = compute_diff_report(
+            source_name="test",
+            source_type="csv_upload",
+            run_id="test-run-1",
+            entity_type="upcoming_launch",
+            incoming_records=incoming,
+            existing_records=existing,
+            key_field="name",
+            compare_fields={"name", "units"},
+        )
+
+        assert report.changed == ["Project A"]
+        assert report.unchanged == ["Project B"]
+        assert report.diffs[0].changed_fields == ["units"]
+
+
 class TestDiffReportOutput:
     """Tests for DiffReport output methods"""
 
@@ -0,0 +1,178 @@
+"""
+Golden tests for GLS awarded -> launch linking (LaunchMatchIndex).
+
+The expected outcomes were captured from the original per-tender linear
+scan implementation of find_matching_launch_record. The indexed matcher must
+reproduce them exactly, covering all six matching passes.
+
+Runs against PostgreSQL (pg_session) with gls_tenders shadowed by an empty
+temporary copy holding only the LAUNCHED fixtures.
+"""
+
+import pytest
+
+from models.gls_tender import GLSTender
+from services.gls_scraper import (
+    LaunchMatchIndex,
+    find_matching_launch_record,
+    link_awarded_to_launches,
+)
+
+
+LAUNCHED = [
+    # (release_id, location_raw, planning_area, site_area_sqm, estimated_units, source)
+    ("l01", "Dairy Farm Walk", "Bukit Panjang", 10000, 530, None),
+    ("l02", "Lorong Chuan", "Serangoon", 12000, 545, "ura_stated"),
+    ("l03", "Tengah Garden Avenue", "Tengah", 24000, 860, "computed"),
+    ("l04", "Holland Link", "Bukit Timah", 9000, 200, None),
+    ("l05", "Zion Road (Parcel A)", "River Valley", 15000, 540, None),
+    ("l06", "Zion Road (Parcel B)", "River Valley", 15500, 775, None),
+    ("l07", "Dorset Road", "Novena", 11000, 300, None),
+    ("l08", "Upper Thomson Road (Parcel A)", "Bishan", 20000, 700, None),
+    ("l09", "Upper Thomson Road (Parcel B)", "Bishan", 18000, 650, None),
+    ("l10", "Bayshore Road", "Bedok", 30000, 1000, None),
+    ("l11", "Bayshore Drive", "Bedok", 25000, 900, None),
+    ("l12", "Jalan Loyang Besar", "Pasir Ris", 13000, 420, None),
+    ("l13", "Marina Gardens Lane", "Marina South", 8000, 790, None),
+    ("l14", "Media Circle (Parcel A)", "Queenstown", 7000, 335, None),
+    ("l15", "Media Circle (Parcel B)", "Queenstown", 7100, 340, None),
+    ("l16", "Senja Close", "Bukit Panjang", 14000, 500, None),
+    ("l17", "Champions Way", "Woodlands", 21000, 375, None),
+    ("l18", "Kovan Road", "Hougang", 10500, 390, None),
+    ("l19", "Pine Grove (Parcel A)", "Bukit Timah", 16000, 520, None),
+    ("l20", "Hougang Central", "Hougang", 17000, 600, None),
+    ("l21", "at Lentor Central", "Ang Mo Kio", 9000, 475, None),
+    ("l22", "Lentor Gardens", "Ang Mo Kio", 9500, 530, None),
+    ("l23", "No Units Site", "Ang Mo Kio", 9000, None, None),
+    ("l24", "Tampines Street 62", "Tampines", 19000, 585, None),
+    ("l25", "Orchard Boulevard", "Orchard", 6000, 200, None),
+]
+
+# ((location_raw, planning_area, site_area_sqm), (release_id, units, source) | None)
+GOLDEN = [
+    (('Dairy Farm Walk', 'Bukit Panjang', None), ('l01', 530, 'ura_stated')),
+    (('Zion Road (Parcel A)', 'River Valley', None), ('l05', 540, 'ura_stated')),
+    (('zion road parcel b', 'River Valley', None), ('l05', 540, 'ura_stated')),
+    (('At Dorset Road', 'Novena', None), ('l07', 300, 'ura_stated')),
+    (('Chuan Grove', 'Serangoon', None), ('l02', 545, 'ura_stated')),
+    (('Tengah Garden Walk', 'Tengah', None), ('l03', 860, 'computed')),
+    (('Upper Thomson Road', 'Bishan', None), ('l08', 700, 'ura_stated')),
+    (('Bayshore', 'Bedok', None), ('l10', 1000, 'ura_stated')),
+    (('Loyang Avenue', 'Pasir Ris', None), ('l12', 420, 'ura_stated')),
+    (('Unknown Plot', 'Orchard', 6500), ('l25', 200, 'inferred_from_site_area')),
+    (('Unknown Plot', 'Tampines', 99999), ('l24', 585, 'inferred_from_planning_area')),
+    (('Unknown Plot', 'Tampines', None), ('l24', 585, 'inferred_from_planning_area')),
+    (('Unknown Plot', 'Bukit Timah', 8500), ('l04', 200, 'inferred_from_site_area')),
+    (('Unknown Plot', 'Bukit Timah', 30000), None),
+    (('Random Site', 'Nowhere', 1000), None),
+    (('Media Circle', 'Queenstown', None), ('l14', 335, 'ura_stated')),
+    (('Media Circle', 'Queenstown', 7050), ('l14', 335, 'ura_stated')),
+    (('Lentor Central', 'Ang Mo Kio', None), ('l21', 475, 'ura_stated')),
+    (('Lentor Hills Road', 'Ang Mo Kio', None), ('l21', 475, 'ura_stated')),
+    (('Hougang Central', None, None), ('l20', 600, 'ura_stated')),
+    (('Kovan Central', None, 10500), None),
+    (('Kovan Central', 'Hougang', None), ('l18', 390, 'ura_stated')),
+    (('Senja Road', 'Bukit Panjang', 14500), ('l16', 500, 'ura_stated')),
+    (('Champions Way (Parcel B)', 'Woodlands', None), ('l17', 375, 'ura_stated')),
+    (('Marina Gardens Crescent', 'Marina South', None), ('l13', 790, 'ura_stated')),
+    (('Pine Grove', 'Bukit Timah', None), ('l19', 520, 'ura_stated')),
+    (('Holland Close', 'Bukit Timah', 9100), ('l04', 200, 'ura_stated')),
+    (('Ang Mo Kio Avenue', 'Ang Mo Kio', 9000), ('l21', 475, 'inferred_from_site_area')),
+    (('', 'Bedok', None), None),
+]
+
+
+@pytest.fixture
+def session(pg_session, pg_empty_tables):
+    pg_empty_tables(GLSTender.__tablename__)
+    for release_id, location, planning_area, area, units, source in LAUNCHED:
+        pg_session.add(GLSTender(
+            status="launched",
+            release_id=release_id,
+            release_url=f"https://www.ura.gov.sg/{release_id}",
+            location_raw=location,
+            planning_area=planning_area,
+            site_area_sqm=area,
+            estimated_units=units,
+            estimated_units_source=source,
+        ))
+    pg_session.commit()
+    return pg_session
+
+
+def _summary(match):
+    if match is None:
+        return None
+    return (match["launch_release_id"], match["estimated_units"], match["estimated_units_source"])
+
+
+@pytest.mark.parametrize("query,expected", GOLDEN)
+def test_find_matching_launch_record_golden(session, query, expected):
+    location_raw, planning_area, site_area_sqm = query
+    match = find_matching_launch_record(
+        location_raw, planning_area, session, site_area_sqm=site_area_sqm
+    )
+    assert _summary(match) == expected
+
+
+def test_prebuilt_index_matches_golden(session):
+    index = LaunchMatchIndex.build(session)
+    results = [
+        _summary(index.match(loc, pa, site_area_sqm=area))
+        for (loc, pa, area), _ in GOLDEN
+    ]
+    assert results == [expected for _, expected in GOLDEN]
+
+
+def test_index_excludes_launches_without_units(session):
+    index = LaunchMatchIndex.build(session)
+    assert "l23" not in {launch.release_id for launch in index.launches}
+
+
+def test_link_awarded_to_launches_builds_index_once(session, monkeypatch):
+    for i, ((loc, pa, area), _) in enumerate(GOLDEN):
+        session.add(GLSTender(
+            status="awarded",
+            release_id=f"a{i:02d}",
+            release_url="https://www.ura.gov.sg/awarded",
+            location_raw=loc or "Unknown",
+            planning_area=pa,
+            site_area_sqm=area,
+        ))
+    session.commit()
+
+    builds = []
+    original_build = LaunchMatchIndex.build.__func__
+
+    def counting_build(cls, db_session):
+        builds.append(1)
+        return original_build(cls, db_session)
+
+    monkeypatch.setattr(LaunchMatchIndex, "build", classmethod(counting_build))
+
+    stats = link_awarded_to_launches(session)
+
+    assert len(builds) == 1
+    assert stats["linked"] + stats["no_match"] == len(GOLDEN)
+
+
+def test_link_awarded_to_launches_refreshes_content_hash(session):
+    tender = GLSTender(
+        status="awarded",
+        release_id="a-hash",
+        release_url="https://www.ura.gov.sg/awarded",
+        location_raw="Dairy Farm Walk",
+        planning_area="Bukit Panjang",
+    )
+    tender.content_hash = GLSTender.compute_content_hash(tender)
+    unlinked_hash = tender.content_hash
+    session.add(tender)
+    session.commit()
+
+    link_awarded_to_launches(session)
+    session.expire_all()
+
+    stored = session.query(GLSTender).filter_by(release_id="a-hash").one()
+    assert stored.estimated_units == 530
+    assert stored.content_hash == GLSTender.compute_content_hash(stored)
+    assert stored.content_hash != unlinked_hash
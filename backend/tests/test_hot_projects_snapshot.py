@@ -0,0 +1,172 @@
+"""
+Tests for the precomputed hot projects leaderboard.
+
+The snapshot lives in Postgres; these tests cover the bedroom filter
+mapping, row formatting shared by the live and snapshot paths, and the
+build/read statements against a recording session.
+"""
+
+import json
+from collections import namedtuple
+from datetime import date, datetime, timezone
+
+import pytest
+
+from services import hot_projects_snapshot_service as hot
+from services.hot_projects_snapshot_service import (
+    HOT_PROJECTS_BEDROOM_KEYS,
+    bedroom_filter_key,
+    bedroom_sql_params,
+    format_hot_project,
+    parse_bedroom_filter,
+)
+
+Row = namedtuple('Row', [
+    'project_name', 'district', 'units_sold', 'total_value', 'avg_psf', 'median_price',
+    'median_psf', 'first_new_sale', 'last_new_sale', 'has_popular_school_1km',
+    'market_segment', 'latitude', 'longitude',
+])
+
+
+def _row(**overrides):
+    values = dict(
+        project_name='GRAND DUNMAN', district='D15', units_sold=708, total_value=1.5e9,
+        avg_psf=2512.345, median_price=2100000.4, median_psf=2500.0,
+        first_new_sale=date(2023, 3, 1), last_new_sale=date(2025, 6, 1),
+        has_popular_school_1km=False, market_segment=None, latitude=None, longitude=None,
+    )
+    values.update(overrides)
+    return Row(**values)
+
+
+@pytest.fixture(autouse=True)
+def csv_units(monkeypatch):
+    monkeypatch.setattr('services.new_launch_units._load_data', lambda: {
+        'GRAND DUNMAN': {'total_units': 1008, 'developer': 'SingHaiyi'},
+    })
+
+
+class TestBedroomFilter:
+
+    @pytest.mark.parametrize('bedrooms, bedroom, key', [
+        (None, None, 'all'),
+        ([], None, 'all'),
+        (['2'], 2, '2'),
+        (['3,1'], 3, '3'),
+        ([4], 4, '4+'),
+        (['5'], 5, '5+'),
+        (['6'], 6, None),
+        (['x'], None, 'all'),
+    ])
+    def test_keys(self, bedrooms, bedroom, key):
+        assert parse_bedroom_filter(bedrooms) == bedroom
+        assert bedroom_filter_key(bedroom) == key
+
+    def test_every_key_has_sql_params(self):
+        assert bedroom_sql_params(None) == {'bedroom_exact': None, 'bedroom_min': None}
+        assert bedroom_sql_params(2) == {'bedroom_exact': 2, 'bedroom_min': None}
+        assert bedroom_sql_params(5) == {'bedroom_exact': None, 'bedroom_min': 5}
+
+
+class TestFormat:
+
+    def test_sell_through_from_csv_units(self):
+        project = format_hot_project(_row(), [])
+
+        assert project['total_units'] == 1008
+        assert project['developer'] == 'SingHaiyi'
+        assert project['percent_sold'] == 70.2
+        assert project['unsold_inventory'] == 300
+        assert project['region'] == 'East'
+        assert project['median_price'] == 2100000
+        assert project['first_new_sale'] == '2023-03-01'
+        json.dumps(project)  # stored as JSONB
+
+    def test_discrepancy_and_unknown_units(self):
+        over = format_hot_project(_row(units_sold=1200), [])
+        assert over['data_discrepancy'] is True
+        assert over['percent_sold'] == 100.0
+
+        unknown = format_hot_project(_row(project_name='MYSTERY'), [])
+        assert unknown['total_units'] is None
+        assert unknown['percent_sold'] is None
+
+
+class RecordingSession:
+    def __init__(self, results=()):
+        self.executed = []
+        self.results = list(results)
+        self.committed = False
+
+    def execute(self, stmt, params=None):
+        self.executed.append((str(stmt), params))
+        return self.results.pop(0) if self.results else None
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        pass
+
+
+class Rows:
+    def __init__(self, rows=(), scalar=None):
+        self._rows = list(rows)
+        self._scalar = scalar
+
+    def fetchall(self):
+        return self._rows
+
+    def scalar(self):
+        return self._scalar
+
+
+def test_rebuild_materializes_every_bedroom_filter(monkeypatch):
+    monkeypatch.setattr(hot, '_load_school_data', lambda session: [])
+    session = RecordingSession([Rows([_row()]) for _ in HOT_PROJECTS_BEDROOM_KEYS])
+
+    written = hot.rebuild_hot_projects_snapshot(session)
+
+    leaderboards = [params for sql, params in session.executed if 'total_project_sales' in sql]
+    assert len(leaderboards) == len(HOT_PROJECTS_BEDROOM_KEYS)
+    assert all(p['districts'] is None and p['limit'] is None for p in leaderboards)
+    assert leaderboards[-1]['bedroom_min'] == 5
+
+    inserted = session.executed[-1][1]
+    assert written == len(inserted) == len(HOT_PROJECTS_BEDROOM_KEYS)
+    assert [r['bedroom_key'] for r in inserted] == list(HOT_PROJECTS_BEDROOM_KEYS)
+    assert inserted[0]['median_price'] == 2100000.4
+    assert json.loads(inserted[0]['project'])['unsold_inventory'] == 300
+    assert session.committed
+
+
+class TestRead:
+
+    def _read(self, monkeypatch, *results):
+        from models.database import db
+
+        session = RecordingSession(results)
+        monkeypatch.setattr(db.session, 'execute', session.execute, raising=False)
+        snapshot = hot.get_hot_projects_snapshot(
+            '3', districts=None, segment_districts=['D15', 'D16'],
+            price_min=1e6, price_max=None, limit=20)
+        return snapshot, session
+
+    def test_rows_served_from_snapshot(self, monkeypatch):
+        built_at = datetime(2026, 1, 5, tzinfo=timezone.utc)
+        ReadRow = namedtuple('ReadRow', ['project', 'built_at'])
+
+        snapshot, session = self._read(monkeypatch, Rows([ReadRow({'project_name': 'A'}, built_at)]))
+
+        assert snapshot == ([{'project_name': 'A'}], built_at)
+        assert len(session.executed) == 1
+        assert session.executed[0][1]['segment_districts'] == ['D15', 'D16']
+
+    def test_no_matching_rows_is_an_empty_leaderboard(self, monkeypatch):
+        built_at = datetime(2026, 1, 5, tzinfo=timezone.utc)
+        snapshot, _ = self._read(monkeypatch, Rows([]), Rows(scalar=built_at))
+        assert snapshot == ([], built_at)
+
+    def test_missing_snapshot_falls_back_to_live(self, monkeypatch):
+        snapshot, _ = self._read(monkeypatch, Rows([]), Rows(scalar=None))
+        assert snapshot is None
@@ -0,0 +1,104 @@
+"""
+Tests for the project_launches read path in new_launch_service.
+
+The dimension itself is built in Postgres (see test_new_launch_absorption
+for integration coverage); these cover the shared absorption aggregation,
+that the dimension SQL binds the same guarded params as the live SQL, and
+the per-process availability check.
+"""
+
+import re
+from datetime import date
+
+import pytest
+
+from services import dataset_catalog, launch_dimension_service, new_launch_service
+from services.new_launch_service import _aggregate_absorption
+
+
+class TestAggregateAbsorption:
+
+    def test_averages_per_period_and_caps_at_100(self):
+        rows = [
+            (date(2024, 1, 1), "A", 50, 100),
+            (date(2024, 1, 1), "B", 300, 200),   # capped at 100%
+            (date(2024, 4, 1), "C", 10, 40),
+        ]
+        assert _aggregate_absorption(rows, "quarter") == [
+            {"periodStart": "2024-01-01", "projectCount": 2, "avgAbsorption": 75.0,
+             "projectsWithUnits": 2, "projectsMissing": 0},
+            {"periodStart": "2024-04-01", "projectCount": 1, "avgAbsorption": 25.0,
+             "projectsWithUnits": 1, "projectsMissing": 0},
+        ]
+
+    def test_missing_units_excluded_from_average(self):
+        rows = [
+            (date(2024, 2, 1), "A", 0, None),
+            (date(2024, 2, 1), "B", 0, 0),
+            (date(2024, 2, 1), "C", 20, 100),
+        ]
+        [period] = _aggregate_absorption(rows, "month")
+        assert period["projectCount"] == 3
+        assert period["avgAbsorption"] == 20.0
+        assert period["projectsMissing"] == 2
+
+    def test_empty(self):
+        assert _aggregate_absorption([], "year") == []
+
+
+class TestDimensionSql:
+
+    GUARDED_PARAMS = {
+        "time_grain", "date_from_is_null", "date_from", "date_to_is_null",
+        "date_to_exclusive", "districts_is_null", "districts",
+        "bedrooms_is_null", "bedrooms",
+    }
+
+    def _params(self, sql):
+        return set(re.findall(r"(?<!:):([a-z_]+)", sql))
+
+    def test_timeline_params(self):
+        assert self._params(new_launch_service._TIMELINE_DIMENSION_SQL) == self.GUARDED_PARAMS
+
+    def test_absorption_params(self):
+        assert self._params(new_launch_service._ABSORPTION_DIMENSION_SQL) == self.GUARDED_PARAMS
+
+    def test_absorption_filters_on_launch_district(self):
+        # Live absorption uses the first sale's district; timeline uses MIN(district)
+        assert "pl.launch_district = ANY(:districts)" in new_launch_service._ABSORPTION_DIMENSION_SQL
+        assert "pl.district = ANY(:districts)" in new_launch_service._TIMELINE_DIMENSION_SQL
+
+
+class TestAvailability:
+
+    class Session:
+        def __init__(self, populated):
+            self.populated = populated
+            self.queries = 0
+
+        def execute(self, stmt):
+            self.queries += 1
+            return self
+
+        def scalar(self):
+            return self.populated
+
+    @pytest.fixture(autouse=True)
+    def reset(self, monkeypatch):
+        monkeypatch.setattr(launch_dimension_service, "_available", None)
+
+    def test_checked_once_until_data_changes(self):
+        session = self.Session(True)
+        assert launch_dimension_service.launch_dimension_available(session)
+        assert launch_dimension_service.launch_dimension_available(session)
+        assert session.queries == 1
+
+        dataset_catalog._notify_change()
+        assert launch_dimension_service.launch_dimension_available(session)
+        assert session.queries == 2
+
+    def test_empty_table_is_rechecked(self):
+        session = self.Session(False)
+        assert not launch_dimension_service.launch_dimension_available(session)
+        session.populated = True
+        assert launch_dimension_service.launch_dimension_available(session)
@@ -0,0 +1,205 @@
+"""
+Tests for bulk promotion in ScrapingOrchestrator.promote_run().
+
+Runs against PostgreSQL (pg_session) with the scraper tables shadowed by
+empty temporary copies, so the promotion path exercises real ORM
+inserts/updates and nothing persists. Verifies:
+- created / updated / candidate / skipped outcomes
+- field authority gating against prefetched canonicals
+- schema-change check skips the entity's own row
+- only the newest prior versions are prefetched, per exact key
+- query count does not grow with the number of scraped entities
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, text
+
+from models.database import db
+from scrapers.models import (
+    ScrapedEntity,
+    CanonicalEntity,
+    EntityCandidate,
+    ScraperSchemaChange,
+    IngestionRun,
+)
+from scrapers.orchestrator import ScrapingOrchestrator
+from scrapers.utils.hashing import compute_json_hash
+
+
+SCRAPER_TABLES = [
+    IngestionRun.__tablename__,
+    ScrapedEntity.__tablename__,
+    CanonicalEntity.__tablename__,
+    EntityCandidate.__tablename__,
+    ScraperSchemaChange.__tablename__,
+]
+
+
+@pytest.fixture
+def session(pg_session, pg_empty_tables):
+    pg_empty_tables(*SCRAPER_TABLES)
+    return pg_session
+
+
+def _make_run(session, run_id):
+    session.add(IngestionRun(
+        run_id=run_id,
+        scraper_name="test",
+        source_domain="ura.gov.sg",
+        source_tier="A",
+        source_type="scrape",
+    ))
+    session.flush()
+
+
+def _scraped(run_id, key, data, tier="A", domain="ura.gov.sg"):
+    return ScrapedEntity(
+        entity_type="gls_tender",
+        entity_key=key,
+        source_domain=domain,
+        source_url=f"https://{domain}/{key}",
+        source_tier=tier,
+        extracted=data,
+        extracted_hash=compute_json_hash(data),
+        run_id=run_id,
+    )
+
+
+def _canonical(key, data, tier="A"):
+    return CanonicalEntity(
+        entity_type="gls_tender",
+        entity_key=key,
+        canonical=data,
+        canonical_hash=compute_json_hash(data),
+        confidence_score=1.0,
+        status="active",
+        provenance=[],
+        highest_tier=tier,
+    )
+
+
+class TestPromoteRun:
+
+    def test_outcomes_per_tier_and_conflict(self, session):
+        _make_run(session, "run-1")
+        session.add(_canonical("existing-a", {"tenure": "99", "site_area_sqm": 1000}))
+        session.add(_canonical("existing-b", {"tenure": "99"}))
+        session.add_all([
+            _scraped("run-1", "new-1", {"tenure": "99", "site_area_sqm": 500}),
+            _scraped("run-1", "existing-a", {"site_area_sqm": 1200}),
+            # Tier B cannot override Tier A authoritative tenure -> nothing to apply
+            _scraped("run-1", "existing-b", {"tenure": "999"}, tier="B", domain="b.com"),
+            _scraped("run-1", "tier-c", {"tenure": "99"}, tier="C", domain="c.com"),
+        ])
+        session.commit()
+
+        stats = ScrapingOrchestrator(session).promote_run("run-1")
+
+        assert stats["total"] == 4
+        assert stats["created"] == 1
+        assert stats["updated"] == 1
+        assert stats["candidate"] == 1
+        assert stats["skipped"] == 1
+        assert set(stats["timings_ms"]) == {"load", "prefetch", "diff", "write", "commit"}
+
+        created = session.query(CanonicalEntity).filter_by(entity_key="new-1").one()
+        assert created.canonical == {"tenure": "99", "site_area_sqm": 500}
+
+        updated = session.query(CanonicalEntity).filter_by(entity_key="existing-a").one()
+        assert updated.canonical["site_area_sqm"] == 1200
+
+        untouched = session.query(CanonicalEntity).filter_by(entity_key="existing-b").one()
+        assert untouched.canonical == {"tenure": "99"}
+
+        candidates = session.query(EntityCandidate).all()
+        assert [(c.entity_key, c.reason) for c in candidates] == [("tier-c", "tier_c_only")]
+
+    def test_empty_data_is_skipped(self, session):
+        _make_run(session, "run-1")
+        session.add(_canonical("existing-a", {"tenure": "99"}))
+        # Tier B cannot update latitude at all -> nothing allowed
+        session.add(_scraped("run-1", "existing-a", {"latitude": 1.3}, tier="B", domain="b.com"))
+        session.commit()
+
+        stats = ScrapingOrchestrator(session).promote_run("run-1")
+
+        assert stats["skipped"] == 1
+        assert stats["updated"] == 0
+
+    def test_no_schema_change_against_itself(self, session):
+        _make_run(session, "run-1")
+        session.add(_scraped("run-1", "k1", {"tenure": "99"}))
+        session.commit()
+
+        ScrapingOrchestrator(session).promote_run("run-1")
+
+        assert session.query(ScraperSchemaChange).count() == 0
+
+    def test_prefetch_loads_newest_versions_of_run_keys_only(self, session):
+        # Scrapers upsert one row per source today; drop the copy's unique
+        # key so the test can model a source with retained history
+        unique_key = session.execute(text(
+            "SELECT conname FROM pg_constraint "
+            "WHERE conrelid = 'pg_temp.scraped_entities'::regclass AND contype = 'u'"
+        )).scalar_one()
+        session.execute(text(f'ALTER TABLE pg_temp.scraped_entities DROP CONSTRAINT "{unique_key}"'))
+
+        first_scrape = datetime(2025, 1, 1)
+        for i in range(10):
+            _make_run(session, f"old-{i}")
+            row = _scraped(f"old-{i}", "k1", {"tenure": "99", "version": i})
+            row.scraped_at = first_scrape + timedelta(days=i)
+            session.add(row)
+        # (k1, b.com) and (k2, ura.gov.sg) match independent IN lists on
+        # type, key and domain, but neither key is in the run
+        session.add(_scraped("old-0", "k1", {"tenure": "99"}, tier="B", domain="b.com"))
+        session.add(_scraped("old-0", "k2", {"tenure": "99"}))
+        _make_run(session, "run-1")
+        session.add_all([
+            _scraped("run-1", "k1", {"tenure": "99", "version": 10, "site_area_sqm": 500}),
+            _scraped("run-1", "k2", {"tenure": "99"}, tier="B", domain="b.com"),
+        ])
+        session.commit()
+
+        entities = session.query(ScrapedEntity).filter_by(run_id="run-1").all()
+        versions = ScrapingOrchestrator(session)._prefetch_previous_versions(entities)
+
+        assert set(versions) == {
+            ("gls_tender", "k1", "ura.gov.sg"),
+            ("gls_tender", "k2", "b.com"),
+        }
+        assert [v.run_id for v in versions[("gls_tender", "k1", "ura.gov.sg")]] == ["run-1", "old-9"]
+        assert [v.run_id for v in versions[("gls_tender", "k2", "b.com")]] == ["run-1"]
+
+        ScrapingOrchestrator(session).promote_run("run-1")
+
+        change = session.query(ScraperSchemaChange).filter_by(entity_key="k1").one()
+        assert change.previous_hash == compute_json_hash({"tenure": "99", "version": 9})
+
+    def test_query_count_independent_of_run_size(self, session):
+        def count_selects(n):
+            run_id = f"run-{n}"
+            _make_run(session, run_id)
+            session.add_all([
+                _scraped(run_id, f"{run_id}-k{i}", {"tenure": "99"})
+                for i in range(n)
+            ])
+            session.commit()
+
+            selects = []
+
+            def before(conn, cursor, statement, params, context, executemany):
+                if statement.lstrip().upper().startswith("SELECT"):
+                    selects.append(statement)
+
+            event.listen(db.engine, "before_cursor_execute", before)
+            try:
+                stats = ScrapingOrchestrator(session).promote_run(run_id)
+            finally:
+                event.remove(db.engine, "before_cursor_execute", before)
+            assert stats["created"] == n
+            return len(selects)
+
+        assert count_selects(3) == count_selects(30)
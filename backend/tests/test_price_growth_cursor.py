@@ -0,0 +1,114 @@
+"""
+Tests for price-growth keyset pagination.
+
+The series query runs in Postgres; these tests cover the cursor codec,
+has_next on the last page and the response contract for cursor pagination.
+"""
+
+from collections import namedtuple
+from datetime import date
+
+import pytest
+
+from api.contracts.pydantic_models.transactions import (
+    PriceGrowthParams,
+    PriceGrowthResponse,
+)
+from services.price_growth_service import (
+    decode_cursor,
+    encode_cursor,
+    get_transaction_price_growth,
+)
+from utils.normalize import ValidationError
+
+
+def test_cursor_round_trip():
+    cursor = encode_cursor(date(2024, 3, 1), 123456)
+    assert decode_cursor(cursor) == (date(2024, 3, 1), 123456)
+
+
+def test_cursor_is_url_safe():
+    cursor = encode_cursor(date(2024, 3, 1), 999999999)
+    assert all(c.isalnum() or c in "-_" for c in cursor)
+
+
+@pytest.mark.parametrize("bad", ["", "not-a-cursor", "MjAyNC0wMy0wMQ", "!!!"])
+def test_malformed_cursor_rejected(bad):
+    with pytest.raises(ValidationError) as exc:
+        decode_cursor(bad)
+    assert exc.value.field == "cursor"
+
+
+def test_cursor_param_accepted():
+    cursor = encode_cursor(date(2024, 3, 1), 42)
+    assert PriceGrowthParams(cursor=cursor).cursor == cursor
+
+
+def test_response_exposes_next_cursor():
+    cursor = encode_cursor(date(2024, 3, 1), 42)
+    response = PriceGrowthResponse.from_service({
+        "data": [],
+        "pagination": {
+            "page": 1,
+            "per_page": 50,
+            "total_count": 120,
+            "total_pages": 3,
+            "has_next": True,
+            "has_prev": False,
+            "next_cursor": cursor,
+        },
+        "filters_applied": {},
+    }).model_dump(by_alias=True)
+
+    assert response["meta"]["nextCursor"] == cursor
+
+
+GrowthRow = namedtuple("GrowthRow", [
+    "id", "project_name", "bedroom_count", "floor_level", "transaction_date", "psf",
+    "txn_sequence", "cumulative_growth_pct", "incremental_growth_pct",
+    "days_since_prev", "annualized_growth_pct",
+])
+
+
+class Result:
+    def __init__(self, rows=(), scalar=None):
+        self._rows = list(rows)
+        self._scalar = scalar
+
+    def fetchall(self):
+        return self._rows
+
+    def scalar(self):
+        return self._scalar
+
+
+@pytest.fixture
+def growth_rows(monkeypatch):
+    """Serve `available` rows after the cursor, honouring the query LIMIT."""
+    from models.database import db
+
+    def serve(available):
+        rows = [
+            GrowthRow(i, "A", 2, "Mid", date(2024, 1, i), 2000.0, i, None, None, None, None)
+            for i in range(1, available + 1)
+        ]
+
+        def execute(stmt, params):
+            if "LIMIT" in str(stmt):
+                return Result(rows[:params["limit"]])
+            return Result(scalar=available)
+
+        monkeypatch.setattr(db.session, "execute", execute, raising=False)
+
+    return serve
+
+
+@pytest.mark.parametrize("available, has_next", [(3, False), (4, True)])
+def test_cursor_has_next_on_exactly_full_page(growth_rows, available, has_next):
+    growth_rows(available)
+    result = get_transaction_price_growth(
+        per_page=3, cursor=encode_cursor(date(2023, 12, 31), 0))
+
+    assert len(result["data"]) == 3
+    assert result["pagination"]["has_next"] is has_next
+    assert (result["pagination"]["next_cursor"] is not None) is has_next
@@ -0,0 +1,87 @@
+"""
+Tests for utils.project_name - canonical project-name normalization.
+
+Covers the documented normalization examples, parity between the
+data_health re-exports and the shared module, and the bounded memo table.
+"""
+
+import pytest
+
+from utils import project_name
+from utils.project_name import (
+    PROJECT_NAME_CACHE_SIZE,
+    display_name,
+    normalize_name,
+    project_key,
+    slugify,
+)
+
+
+class TestNormalizeName:
+
+    @pytest.mark.parametrize("raw,expected", [
+        ("THE SAIL @ MARINA BAY", "SAIL AT MARINA BAY"),
+        ("D'LEEDON", "DLEEDON"),
+        ("8@BT", "8 AT BT"),
+        ("  normanton   park  ", "NORMANTON PARK"),
+        ("Parc Clematis", "PARC CLEMATIS"),
+        ("", ""),
+        (None, ""),
+    ])
+    def test_examples(self, raw, expected):
+        assert normalize_name(raw) == expected
+
+    def test_the_only_stripped_when_leading(self):
+        assert normalize_name("LEEDON THE RESIDENCE") == "LEEDON THE RESIDENCE"
+
+
+class TestProjectKey:
+
+    @pytest.mark.parametrize("raw", [
+        "THE SAIL @ MARINA BAY",
+        "The Sail at Marina Bay",
+        "  the sail  @marina bay ",
+    ])
+    def test_variants_share_key(self, raw):
+        assert project_key(raw) == "sail-at-marina-bay"
+
+    def test_slugify(self):
+        assert slugify("SAIL AT MARINA BAY") == "sail-at-marina-bay"
+        assert slugify("  A -- B  ") == "a-b"
+        assert slugify("") == ""
+
+    def test_data_health_reexports_shared_functions(self):
+        from data_health import normalize_name as dh_normalize, project_key as dh_key
+        assert dh_normalize is normalize_name
+        assert dh_key is project_key
+
+
+class TestDisplayName:
+
+    @pytest.mark.parametrize("raw,expected", [
+        ("  the  sail @ marina bay ", "THE SAIL @ MARINA BAY"),
+        ("D'LEEDON", "D'LEEDON"),
+        ("", ""),
+    ])
+    def test_examples(self, raw, expected):
+        assert display_name(raw) == expected
+
+    def test_data_processor_delegates(self):
+        from services.data_processor import normalize_project_name
+        assert normalize_project_name("  parc   clematis ") == "PARC CLEMATIS"
+        assert normalize_project_name(None) == ""
+
+
+class TestMemoization:
+
+    def test_cache_is_bounded(self):
+        assert normalize_name.cache_info().maxsize == PROJECT_NAME_CACHE_SIZE
+        assert project_key.cache_info().maxsize == PROJECT_NAME_CACHE_SIZE
+
+    def test_repeat_calls_hit_cache(self):
+        project_name.clear_cache()
+        project_key("THE SAIL @ MARINA BAY")
+        project_key("THE SAIL @ MARINA BAY")
+        info = project_key.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
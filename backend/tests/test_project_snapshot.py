@@ -0,0 +1,134 @@
+"""
+Tests for project_analytics_snapshot readers.
+
+The snapshot is built in Postgres; these tests cover the read-side helpers
+and that the exit-queue orchestrator runs entirely from a snapshot row
+without touching the database.
+"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from services.exit_queue_service import basic_stats_from_snapshot, get_exit_queue_analysis
+from services.project_snapshot_service import (
+    snapshot_bands,
+    snapshot_resales_since,
+    snapshot_unit_data,
+)
+
+
+@pytest.fixture
+def snapshot():
+    today = date.today().replace(day=1)
+    recent = (today - timedelta(days=40)).replace(day=1)
+    return {
+        "project_name": "NORMANTON PARK",
+        "project_key": "normanton-park",
+        "district": "D05",
+        "tenure": "99 yrs lease commencing from 2018",
+        "new_sale_count": 1800,
+        "resale_count": 42,
+        "resale_district": "D05",
+        "first_resale_date": date(2021, 3, 1),
+        "resale_total": 40,
+        "resale_median_psf": 1650.456,
+        "resale_date_counts": {
+            "2021-03-01": 10,
+            "2022-06-01": 20,
+            recent.isoformat(): 10,
+        },
+        "resale_bedroom_types": 4,
+        "monthly_bands": [
+            {"month": "2022-05", "count": 3, "p25": 1500.4, "p50": 1600.6, "p75": 1700.0},
+            {"month": "2022-06", "count": 5, "p25": 1510.0, "p50": 1610.0, "p75": 1710.0},
+            {"month": "2022-07", "count": 4, "p25": 1520.0, "p50": 1620.0, "p75": 1720.0},
+        ],
+        "unit_data": None,
+    }
+
+
+class TestSnapshotBands:
+
+    def test_window_is_month_granular(self, snapshot):
+        bands = snapshot_bands(snapshot, date(2022, 5, 15), date(2022, 7, 31))
+        assert [b["month"] for b in bands] == ["2022-06", "2022-07"]
+
+    def test_first_of_month_boundary_inclusive(self, snapshot):
+        bands = snapshot_bands(snapshot, date(2022, 5, 1), date(2022, 6, 1))
+        assert [b["month"] for b in bands] == ["2022-05", "2022-06"]
+
+    def test_rounding_matches_live_shape(self, snapshot):
+        band = snapshot_bands(snapshot, date(2022, 5, 1), date(2022, 5, 31))[0]
+        assert band == {"month": "2022-05", "count": 3, "p25": 1500.0, "p50": 1601.0, "p75": 1700.0}
+
+
+class TestSnapshotResaleStats:
+
+    def test_resales_since(self, snapshot):
+        assert snapshot_resales_since(snapshot, date(2022, 6, 1)) == 30
+        assert snapshot_resales_since(snapshot, date(2022, 6, 2)) == 10
+
+    def test_basic_stats(self, snapshot):
+        stats = basic_stats_from_snapshot(snapshot, date.today() - timedelta(days=365))
+        assert stats.district == "D05"
+        assert stats.total_resale_transactions == 40
+        assert stats.resales_12m == 10
+        assert stats.median_psf == pytest.approx(1650.456)
+
+    def test_no_resales_returns_none(self, snapshot):
+        snapshot["resale_total"] = 0
+        assert basic_stats_from_snapshot(snapshot, date.today()) is None
+
+    def test_unit_data(self, snapshot):
+        assert snapshot_unit_data(snapshot) is None
+        snapshot["unit_data"] = {"total_units": 1862, "unit_source": "registry", "top": 2023}
+        assert snapshot_unit_data(snapshot) == {
+            "project_name": "NORMANTON PARK",
+            "total_units": 1862,
+            "unit_source": "registry",
+            "top": 2023,
+        }
+
+
+class TestExitQueueFromSnapshot:
+
+    def test_runs_without_database(self, snapshot):
+        snapshot["unit_data"] = {"total_units": 1862, "unit_source": "registry", "top": 2023}
+
+        def fail(*args, **kwargs):
+            raise AssertionError("live lookup should not be used")
+
+        result, error, status = get_exit_queue_analysis(
+            db=None, text=fail, project_name="NORMANTON PARK",
+            get_units_for_project=fail, snapshot=snapshot,
+        )
+
+        assert error is None
+        assert result.fundamentals.total_units == 1862
+        assert result.resale_metrics.total_resale_transactions == 40
+        assert result.resale_metrics.resales_12m == 10
+        assert result.gating_flags.unit_type_mixed is True
+
+    def test_missing_registry_units_use_hybrid_lookup(self, snapshot):
+        calls = []
+
+        def lookup(name):
+            calls.append(name)
+            return {"total_units": 1000, "unit_source": "csv"}
+
+        result, _, _ = get_exit_queue_analysis(
+            db=None, text=None, project_name="NORMANTON PARK",
+            get_units_for_project=lookup, snapshot=snapshot,
+        )
+        assert calls == ["NORMANTON PARK"]
+        assert result.fundamentals.total_units == 1000
+
+    def test_no_resales_is_404(self, snapshot):
+        snapshot["resale_total"] = 0
+        result, error, status = get_exit_queue_analysis(
+            db=None, text=None, project_name="NORMANTON PARK",
+            get_units_for_project=lambda name: None, snapshot=snapshot,
+        )
+        assert result is None
+        assert status == 404
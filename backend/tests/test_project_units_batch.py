@@ -0,0 +1,100 @@
+import pytest
+
+from services import new_launch_units
+from services.new_launch_units import get_project_units, get_project_units_batch
+from utils.project_name import project_key
+
+REGISTRY = {
+    project_key('ALPHA RESIDENCES'): {'total_units': 500, 'district': 'D09', 'top_year': 2015,
+                                      'data_source': 'csv_import'},
+}
+CSV = {
+    'BETA GARDENS': {'total_units': 80, 'developer': 'Beta Dev', 'top': 2010, 'district': 'D15',
+                     'tenure': 'Freehold', 'source': 'URA'},
+    'ALPHA RESIDENCES': {'total_units': 999},
+}
+UPCOMING = {
+    'GAMMA LAUNCH': {'total_units': 300, 'data_source': 'edgeprop', 'data_confidence': 'medium'},
+}
+
+
+@pytest.fixture
+def sources(monkeypatch):
+    calls = {'registry': [], 'upcoming': []}
+
+    def registry_bulk(keys):
+        calls['registry'].append(set(keys))
+        return {k: REGISTRY[k] for k in keys if k in REGISTRY}
+
+    def upcoming_bulk(names):
+        calls['upcoming'].append(set(names))
+        return {n: UPCOMING[n] for n in names if n in UPCOMING}
+
+    monkeypatch.setattr(new_launch_units, '_load_data', lambda: CSV)
+    monkeypatch.setattr(new_launch_units, '_lookup_project_registry_bulk', registry_bulk)
+    monkeypatch.setattr(new_launch_units, '_lookup_upcoming_launches_bulk', upcoming_bulk)
+    monkeypatch.setattr(new_launch_units, '_lookup_project_registry',
+                        lambda name: REGISTRY.get(project_key(name)))
+    monkeypatch.setattr(new_launch_units, '_lookup_upcoming_launches', lambda name: UPCOMING.get(name))
+    return calls
+
+
+def test_batch_matches_single_lookups(sources):
+    names = ['Alpha Residences', 'BETA GARDENS', 'Gamma Launch', 'UNKNOWN COURT', 'BETA GARDENS']
+
+    result = get_project_units_batch(names)
+
+    assert set(result) == set(names)
+    for name in names:
+        assert result[name] == get_project_units(name)
+    assert [result[n]['unit_source'] for n in names[:4]] == ['registry', 'csv', 'database', None]
+
+
+def test_batch_issues_one_lookup_per_source(sources):
+    get_project_units_batch(['ALPHA RESIDENCES', 'BETA GARDENS', 'GAMMA LAUNCH', 'UNKNOWN COURT'])
+
+    assert len(sources['registry']) == 1
+    # Only names the registry and CSV could not resolve reach upcoming_launches
+    assert sources['upcoming'] == [{'GAMMA LAUNCH', 'UNKNOWN COURT'}]
+
+
+def test_empty_batch_runs_no_queries(sources):
+    assert get_project_units_batch([None, '']) == {}
+    assert sources['registry'] == []
+
+
+def test_registry_bulk_query_uses_any(monkeypatch):
+    from models.database import db
+
+    executed = []
+
+    class Result:
+        def mappings(self):
+            return self
+
+        def all(self):
+            return [{'project_key': 'alpha-residences', 'total_units': 500, 'district': 'D09',
+                     'developer': None, 'tenure': None, 'top_year': 2015,
+                     'data_source': 'csv_import', 'confidence_score': None}]
+
+    def execute(stmt, params):
+        executed.append((str(stmt), params))
+        return Result()
+
+    monkeypatch.setattr(db.session, 'execute', execute, raising=False)
+
+    rows = new_launch_units._lookup_project_registry_bulk({'alpha-residences', 'beta-gardens'})
+
+    assert len(executed) == 1
+    assert 'project_key = ANY(:keys)' in executed[0][0]
+    assert sorted(executed[0][1]['keys']) == ['alpha-residences', 'beta-gardens']
+    assert rows['alpha-residences']['total_units'] == 500
+    assert rows['alpha-residences']['confidence_score'] == 0.9
+
+
+def test_registry_units_map_dropped_on_data_change(monkeypatch):
+    from services import dataset_catalog
+
+    monkeypatch.setattr(new_launch_units, '_registry_units_cache', ({'alpha': {'total_units': 500}}, 0.0))
+    dataset_catalog._notify_change()
+    assert new_launch_units._registry_units_cache is None
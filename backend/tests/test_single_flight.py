@@ -0,0 +1,139 @@
+import threading
+import time
+
+import pytest
+from flask import Flask
+
+from utils.single_flight import SingleFlight, get_single_flight_stats, request_flight_key, single_flight
+
+
+def _run_concurrently(n, target):
+    results = [None] * n
+    errors = [None] * n
+
+    def run(i):
+        try:
+            results[i] = target()
+        except Exception as e:
+            errors[i] = e
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join(5)
+    return results, errors
+
+
+def _slow(value, release, calls):
+    def fn():
+        calls.append(1)
+        release.wait(2)
+        return value
+    return fn
+
+
+def test_followers_share_leader_result_and_state_is_released():
+    flight = SingleFlight('test-share')
+    release = threading.Event()
+    calls = []
+
+    def target():
+        return flight.do('k', _slow({'v': 1}, release, calls))
+
+    def release_when_joined():
+        while flight.stats['followers'] < 4:
+            time.sleep(0.005)
+        release.set()
+
+    threading.Thread(target=release_when_joined, daemon=True).start()
+    results, errors = _run_concurrently(5, target)
+
+    assert errors == [None] * 5
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert flight.in_flight() == 0
+    assert flight._calls == {}
+
+
+def test_leader_error_reaches_followers():
+    flight = SingleFlight('test-error')
+    release = threading.Event()
+
+    def fail():
+        release.wait(2)
+        raise RuntimeError('db down')
+
+    def release_when_joined():
+        while flight.stats['followers'] < 2:
+            time.sleep(0.005)
+        release.set()
+
+    threading.Thread(target=release_when_joined, daemon=True).start()
+    _, errors = _run_concurrently(3, lambda: flight.do('k', fail))
+
+    assert all(isinstance(e, RuntimeError) for e in errors)
+    assert flight.in_flight() == 0
+
+
+def test_read_through_followers_rerun_after_leader():
+    flight = SingleFlight('test-reread')
+    cache = {}
+    computed = []
+    release = threading.Event()
+
+    def view():
+        if 'k' in cache:
+            return 'hit'
+        computed.append(1)
+        release.wait(2)
+        cache['k'] = 'value'
+        return 'miss'
+
+    def release_when_joined():
+        while flight.stats['followers'] < 2:
+            time.sleep(0.005)
+        release.set()
+
+    threading.Thread(target=release_when_joined, daemon=True).start()
+    results, _ = _run_concurrently(3, lambda: flight.do('k', view, share_result=False))
+
+    assert len(computed) == 1
+    assert sorted(results) == ['hit', 'hit', 'miss']
+
+
+def test_follower_timeout_computes_itself():
+    flight = SingleFlight('test-timeout', timeout=0.05)
+    release = threading.Event()
+    leader = threading.Thread(target=lambda: flight.do('k', lambda: release.wait(2)))
+    leader.start()
+    while flight.in_flight() == 0:
+        time.sleep(0.005)
+
+    assert flight.do('k', lambda: 'own') == 'own'
+    assert flight.stats['timeouts'] == 1
+    release.set()
+    leader.join(2)
+
+
+def test_decorator_keys_and_bypass():
+    calls = []
+
+    @single_flight(lambda x, skip=False: None if skip else x, name='test-decorator')
+    def double(x, skip=False):
+        calls.append(x)
+        return x * 2
+
+    assert double(2) == 4
+    assert double(3, skip=True) == 6
+    assert double.flight.stats['leaders'] == 1
+    assert get_single_flight_stats()['test-decorator']['in_flight'] == 0
+
+
+@pytest.mark.parametrize('path, expected', [
+    ('/api/aggregate?group_by=month', '/api/aggregate?group_by=month'),
+    ('/api/aggregate?group_by=month&skip_cache=true', None),
+])
+def test_request_flight_key(path, expected):
+    with Flask(__name__).test_request_context(path):
+        assert request_flight_key() == expected
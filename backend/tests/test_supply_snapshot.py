@@ -0,0 +1,140 @@
+"""
+Tests for supply pipeline snapshots.
+
+Snapshots are stored in Postgres; these tests cover the shared assembly
+used by both the live and snapshot paths, staleness annotation, and that a
+failed rebuild keeps the previous snapshot.
+"""
+
+from datetime import date, datetime, timezone
+
+import pytest
+
+from services.supply_service import _assemble_summary
+from services import supply_service
+from services.supply_snapshot_service import (
+    annotate_snapshot,
+    bump_input_generation,
+    refresh_supply_snapshots,
+)
+
+
+@pytest.fixture
+def inputs():
+    unsold = (
+        {'D15': 300},
+        [{'name': 'GRAND DUNMAN', 'district': 'D15', 'region': 'RCR',
+          'unsold': 300, 'total_units': 1008, 'sold': 708, 'category': 'unsold'}],
+    )
+    upcoming = (
+        {'D09': 500},
+        [{'name': 'NEW SITE', 'district': 'D09', 'region': 'CCR',
+          'units': 500, 'launch_quarter': 'Q2', 'category': 'upcoming'}],
+    )
+    gls_by_region = {'OCR': 900}
+    gls_district = (
+        {'D19': 600},
+        [{'name': 'Sengkang West', 'district': 'D19', 'region': 'OCR',
+          'units': 600, 'planning_area': 'Sengkang', 'category': 'gls'}],
+    )
+    return unsold, upcoming, gls_by_region, gls_district
+
+
+class TestAssembleSummary:
+    """Both include_gls variants are built from one fetch of the inputs."""
+
+    def test_with_gls(self, inputs):
+        result = _assemble_summary(*inputs, include_gls=True, launch_year=2026)
+
+        assert result['totals'] == {
+            'unsoldInventory': 300,
+            'upcomingLaunches': 500,
+            'glsPipeline': 900,
+            'totalEffectiveSupply': 1700,
+        }
+        assert 'D19' in result['byDistrict']
+        assert result['meta']['includeGls'] is True
+
+    def test_without_gls(self, inputs):
+        result = _assemble_summary(*inputs, include_gls=False, launch_year=2026)
+
+        assert result['totals']['glsPipeline'] == 0
+        assert result['totals']['totalEffectiveSupply'] == 800
+        assert 'D19' not in result['byDistrict']
+        assert result['meta']['computedAs'] == 'unsoldInventory + upcomingLaunches'
+
+
+class TestAnnotateSnapshot:
+
+    def _payload(self):
+        return {'byRegion': {}, 'byDistrict': {}, 'totals': {}, 'meta': {'launchYear': 2026}}
+
+    def test_fresh_snapshot(self):
+        built_at = datetime(2026, 1, 5, 3, 0, tzinfo=timezone.utc)
+        generations = {'gls_tenders': 3, 'upcoming_launches': 1, 'transactions': 12}
+
+        result = annotate_snapshot(self._payload(), generations, built_at, dict(generations))
+
+        assert result['meta']['launchYear'] == 2026
+        assert result['meta']['stale'] is False
+        assert result['meta']['inputGenerations'] == generations
+        assert result['meta']['snapshotBuiltAt'] == built_at.isoformat()
+
+    def test_stale_when_an_input_moved_on(self):
+        built_from = {'gls_tenders': 3, 'upcoming_launches': 1, 'transactions': 12}
+        current = {'gls_tenders': 4, 'upcoming_launches': 1, 'transactions': 12}
+
+        result = annotate_snapshot(self._payload(), built_from, None, current)
+
+        assert result['meta']['stale'] is True
+        assert result['meta']['snapshotBuiltAt'] is None
+
+    def test_as_of_date_is_today_until_stale(self):
+        built_at = datetime(2026, 1, 5, 3, 0, tzinfo=timezone.utc)
+        generations = {'gls_tenders': 3}
+
+        fresh = annotate_snapshot(self._payload(), generations, built_at, dict(generations))
+        stale = annotate_snapshot(self._payload(), generations, built_at, {'gls_tenders': 4})
+
+        assert fresh['meta']['asOfDate'] == date.today().isoformat()
+        assert stale['meta']['asOfDate'] == '2026-01-05'
+
+
+def test_unknown_input_rejected():
+    with pytest.raises(ValueError):
+        bump_input_generation(session=None, input_name='resale_listings')
+
+
+class RecordingSession:
+    def __init__(self):
+        self.executed = []
+        self.commits = 0
+        self.rolled_back = False
+
+    def execute(self, stmt, params=None):
+        self.executed.append(str(stmt))
+        return self
+
+    def fetchall(self):
+        return []
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+def test_fetch_error_keeps_previous_snapshot(monkeypatch):
+    def unavailable(session=None, strict=False):
+        assert strict
+        raise RuntimeError('connection reset')
+
+    monkeypatch.setattr(supply_service, '_get_unsold_inventory_with_projects', unavailable)
+    session = RecordingSession()
+
+    assert refresh_supply_snapshots(session, 'transactions') is False
+
+    assert session.rolled_back
+    assert session.commits == 1  # generation bump only: the old rows read as stale
+    assert not any('supply_snapshots' in sql for sql in session.executed)
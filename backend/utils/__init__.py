@@ -12,6 +12,7 @@ from .auth import (
     get_k_threshold,
     get_granularity_level,
     auto_widen_for_k_anonymity,
+    count_widening_levels,
     build_k_anonymity_meta,
     build_suppressed_row,
     suppress_if_needed,
@@ -46,6 +47,7 @@ __all__ = [
     'get_k_threshold',
     'get_granularity_level',
     'auto_widen_for_k_anonymity',
+    'count_widening_levels',
     'build_k_anonymity_meta',
     'build_suppressed_row',
     'suppress_if_needed',
@@ -3,19 +3,147 @@ Access Check Utility
 
 Provides authentication and access helpers from Firebase ID tokens.
 """
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
 from flask import request
 from functools import wraps
+from sqlalchemy import event
+from sqlalchemy.orm import make_transient_to_detached
 from models.user import User
 from models.database import db
 
 
+# ============================================================================
+# VERIFIED IDENTITY CACHE
+# ============================================================================
+#
+# Repeat requests carrying the same ID token skip both verify_id_token and
+# the User lookup. Entries are keyed by sha256(token) (the raw token is never
+# stored) and expire at the earlier of the token's `exp` and
+# IDENTITY_CACHE_TTL_SECONDS, which also bounds how long another worker can
+# serve a stale access tier. User updates/deletes in this process evict the
+# user's entries immediately (see _invalidate_on_user_change).
+#
+# Signature checks use the Google public keys cached by firebase_admin's
+# cache-control aware transport; check_revoked stays off so verification
+# never makes a per-request network call.
+
+IDENTITY_CACHE_TTL_SECONDS = 300
+IDENTITY_CACHE_MAX_ENTRIES = 4096
+
+
+class _VerifiedIdentity:
+    __slots__ = ('user_id', 'firebase_uid', 'email', 'display_name', 'avatar_url',
+                 'access_level', 'expires_at')
+
+    def __init__(self, user: User, expires_at: float):
+        self.user_id = user.id
+        self.firebase_uid = user.firebase_uid
+        self.email = user.email
+        self.display_name = user.display_name
+        self.avatar_url = user.avatar_url
+        self.access_level = user.access_level_storage
+        self.expires_at = expires_at
+
+    def to_user(self) -> User:
+        """Attach a User to the current session without a SELECT."""
+        user = User(
+            id=self.user_id,
+            firebase_uid=self.firebase_uid,
+            email=self.email,
+            display_name=self.display_name,
+            avatar_url=self.avatar_url,
+            access_level_storage=self.access_level,
+        )
+        make_transient_to_detached(user)
+        return db.session.merge(user, load=False)
+
+
+_identity_cache: 'OrderedDict[str, _VerifiedIdentity]' = OrderedDict()
+_identity_cache_lock = threading.Lock()
+_identity_cache_stats = {'hits': 0, 'misses': 0, 'invalidations': 0}
+
+
+def _token_key(id_token: str) -> str:
+    return hashlib.sha256(id_token.encode('utf-8')).hexdigest()
+
+
+def _get_cached_identity(key: str) -> Optional[_VerifiedIdentity]:
+    with _identity_cache_lock:
+        identity = _identity_cache.get(key)
+        if identity is None:
+            _identity_cache_stats['misses'] += 1
+            return None
+        if time.time() >= identity.expires_at:
+            del _identity_cache[key]
+            _identity_cache_stats['misses'] += 1
+            return None
+        _identity_cache.move_to_end(key)
+        _identity_cache_stats['hits'] += 1
+        return identity
+
+
+def _cache_identity(key: str, user: User, token_exp) -> None:
+    expires_at = time.time() + IDENTITY_CACHE_TTL_SECONDS
+    if token_exp:
+        expires_at = min(expires_at, float(token_exp))
+    if expires_at <= time.time():
+        return
+    identity = _VerifiedIdentity(user, expires_at)
+    with _identity_cache_lock:
+        _identity_cache[key] = identity
+        _identity_cache.move_to_end(key)
+        while len(_identity_cache) > IDENTITY_CACHE_MAX_ENTRIES:
+            _identity_cache.popitem(last=False)
+
+
+def invalidate_user_identity(user_id: Optional[int] = None, firebase_uid: Optional[str] = None) -> int:
+    """
+    Evict cached identities for a user (call when access/subscription changes).
+
+    Returns:
+        Number of entries removed
+    """
+    with _identity_cache_lock:
+        stale = [
+            key for key, identity in _identity_cache.items()
+            if (user_id is not None and identity.user_id == user_id)
+            or (firebase_uid is not None and identity.firebase_uid == firebase_uid)
+        ]
+        for key in stale:
+            del _identity_cache[key]
+        _identity_cache_stats['invalidations'] += len(stale)
+    return len(stale)
+
+
+def clear_identity_cache() -> None:
+    with _identity_cache_lock:
+        _identity_cache.clear()
+
+
+def get_identity_cache_stats() -> dict:
+    with _identity_cache_lock:
+        return dict(_identity_cache_stats, size=len(_identity_cache))
+
+
+@event.listens_for(User, 'after_update')
+@event.listens_for(User, 'after_delete')
+def _invalidate_on_user_change(mapper, connection, target):
+    invalidate_user_identity(user_id=target.id, firebase_uid=target.firebase_uid)
+
+
 def get_user_from_firebase_token():
     """
     Extract and verify user from Authorization: Bearer <firebase-id-token> header.
 
     Verifies the Firebase ID token via firebase_admin.auth, looks up the user
     by firebase_uid (indexed), auto-creates if not found, and updates profile
-    if changed.
+    if changed. Verified identities are cached per token until the token
+    expires (see VERIFIED IDENTITY CACHE above).
 
     Returns:
         User object if valid Firebase token, None otherwise
@@ -28,6 +156,14 @@ def get_user_from_firebase_token():
     if not id_token:
         return None
 
+    cache_key = _token_key(id_token)
+    identity = _get_cached_identity(cache_key)
+    if identity is not None:
+        try:
+            return identity.to_user()
+        except Exception:
+            invalidate_user_identity(user_id=identity.user_id)
+
     try:
         from routes.auth import get_firebase_app
         firebase_app = get_firebase_app()
@@ -35,7 +171,7 @@ def get_user_from_firebase_token():
             return None
 
         from firebase_admin import auth as firebase_auth
-        decoded_token = firebase_auth.verify_id_token(id_token)
+        decoded_token = firebase_auth.verify_id_token(id_token, app=firebase_app, check_revoked=False)
     except Exception:
         return None
 
@@ -82,6 +218,7 @@ def get_user_from_firebase_token():
             if needs_update:
                 db.session.commit()
 
+        _cache_identity(cache_key, user, decoded_token.get('exp'))
         return user
     except Exception:
         db.session.rollback()
@@ -261,18 +398,11 @@ def check_k_anonymity(count, level=None, filters=None):
     return (True, None)
 
 
-def auto_widen_for_k_anonymity(filters: dict, get_count_fn):
+def _widening_path(filters: dict) -> list:
     """
-    Automatically widen filters until K-anonymity passes.
+    Candidate (filters, level, k_required) steps, narrowest first.
 
     Progressively widens: project → district → segment → market
-
-    Args:
-        filters: Original filter dict
-        get_count_fn: Callable that takes filters and returns count
-
-    Returns:
-        tuple: (final_filters: dict, fallback_level: str, count: int)
     """
     def remove_project(f):
         """Remove project filters"""
@@ -298,35 +428,110 @@ def auto_widen_for_k_anonymity(filters: dict, get_count_fn):
     # Build widening path from current level
     if current_level == "unit":
         # Unit is always blocked - widen to project first
-        widening_path = [
+        return [
             (remove_project(filters), "project", 15),
             (remove_district(filters), "district", 20),
             (remove_segment(filters), "segment", 30),
             ({}, "market", 30),
         ]
     elif current_level == "project":
-        widening_path = [
+        return [
             (filters, "project", 15),
             (remove_project(filters), "district", 20),
             (remove_district(filters), "segment", 30),
             (remove_segment(filters), "market", 30),
         ]
     elif current_level == "district":
-        widening_path = [
+        return [
             (filters, "district", 20),
             (remove_district(filters), "segment", 30),
             (remove_segment(filters), "market", 30),
         ]
     elif current_level == "segment":
-        widening_path = [
+        return [
             (filters, "segment", 30),
             (remove_segment(filters), "market", 30),
         ]
-    else:  # market
-        widening_path = [(filters, "market", 30)]
+    return [(filters, "market", 30)]  # market
+
+
+def count_widening_levels(filter_sets: list, table: str = "transactions_primary") -> list:
+    """
+    Count rows for several filter sets in one statement.
+
+    The sets along a widening path share most conditions, so the conditions
+    common to every set go in WHERE and each set's extra conditions become a
+    COUNT(*) FILTER (...) column - one scan instead of one per level.
+
+    Args:
+        filter_sets: Filter dicts (build_sql_where format)
+        table: Table or view to count
+
+    Returns:
+        List of counts, one per filter set
+    """
+    from sqlalchemy import text
+    from utils.filter_builder import build_sql_where
+
+    if not filter_sets:
+        return []
+
+    level_parts = []
+    params = {}
+    for level_filters in filter_sets:
+        where_parts, level_params = build_sql_where(level_filters)
+        level_parts.append(where_parts)
+        params.update(level_params)
+
+    common = [p for p in level_parts[0] if all(p in parts for parts in level_parts[1:])]
+    columns = []
+    for i, parts in enumerate(level_parts):
+        extra = [p for p in parts if p not in common]
+        if extra:
+            columns.append(f"COUNT(*) FILTER (WHERE {' AND '.join(extra)}) AS level_{i}")
+        else:
+            columns.append(f"COUNT(*) AS level_{i}")
 
-    for widened_filters, level, k_required in widening_path:
-        count = get_count_fn(widened_filters)
+    sql = f"SELECT {', '.join(columns)} FROM {table}"
+    if common:
+        sql += f" WHERE {' AND '.join(common)}"
+
+    row = db.session.execute(text(sql), params).fetchone()
+    return [int(row[i] or 0) for i in range(len(filter_sets))]
+
+
+def auto_widen_for_k_anonymity(filters: dict, get_count_fn=None, get_counts_fn=None):
+    """
+    Automatically widen filters until K-anonymity passes.
+
+    Progressively widens: project → district → segment → market, returning
+    the narrowest level whose count clears its K threshold.
+
+    Counts for every level are fetched in one call to get_counts_fn
+    (default: count_widening_levels, a single SQL statement). Passing
+    get_count_fn instead counts level by level, stopping at the first pass.
+
+    Args:
+        filters: Original filter dict
+        get_count_fn: Optional callable that takes filters and returns count
+        get_counts_fn: Optional callable that takes a list of filter dicts
+                       and returns their counts in order
+
+    Returns:
+        tuple: (final_filters: dict, fallback_level: str, count: int)
+    """
+    widening_path = _widening_path(filters)
+
+    if get_count_fn is not None and get_counts_fn is None:
+        for widened_filters, level, k_required in widening_path:
+            count = get_count_fn(widened_filters)
+            if count >= k_required:
+                return widened_filters, level, count
+        # Even market-wide doesn't pass - return with warning
+        return {}, "market", 0
+
+    counts = (get_counts_fn or count_widening_levels)([f for f, _, _ in widening_path])
+    for (widened_filters, level, k_required), count in zip(widening_path, counts):
         if count >= k_required:
             return widened_filters, level, count
 
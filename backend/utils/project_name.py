@@ -0,0 +1,117 @@
+"""
+Project Name Canonicalization
+=============================
+
+Single source of truth for turning raw project names into:
+- a canonical display name (normalize_name): "THE SAIL @ MARINA BAY" -> "SAIL AT MARINA BAY"
+- a stable lookup key (project_key):        "THE SAIL @ MARINA BAY" -> "sail-at-marina-bay"
+
+project_key is the identifier stored in project_units.project_key and in the
+persisted transactions.project_key column (migration 026), so joins between
+the two are plain indexed equality.
+
+Patterns are compiled once and results are memoized in a bounded LRU table;
+the same few thousand project names are normalized over and over by the
+registry, ingest and analytics paths.
+
+Usage:
+    from utils.project_name import normalize_name, project_key
+
+    project_key("D'LEEDON")   # 'dleedon'
+"""
+
+import re
+from functools import lru_cache
+
+# Max distinct names memoized per process (Singapore has ~4k condo projects)
+PROJECT_NAME_CACHE_SIZE = 8192
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_AT_SIGN_RE = re.compile(r'@')
+_LEADING_THE_RE = re.compile(r'^THE\s+')
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+_SLUG_INVALID_RE = re.compile(r'[^a-z0-9-]')
+_HYPHEN_RUN_RE = re.compile(r'-+')
+
+
+@lru_cache(maxsize=PROJECT_NAME_CACHE_SIZE)
+def normalize_name(raw: str) -> str:
+    """
+    Canonicalize project name to a normalized, human-readable form.
+
+    Transformations applied:
+    1. Uppercase
+    2. Collapse whitespace
+    3. "@" -> " AT "
+    4. Remove leading "THE "
+    5. Remove punctuation (keeps alphanumeric + spaces)
+    6. Final whitespace collapse
+
+    Examples:
+        >>> normalize_name("THE SAIL @ MARINA BAY")
+        'SAIL AT MARINA BAY'
+        >>> normalize_name("D'LEEDON")
+        'DLEEDON'
+        >>> normalize_name("8@BT")
+        '8 AT BT'
+    """
+    if not raw:
+        return ''
+
+    s = raw.upper().strip()
+    s = _WHITESPACE_RE.sub(' ', s)
+    s = _AT_SIGN_RE.sub(' AT ', s)
+    s = _LEADING_THE_RE.sub('', s)
+    s = _PUNCTUATION_RE.sub('', s)
+    return _WHITESPACE_RE.sub(' ', s).strip()
+
+
+def slugify(text: str) -> str:
+    """
+    Convert text to URL-safe slug (lowercase, hyphens instead of spaces).
+
+    Examples:
+        >>> slugify("SAIL AT MARINA BAY")
+        'sail-at-marina-bay'
+    """
+    if not text:
+        return ''
+
+    s = _WHITESPACE_RE.sub('-', text.lower())
+    s = _SLUG_INVALID_RE.sub('', s)
+    s = _HYPHEN_RUN_RE.sub('-', s)
+    return s.strip('-')
+
+
+@lru_cache(maxsize=PROJECT_NAME_CACHE_SIZE)
+def project_key(raw: str) -> str:
+    """
+    Generate stable lookup key for a project name.
+
+    Two project names that should match produce the same key.
+
+    Examples:
+        >>> project_key("THE SAIL @ MARINA BAY")
+        'sail-at-marina-bay'
+        >>> project_key("The Sail at Marina Bay")
+        'sail-at-marina-bay'
+    """
+    return slugify(normalize_name(raw))
+
+
+def display_name(raw: str) -> str:
+    """
+    Uppercase, trimmed, whitespace-collapsed name.
+
+    Lighter than normalize_name: keeps punctuation and a leading "THE", so it
+    is only suitable for de-duplicating casing/spacing variants of one name.
+    """
+    if not raw:
+        return ''
+    return _WHITESPACE_RE.sub(' ', str(raw).strip().upper())
+
+
+def clear_cache() -> None:
+    """Drop memoized results (tests / after bulk renames)."""
+    normalize_name.cache_clear()
+    project_key.cache_clear()
@@ -0,0 +1,173 @@
+"""
+Process-wide Redis client with a local fallback.
+
+One connection pool per process (health-checked connections, short socket
+timeouts) instead of a new client per call. When REDIS_URL is unset or Redis
+is unreachable, callers get a bounded in-process TTL store with the same
+get/setex/delete surface; reconnection is retried after a backoff. A
+connection error or timeout on a live client drops it and retries that
+call against the local store.
+
+Usage:
+    from utils.redis_client import get_cache_client
+
+    client = get_cache_client()
+    client.setex("key", 3600, "value")
+    client.get("key")
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+REDIS_HEALTH_CHECK_INTERVAL = 30   # seconds between PINGs on idle connections
+REDIS_SOCKET_TIMEOUT = 2.0
+REDIS_RECONNECT_BACKOFF = 30       # seconds before retrying an unreachable Redis
+LOCAL_CACHE_MAX_ENTRIES = 1024
+
+
+class LocalTTLStore:
+    """Bounded in-process stand-in for the Redis calls the app makes."""
+
+    def __init__(self, max_entries: int = LOCAL_CACHE_MAX_ENTRIES):
+        self._data: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and time.monotonic() >= expires_at:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def setex(self, key: str, ttl: int, value: Any) -> bool:
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self._max_entries:
+                self._data.popitem(last=False)
+        return True
+
+    def delete(self, *keys: str) -> int:
+        with self._lock:
+            return sum(1 for key in keys if self._data.pop(key, None) is not None)
+
+    def ping(self) -> bool:
+        return True
+
+
+_redis = None
+_redis_failed_at = 0.0
+_redis_lock = threading.Lock()
+_local_store = LocalTTLStore()
+
+
+def get_redis_client():
+    """
+    Get the pooled Redis client, or None if Redis is not configured/reachable.
+
+    The client is created (and PINGed) once per process; after a failure the
+    next attempt waits REDIS_RECONNECT_BACKOFF seconds.
+    """
+    global _redis, _redis_failed_at
+
+    if _redis is not None:
+        return _redis
+
+    redis_url = os.environ.get('REDIS_URL')
+    if not redis_url:
+        return None
+
+    with _redis_lock:
+        if _redis is not None:
+            return _redis
+        if time.monotonic() - _redis_failed_at < REDIS_RECONNECT_BACKOFF:
+            return None
+
+        try:
+            import redis
+            pool = redis.ConnectionPool.from_url(
+                redis_url,
+                health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
+                socket_timeout=REDIS_SOCKET_TIMEOUT,
+                socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+            )
+            client = redis.Redis(connection_pool=pool)
+            client.ping()
+            _redis = client
+            logger.info("Redis connection pool ready")
+        except Exception as e:
+            _redis_failed_at = time.monotonic()
+            logger.warning(f"Redis unavailable, using local cache: {e}")
+
+    return _redis
+
+
+class FallbackCacheClient:
+    """
+    get/setex/delete against pooled Redis, falling back per call.
+
+    On a Redis connection error or timeout the client is dropped (with
+    reconnect backoff) and the call is retried once on the local store.
+    """
+
+    def get(self, key: str) -> Optional[Any]:
+        return self._call('get', key)
+
+    def setex(self, key: str, ttl: int, value: Any) -> bool:
+        return self._call('setex', key, ttl, value)
+
+    def delete(self, *keys: str) -> int:
+        return self._call('delete', *keys)
+
+    def ping(self) -> bool:
+        return self._call('ping')
+
+    def _call(self, method: str, *args):
+        client = get_redis_client()
+        if client is not None:
+            import redis
+            try:
+                return getattr(client, method)(*args)
+            except (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError) as e:
+                logger.warning(f"Redis {method} failed, using local cache: {e}")
+                reset_redis_client(backoff=True)
+        return getattr(_local_store, method)(*args)
+
+
+_fallback_client = FallbackCacheClient()
+
+
+def get_cache_client():
+    """Redis (with per-call local fallback) if available, else the local TTL store."""
+    return _fallback_client if get_redis_client() is not None else _local_store
+
+
+def reset_redis_client(backoff: bool = False) -> None:
+    """
+    Drop the pooled client; the next call reconnects.
+
+    Args:
+        backoff: Wait REDIS_RECONNECT_BACKOFF seconds before reconnecting
+            (after a connection error)
+    """
+    global _redis, _redis_failed_at
+    with _redis_lock:
+        if _redis is not None:
+            try:
+                _redis.connection_pool.disconnect()
+            except Exception:
+                pass
+        _redis = None
+        _redis_failed_at = time.monotonic() if backoff else 0.0
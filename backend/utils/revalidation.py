@@ -0,0 +1,90 @@
+"""
+Background Revalidation - bounded executor for stale-while-revalidate caches
+
+A cache that serves a stale entry hands the refresh here instead of
+recomputing on the request thread:
+
+- At most one refresh per key is queued or running at a time
+- At most REVALIDATE_MAX_PENDING refreshes are outstanding; beyond that
+  new ones are dropped (the entry is refreshed by a later request, or
+  recomputed synchronously once it passes its hard TTL)
+- Refreshes run on REVALIDATE_WORKERS daemon threads inside the
+  submitting request's Flask app context, so db.session works as usual
+
+The executor is created on first use (no threads at import time).
+
+Usage:
+    from utils.revalidation import submit_refresh
+
+    submit_refresh(cache_key, lambda: cache.set(cache_key, compute()))
+"""
+
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Set
+
+logger = logging.getLogger('revalidation')
+
+REVALIDATE_WORKERS = 2
+REVALIDATE_MAX_PENDING = 32
+
+_executor: Optional[ThreadPoolExecutor] = None
+_pending: Set[Any] = set()
+_lock = threading.Lock()
+_stats = {'submitted': 0, 'deduped': 0, 'dropped': 0, 'completed': 0, 'failed': 0}
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=REVALIDATE_WORKERS, thread_name_prefix='revalidate')
+    return _executor
+
+
+def submit_refresh(key: Any, refresh: Callable[[], None]) -> bool:
+    """
+    Run refresh() in the background unless one is already pending for key.
+
+    Returns:
+        True if a refresh was queued
+    """
+    from flask import current_app, has_app_context
+
+    app = current_app._get_current_object() if has_app_context() else None
+
+    with _lock:
+        if key in _pending:
+            _stats['deduped'] += 1
+            return False
+        if len(_pending) >= REVALIDATE_MAX_PENDING:
+            _stats['dropped'] += 1
+            return False
+        _pending.add(key)
+        _stats['submitted'] += 1
+        executor = _get_executor()
+
+    def run():
+        try:
+            if app is not None:
+                with app.app_context():
+                    refresh()
+            else:
+                refresh()
+            with _lock:
+                _stats['completed'] += 1
+        except Exception as e:
+            with _lock:
+                _stats['failed'] += 1
+            logger.warning(f"Background refresh of {key!r} failed: {e}")
+        finally:
+            with _lock:
+                _pending.discard(key)
+
+    executor.submit(run)
+    return True
+
+
+def get_revalidation_stats() -> Dict[str, Any]:
+    with _lock:
+        return dict(_stats, pending=len(_pending), workers=REVALIDATE_WORKERS)
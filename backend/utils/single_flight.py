@@ -0,0 +1,192 @@
+"""
+Single-Flight - one computation per cache key across concurrent callers
+
+Cached endpoints used to guard misses with a threading.Lock per cache key,
+held in a module dict that was never pruned. With free-form filter
+combinations those tables grew for the life of the worker. A SingleFlight
+keeps state only while a computation is running:
+
+- The first caller for a key (leader) runs the function
+- Concurrent callers for the same key (followers) wait on the leader, up
+  to a timeout, and receive its result or exception
+- The key's entry is dropped as soon as the leader finishes, so the table
+  holds in-flight keys only
+
+share_result=False is for functions that read through a cache (Flask views
+in particular, whose Response objects must not be shared between threads):
+followers wait for the leader and then run the function themselves, which
+now finds the leader's cached value.
+
+A follower that waits longer than the timeout stops waiting and runs the
+function itself rather than failing the request.
+
+Flights are per process (each gunicorn worker has its own).
+
+Usage:
+    from utils.single_flight import SingleFlight, single_flight, request_flight_key
+
+    _flight = SingleFlight('dashboard')
+    result = _flight.do(cache_key, lambda: compute(filters))
+
+    @analytics_bp.route("/aggregate")
+    @api_contract("aggregate")
+    @single_flight(request_flight_key, name='aggregate', share_result=False)
+    def aggregate():
+        ...
+"""
+
+import functools
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger('single_flight')
+
+# Followers stop waiting on a leader after this long and compute themselves
+SINGLE_FLIGHT_TIMEOUT_SECONDS = 30.0
+
+
+class _Call:
+    """One in-progress computation and its outcome."""
+
+    __slots__ = ('done', 'value', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Deduplicates concurrent calls by key; holds state only while in flight."""
+
+    def __init__(self, name: str, timeout: float = SINGLE_FLIGHT_TIMEOUT_SECONDS):
+        self.name = name
+        self.timeout = timeout
+        self._calls: Dict[Any, _Call] = {}
+        self._lock = threading.Lock()
+        self.stats = {'leaders': 0, 'followers': 0, 'timeouts': 0}
+        _register(self)
+
+    def do(self, key: Any, fn: Callable[[], Any], share_result: bool = True) -> Any:
+        """
+        Run fn once for key among concurrent callers.
+
+        Args:
+            key: Hashable key identifying identical work (usually the cache key)
+            fn: Zero-argument function to run
+            share_result: Followers get the leader's result/exception when
+                True; when False they wait, then call fn themselves
+
+        Returns:
+            fn's result (the leader's, for followers sharing results)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = _Call()
+                self._calls[key] = call
+                self.stats['leaders'] += 1
+            else:
+                self.stats['followers'] += 1
+
+        if is_leader:
+            try:
+                call.value = fn()
+                return call.value
+            except BaseException as e:
+                call.error = e
+                raise
+            finally:
+                with self._lock:
+                    if self._calls.get(key) is call:
+                        del self._calls[key]
+                call.done.set()
+
+        if not call.done.wait(self.timeout):
+            with self._lock:
+                self.stats['timeouts'] += 1
+            logger.warning(f"{self.name}: gave up waiting {self.timeout}s for in-flight {key!r}")
+            return fn()
+
+        if not share_result:
+            return fn()
+        if call.error is not None:
+            raise call.error
+        return call.value
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.stats, in_flight=len(self._calls), timeout=self.timeout)
+
+
+def single_flight(
+    key_fn: Callable[..., Any],
+    name: Optional[str] = None,
+    share_result: bool = True,
+    timeout: float = SINGLE_FLIGHT_TIMEOUT_SECONDS,
+):
+    """
+    Decorator: concurrent calls that map to the same key run the function once.
+
+    Args:
+        key_fn: Called with the function's arguments; returns the flight key,
+            or None to bypass single-flight for that call (e.g. skip_cache)
+        name: Flight name for stats (default: the function's qualified name)
+        share_result: See SingleFlight.do
+        timeout: Follower wait limit in seconds
+
+    The SingleFlight is exposed as wrapper.flight.
+    """
+    def decorator(fn):
+        flight = SingleFlight(name or fn.__qualname__, timeout=timeout)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            key = key_fn(*args, **kwargs)
+            if key is None:
+                return fn(*args, **kwargs)
+            return flight.do(key, lambda: fn(*args, **kwargs), share_result=share_result)
+
+        wrapper.flight = flight
+        return wrapper
+
+    return decorator
+
+
+def request_flight_key(*args, **kwargs) -> Optional[str]:
+    """
+    Flight key for a GET view: path plus query string.
+
+    Returns None for skip_cache requests so they always run.
+    """
+    from flask import request
+
+    if request.method != 'GET' or request.args.get('skip_cache', '').lower() == 'true':
+        return None
+    return request.full_path
+
+
+# =============================================================================
+# REGISTRY (stats only)
+# =============================================================================
+
+_flights: Dict[str, SingleFlight] = {}
+_flights_lock = threading.Lock()
+
+
+def _register(flight: SingleFlight) -> None:
+    with _flights_lock:
+        _flights[flight.name] = flight
+
+
+def get_single_flight_stats() -> Dict[str, Dict[str, Any]]:
+    """Per-flight leader/follower/timeout counts and in-flight keys."""
+    with _flights_lock:
+        flights = list(_flights.values())
+    return {f.name: f.get_stats() for f in flights}
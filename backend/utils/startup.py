@@ -0,0 +1,262 @@
+"""
+Worker boot profiling and deferred startup tasks.
+
+create_app() runs in every gunicorn worker on boot and restart, so anything
+not needed to serve /api/health is kept off that path:
+
+- BootProfile times each create_app phase and logs one BOOT line, warning
+  when boot exceeds BOOT_TARGET_MS
+- DeferredStartup runs non-critical work (diagnostics, Firebase pre-init,
+  validation reports, cache warming) in a background thread after the app
+  is built; /api/ready answers 503 (status "starting") until the tasks
+  that gate readiness have finished
+- profile_imports() runs `python -X importtime` in a fresh interpreter and
+  aggregates the result (see `python cli.py startup-profile`)
+
+Log format:
+    BOOT total_ms=<float> target_ms=<int> phases=<name>:<ms>,...
+    STARTUP_TASK name=<name> status=<ok|failed> elapsed_ms=<float>
+"""
+
+import logging
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+BOOT_TARGET_MS = int(os.getenv('BOOT_TARGET_MS', '3000'))
+
+# Modules that must not load while building the app; they are imported on
+# first use by the routes/services that need them
+HEAVY_MODULES = (
+    'pandas',
+    'numpy',
+    'anthropic',
+    'firebase_admin',
+    'alembic',
+    'requests',
+)
+
+
+class BootProfile:
+    """Wall-clock timing of create_app phases."""
+
+    def __init__(self, target_ms: int = BOOT_TARGET_MS):
+        self.target_ms = target_ms
+        self.phases: List[Dict] = []
+        self._start = time.perf_counter()
+        self.total_ms: Optional[float] = None
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append({
+                'name': name,
+                'elapsed_ms': round((time.perf_counter() - start) * 1000, 2),
+            })
+
+    def finish(self) -> float:
+        """Stop the clock and log the BOOT line."""
+        self.total_ms = round((time.perf_counter() - self._start) * 1000, 2)
+        phases = ','.join(f"{p['name']}:{p['elapsed_ms']:.0f}" for p in self.phases)
+        message = f"BOOT total_ms={self.total_ms:.2f} target_ms={self.target_ms} phases={phases}"
+        if self.total_ms > self.target_ms:
+            logger.warning(message + " over_target=true")
+        else:
+            logger.info(message)
+        return self.total_ms
+
+    def report(self) -> Dict:
+        return {
+            'total_ms': self.total_ms,
+            'target_ms': self.target_ms,
+            'phases': list(self.phases),
+        }
+
+
+class DeferredStartup:
+    """
+    Startup tasks run after create_app returns, in a background thread.
+
+    Each task runs inside the app context; failures are logged and recorded,
+    never raised. Tasks added with gates_ready=False (e.g. cache warming) do
+    not hold back readiness.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._tasks: List[Dict] = []
+        self.results: Dict[str, Dict] = {}
+        self._ready = threading.Event()
+        self._lock = threading.Lock()
+        self._started = False
+
+    def add(self, name: str, fn: Callable[[], None], gates_ready: bool = True) -> None:
+        self._tasks.append({'name': name, 'fn': fn, 'gates_ready': gates_ready})
+
+    def start(self, background: bool = True) -> None:
+        """Run the tasks; background=False runs them inline (tests, CLI)."""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+
+        if background:
+            threading.Thread(target=self._run, name='deferred-startup', daemon=True).start()
+        else:
+            self._run()
+
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        return self._ready.wait(timeout)
+
+    def report(self) -> Dict:
+        return {
+            'ready': self.is_ready(),
+            'tasks': [
+                dict(self.results.get(t['name'], {'status': 'pending'}),
+                     name=t['name'], gates_ready=t['gates_ready'])
+                for t in self._tasks
+            ],
+        }
+
+    def _run(self) -> None:
+        # Readiness-gating tasks first, then the rest (cache warming)
+        ordered = sorted(self._tasks, key=lambda t: not t['gates_ready'])
+        for task in ordered:
+            if not task['gates_ready']:
+                self._ready.set()
+            self._run_task(task)
+        self._ready.set()
+
+    def _run_task(self, task: Dict) -> None:
+        start = time.perf_counter()
+        status, error = 'ok', None
+        try:
+            with self.app.app_context():
+                task['fn']()
+        except Exception as e:
+            status, error = 'failed', str(e)
+            logger.warning(f"Startup task {task['name']} failed (non-fatal): {e}")
+        elapsed_ms = round((time.perf_counter() - start) * 1000, 2)
+        self.results[task['name']] = {'status': status, 'elapsed_ms': elapsed_ms, 'error': error}
+        logger.info(f"STARTUP_TASK name={task['name']} status={status} elapsed_ms={elapsed_ms:.2f}")
+
+
+def get_deferred_startup(app) -> Optional[DeferredStartup]:
+    """The app's DeferredStartup, or None for apps built without one."""
+    return app.extensions.get('deferred_startup')
+
+
+# =============================================================================
+# IMPORT PROFILING
+# =============================================================================
+
+_IMPORTTIME_RE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$')
+
+
+def parse_importtime(stderr: str) -> List[Dict]:
+    """
+    Parse `python -X importtime` output.
+
+    Returns:
+        One dict per module: module, self_us, cumulative_us, depth
+    """
+    rows = []
+    for line in stderr.splitlines():
+        match = _IMPORTTIME_RE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        rows.append({
+            'module': module,
+            'self_us': int(self_us),
+            'cumulative_us': int(cumulative_us),
+            'depth': (len(indent) - 1) // 2,
+        })
+    return rows
+
+
+def summarize_imports(rows: List[Dict], top: int = 25) -> Dict:
+    """Total import time, slowest top-level packages and heavy modules loaded."""
+    packages: Dict[str, int] = {}
+    for row in rows:
+        package = row['module'].split('.')[0]
+        packages[package] = packages.get(package, 0) + row['self_us']
+
+    loaded = {row['module'] for row in rows}
+    return {
+        'total_ms': round(sum(r['self_us'] for r in rows) / 1000, 1),
+        'modules': len(rows),
+        'top_packages': [
+            {'package': name, 'self_ms': round(us / 1000, 1)}
+            for name, us in sorted(packages.items(), key=lambda kv: kv[1], reverse=True)[:top]
+        ],
+        'top_cumulative': [
+            {'module': r['module'], 'cumulative_ms': round(r['cumulative_us'] / 1000, 1)}
+            for r in sorted(rows, key=lambda r: r['cumulative_us'], reverse=True)[:top]
+        ],
+        'heavy_modules_loaded': sorted(m for m in HEAVY_MODULES if m in loaded),
+    }
+
+
+_BOOT_LINE_RE = re.compile(r'BOOT total_ms=([\d.]+) target_ms=(\d+) phases=(\S*)')
+
+DEFAULT_PROFILE_STATEMENT = 'import logging; logging.basicConfig(level=logging.INFO); import app'
+
+
+def parse_boot_line(output: str) -> Optional[Dict]:
+    """Extract the BootProfile BOOT line from log output, if present."""
+    match = _BOOT_LINE_RE.search(output)
+    if not match:
+        return None
+    total_ms, target_ms, phases = match.groups()
+    return {
+        'total_ms': float(total_ms),
+        'target_ms': int(target_ms),
+        'phases': [
+            {'name': name, 'elapsed_ms': float(ms)}
+            for name, ms in (p.rsplit(':', 1) for p in phases.split(',') if ':' in p)
+        ],
+    }
+
+
+def profile_imports(statement: str = DEFAULT_PROFILE_STATEMENT, cwd: Optional[str] = None,
+                    timeout: int = 120) -> Dict:
+    """
+    Import-time breakdown of `statement` in a fresh interpreter.
+
+    The default statement imports app (which builds it, as gunicorn does),
+    so the create_app phase timings are included when boot succeeds.
+
+    Returns:
+        summarize_imports() output plus boot (parsed BOOT line or None) and
+        returncode (non-zero when the statement failed, e.g. no database)
+    """
+    backend_dir = cwd or os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=backend_dir,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+    summary = summarize_imports(parse_importtime(proc.stderr))
+    summary['boot'] = parse_boot_line(proc.stderr)
+    summary['returncode'] = proc.returncode
+    if proc.returncode:
+        messages = [line for line in proc.stderr.splitlines()
+                    if line.strip() and not line.startswith('import time:')]
+        summary['error'] = messages[-1] if messages else None
+    return summary
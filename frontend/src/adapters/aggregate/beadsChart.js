@@ -71,7 +71,8 @@ const scaleBubbleRadius = (count, maxCount, minCount) => {
  * grouped by bedroom type.
  *
  * @param {Array} rawData - Raw beads_chart array from API:
- *   [{ region, bedroom, volumeWeightedMedian, transactionCount, totalValue }, ...]
+ *   [{ region, bedroom, volumeWeightedMedian, volumeWeightedP25, volumeWeightedP75,
+ *      transactionCount, totalValue }, ...]
  * @returns {Object} Transformed data:
  *   {
  *     datasets: [
@@ -132,6 +133,8 @@ export const transformBeadsChartSeries = (rawData) => {
         region: item.region,
         bedroom: item.bedroom,
         volumeWeightedMedian: item.volumeWeightedMedian,
+        volumeWeightedP25: item.volumeWeightedP25,
+        volumeWeightedP75: item.volumeWeightedP75,
         transactionCount: item.transactionCount,
         totalValue: item.totalValue,
       },
@@ -1998,6 +1998,59 @@ def _idempotent_promote(logger: UploadLogger, batch_id: str, stats: Dict) -> Tup
         return False, stats
 
 
+def refresh_after_publish(logger: UploadLogger):
+    """
+    Bring derived columns and snapshots in line with newly published rows.
+
+    Runs after every successful atomic_publish (full upload and --publish).
+    Each step is non-critical: failures are logged and readers fall back to
+    the live query path until the next refresh.
+    """
+    from data_health.core import sync_transaction_project_keys
+    from services.hot_projects_snapshot_service import refresh_hot_projects_snapshot
+    from services.launch_dimension_service import refresh_launch_dimension_for_engine
+    from services.price_growth_service import refresh_price_growth_columns
+    from services.project_snapshot_service import refresh_project_snapshots
+    from services.supply_snapshot_service import refresh_supply_snapshots
+
+    # CSV rows arrive without project_key; project lookups match on it
+    try:
+        keyed = sync_transaction_project_keys(db.session)
+        logger.log(f"✓ project_key set on {keyed:,} transactions")
+    except Exception as e:
+        db.session.rollback()
+        logger.log(f"⚠️  project_key sync failed (non-critical): {e}")
+
+    # ...and without segment price-growth series (only changed rows are written)
+    try:
+        refreshed = refresh_price_growth_columns(db.session)
+        db.session.commit()
+        logger.log(f"✓ Price growth series refreshed on {refreshed:,} transactions")
+    except Exception as e:
+        db.session.rollback()
+        logger.log(f"⚠️  Price growth refresh failed (non-critical): {e}")
+
+    if refresh_project_snapshots(db.engine):
+        logger.log("✓ Project analytics snapshots rebuilt")
+    else:
+        logger.log("⚠️  Project snapshot rebuild failed (served live until next refresh)")
+
+    if refresh_launch_dimension_for_engine(db.engine):
+        logger.log("✓ New-launch dimension rebuilt")
+    else:
+        logger.log("⚠️  New-launch dimension rebuild failed (stale until next refresh)")
+
+    if refresh_supply_snapshots(db.session, 'transactions'):
+        logger.log("✓ Supply pipeline snapshots rebuilt")
+    else:
+        logger.log("⚠️  Supply snapshot rebuild failed (previous snapshot served as stale)")
+
+    if refresh_hot_projects_snapshot(db.engine):
+        logger.log("✓ Hot projects leaderboard rebuilt")
+    else:
+        logger.log("⚠️  Hot projects leaderboard rebuild failed (served live until next refresh)")
+
+
 def rollback_to_previous(logger: UploadLogger) -> bool:
     """
     Rollback production to previous version.
@@ -2573,6 +2626,7 @@ def main():
                 success, publish_stats = atomic_publish(logger)
 
                 if success:
+                    refresh_after_publish(logger)
                     exit_code = 0
                 else:
                     exit_code = 1
@@ -2933,6 +2987,10 @@ def main():
                 except Exception as e:
                     logger.log(f"Project location update failed (non-critical): {e}")
 
+                # STAGE 8: Refresh derived columns and snapshots from the published rows
+                logger.stage("REFRESH DERIVED DATA")
+                refresh_after_publish(logger)
+
             # Step B: Mark batch as complete
             if run_ctx:
                 run_ctx.complete()